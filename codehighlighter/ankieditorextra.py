@@ -4,50 +4,28 @@ from dataclasses import dataclass
 from typing import Callable, Optional, Union
 
 import aqt  # type: ignore
-import bs4  # type: ignore
 
-from .bs4extra import encode_soup
+from .editorfutures import EditorFutures, then
+from .editorhelper import (
+    FAILED_TO_FIND_FIELD,
+    FAILED_TO_FIND_SELECTION,
+    BridgeStats,
+    call_editor_helper,
+    encode_text,
+)
 from .html import HtmlString, PlainString
 
+if typing.TYPE_CHECKING:
+    import bs4  # type: ignore
+
 __all__ = [
     "transform_selection",
+    "transform_selection_async",
 ]
 
 T = typing.TypeVar("T")
 
 
-def eval_js_with_callback(
-    webview: aqt.editor.EditorWebView, js: str, callback: Callable[[typing.Any], None]
-) -> None:
-    """Evaluates JavaScript in the webview and calls `callback` with the result.
-
-    Wraps the code inside a try-catch statement. On exception, gives the
-    callback a dictionary ({'error': {'name': str, 'message', str}}) or just
-    {'error': str}.
-
-    Args:
-        webview: The editor webview.
-        js: The JavaScript code to execute.
-        callback: The callback function.
-
-    Returns:
-        None.
-    """
-    webview.evalWithCallback(
-        f"""
-        (function() {{
-           try {{
-               {js}
-           }} catch(e) {{
-               if ('name' in e && 'message' in e)
-                   return {{ error: {{ name: e.name, message: e.message }} }}
-               return {{ error: JSON.stringify(e) }}
-           }}
-        }})();""",
-        callback,
-    )
-
-
 @dataclass
 class SelectedText:
     text: PlainString
@@ -79,6 +57,7 @@ def wrap_and_get_selection(
     webview: aqt.editor.EditorWebView,
     wrap_id: str,
     cb: Callable[[Union[SelectedText, SelectionException]], None],
+    stats: Optional[BridgeStats] = None,
 ) -> None:
     """Wraps a field selection in a span tag and returns the selected text.
 
@@ -86,11 +65,11 @@ def wrap_and_get_selection(
         webview: The editor webview.
         wrap_id: The ID of the span tag to wrap the selection in.
         cb: The callback function to receive the selection or exception.
+        stats: Optional counters of the bridge's traffic.
 
     Returns:
         None.
     """
-    failed_to_find_selection = "Failed to find a selection."
 
     def handle_result(result):
 
@@ -106,7 +85,7 @@ def wrap_and_get_selection(
 
         error = safe_get(result, "error")
         message = safe_get(error, "message")
-        if message == failed_to_find_selection:
+        if message == FAILED_TO_FIND_SELECTION:
             cb(NoSelectionException())
         elif message == (
             "Failed to execute 'surroundContents' on 'Range': "
@@ -120,45 +99,8 @@ def wrap_and_get_selection(
 
         return None
 
-    # Not using Anki's own `wrap` function uses `document.execCommand`, which
-    # is deprecated and doesn't work for inline selections.
-    # Using the Range API is better as it doesn't suffer from those drawbacks.
-    #
-    # We need to wrap the selection in a tag, because `transform` may lose
-    # focus (e.g., by presenting a modal dialog) and with it, the selection.
-    #
-    # We return the rendered selected text. A previous version of this code
-    # return the inner HTML (`document.activeElement.shadowRoot.innerHTLM`).
-    # The former is more useful: the user usually cares about highlighting the
-    # text they see, not some abstract HTML representation. Having the reparse
-    # HTML was more complex and fragile.
-    eval_js_with_callback(
-        webview,
-        f"""
-        let selection = document.activeElement.shadowRoot.getSelection();
-        const selectionText = selection.toString();
-        if (selection.rangeCount == 0)
-           return {{ error: {{ name: 'InvalidStateError',
-                               message: '{failed_to_find_selection}' }} }};
-        const range = selection.getRangeAt(selection.rangeCount - 1);
-        if (!range) return;
-        const spanTag = document.createElement('span')
-        spanTag['id'] = '{wrap_id}'
-        try {{
-            range.surroundContents(spanTag);
-            return {{ selectionText }};
-        }} catch (e) {{
-            if (!(e instanceof DOMException)) {{
-                throw e
-            }}
-            // Try an alternative approach.
-            let selectedContent = range.extractContents();
-            spanTag.appendChild(selectedContent);
-            range.insertNode(spanTag);
-            return {{ selectionText }};
-        }}
-        """,
-        handle_result,
+    call_editor_helper(
+        webview, "wrapAndGetSelection", [json.dumps(wrap_id)], handle_result, stats
     )
 
 
@@ -177,6 +119,7 @@ def unwrap_selection(
     wrap_id: str,
     action: Union[UnwrapSelection, ReplaceWrapSelection],
     cb,
+    stats: Optional[BridgeStats] = None,
 ) -> None:
     """Unwraps the span tag created by `wrap_and_get_selection`.
 
@@ -185,47 +128,96 @@ def unwrap_selection(
         wrap_id: The ID of the span tag to unwrap.
         action: The action to perform (either UnwrapSelection or ReplaceWrapSelection).
         cb: The callback function.
+        stats: Optional counters of the bridge's traffic.
 
     Returns:
         None.
     """
-
-    if isinstance(action, UnwrapSelection):
-        action_js = "selection.replaceWith(...selection.childNodes);"
-    elif isinstance(action, ReplaceWrapSelection):
-        action_js = f"selection.outerHTML = {action.contents};"
-
-    # Replace the selection span directly in the webview.
-    #
-    # This approach is simpler and more robust than replacing the selection
-    # inside Python and flushing the new note to Anki's DB:
-    #
-    # * We avoid having to figure out flush field changes DB and see them
-    #   reflected in the webview.
-    # * The field's representation in webview and the serialized note can
-    #   differ significantly. Mathjax expressions in a webview are a
-    #   complex HTML element, while they get serialized to `\(expr\)`
-    #   inside a note. Not having to reconcile that is good, as we don't
-    #   have to touch non-selection code.
-    eval_js_with_callback(
+    encode_text(
         webview,
-        f"""
-         let selection = document.activeElement.shadowRoot.getElementById({wrap_id});
-         // A hack against spurious br-tags that get inserted by the Anki editor.
-         // https://github.com/gregorias/anki-code-highlighter/issues/51
-         if (selection.nextElementSibling?.tagName === "BR" && selection.nextElementSibling.nextSibling === null) {{
-             selection.nextElementSibling.remove();
-         }}
-         {action_js}
-         return null;""",
+        replacement(action),
+        lambda html: call_editor_helper(
+            webview, "unwrapSelection", [json.dumps(wrap_id), html], cb, stats
+        ),
         cb,
+        stats,
+    )
+
+
+def replacement(action: Union[UnwrapSelection, ReplaceWrapSelection]) -> Optional[str]:
+    """Returns the HTML that replaces the selection or None to unwrap it."""
+    if isinstance(action, ReplaceWrapSelection):
+        return action.contents
+    return None
+
+
+def replace_selection_and_ensure_styles(
+    webview: aqt.editor.EditorWebView,
+    wrap_id: str,
+    action: ReplaceWrapSelection,
+    style_block: str,
+    cb: Callable[[Union[bool, SelectionException]], None],
+    stats: Optional[BridgeStats] = None,
+) -> None:
+    """Replaces the selection span and ensures the field's style block.
+
+    This does the job of `unwrap_selection` and of setting up the field's
+    styles in one round trip to the webview. The field's HTML stays in the
+    webview:
+
+    * If the field starts with the style block, the field stays as it is.
+    * If the field has no style block, the block's nodes are prepended.
+    * If the field has a stale style block, e.g., from an older version, the
+      block is replaced. If the stale block lacks its closing guard, the
+      field stays as it is, and the caller should set up the styles.
+
+    Args:
+        webview: The editor webview.
+        wrap_id: The ID of the span tag to replace.
+        action: The replacement.
+        style_block: The guarded style block that the field should start
+            with. Its first node must be the opening guard comment.
+        cb: The callback function to receive whether the field's styles are
+            set up (False if the stale block couldn't be replaced) or an
+            exception.
+        stats: Optional counters of the bridge's traffic.
+
+    Returns:
+        None.
+    """
+
+    def handle_result(result):
+        if isinstance(result, dict) and "styles" in result:
+            cb(result["styles"] != "stale")
+            return None
+        error = result.get("error") if isinstance(result, dict) else result
+        cb(UnknownSelectionException(message=str(error)))
+        return None
+
+    encode_text(
+        webview,
+        action.contents,
+        lambda html: call_editor_helper(
+            webview,
+            "replaceSelectionAndEnsureStyles",
+            [json.dumps(wrap_id), html, json.dumps(style_block)],
+            handle_result,
+            stats,
+        ),
+        handle_result,
+        stats,
     )
 
 
+# A highlighter's result: either ready markup or a tag that needs encoding.
+Highlighted = Union[HtmlString, "bs4.Tag"]
+
+
 # This function returns `str` and not bs4.Tag, because this function will be
 # unit-tested, and I want unit-tests to also test the encoding functionality.
 def highlight_selection(
-    selection: PlainString, highlighter: Callable[[PlainString], Optional[bs4.Tag]]
+    selection: PlainString,
+    highlighter: Callable[[PlainString], Optional[Highlighted]],
 ) -> Optional[HtmlString]:
     """Highlights a selection from a field.
 
@@ -234,26 +226,46 @@ def highlight_selection(
         highlighter: A function that highlights the code.
 
     Returns:
-        The highlighted HTML tag.
+        The highlighted HTML.
     """
-    highlighted_selection = highlighter(selection)
-    return encode_soup(highlighted_selection) if highlighted_selection else None
+    return encode_highlighted(highlighter(selection))
+
+
+def encode_highlighted(highlighted: Optional[Highlighted]) -> Optional[HtmlString]:
+    """Encodes a highlighter's result into HTML.
+
+    Args:
+        highlighted: The highlighter's result.
+
+    Returns:
+        The highlighted HTML.
+    """
+    if highlighted is None:
+        return None
+    if isinstance(highlighted, str):
+        # Ready markup doesn't need a BeautifulSoup round trip.
+        return HtmlString(highlighted)
+    # Only legacy highlighters return tags, so load BeautifulSoup lazily.
+    from .bs4extra import encode_soup
+
+    return encode_soup(highlighted)
 
 
 def get_note_field(
     webview: aqt.editor.EditorWebView,
     cb: Callable[[Union[str, SelectionException]], None],
+    stats: Optional[BridgeStats] = None,
 ) -> None:
     """Gets the HTML content of the active note field.
 
     Args:
         webview: The editor webview.
         cb: The callback function to receive the note field HTML content or an exception.
+        stats: Optional counters of the bridge's traffic.
 
     Returns:
         None.
     """
-    failed_to_find_field = "Failed to find the active note field."
 
     def handle_result(result):
         if isinstance(result, dict) and "error" in result:
@@ -261,26 +273,20 @@ def get_note_field(
             return None
 
         if result is None:
-            cb(UnknownSelectionException(message=failed_to_find_field))
+            cb(UnknownSelectionException(message=FAILED_TO_FIND_FIELD))
             return None
 
         cb(result)
         return None
 
-    eval_js_with_callback(
-        webview,
-        """
-        let element = document.activeElement.shadowRoot.querySelector("anki-editable");
-        return element ? element.innerHTML : null;
-        """,
-        handle_result,
-    )
+    call_editor_helper(webview, "getNoteField", [], handle_result, stats)
 
 
 def set_note_field(
     webview: aqt.editor.EditorWebView,
     html: str,
     cb: Callable[[Union[None, SelectionException]], None],
+    stats: Optional[BridgeStats] = None,
 ) -> None:
     """Sets the HTML content of the active note field.
 
@@ -288,11 +294,11 @@ def set_note_field(
         webview: The editor webview.
         html: The HTML content to set.
         cb: The callback function called after setting the content.
+        stats: Optional counters of the bridge's traffic.
 
     Returns:
         None.
     """
-    js_html = json.dumps(html)
 
     def handle_result(result):
         if isinstance(result, dict) and "error" in result:
@@ -301,17 +307,14 @@ def set_note_field(
         cb(None)
         return None
 
-    eval_js_with_callback(
+    encode_text(
         webview,
-        f"""
-        let element = document.activeElement.shadowRoot.querySelector("anki-editable");
-        if (!element) {{
-            return {{ error: {{ message: "Failed to find the active note field." }} }};
-        }}
-        element.innerHTML = {js_html};
-        return null;
-        """,
+        html,
+        lambda html_arg: call_editor_helper(
+            webview, "setNoteField", [html_arg], handle_result, stats
+        ),
         handle_result,
+        stats,
     )
 
 
@@ -347,6 +350,37 @@ class EditorInterface:
         """
         pass
 
+    def replace_selection_and_ensure_styles(
+        self,
+        action: ReplaceWrapSelection,
+        style_block: str,
+        cb: Callable[[Union[bool, SelectionException]], None],
+    ) -> None:
+        """Replaces the selection span and ensures the field's style block.
+
+        The default implementation combines `unwrap_selection` and
+        `get_note_field` and only checks whether the field starts with the
+        style block. Implementations should override it with a single round
+        trip that also inserts a missing block.
+
+        Args:
+            action: The replacement.
+            style_block: The style block that the field should start with.
+            cb: The callback function to receive whether the field's styles
+                are set up or an exception.
+
+        Returns:
+            None.
+        """
+
+        def on_field(html: Union[str, SelectionException]) -> None:
+            if isinstance(html, SelectionException):
+                cb(html)
+            else:
+                cb(html.startswith(style_block))
+
+        self.unwrap_selection(action, lambda _: self.get_note_field(on_field))
+
     def get_note_field(
         self, cb: Callable[[Union[str, SelectionException]], None]
     ) -> None:
@@ -377,35 +411,51 @@ class EditorInterface:
 
 class AnkiEditorInterface(EditorInterface):
 
-    def __init__(self, webview: aqt.editor.EditorWebView, random_id: str):
+    def __init__(
+        self,
+        webview: aqt.editor.EditorWebView,
+        random_id: str,
+        stats: Optional[BridgeStats] = None,
+    ):
         self.webview = webview
         self.random_id = random_id
+        self.stats = stats
 
     def wrap_and_get_selection(
         self, cb: Callable[[Union[SelectedText, SelectionException]], None]
     ) -> None:
-        wrap_and_get_selection(self.webview, self.random_id, cb)
+        wrap_and_get_selection(self.webview, self.random_id, cb, self.stats)
 
     def unwrap_selection(
         self,
         action: Union[UnwrapSelection, ReplaceWrapSelection],
         cb: Callable[[typing.Any], None],
     ) -> None:
-        unwrap_selection(self.webview, self.random_id, action, cb)
+        unwrap_selection(self.webview, self.random_id, action, cb, self.stats)
+
+    def replace_selection_and_ensure_styles(
+        self,
+        action: ReplaceWrapSelection,
+        style_block: str,
+        cb: Callable[[Union[bool, SelectionException]], None],
+    ) -> None:
+        replace_selection_and_ensure_styles(
+            self.webview, self.random_id, action, style_block, cb, self.stats
+        )
 
     def get_note_field(
         self, cb: Callable[[Union[str, SelectionException]], None]
     ) -> None:
-        get_note_field(self.webview, cb)
+        get_note_field(self.webview, cb, self.stats)
 
     def set_note_field(
         self, html: str, cb: Callable[[Union[None, SelectionException]], None]
     ) -> None:
-        set_note_field(self.webview, html, cb)
+        set_note_field(self.webview, html, cb, self.stats)
 
 
 def transform_selection(
-    highlight: Callable[[PlainString], Optional[bs4.Tag]],
+    highlight: Callable[[PlainString], Optional[Highlighted]],
     editor: EditorInterface,
     on_error: Callable[[str], typing.Any],
     on_done: Optional[Callable[[], None]] = None,
@@ -424,6 +474,51 @@ def transform_selection(
     Returns:
         None.
     """
+    transform_selection_async(
+        lambda code, on_highlighted: on_highlighted(highlight(code)),
+        editor,
+        on_error,
+        on_done,
+    )
+
+
+# Receives a highlighter's result or None if highlighting has failed or has
+# been cancelled.
+HighlightCallback = Callable[[Optional[Highlighted]], None]
+
+
+def transform_selection_async(
+    highlight: Callable[[PlainString, HighlightCallback], None],
+    editor: EditorInterface,
+    on_error: Callable[[str], typing.Any],
+    on_done: Optional[Callable[[], None]] = None,
+    style_block: Optional[str] = None,
+    on_stale_styles: Optional[Callable[[], typing.Any]] = None,
+) -> None:
+    """Like `transform_selection`, but with an asynchronous highlighter.
+
+    The highlighter receives the selected code and a callback, which it must
+    call exactly once with the result. It can do so later, e.g., once a
+    background task finishes. If the result is None, the selection is left
+    as it was.
+
+    Args:
+        highlight: The asynchronous highlighting function.
+        editor: The editor interface.
+        on_error: The callback function that is called if an unrecoverable error
+            has occurred. Provides an error message.
+        on_done: The callback function called after the transformation is complete
+            and successful.
+        style_block: An optional style block that the field should start
+            with. The replacement ensures it in the same round trip.
+        on_stale_styles: The callback function called after a successful
+            transformation if the editor couldn't ensure `style_block`, e.g.,
+            because the field has a malformed block.
+
+    Returns:
+        None.
+    """
+    editor_futures = EditorFutures(editor)
 
     def transform_field(
         selection_return: Union[SelectedText, SelectionException],
@@ -465,22 +560,39 @@ def transform_selection(
                 )
             return None
 
-        highlighted_selection = highlight_selection(
-            selection_return.text, highlighter=highlight
-        )
+        highlight(selection_return.text, replace_selection)
 
-        def handle_done(_):
-            if on_done:
-                on_done()
+    def replace_selection(highlighted: Optional[Highlighted]) -> None:
+        highlighted_selection = encode_highlighted(highlighted)
+        if not highlighted_selection:
+            # Highlighting failed or has been cancelled.
+            # Remove the span tag added by the transform function.
+            editor_futures.cancel()
+            editor_futures.unwrap_selection(UnwrapSelection())
+            return None
 
-        if highlighted_selection:
-            editor.unwrap_selection(
-                ReplaceWrapSelection(contents=HtmlString(repr(highlighted_selection))),
-                handle_done,
-            )
+        action = ReplaceWrapSelection(contents=highlighted_selection)
+        if style_block is None:
+            then(editor_futures.unwrap_selection(action), handle_done)
         else:
-            # Highlighting failed.
-            # Remove the span tag added by the transform function.
-            editor.unwrap_selection(UnwrapSelection(), lambda _: None)
+            replace_and_ensure_styles(action, style_block)
+
+    def replace_and_ensure_styles(
+        action: ReplaceWrapSelection, style_block: str
+    ) -> None:
+        then(
+            editor_futures.replace_selection_and_ensure_styles(action, style_block),
+            handle_styles,
+        )
+
+    def handle_styles(styles_set_up: Union[bool, SelectionException]) -> None:
+        # If the editor has failed, let the callback handle the field.
+        if styles_set_up is not True and on_stale_styles:
+            on_stale_styles()
+        handle_done(None)
+
+    def handle_done(_) -> None:
+        if on_done:
+            on_done()
 
-    editor.wrap_and_get_selection(transform_field)
+    then(editor_futures.wrap_and_get_selection(), transform_field)
@@ -4,16 +4,17 @@ The module is plugin agnostic: it contains generic mechanisms for updating
 relevant assets.
 """
 
-import contextlib
 import os.path
 import pathlib
 import typing
 from collections.abc import Callable
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Protocol
+from typing import Optional, Protocol
 
 from anki.media import MediaManager
 
+from .background import BackgroundRunner
 from .media import (
     MediaInstaller,
     anki_media_directory,
@@ -28,11 +29,12 @@ __all__ = [
     "AnkiAssetManager",
     "has_newer_version",
     "sync_assets",
+    "sync_assets_in_background",
 ]
 
 
 class AssetManager(Protocol):
-    """An object that can install and delete an add-on’s assets."""
+    """An object that can install, update, and delete an add-on’s assets."""
 
     def install_assets(self) -> None:
         return None
@@ -40,6 +42,17 @@ class AssetManager(Protocol):
     def delete_assets(self) -> None:
         return None
 
+    def update_assets(self) -> None:
+        return None
+
+    def prepare_update(self) -> Callable[[], None]:
+        """Prepares `update_assets` and returns the step that applies it.
+
+        The preparation may run in the background. Run the returned step on
+        the main thread.
+        """
+        return self.update_assets
+
 
 def has_newer_version(media: MediaManager, version_asset: str) -> bool:
     """
@@ -94,6 +107,12 @@ class AnkiAssetManager:
     def delete_assets(self) -> None:
         self.media_installer.delete_media_assets()
 
+    def update_assets(self) -> None:
+        self.media_installer.update_media_assets()
+
+    def prepare_update(self) -> Callable[[], None]:
+        return self.media_installer.prepare_media_update()
+
 
 addon_path = os.path.dirname(__file__)
 
@@ -113,10 +132,52 @@ def assets_directory() -> pathlib.Path:
 def sync_assets(
     has_newer_version: Callable[[], bool], asset_manager: AssetManager
 ) -> None:
-    """Checks if assets need updating and updates them."""
+    """Checks if assets need updating and updates them.
+
+    Only assets whose contents have changed are replaced, so that Anki's media
+    sync doesn't upload unchanged files again.
+    """
     if has_newer_version():
-        asset_manager.delete_assets()
-        asset_manager.install_assets()
+        asset_manager.update_assets()
+
+
+def sync_assets_in_background(
+    has_newer_version: Callable[[], bool],
+    asset_manager: AssetManager,
+    runner: BackgroundRunner,
+) -> Future[None]:
+    """Like `sync_assets`, but checks and prepares the update in the background.
+
+    Only the step that registers the changes with Anki runs on the main thread.
+
+    Args:
+        has_newer_version: The check of whether assets need updating.
+        asset_manager: The asset manager.
+        runner: The runner of the background work.
+
+    Returns:
+        The future of the sync. It resolves on the main thread once the assets
+        are up to date.
+    """
+    synced: Future[None] = Future()
+
+    def prepare() -> Optional[Callable[[], None]]:
+        if not has_newer_version():
+            return None
+        return asset_manager.prepare_update()
+
+    def on_prepared(future: Future) -> None:
+        try:
+            apply = future.result()
+            if apply is not None:
+                apply()
+        except Exception as e:
+            synced.set_exception(e)
+            return None
+        synced.set_result(None)
+
+    runner(prepare, on_prepared)
+    return synced
 
 
 def get_addon_assets(asset_prefix: str) -> list[Path]:
@@ -141,20 +202,12 @@ class State(typing.Generic[T]):
         self.value = val
 
 
-@contextlib.contextmanager
-def AnkiAssetStateManager(
+def read_asset_state(
     media: MediaManager, path: pathlib.Path, serializer: Serializer[T], default: T
-) -> typing.Generator[State[T], None, None]:
+) -> T:
+    """Reads a state stored in a media asset."""
     try:
         with open_media_asset(media, path, "r") as f:
-            content = serializer.loads(f.read()) or default
+            return serializer.loads(f.read()) or default
     except Exception:
-        content = default
-
-    state: State[T] = State(content)
-    try:
-        yield state
-    finally:
-        with open_media_asset(media, path, "w") as f:
-            serialized_content = serializer.dumps(state.get())
-            f.write(serialized_content)
+        return default
@@ -0,0 +1,89 @@
+"""Utilities for running work off the main thread.
+
+The add-on's GUI code runs on Qt's main thread. Long-running work, e.g.,
+highlighting a huge snippet, goes through a `BackgroundRunner`, which runs a
+task and hands its future to a callback on the main thread. Tests and other
+GUI-less callers use `run_in_foreground`.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, Protocol
+
+__all__ = [
+    "BackgroundRunner",
+    "CancellationToken",
+    "Cancelled",
+    "NoProgress",
+    "Progress",
+    "Scheduler",
+    "run_in_foreground",
+]
+
+
+class Cancelled(Exception):
+    """Raised by a task that noticed that it has been cancelled."""
+
+
+class CancellationToken:
+    """A thread-safe flag that asks a task to stop."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raises Cancelled if the token has been cancelled."""
+        if self._event.is_set():
+            raise Cancelled()
+
+
+# Runs a task and calls the callback with the task's future on the main
+# thread. Anki's `mw.taskman.run_in_background` has this shape.
+BackgroundRunner = Callable[[Callable[[], Any], Callable[[Future], None]], None]
+
+
+# Calls a function on the main thread after a delay in seconds, e.g., with a
+# Qt timer.
+Scheduler = Callable[[float, Callable[[], None]], None]
+
+
+def run_in_foreground(
+    task: Callable[[], Any], on_done: Callable[[Future], None]
+) -> None:
+    """A BackgroundRunner that runs the task on the calling thread."""
+    future: Future = Future()
+    try:
+        future.set_result(task())
+    except Exception as e:
+        future.set_exception(e)
+    on_done(future)
+
+
+class Progress(Protocol):
+    """A progress indicator for a cancellable background task."""
+
+    def start(self, token: CancellationToken) -> None:
+        """Shows the indicator. Cancelling it cancels the token."""
+        ...
+
+    def finish(self) -> None:
+        """Hides the indicator."""
+        ...
+
+
+class NoProgress:
+    """A Progress that shows nothing."""
+
+    def start(self, token: CancellationToken) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
@@ -1,13 +1,85 @@
-"""This module handles the JSON add-on config."""
+"""This module handles the JSON add-on config.
 
+Anki reads and merges the config's JSON on every `getConfig` call, so this
+module keeps a validated snapshot (`snapshot`) until the user edits the
+config.
+"""
+
+import dataclasses
+import functools
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 import aqt
 
+__all__ = [
+    "AddonConfig",
+    "Config",
+    "config",
+    "get",
+    "invalidate",
+    "snapshot",
+    "watch_updates",
+]
+
 # A config is a dictionary.
 Config = dict[str, Any]
 
 
+def _key(key: str, default: Any) -> Any:
+    return dataclasses.field(default=default, metadata={"key": key})
+
+
+@dataclass(frozen=True)
+class AddonConfig:
+    """The add-on's typed config.
+
+    A value that is missing or has a wrong type falls back to its default.
+    """
+
+    block_style: str = _key("block-style", "display:flex; justify-content:center;")
+    auto_detect_display_style: bool = _key("auto-detect-display-style", True)
+    shortcut: str = _key("shortcut", "ctrl+o")
+    auto_update_media: bool = _key("auto-update-media", True)
+    dev_mode: bool = _key("dev-mode", False)
+    persistent_highlight_cache: bool = _key("persistent-highlight-cache", True)
+    highlight_time_budget: float = _key("highlight-time-budget", 5)
+    highlight_memory_budget: float = _key("highlight-memory-budget", 512)
+    warm_up_budget: float = _key("warm-up-budget", 2)
+
+    @classmethod
+    def from_dict(cls, config: Config) -> "AddonConfig":
+        """Parses and validates a config dictionary.
+
+        Args:
+            config: The config dictionary.
+
+        Returns:
+            The typed config.
+        """
+        types = typing.get_type_hints(cls)
+        values: dict[str, Any] = {}
+        for field in dataclasses.fields(cls):
+            value = config.get(field.metadata["key"])
+            if _is_valid(value, types[field.name]):
+                values[field.name] = value
+        return cls(**values)
+
+
+def _is_valid(value: Any, expected_type: type) -> bool:
+    if expected_type is bool:
+        return isinstance(value, bool)
+    if expected_type is float:
+        # JSON doesn't distinguish ints from floats, but bool is an int.
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if expected_type is str:
+        # An empty string means the default, e.g., an empty shortcut.
+        return isinstance(value, str) and value != ""
+    return isinstance(value, expected_type)
+
+
 def config() -> Config:
     """Returns the add-on's config.
 
@@ -26,9 +98,28 @@ def config() -> Config:
     return file_config
 
 
+@functools.cache
+def _cached_config() -> Config:
+    return config()
+
+
+@functools.cache
+def snapshot() -> AddonConfig:
+    """Returns the add-on's typed config.
+
+    The snapshot stays the same until `invalidate` is called.
+
+    Raises:
+        RuntimeError: If the Anki main window is not available.
+    """
+    return AddonConfig.from_dict(_cached_config())
+
+
 def get(key: str, default: Any = None) -> Any:
     """Returns the value for the given configuration key.
 
+    Prefer the typed `snapshot` for known keys.
+
     Args:
         key: The configuration key to retrieve.
         default: The default value to return if the key is not found
@@ -40,5 +131,27 @@ def get(key: str, default: Any = None) -> Any:
     Raises:
         RuntimeError: If the Anki main window is not available.
     """
-    config_snapshot = config()
-    return config_snapshot.get(key, default)
+    return _cached_config().get(key, default)
+
+
+def invalidate(*_: Any) -> None:
+    """Drops the cached config, e.g., after the user has edited it."""
+    _cached_config.cache_clear()
+    snapshot.cache_clear()
+
+
+def watch_updates(*listeners: Callable[[], Any]) -> None:
+    """Invalidates the cached config whenever the user edits it in Anki.
+
+    Args:
+        listeners: Functions to call after the invalidation, e.g., to rebuild
+            objects that were created from the old config.
+    """
+
+    def on_update(*_: Any) -> None:
+        invalidate()
+        for listener in listeners:
+            listener()
+
+    if aqt.mw:
+        aqt.mw.addonManager.setConfigUpdatedAction(__name__, on_update)
@@ -11,15 +11,17 @@ this module.
 
 import dataclasses
 import enum
+import time
 import typing
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, Tuple, Union
 
 from aqt.qt import QInputDialog
 
-from . import pygments_highlighter
-from .fuzzy_finder_dialog import FuzzyFinderDialog
+from .frecency import Frecency, FrecencyJSONConverter
+from .fuzzy_finder_dialog import FuzzyFinderDialog, OptionFilter, OptionPreviewer
 from .listextra import index_or
 from .serialization import JSONObjectConverter
 
@@ -77,27 +79,27 @@ def showChoiceDialog(
 
 def ask_for_language(
     parent,
-    languages: List[str],
+    languages: Union[List[str], OptionFilter],
     current: Optional[str],
+    previewer: Optional[OptionPreviewer] = None,
 ) -> Optional[str]:
     """Shows a dialog asking for a programming language with a fuzzy finder.
 
     Args:
         parent: The parent widget.
-        languages: A list of available programming languages.
-        current: The default language to preselect.
+        languages: A list of available programming languages, or an index
+            that finds them, e.g., a `LanguageIndex`.
+        current: The default language to preselect if it's listed.
+        previewer: The previewer of the snippet in the selected language.
 
     Returns:
         The selected language, or None if cancelled.
     """
     enter_lang = "Language"
-    provide_lang_long = "Select the snippet’s language (e.g., C++)"
-
-    if current not in languages:
-        current = None
+    provide_lang_long = "Select the snippet’s language (e.g., C++, py, .rs)"
 
     return FuzzyFinderDialog.ask(
-        parent, enter_lang, provide_lang_long, languages, current
+        parent, enter_lang, provide_lang_long, languages, current, previewer
     )
 
 
@@ -200,10 +202,16 @@ class PygmentsConfigJSONConverter(JSONObjectConverter[PygmentsConfig]):
         return config_dict
 
 
+# Creates a previewer of the snippet in languages for a display style.
+LanguagePreviewFactory = Callable[[DISPLAY_STYLE], OptionPreviewer]
+
+
 def ask_for_pygments_config(
     parent,
     preselected: PartialPygmentsConfig,
     defaults: PygmentsConfig,
+    language_preferences: Optional[Mapping[str, float]] = None,
+    language_preview: Optional[LanguagePreviewFactory] = None,
 ) -> Optional[PartialPygmentsConfig]:
     """Shows a wizard that configures Pygments.
 
@@ -212,6 +220,9 @@ def ask_for_pygments_config(
         preselected: The preselected configuration. The wizard will only ask for
           the other options.
         defaults: The default configuration.
+        language_preferences: Scores of the languages to list first, e.g.,
+          their frecency.
+        language_preview: The factory of the language list's previewer.
 
     Returns:
         The selected Pygments configuration, or None if cancelled.
@@ -224,9 +235,21 @@ def ask_for_pygments_config(
         selected = dataclasses.replace(selected, display_style=display_style)
 
     if preselected.language is None:
-        available_languages = list(pygments_highlighter.get_available_languages())
+        # Import Pygments only once the wizard needs it.
+        from . import pygments_highlighter
+
+        language_index = pygments_highlighter.get_language_index()
+        language_index.set_preferences(language_preferences or {})
+        display_style = (
+            selected.display_style
+            or preselected.display_style
+            or defaults.display_style
+        )
         language = ask_for_language(
-            parent=parent, languages=available_languages, current=defaults.language
+            parent=parent,
+            languages=language_index,
+            current=defaults.language,
+            previewer=language_preview(display_style) if language_preview else None,
         )
         if not language:
             return None
@@ -243,28 +266,35 @@ class HighlighterWizardState:
 
     Attributes:
         pygments_config: The Pygments configuration.
+        language_frecency: How frequently and recently the user has chosen
+            each language.
     """
 
     pygments_config: PygmentsConfig = PygmentsConfig(
         display_style=DISPLAY_STYLE.BLOCK, language="C++"
     )
+    language_frecency: Frecency = dataclasses.field(default_factory=Frecency)
 
 
 class HighlighterWizardStateJSONConverter(JSONObjectConverter[HighlighterWizardState]):
 
     def __init__(self):
         self.pc = PygmentsConfigJSONConverter()
+        self.frecency = FrecencyJSONConverter()
 
     def deconvert(self, json_object) -> Optional[HighlighterWizardState]:
         pc = self.pc.deconvert(json_object["pygments_config"])
         if pc is None:
             return None
 
-        return HighlighterWizardState(pc)
+        # Older states have no frecency.
+        frecency = self.frecency.deconvert(json_object.get("language_frecency"))
+        return HighlighterWizardState(pc, frecency or Frecency())
 
     def convert(self, t: HighlighterWizardState):
         config_dict = dict()
         config_dict["pygments_config"] = self.pc.convert(t.pygments_config)
+        config_dict["language_frecency"] = self.frecency.convert(t.language_frecency)
         return config_dict
 
 
@@ -276,6 +306,7 @@ def ask_for_highlighter_config(
     parent,
     preselected: PartialPygmentsConfig,
     state: HighlighterWizardState,
+    language_preview: Optional[LanguagePreviewFactory] = None,
 ) -> Tuple[Optional[HighlighterConfig], HighlighterWizardState]:
     """Shows a wizard that configures a highlighter.
 
@@ -285,13 +316,19 @@ def ask_for_highlighter_config(
         parent: The parent widget.
         preselected: Preselected config options that the wizard should not ask for.
         state: The state of the wizard to use.
+        language_preview: The factory of the language list's previewer.
 
     Returns:
         A tuple containing the selected configuration (or None if cancelled)
         and the updated wizard state.
     """
+    now = time.time()
     selected_pygments_config = ask_for_pygments_config(
-        parent, preselected=preselected, defaults=state.pygments_config
+        parent,
+        preselected=preselected,
+        defaults=state.pygments_config,
+        language_preferences=state.language_frecency.scores(now),
+        language_preview=language_preview,
     )
     if selected_pygments_config is None:
         return (None, state)
@@ -307,5 +344,11 @@ def ask_for_highlighter_config(
 
     return (
         final_pygments_config,
-        dataclasses.replace(state, pygments_config=new_state),
+        dataclasses.replace(
+            state,
+            pygments_config=new_state,
+            language_frecency=state.language_frecency.record(
+                final_pygments_config.language, now
+            ),
+        ),
     )
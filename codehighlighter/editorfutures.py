@@ -0,0 +1,135 @@
+"""A future-based facade over `EditorInterface`.
+
+`EditorInterface` takes a callback per call, so a flow of nested callbacks
+waits for each call to finish before it issues the next one. `EditorFutures`
+returns a `concurrent.futures.Future` per call instead. Each call is issued
+right away, so independent calls overlap. The webview runs the calls in the
+order they were issued, so a flow can also pipeline dependent calls, e.g.,
+set a field and then replace a selection in it, without waiting in between.
+
+The editor calls back on the main thread, so the futures resolve and run
+their callbacks there, too.
+"""
+
+from __future__ import annotations
+
+import typing
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .ankieditorextra import (
+        EditorInterface,
+        ReplaceWrapSelection,
+        SelectedText,
+        SelectionException,
+        UnwrapSelection,
+    )
+
+__all__ = ["EditorFutures", "then"]
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+
+
+class EditorFutures:
+    """Issues editor calls that return futures.
+
+    A future that has been cancelled, e.g., with `cancel`, ignores the
+    editor's late result.
+    """
+
+    def __init__(self, editor: EditorInterface):
+        self.editor = editor
+        self._pending: set[Future] = set()
+
+    def wrap_and_get_selection(
+        self,
+    ) -> Future[Union[SelectedText, SelectionException]]:
+        return self._call(self.editor.wrap_and_get_selection)
+
+    def unwrap_selection(
+        self, action: Union[UnwrapSelection, ReplaceWrapSelection]
+    ) -> Future[typing.Any]:
+        return self._call(self.editor.unwrap_selection, action)
+
+    def replace_selection_and_ensure_styles(
+        self, action: ReplaceWrapSelection, style_block: str
+    ) -> Future[Union[bool, SelectionException]]:
+        return self._call(
+            self.editor.replace_selection_and_ensure_styles, action, style_block
+        )
+
+    def get_note_field(self) -> Future[Union[str, SelectionException]]:
+        return self._call(self.editor.get_note_field)
+
+    def set_note_field(self, html: str) -> Future[Union[None, SelectionException]]:
+        return self._call(self.editor.set_note_field, html)
+
+    def cancel(self) -> None:
+        """Cancels all calls that haven't returned yet."""
+        for future in list(self._pending):
+            future.cancel()
+
+    def _call(self, method: Callable[..., None], *args) -> Future:
+        future: Future = Future()
+        self._pending.add(future)
+
+        def resolve(result: typing.Any) -> None:
+            self._pending.discard(future)
+            _resolve(future, result)
+
+        method(*args, resolve)
+        return future
+
+
+def then(future: Future[T], fn: Callable[[T], Union[U, Future[U]]]) -> Future[U]:
+    """Returns a future of `fn` applied to the future's result.
+
+    If `fn` returns a future, the returned future resolves with that future's
+    result. Cancelling `future` cancels the returned future. If `fn` raises,
+    the returned future fails, and the exception also propagates, so that
+    `concurrent.futures` logs it.
+
+    Args:
+        future: The future.
+        fn: The function to call with the future's result.
+
+    Returns:
+        The future of the function's result.
+    """
+    result: Future[U] = Future()
+
+    def on_done(done: Future[T]) -> None:
+        if done.cancelled():
+            result.cancel()
+            return None
+        try:
+            value = fn(done.result())
+        except Exception as e:
+            if not result.cancelled():
+                result.set_exception(e)
+            raise
+        if isinstance(value, Future):
+            value.add_done_callback(lambda inner: _copy(inner, result))
+        else:
+            _resolve(result, value)
+
+    future.add_done_callback(on_done)
+    return result
+
+
+def _resolve(future: Future, value: typing.Any) -> None:
+    if not future.cancelled():
+        future.set_result(value)
+
+
+def _copy(source: Future, target: Future) -> None:
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        if not target.cancelled():
+            target.set_exception(source.exception())
+    else:
+        _resolve(target, source.result())
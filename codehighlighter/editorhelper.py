@@ -0,0 +1,366 @@
+"""The JavaScript helper that the add-on preloads into Anki's editor.
+
+The add-on talks to the editor webview through Qt's JavaScript bridge. Instead
+of sending a full script body on every call, the add-on injects a versioned
+helper namespace once per editor page (see `inject_editor_helper`). A call is
+then a short function invocation with JSON arguments.
+
+Large text arguments, e.g., a multi-megabyte highlighted snippet, travel in
+bounded chunks (see `encode_text`), so that the webview never has to parse one
+huge script.
+"""
+
+import itertools
+import json
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Optional
+
+import aqt  # type: ignore
+
+__all__ = [
+    "BridgeStats",
+    "EDITOR_HELPER_JS",
+    "EDITOR_HELPER_VERSION",
+    "FAILED_TO_FIND_FIELD",
+    "FAILED_TO_FIND_SELECTION",
+    "TRANSFER_CHUNK_SIZE",
+    "call_editor_helper",
+    "encode_text",
+]
+
+# Bump the version whenever the helper's functions change, so that a stale
+# helper from an older version of the add-on doesn't serve calls.
+EDITOR_HELPER_VERSION = 3
+
+FAILED_TO_FIND_SELECTION = "Failed to find a selection."
+FAILED_TO_FIND_FIELD = "Failed to find the active note field."
+
+# The number of characters of a text argument that one call transfers.
+TRANSFER_CHUNK_SIZE = 256 * 1024
+
+_transfer_ids = itertools.count()
+
+# The helper's functions return a result or `{ error: ... }`.
+#
+# Not using Anki's own `wrap` function uses `document.execCommand`, which is
+# deprecated and doesn't work for inline selections. Using the Range API is
+# better as it doesn't suffer from those drawbacks.
+#
+# We need to wrap the selection in a tag, because `transform` may lose focus
+# (e.g., by presenting a modal dialog) and with it, the selection.
+#
+# `wrapAndGetSelection` returns the rendered selected text. A previous version
+# of this code return the inner HTML
+# (`document.activeElement.shadowRoot.innerHTLM`). The former is more useful:
+# the user usually cares about highlighting the text they see, not some
+# abstract HTML representation. Having the reparse HTML was more complex and
+# fragile.
+#
+# `unwrapSelection` replaces the selection span directly in the webview. This
+# approach is simpler and more robust than replacing the selection inside
+# Python and flushing the new note to Anki's DB:
+#
+# * We avoid having to figure out flush field changes DB and see them
+#   reflected in the webview.
+# * The field's representation in webview and the serialized note can differ
+#   significantly. Mathjax expressions in a webview are a complex HTML element,
+#   while they get serialized to `\(expr\)` inside a note. Not having to
+#   reconcile that is good, as we don't have to touch non-selection code.
+EDITOR_HELPER_JS = (
+    """
+globalThis.gchEditor = {
+  version: """
+    + str(EDITOR_HELPER_VERSION)
+    + """,
+
+  // Chunks of text arguments, keyed by transfer ID. They survive a
+  // re-injection of the helper.
+  transfers: globalThis.gchEditor?.transfers ?? new Map(),
+
+  call(name, ...args) {
+    try {
+      return this[name](...args);
+    } catch (e) {
+      if ("name" in e && "message" in e)
+        return { error: { name: e.name, message: e.message } };
+      return { error: JSON.stringify(e) };
+    }
+  },
+
+  appendChunk(transferId, chunk) {
+    const chunks = this.transfers.get(transferId) ?? [];
+    chunks.push(chunk);
+    this.transfers.set(transferId, chunks);
+    return null;
+  },
+
+  // Resolves a text argument: a string, null, or a completed transfer.
+  text(arg) {
+    if (arg === null || typeof arg === "string") return arg;
+    const chunks = this.transfers.get(arg.transfer) ?? [];
+    this.transfers.delete(arg.transfer);
+    if (chunks.length !== arg.chunks) {
+      throw new Error("The transfer of a text argument is incomplete.");
+    }
+    return chunks.join("");
+  },
+
+  field() {
+    return document.activeElement.shadowRoot.querySelector("anki-editable");
+  },
+
+  wrapAndGetSelection(wrapId) {
+    const selection = document.activeElement.shadowRoot.getSelection();
+    const selectionText = selection.toString();
+    if (selection.rangeCount == 0)
+      return { error: { name: "InvalidStateError", message: """
+    + json.dumps(FAILED_TO_FIND_SELECTION)
+    + """ } };
+    const range = selection.getRangeAt(selection.rangeCount - 1);
+    if (!range) return;
+    const spanTag = document.createElement("span");
+    spanTag["id"] = wrapId;
+    try {
+      range.surroundContents(spanTag);
+      return { selectionText };
+    } catch (e) {
+      if (!(e instanceof DOMException)) {
+        throw e;
+      }
+      // Try an alternative approach.
+      const selectedContent = range.extractContents();
+      spanTag.appendChild(selectedContent);
+      range.insertNode(spanTag);
+      return { selectionText };
+    }
+  },
+
+  // Replaces the selection span with `html` or, if it's null, with its
+  // contents.
+  unwrapSelection(wrapId, html) {
+    // Resolve the text before touching the DOM, so that the commit is atomic.
+    html = this.text(html);
+    const selection = document.activeElement.shadowRoot.getElementById(wrapId);
+    // A hack against spurious br-tags that get inserted by the Anki editor.
+    // https://github.com/gregorias/anki-code-highlighter/issues/51
+    if (selection.nextElementSibling?.tagName === "BR" && selection.nextElementSibling.nextSibling === null) {
+      selection.nextElementSibling.remove();
+    }
+    if (html === null) {
+      selection.replaceWith(...selection.childNodes);
+    } else {
+      selection.outerHTML = html;
+    }
+    return null;
+  },
+
+  // Compares and inserts nodes instead of going through `innerHTML`, which
+  // would serialize or re-render the whole field.
+  replaceSelectionAndEnsureStyles(wrapId, html, styleBlock) {
+    this.unwrapSelection(wrapId, html);
+    const element = this.field();
+    if (!element) {
+      return { error: { message: """
+    + json.dumps(FAILED_TO_FIND_FIELD)
+    + """ } };
+    }
+    const template = document.createElement("template");
+    template.innerHTML = styleBlock;
+    const isBlank = (node) =>
+      node.nodeType === Node.TEXT_NODE && node.data.trim() === "";
+    const blockNodes = [...template.content.childNodes].filter((n) => !isBlank(n));
+    const fieldNodes = [...element.childNodes].filter((n) => !isBlank(n));
+    if (blockNodes.every((node, i) => node.isEqualNode(fieldNodes[i]))) {
+      return { styles: "current" };
+    }
+    // Replace a stale block, e.g., from an older version, from its first
+    // opening guard to its last closing guard.
+    const guardBegin = blockNodes[0].data;
+    const guardEnd = blockNodes[blockNodes.length - 1].data;
+    let staleBegin = null;
+    let staleEnd = null;
+    const comments = document.createTreeWalker(element, NodeFilter.SHOW_COMMENT);
+    while (comments.nextNode()) {
+      const data = comments.currentNode.data;
+      if (data === guardBegin && staleBegin === null) {
+        staleBegin = comments.currentNode;
+      } else if (data === guardEnd && staleBegin !== null) {
+        staleEnd = comments.currentNode;
+      }
+    }
+    if (staleBegin !== null && staleEnd === null) {
+      // A block without its closing guard is not ours to cut.
+      return { styles: "stale" };
+    }
+    if (staleBegin !== null) {
+      const range = document.createRange();
+      range.setStartBefore(staleBegin);
+      range.setEndAfter(staleEnd);
+      range.deleteContents();
+      while (element.firstChild && isBlank(element.firstChild)) {
+        element.firstChild.remove();
+      }
+    }
+    const gap = element.hasChildNodes() ? [document.createTextNode("\\n")] : [];
+    element.prepend(...template.content.childNodes, ...gap);
+    return { styles: staleBegin === null ? "inserted" : "replaced" };
+  },
+
+  getNoteField() {
+    const element = this.field();
+    return element ? element.innerHTML : null;
+  },
+
+  setNoteField(html) {
+    html = this.text(html);
+    const element = this.field();
+    if (!element) {
+      return { error: { message: """
+    + json.dumps(FAILED_TO_FIND_FIELD)
+    + """ } };
+    }
+    element.innerHTML = html;
+    return null;
+  },
+};
+"""
+)
+
+
+@dataclass
+class BridgeStats:
+    """Counters of the editor bridge's traffic.
+
+    Attributes:
+        calls: The number of helper calls.
+        sent_bytes: The size of the scripts sent to the webview.
+        received_bytes: The size of the JSON results received from the
+            webview.
+        injections: The number of times the helper had to be re-injected,
+            e.g., after a page reload.
+    """
+
+    calls: int = 0
+    sent_bytes: int = 0
+    received_bytes: int = 0
+    injections: int = 0
+
+
+def call_editor_helper(
+    webview: aqt.editor.EditorWebView,
+    function: str,
+    args: list[str],
+    callback: Callable[[typing.Any], None],
+    stats: Optional[BridgeStats] = None,
+) -> None:
+    """Calls a function of the editor helper and calls `callback` with the result.
+
+    If the webview doesn't have the current helper, e.g., because the page has
+    been reloaded, this function injects it and calls the function again.
+
+    On exception, gives the callback a dictionary
+    ({'error': {'name': str, 'message', str}}) or just {'error': str}.
+
+    Args:
+        webview: The editor webview.
+        function: The name of the helper function.
+        args: The JavaScript expressions of the function's arguments, e.g.,
+            JSON values.
+        callback: The callback function.
+        stats: Optional counters of the bridge's traffic.
+
+    Returns:
+        None.
+    """
+    call = f"gchEditor.call({', '.join([json.dumps(function), *args])})"
+    js = (
+        f"globalThis.gchEditor?.version === {EDITOR_HELPER_VERSION}"
+        + f" ? {call} : {{ missingHelper: true }}"
+    )
+
+    def send(script: str, on_result: Callable[[typing.Any], None]) -> None:
+        if stats is not None:
+            stats.calls += 1
+            stats.sent_bytes += len(script.encode())
+        webview.evalWithCallback(script, on_result)
+
+    def count(result: typing.Any) -> typing.Any:
+        if stats is not None:
+            stats.received_bytes += len(json.dumps(result).encode())
+        return result
+
+    def handle_result(result: typing.Any) -> None:
+        if isinstance(result, dict) and result.get("missingHelper"):
+            if stats is not None:
+                stats.injections += 1
+            send(f"{EDITOR_HELPER_JS}\n{call};", lambda r: callback(count(r)))
+            return None
+        callback(count(result))
+
+    send(js, handle_result)
+
+
+def encode_text(
+    webview: aqt.editor.EditorWebView,
+    text: Optional[str],
+    on_encoded: Callable[[str], None],
+    on_error: Callable[[typing.Any], None],
+    stats: Optional[BridgeStats] = None,
+) -> None:
+    """Makes a text available as an argument of an editor helper call.
+
+    A short text is encoded as a JSON string. A long text is sent to the
+    webview in chunks of TRANSFER_CHUNK_SIZE characters, and its argument
+    refers to the transfer. The helper function that receives the argument
+    reassembles the text, or fails before touching the DOM if a chunk is
+    missing.
+
+    Args:
+        webview: The editor webview.
+        text: The text. None is encoded as null.
+        on_encoded: The callback function to receive the argument's
+            JavaScript expression once the webview can accept the call.
+        on_error: The callback function to receive an error result if the
+            transfer has failed.
+        stats: Optional counters of the bridge's traffic.
+
+    Returns:
+        None.
+    """
+    if text is None or len(text) <= TRANSFER_CHUNK_SIZE:
+        on_encoded(json.dumps(text))
+        return None
+
+    transfer_id = str(next(_transfer_ids))
+    chunks = [
+        text[i : i + TRANSFER_CHUNK_SIZE]
+        for i in range(0, len(text), TRANSFER_CHUNK_SIZE)
+    ]
+
+    def on_first_chunk(result: typing.Any) -> None:
+        if isinstance(result, dict) and "error" in result:
+            on_error(result)
+            return None
+        # The first chunk has made sure that the helper is there. The webview
+        # runs scripts in order, so the remaining chunks and the call that
+        # uses them don't have to wait for each other. The call detects lost
+        # chunks.
+        for chunk in chunks[1:]:
+            call_editor_helper(
+                webview,
+                "appendChunk",
+                [json.dumps(transfer_id), json.dumps(chunk)],
+                lambda _: None,
+                stats,
+            )
+        on_encoded(json.dumps({"transfer": transfer_id, "chunks": len(chunks)}))
+
+    call_editor_helper(
+        webview,
+        "appendChunk",
+        [json.dumps(transfer_id), json.dumps(chunks[0])],
+        on_first_chunk,
+        stats,
+    )
@@ -2,7 +2,7 @@
 
 from .guard import delete_guarded_snippet, guard_html_comments, prepend_guarded_snippet
 
-__all__ = ["set_up_style_import"]
+__all__ = ["set_up_style_import", "style_import_block"]
 
 
 def set_up_style_import(
@@ -24,8 +24,25 @@ def set_up_style_import(
     """
     guards = guard_html_comments(guard)
     cleaned_html = delete_guarded_snippet(html, guards)
+    return prepend_guarded_snippet(cleaned_html, _style_import(css_assets), guards)
+
+
+def style_import_block(css_assets: list[str], guard: str) -> str:
+    """Returns the guarded stylesheet import block.
+
+    A field that is set up with `set_up_style_import` starts with this block.
+
+    Args:
+        css_assets: The list of CSS files to import.
+        guard: The guard string to identify the snippet.
+
+    Returns:
+        The guarded stylesheet import block.
+    """
+    guard_begin, guard_end = guard_html_comments(guard)
+    return guard_begin + _style_import(css_assets) + guard_end
 
-    imports = "".join(f'  @import "{css_asset}";\n' for css_asset in css_assets)
-    snippet = f"<style>\n{imports}</style>\n"
 
-    return prepend_guarded_snippet(cleaned_html, snippet, guards)
+def _style_import(css_assets: list[str]) -> str:
+    imports = "".join(f'  @import "{css_asset}";\n' for css_asset in css_assets)
+    return f"<style>\n{imports}</style>\n"
@@ -0,0 +1,105 @@
+"""Ranks items by how frequently and recently they have been used.
+
+Each use adds one to an item's score, and scores halve every `HALF_LIFE`
+seconds, so an item used daily outranks one used often a few months ago.
+`Frecency` keeps only the `capacity` best items, so that saving it costs the
+same however long it has been in use.
+"""
+
+import math
+import typing
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from .serialization import JSONObjectConverter
+
+__all__ = ["Frecency", "FrecencyEntry", "FrecencyJSONConverter", "HALF_LIFE"]
+
+# A week in seconds.
+HALF_LIFE = 7 * 24 * 60 * 60
+
+
+class FrecencyEntry(NamedTuple):
+    """An item's score at the time of its last use."""
+
+    score: float
+    last_used: float
+
+
+@dataclass(frozen=True)
+class Frecency:
+    """The frecency of used items.
+
+    Attributes:
+        entries: The entries of the used items.
+        capacity: How many items to remember.
+    """
+
+    entries: Mapping[str, FrecencyEntry] = field(default_factory=dict)
+    capacity: int = 16
+
+    def score(self, item: str, now: float) -> float:
+        """Returns the item's score at the given time, 0 if it's unused."""
+        entry = self.entries.get(item)
+        if entry is None:
+            return 0
+        return _decay(entry, now)
+
+    def scores(self, now: float) -> dict[str, float]:
+        """Returns the scores of all used items at the given time."""
+        return {item: _decay(entry, now) for item, entry in self.entries.items()}
+
+    def top(self, now: float, count: int) -> list[str]:
+        """Returns up to count used items, the highest scored first."""
+        return sorted(
+            self.entries, key=lambda i: _decay(self.entries[i], now), reverse=True
+        )[:count]
+
+    def record(self, item: str, now: float) -> "Frecency":
+        """Returns the frecency after a use of the item.
+
+        Args:
+            item: The used item.
+            now: The time of use in seconds since the epoch.
+
+        Returns:
+            The updated frecency. It forgets the lowest scored items beyond
+            its capacity.
+        """
+        entries = dict(self.entries)
+        entries[item] = FrecencyEntry(self.score(item, now) + 1, now)
+        if len(entries) > self.capacity:
+            best = sorted(entries, key=lambda i: _decay(entries[i], now), reverse=True)
+            entries = {i: entries[i] for i in best[: self.capacity]}
+        return Frecency(entries, self.capacity)
+
+
+def _decay(entry: FrecencyEntry, now: float) -> float:
+    elapsed = max(0.0, now - entry.last_used)
+    return entry.score * math.pow(0.5, elapsed / HALF_LIFE)
+
+
+class FrecencyJSONConverter(JSONObjectConverter[Frecency]):
+    """Converts a frecency to a JSON object of [score, last_used] pairs."""
+
+    def deconvert(self, json_object: typing.Any) -> Optional[Frecency]:
+        if not isinstance(json_object, dict):
+            return None
+        entries = {}
+        for item, entry in json_object.items():
+            # Skip malformed entries instead of dropping the whole history.
+            if (
+                isinstance(entry, list)
+                and len(entry) == 2
+                and all(_is_number(x) for x in entry)
+            ):
+                entries[item] = FrecencyEntry(float(entry[0]), float(entry[1]))
+        return Frecency(entries)
+
+    def convert(self, t: Frecency):
+        return {item: list(entry) for item, entry in t.entries.items()}
+
+
+def _is_number(x: typing.Any) -> bool:
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
@@ -1,6 +1,7 @@
 """A fuzzy finder dialog for selecting items."""
 
-from typing import Any, List, Optional
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, List, Optional, Protocol, Union, runtime_checkable
 
 from aqt.qt import (
     QDialog,
@@ -8,33 +9,87 @@ from aqt.qt import (
     QEvent,
     QLabel,
     QLineEdit,
-    QListWidget,
+    QListView,
+    QStringListModel,
     Qt,
+    QTextBrowser,
     QVBoxLayout,
 )
 
+__all__ = [
+    "FuzzyFinderDialog",
+    "OptionFilter",
+    "OptionIndex",
+    "OptionPreviewer",
+    "filter_and_sort_options",
+    "is_subsequence",
+    "score_match",
+]
+
+
+@runtime_checkable
+class OptionFilter(Protocol):
+    """Ranks options for the user's query."""
+
+    def filter(self, query: str) -> List[str]:
+        """Returns the options that match the query, best first."""
+        ...
+
+
+class OptionPreviewer(Protocol):
+    """Previews the selected option in the finder's preview pane."""
+
+    def preview(self, option: str, show: Callable[[str], None]) -> None:
+        """Previews the option by calling `show` with HTML, now or later."""
+        ...
+
+    def cancel(self) -> None:
+        """Drops the pending preview."""
+        ...
+
 
 class FuzzyFinderDialog(QDialog):
+    """A dialog that lets the user pick an option by typing parts of it.
+
+    Building the dialog takes a while on slow machines, so `ask` keeps one
+    dialog per parent window and resets it for the next question.
+    """
+
+    # The kept dialogs by their class and parent.
+    _kept: dict[tuple[type, int], "FuzzyFinderDialog"] = {}
+
     def __init__(
         self,
         parent,
         title: str,
         label_text: str,
-        options: List[str],
+        options: Union[List[str], OptionFilter],
         current: Optional[str] = None,
+        previewer: Optional[OptionPreviewer] = None,
     ):
+        """
+        Args:
+            parent: The parent widget.
+            title: The window title.
+            label_text: The help text above the search input.
+            options: The options, or a filter that finds them for a query.
+            current: The option to preselect.
+            previewer: The previewer of the selected option. Without one,
+                the dialog shows no preview pane.
+        """
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setMinimumWidth(350)
         self.setMinimumHeight(450)
 
-        self.options = options
+        self.options: Union[List[str], OptionFilter] = []
+        self.index: OptionFilter = OptionIndex([])
+        self.previewer: Optional[OptionPreviewer] = None
         self.selected_value: Optional[str] = None
 
         layout = QVBoxLayout(self)
 
         # Help / Label text
-        self.label = QLabel(label_text, self)
+        self.label = QLabel(self)
         layout.addWidget(self.label)
 
         # Search input
@@ -42,9 +97,23 @@ class FuzzyFinderDialog(QDialog):
         self.search_input.setPlaceholderText("Type to filter...")
         layout.addWidget(self.search_input)
 
-        # List of items
-        self.list_widget = QListWidget(self)
-        layout.addWidget(self.list_widget)
+        # List of items. The model swaps in each filtered list in one call
+        # instead of rebuilding list items.
+        self.model = QStringListModel(self)
+        self.list_view = QListView(self)
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        try:
+            no_edit_triggers = QListView.EditTrigger.NoEditTriggers
+        except AttributeError:
+            no_edit_triggers = getattr(QListView, "NoEditTriggers")
+        self.list_view.setEditTriggers(no_edit_triggers)
+        layout.addWidget(self.list_view)
+
+        # Preview of the selected option
+        self.preview = QTextBrowser(self)
+        self.preview.setMinimumHeight(150)
+        layout.addWidget(self.preview)
 
         # Standard buttons compatibility
         try:
@@ -65,28 +134,66 @@ class FuzzyFinderDialog(QDialog):
 
         # Connect signals
         self.search_input.textChanged.connect(self.filter_options)
-        self.list_widget.itemDoubleClicked.connect(self.accept)
+        self.list_view.doubleClicked.connect(self.accept)
+        selection_model = self.list_view.selectionModel()
+        assert selection_model is not None
+        selection_model.currentChanged.connect(self.preview_current)
         self.search_input.installEventFilter(self)
 
-        # Initial population
+        self.reset(title, label_text, options, current, previewer)
+
+    def reset(
+        self,
+        title: str,
+        label_text: str,
+        options: Union[List[str], OptionFilter],
+        current: Optional[str] = None,
+        previewer: Optional[OptionPreviewer] = None,
+    ) -> None:
+        """Prepares the dialog for a new question.
+
+        The dialog clears the query and the previous answer. It keeps its
+        widgets, and it keeps its list if the options haven't changed.
+        """
+        self.setWindowTitle(title)
+        self.label.setText(label_text)
+        if options != self.options:
+            self.options = options
+            self.index = (
+                options if isinstance(options, OptionFilter) else OptionIndex(options)
+            )
+        self.selected_value = None
+        if self.previewer is not None:
+            self.previewer.cancel()
+        self.previewer = previewer
+        self.preview.clear()
+        self.preview.setVisible(previewer is not None)
+
+        # Clear the query without filtering the options twice.
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
         self.filter_options("")
 
         # Select current/default if provided
-        try:
-            match_flag = Qt.MatchFlag.MatchExactly
-        except AttributeError:
-            match_flag = getattr(Qt, "MatchExactly")
-
-        if current:
-            items = self.list_widget.findItems(current, match_flag)
-            if items:
-                self.list_widget.setCurrentItem(items[0])
-                self.list_widget.scrollToItem(items[0])
-        elif self.list_widget.count() > 0:
-            self.list_widget.setCurrentRow(0)
+        if current and current in self.model.stringList():
+            self.set_current_row(self.model.stringList().index(current))
 
         self.search_input.setFocus()
 
+    def preview_current(self, *_) -> None:
+        row = self.current_row()
+        if self.previewer is not None and row >= 0:
+            self.previewer.preview(self.model.stringList()[row], self.preview.setHtml)
+
+    def current_row(self) -> int:
+        return self.list_view.currentIndex().row()
+
+    def set_current_row(self, row: int) -> None:
+        index = self.model.index(row, 0)
+        self.list_view.setCurrentIndex(index)
+        self.list_view.scrollTo(index)
+
     def handle_navigation_key(self, key: int) -> bool:
         # Keys compatibility
         if hasattr(Qt, "Key"):
@@ -103,14 +210,14 @@ class FuzzyFinderDialog(QDialog):
             Key_Escape = getattr(Qt, "Key_Escape")
 
         if key == Key_Up:
-            row = self.list_widget.currentRow()
+            row = self.current_row()
             if row > 0:
-                self.list_widget.setCurrentRow(row - 1)
+                self.set_current_row(row - 1)
             return True
         elif key == Key_Down:
-            row = self.list_widget.currentRow()
-            if row < self.list_widget.count() - 1:
-                self.list_widget.setCurrentRow(row + 1)
+            row = self.current_row()
+            if row < self.model.rowCount() - 1:
+                self.set_current_row(row + 1)
             return True
         elif key in (Key_Return, Key_Enter):
             self.accept()
@@ -140,19 +247,24 @@ class FuzzyFinderDialog(QDialog):
         return super().eventFilter(obj, event)
 
     def filter_options(self, text: str):
-        self.list_widget.clear()
+        options = self.index.filter(text)
+        if options != self.model.stringList():
+            self.model.setStringList(options)
 
-        filtered = filter_and_sort_options(text, self.options)
-        for opt in filtered:
-            self.list_widget.addItem(opt)
+        if self.model.rowCount() > 0:
+            self.set_current_row(0)
 
-        if self.list_widget.count() > 0:
-            self.list_widget.setCurrentRow(0)
+    def done(self, r: int) -> None:
+        # The answer is in, so drop pending previews.
+        if self.previewer is not None:
+            self.previewer.cancel()
+            self.previewer = None
+        super().done(r)
 
     def accept(self):
-        current_item = self.list_widget.currentItem()
-        if current_item:
-            self.selected_value = current_item.text()
+        row = self.current_row()
+        if row >= 0:
+            self.selected_value = self.model.stringList()[row]
             super().accept()
         else:
             super().reject()
@@ -163,10 +275,11 @@ class FuzzyFinderDialog(QDialog):
         parent,
         title: str,
         label_text: str,
-        options: List[str],
+        options: Union[List[str], OptionFilter],
         current: Optional[str] = None,
+        previewer: Optional[OptionPreviewer] = None,
     ) -> Optional[str]:
-        dialog = cls(parent, title, label_text, options, current)
+        dialog = cls.kept_for(parent, title, label_text, options, current, previewer)
         if hasattr(dialog, "exec"):
             res = dialog.exec()
         else:
@@ -176,11 +289,46 @@ class FuzzyFinderDialog(QDialog):
             return dialog.selected_value
         return None
 
+    @classmethod
+    def kept_for(
+        cls,
+        parent,
+        title: str,
+        label_text: str,
+        options: Union[List[str], OptionFilter],
+        current: Optional[str] = None,
+        previewer: Optional[OptionPreviewer] = None,
+    ) -> "FuzzyFinderDialog":
+        """Returns the parent's kept dialog reset for a question.
+
+        Builds the dialog if the parent has none yet. Qt deletes the dialog
+        together with its parent.
+        """
+        key = (cls, id(parent))
+        dialog = cls._kept.get(key)
+        if dialog is None:
+            dialog = cls(parent, title, label_text, options, current, previewer)
+            cls._kept[key] = dialog
+            dialog.destroyed.connect(lambda *_: cls._kept.pop(key, None))
+        else:
+            dialog.reset(title, label_text, options, current, previewer)
+        return dialog
+
+    @classmethod
+    def discard_kept(cls) -> None:
+        """Deletes all kept dialogs, e.g., before the main window closes."""
+        kept = list(cls._kept.values())
+        cls._kept.clear()
+        for dialog in kept:
+            dialog.deleteLater()
+
 
 def is_subsequence(query: str, target: str) -> bool:
     """Check if query is a subsequence of target, case-insensitively."""
-    query = query.lower()
-    target = target.lower()
+    return _is_lower_subsequence(query.lower(), target.lower())
+
+
+def _is_lower_subsequence(query: str, target: str) -> bool:
     t_idx = 0
     for char in query:
         t_idx = target.find(char, t_idx)
@@ -198,29 +346,87 @@ def score_match(query: str, target: str) -> int:
     1: Subsequence case-insensitive match (default/fallback)
     0: No match (not a subsequence)
     """
-    if not is_subsequence(query, target):
-        return 0
+    return _score_lower_match(query.lower(), target.lower())
+
 
-    target_lower = target.lower()
-    query_lower = query.lower()
+def _score_lower_match(query_lower: str, target_lower: str) -> int:
+    # Check the cheap cases first. Each of them implies a subsequence.
     if target_lower == query_lower:
         return 4
     elif target_lower.startswith(query_lower):
         return 3
     elif query_lower in target_lower:
         return 2
-    else:
+    elif _is_lower_subsequence(query_lower, target_lower):
         return 1
+    else:
+        return 0
+
 
+class OptionIndex:
+    """Options prepared for filtering as the user types.
 
-def filter_and_sort_options(query: str, options: List[str]) -> List[str]:
-    """Filters the options using subsequence matching and sorts them by relevance, then alphabetically."""
-    scored_options = []
-    for opt in options:
-        score = score_match(query, opt)
-        if score > 0:
-            scored_options.append((score, opt))
+    The index lowercases the options once. If a query extends the previous
+    one, only the previous matches can match it, so the index filters just
+    those.
+    """
 
-    # Sort by score descending, then case-insensitive alphabetically
-    scored_options.sort(key=lambda x: (-x[0], x[1].lower()))
-    return [opt for _, opt in scored_options]
+    def __init__(
+        self,
+        options: Sequence[str],
+        preferences: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Args:
+            options: The options.
+            preferences: Scores of preferred options, e.g., their frecency.
+                Among equally good matches, higher scored options rank first.
+        """
+        self.options = list(options)
+        self._lower = [option.lower() for option in self.options]
+        preferences = preferences or {}
+        # Each option's position in the order of preference and then
+        # alphabetical order, which breaks ties between equally scored
+        # matches.
+        ordered = sorted(
+            range(len(self.options)),
+            key=lambda i: (-preferences.get(self.options[i], 0), self._lower[i]),
+        )
+        self._rank = [0] * len(self.options)
+        for rank, i in enumerate(ordered):
+            self._rank[i] = rank
+        self._last_query = ""
+        self._last_matches = list(range(len(self.options)))
+
+    def filter(self, query: str) -> List[str]:
+        """Filters the options like `filter_and_sort_options`."""
+        query_lower = query.lower()
+        candidates = (
+            self._last_matches
+            if query_lower.startswith(self._last_query)
+            else range(len(self.options))
+        )
+        matches = []
+        scored = []
+        for i in candidates:
+            score = _score_lower_match(query_lower, self._lower[i])
+            if score > 0:
+                matches.append(i)
+                scored.append((-score, self._rank[i], i))
+        self._last_query = query_lower
+        self._last_matches = matches
+        scored.sort()
+        return [self.options[i] for _, _, i in scored]
+
+
+def filter_and_sort_options(
+    query: str,
+    options: List[str],
+    preferences: Optional[Mapping[str, float]] = None,
+) -> List[str]:
+    """Filters the options using subsequence matching and sorts them by relevance, then by preference, then alphabetically.
+
+    To filter the same options repeatedly, e.g., on every keystroke, use an
+    `OptionIndex`.
+    """
+    return OptionIndex(options, preferences).filter(query)
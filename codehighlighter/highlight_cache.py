@@ -0,0 +1,239 @@
+"""A content-addressed cache of highlighted snippets.
+
+Users often highlight the same snippet more than once (undo and redo, cloned
+notes, switching back to a previous language), so the cache keeps results
+around in two tiers:
+
+1. An in-memory LRU with a byte budget.
+2. An optional persistent tier, e.g., an SQLite database in user_files.
+
+Keys are opaque strings. Highlighters derive them from everything that
+influences the output (see `pygments_highlighter.cache_key`).
+"""
+
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from .html import HtmlString
+
+__all__ = [
+    "CacheStats",
+    "HighlightCache",
+    "PersistentTier",
+    "SqliteTier",
+]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of a highlight cache's counters.
+
+    Attributes:
+        hits: Lookups served from memory.
+        persistent_hits: Lookups served from the persistent tier.
+        misses: Lookups that found nothing.
+        evictions: Entries evicted from memory to stay within the budget.
+    """
+
+    hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class PersistentTier(Protocol):
+    """A cache tier that survives restarts."""
+
+    def get(self, key: str) -> HtmlString | None: ...
+
+    def put(self, key: str, html: HtmlString) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class SqliteTier:
+    """A persistent cache tier backed by an SQLite database.
+
+    The database remembers the engine fingerprint of its entries and drops
+    all of them when opened with a different fingerprint, e.g., after a
+    Pygments upgrade.
+
+    This class is not thread-safe on its own. HighlightCache serializes
+    access to it.
+    """
+
+    def __init__(self, path: Path, fingerprint: str, max_entries: int = 1000):
+        """
+        Args:
+            path: The database file.
+            fingerprint: The fingerprint of the highlighting engine.
+            max_entries: The number of entries to keep. The least recently
+                used entries are pruned first.
+
+        Raises:
+            sqlite3.Error: If the database can't be opened.
+        """
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta "
+                + "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                + "(key TEXT PRIMARY KEY, html TEXT NOT NULL, used INTEGER NOT NULL)"
+            )
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = 'fingerprint'"
+            ).fetchone()
+            if row is None or row[0] != fingerprint:
+                self.connection.execute("DELETE FROM entries")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)",
+                    (fingerprint,),
+                )
+        # A logical clock is enough for LRU and immune to wall-clock changes.
+        (self.clock,) = self.connection.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM entries"
+        ).fetchone()
+
+    def get(self, key: str) -> HtmlString | None:
+        try:
+            with self.connection:
+                row = self.connection.execute(
+                    "SELECT html FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self.clock += 1
+                self.connection.execute(
+                    "UPDATE entries SET used = ? WHERE key = ?", (self.clock, key)
+                )
+        except sqlite3.Error:
+            # The persistent tier is an optimization. Don't fail highlighting.
+            return None
+        return HtmlString(row[0])
+
+    def put(self, key: str, html: HtmlString) -> None:
+        self.clock += 1
+        try:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                    (key, html, self.clock),
+                )
+                self.connection.execute(
+                    "DELETE FROM entries WHERE used <= ?",
+                    (self.clock - self.max_entries,),
+                )
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Closes the database. Later lookups miss, and later puts are dropped."""
+        self.connection.close()
+
+
+class HighlightCache:
+    """A thread-safe cache of highlighted snippets."""
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        persistent: PersistentTier | None = None,
+    ):
+        """
+        Args:
+            max_bytes: The memory budget of the in-memory tier. Results larger
+                than the budget are not cached.
+            persistent: The optional persistent tier.
+        """
+        self.max_bytes = max_bytes
+        self.persistent = persistent
+        self._entries: OrderedDict[str, HtmlString] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> HtmlString | None:
+        """Returns the cached result or None."""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return html
+            if self.persistent is not None:
+                html = self.persistent.get(key)
+                if html is not None:
+                    self._remember(key, html)
+                    self._persistent_hits += 1
+                    return html
+            self._misses += 1
+            return None
+
+    def put(self, key: str, html: HtmlString) -> None:
+        """Caches a result in all tiers."""
+        if _entry_size(key, html) > self.max_bytes:
+            return
+        with self._lock:
+            self._remember(key, html)
+            if self.persistent is not None:
+                self.persistent.put(key, html)
+
+    def get_or_compute(self, key: str, compute: Callable[[], HtmlString]) -> HtmlString:
+        """Returns the cached result or computes and caches it.
+
+        The computation runs outside of the cache's lock.
+        """
+        html = self.get(key)
+        if html is None:
+            html = compute()
+            self.put(key, html)
+        return html
+
+    def close(self) -> None:
+        """Closes the persistent tier. The in-memory tier keeps working."""
+        with self._lock:
+            if self.persistent is not None:
+                self.persistent.close()
+                self.persistent = None
+
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the cache's counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                persistent_hits=self._persistent_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def _remember(self, key: str, html: HtmlString) -> None:
+        """Puts an entry into the in-memory tier. Requires the lock."""
+        size = _entry_size(key, html)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= _entry_size(key, old)
+        self._entries[key] = html
+        self._size += size
+        while self._size > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._size -= _entry_size(evicted_key, evicted)
+            self._evictions += 1
+
+
+def _entry_size(key: str, html: str) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(html)
@@ -0,0 +1,473 @@
+"""An isolated highlighter process.
+
+Some Pygments grammars backtrack catastrophically on unlucky input, and Python
+can't interrupt a running regex. The worker highlights snippets in a
+long-lived child process instead, so that the add-on can kill it once a
+snippet overruns its time or memory budget. The child keeps its lexers warm
+between snippets.
+
+The processes talk over the child's stdin and stdout with one JSON object per
+line.
+
+A pool of workers highlights bulk jobs on several cores. Unlike a
+ProcessPoolExecutor, whose children import the add-on package's __init__ and
+thus Anki, the workers load only the highlighting modules.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+from .background import CancellationToken, Cancelled
+from .html import HtmlString, PlainString
+
+if TYPE_CHECKING:
+    # The parent process doesn't need Pygments until it falls back to
+    # in-process highlighting.
+    from .pygments_highlighter import HighlightRequest, HtmlStyle, LexerName
+
+__all__ = [
+    "BudgetExceededError",
+    "HighlightWorker",
+    "HighlightWorkerPool",
+    "WorkerError",
+]
+
+# Loads the add-on package without running its __init__, which would set up
+# the Anki GUI, and starts serving.
+_BOOTSTRAP = """
+import importlib, importlib.machinery, importlib.util, sys
+addon_dir, package, memory_budget = sys.argv[1:]
+sys.path.append(addon_dir)
+spec = importlib.machinery.ModuleSpec(package, None, is_package=True)
+spec.submodule_search_locations = [addon_dir]
+sys.modules[package] = importlib.util.module_from_spec(spec)
+importlib.import_module(package + ".highlight_worker").serve(int(memory_budget))
+"""
+
+# How often a waiting job checks its cancellation token.
+_POLL_INTERVAL = 0.05
+
+
+class WorkerError(Exception):
+    """The worker process has failed."""
+
+
+class BudgetExceededError(WorkerError):
+    """A snippet has overrun the worker's time or memory budget."""
+
+
+class HighlightWorker:
+    """Highlights snippets in a child process with a time and memory budget.
+
+    The worker starts its process on first use and restarts it after a
+    failure. If the process can't be started at all, e.g., because Anki is a
+    frozen build without a Python interpreter, the worker highlights
+    in-process without budgets.
+
+    This class is thread-safe. It highlights one snippet at a time.
+    """
+
+    def __init__(
+        self,
+        time_budget: float = 5.0,
+        memory_budget: int = 512 * 1024 * 1024,
+        startup_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            time_budget: The time budget of a snippet in seconds.
+            memory_budget: The memory budget of the process in bytes. Only
+                enforced on Linux.
+            startup_timeout: How long to wait for the process to start in
+                seconds.
+        """
+        self.time_budget = time_budget
+        self.memory_budget = memory_budget
+        self.startup_timeout = startup_timeout
+        self.restarts = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._replies: queue.Queue[Optional[dict[str, Any]]] = queue.Queue()
+        self._unavailable = False
+        self._lock = threading.Lock()
+
+    def highlight_html(
+        self,
+        code: PlainString,
+        language: LexerName,
+        style: HtmlStyle,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> HtmlString:
+        """Highlights the code snippet in the worker process.
+
+        Args:
+            code: A code snippet without HTML markup.
+            language: A language.
+            style: The style options to use.
+            cancellation: An optional token that stops highlighting.
+
+        Returns:
+            HtmlString: The HTML markup of the highlighted code.
+
+        Raises:
+            BudgetExceededError: If the snippet overran the budget.
+            WorkerError: If the worker process has failed.
+            Cancelled: If the cancellation token has been cancelled.
+        """
+        if cancellation is not None and cancellation.cancelled:
+            # Don't start, and then kill, a process for nothing.
+            raise Cancelled()
+        job = {"code": code}
+        with self._lock:
+            if not self._start_if_needed():
+                from .pygments_highlighter import highlight_html
+
+                return highlight_html(code, language, style, cancellation)
+            reply = self._run(job, language, style, self.time_budget, cancellation)
+            return HtmlString(reply["html"])
+
+    def highlight_group(
+        self,
+        language: LexerName,
+        style: HtmlStyle,
+        codes: Sequence[PlainString],
+        cancellation: Optional[CancellationToken] = None,
+    ) -> list[HtmlString]:
+        """Highlights snippets that share a language and a style.
+
+        The snippets go to the worker process in one job, which has the time
+        budget of all its snippets.
+
+        Args:
+            language: A language.
+            style: The style options to use.
+            codes: Code snippets without HTML markup.
+            cancellation: An optional token that stops highlighting.
+
+        Returns:
+            list[HtmlString]: The HTML markup of the highlighted snippets.
+
+        Raises:
+            BudgetExceededError: If the snippets overran the budget.
+            WorkerError: If the worker process has failed.
+            Cancelled: If the cancellation token has been cancelled.
+        """
+        if cancellation is not None and cancellation.cancelled:
+            raise Cancelled()
+        job = {"codes": list(codes)}
+        with self._lock:
+            if not self._start_if_needed():
+                from .pygments_highlighter import highlight_group
+
+                return highlight_group(language, style, codes, cancellation)
+            time_budget = self.time_budget * max(len(codes), 1)
+            reply = self._run(job, language, style, time_budget, cancellation)
+            return [HtmlString(html) for html in reply["htmls"]]
+
+    def close(self) -> None:
+        """Stops the worker process."""
+        with self._lock:
+            self._stop()
+
+    def _start_if_needed(self) -> bool:
+        """Starts the process if needed. Returns whether it is running."""
+        if not self._unavailable and self._process is None:
+            self._start()
+        return self._process is not None
+
+    def _run(
+        self,
+        job: dict[str, Any],
+        language: LexerName,
+        style: HtmlStyle,
+        time_budget: float,
+        cancellation: Optional[CancellationToken],
+    ) -> dict[str, Any]:
+        """Runs a job in the process and returns its reply."""
+        self._send(
+            {
+                **job,
+                "language": language,
+                "display_style": style.display_style,
+                "block_style": style.block_style,
+            }
+        )
+        reply = self._receive(time_budget, cancellation)
+        if "error" in reply:
+            # The process exits after an error, because it might be in a
+            # bad state, e.g., out of memory.
+            self._kill()
+            if reply["error"] == "MemoryError":
+                raise BudgetExceededError(
+                    "The snippet exceeded the memory budget of "
+                    + f"{self.memory_budget // (1024 * 1024)} MiB."
+                )
+            raise WorkerError(reply["error"])
+        return reply
+
+    def _start(self) -> None:
+        if getattr(sys, "frozen", False):
+            # sys.executable is the frozen application, e.g., Anki itself,
+            # rather than a Python interpreter.
+            self._unavailable = True
+            return None
+        addon_dir = os.path.dirname(__file__)
+        package = __name__.rpartition(".")[0]
+        try:
+            process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-c",
+                    _BOOTSTRAP,
+                    addon_dir,
+                    package,
+                    str(self.memory_budget),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                encoding="utf-8",
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        except OSError:
+            self._unavailable = True
+            return None
+        self._process = process
+        self._replies = queue.Queue()
+        threading.Thread(
+            target=_read_replies,
+            args=(process, self._replies),
+            name="highlight-worker-reader",
+            daemon=True,
+        ).start()
+        try:
+            self._receive(self.startup_timeout, None)
+        except WorkerError:
+            # An interpreter that can't run the worker won't get better.
+            self._unavailable = True
+
+    def _send(self, job: dict[str, Any]) -> None:
+        assert self._process is not None and self._process.stdin is not None
+        try:
+            self._process.stdin.write(json.dumps(job) + "\n")
+            self._process.stdin.flush()
+        except OSError as e:
+            self._kill()
+            raise WorkerError(f"The worker process has died ({e}).")
+
+    def _receive(
+        self, timeout: float, cancellation: Optional[CancellationToken]
+    ) -> dict[str, Any]:
+        deadline = time.monotonic() + timeout
+        while True:
+            if cancellation is not None and cancellation.cancelled:
+                self._kill()
+                raise Cancelled()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._kill()
+                raise BudgetExceededError(
+                    f"The snippet exceeded the time budget of {timeout:g} s."
+                )
+            try:
+                reply = self._replies.get(timeout=min(remaining, _POLL_INTERVAL))
+            except queue.Empty:
+                continue
+            if reply is None:
+                self._kill()
+                raise WorkerError("The worker process has died.")
+            return reply
+
+    def _kill(self) -> None:
+        """Kills a failed worker process. The next snippet starts a new one."""
+        if self._process is not None:
+            self.restarts += 1
+        self._stop()
+
+    def _stop(self) -> None:
+        if self._process is None:
+            return None
+        self._process.kill()
+        self._process.wait()
+        for stream in (self._process.stdin, self._process.stdout):
+            if stream is not None:
+                stream.close()
+        self._process = None
+
+
+class HighlightWorkerPool:
+    """Highlights bulk jobs in several worker processes.
+
+    Each worker has the budgets of a HighlightWorker and keeps its lexers warm
+    between jobs.
+
+    This class is thread-safe.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        time_budget: float = 5.0,
+        memory_budget: int = 512 * 1024 * 1024,
+    ):
+        """
+        Args:
+            size: The number of worker processes. Defaults to the number of
+                CPUs.
+            time_budget: The time budget of a snippet in seconds.
+            memory_budget: The memory budget of a process in bytes.
+        """
+        self.workers = [
+            HighlightWorker(time_budget, memory_budget)
+            for _ in range(size or os.cpu_count() or 1)
+        ]
+        self._idle: queue.Queue[HighlightWorker] = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            len(self.workers), thread_name_prefix="highlight-worker-pool"
+        )
+
+    def highlight_many(
+        self,
+        requests: Iterable[HighlightRequest],
+        chunksize: int = 64,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> list[HtmlString]:
+        """Highlights many code snippets.
+
+        The snippets are grouped by language and style, and each worker
+        highlights a chunk of a group at a time.
+
+        Args:
+            requests: The snippets to highlight.
+            chunksize: The maximum number of snippets in one job.
+            cancellation: An optional token that stops highlighting.
+
+        Returns:
+            list[HtmlString]: The HTML markup of the highlighted snippets in
+              the order of requests.
+
+        Raises:
+            BudgetExceededError: If a chunk overran the budget.
+            WorkerError: If a worker process has failed.
+            Cancelled: If the cancellation token has been cancelled.
+        """
+        from .pygments_highlighter import group_requests
+
+        requests = list(requests)
+        results: list[HtmlString] = [HtmlString("")] * len(requests)
+        futures = {}
+        for chunk in group_requests(requests, chunksize):
+            first = requests[chunk[0]]
+            codes = [requests[i].code for i in chunk]
+            future = self._executor.submit(
+                self._highlight_group, first.language, first.style, codes, cancellation
+            )
+            futures[future] = chunk
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                for i, html in zip(futures[future], future.result()):
+                    results[i] = html
+        finally:
+            for future in futures:
+                future.cancel()
+        return results
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        self._executor.shutdown(cancel_futures=True)
+        for worker in self.workers:
+            worker.close()
+
+    def _highlight_group(
+        self,
+        language: LexerName,
+        style: HtmlStyle,
+        codes: Sequence[PlainString],
+        cancellation: Optional[CancellationToken],
+    ) -> list[HtmlString]:
+        # The executor has a thread per worker, so an idle worker is waiting.
+        worker = self._idle.get()
+        try:
+            return worker.highlight_group(language, style, codes, cancellation)
+        finally:
+            self._idle.put(worker)
+
+
+def _read_replies(
+    process: subprocess.Popen, replies: "queue.Queue[Optional[dict[str, Any]]]"
+) -> None:
+    """Forwards the process's replies to a queue. None marks the end."""
+    assert process.stdout is not None
+    try:
+        for line in process.stdout:
+            replies.put(json.loads(line))
+    except (OSError, ValueError):
+        pass
+    replies.put(None)
+
+
+def serve(memory_budget: int) -> None:
+    """Serves highlighting jobs from stdin. Runs in the worker process.
+
+    Args:
+        memory_budget: The memory budget in bytes.
+    """
+    from .pygments_highlighter import HtmlStyle, highlight_group, highlight_html
+
+    channel = sys.stdout
+    # Keep stray prints away from the channel.
+    sys.stdout = sys.stderr
+    _limit_memory(memory_budget)
+
+    def reply(message: dict[str, Any]) -> None:
+        channel.write(json.dumps(message) + "\n")
+        channel.flush()
+
+    reply({"ready": True})
+    while True:
+        try:
+            line = sys.stdin.readline()
+            if not line:
+                return None
+            job = json.loads(line)
+            style = HtmlStyle(job["display_style"], job["block_style"])
+            message: dict[str, Any]
+            if "codes" in job:
+                codes = [PlainString(code) for code in job["codes"]]
+                message = {"htmls": highlight_group(job["language"], style, codes)}
+            else:
+                code = PlainString(job["code"])
+                message = {"html": highlight_html(code, job["language"], style)}
+        except MemoryError:
+            reply({"error": "MemoryError"})
+            return None
+        except Exception as e:
+            reply({"error": repr(e)})
+            return None
+        reply(message)
+
+
+def _limit_memory(budget: int) -> None:
+    """Limits the process's address space to its current size plus a budget.
+
+    This only works on Linux. Other platforms run without a memory limit.
+    """
+    try:
+        import resource
+
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[0])
+    except (ImportError, OSError):
+        return None
+    limit = pages * os.sysconf("SC_PAGE_SIZE") + budget
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
@@ -0,0 +1,164 @@
+"""Finds languages by their names, aliases, file names, and extensions.
+
+The language finder searches all bundled lexers, not just the curated ones.
+Users type what they know about a language: its name ("Python"), an alias
+("py"), a file name ("Dockerfile") or an extension (".rs", "tf").
+`LanguageIndex` precomputes an inverted index of those terms from the static
+lexer index, so that a query costs a few dictionary lookups, a binary search,
+and a scan of the lexer names.
+"""
+
+import bisect
+from collections.abc import Iterable, Mapping
+from typing import List
+
+from .lexerindex import LexerEntry
+
+__all__ = ["LanguageIndex"]
+
+# Match scores. A higher score ranks first.
+_NAME_EXACT = 6
+_TERM_EXACT = 5
+_NAME_PREFIX = 4
+_TERM_PREFIX = 3
+_NAME_SUBSTRING = 2
+_NAME_SUBSEQUENCE = 1
+
+_GLOB_CHARACTERS = frozenset("*?[]")
+
+
+class LanguageIndex:
+    """An index of languages that ranks them for a query.
+
+    The index serves the `filter` interface of the fuzzy finder.
+    """
+
+    def __init__(self, lexers: Mapping[str, LexerEntry], featured: Iterable[str]):
+        """
+        Args:
+            lexers: The lexer index keyed by lexer name.
+            featured: The names of the languages to list for an empty query.
+                They rank first among equally good matches after the
+                preferred languages.
+        """
+        self.names = sorted(lexers, key=str.lower)
+        self._lower_names = [name.lower() for name in self.names]
+        self.featured = [name for name in featured if name in lexers]
+        self.set_preferences({})
+        terms: dict[str, set[str]] = {}
+        for name, entry in lexers.items():
+            for term in _terms(entry):
+                terms.setdefault(term, set()).add(name)
+        self._terms = terms
+        self._sorted_terms = sorted(terms)
+        self._last_query = ""
+        self._last_name_matches = list(range(len(self.names)))
+
+    def set_preferences(self, preferences: Mapping[str, float]) -> None:
+        """Sets the scores of preferred languages, e.g., their frecency.
+
+        Preferred languages rank first among equally good matches and lead
+        the list for an empty query.
+        """
+        featured_set = set(self.featured)
+        # Each language's position in the tie-breaking order.
+        self._rank = {
+            name: rank
+            for rank, name in enumerate(
+                sorted(
+                    self.names,
+                    key=lambda n: (
+                        -preferences.get(n, 0),
+                        n not in featured_set,
+                        n.lower(),
+                    ),
+                )
+            )
+        }
+        preferred = [n for n in preferences if preferences[n] > 0 and n in self._rank]
+        self._empty_query_result = sorted(
+            set(preferred) | featured_set, key=self._rank.__getitem__
+        )
+
+    def filter(self, query: str) -> List[str]:
+        """Returns the languages that match the query, best first.
+
+        Args:
+            query: The user's query.
+
+        Returns:
+            The matching language names. For an empty query, the preferred
+            languages and then the featured ones.
+        """
+        query_lower = query.strip().lower()
+        if not query_lower:
+            return list(self._empty_query_result)
+        scores: dict[str, int] = {}
+        self._score_names(query_lower, scores)
+        self._score_terms(_normalize_term(query_lower), scores)
+        return sorted(scores, key=lambda name: (-scores[name], self._rank[name]))
+
+    def _score_names(self, query_lower: str, scores: dict[str, int]) -> None:
+        # A name that matches an extended query has matched the previous one,
+        # so only scan the previous matches.
+        candidates = (
+            self._last_name_matches
+            if query_lower.startswith(self._last_query)
+            else range(len(self.names))
+        )
+        matches = []
+        for i in candidates:
+            name_lower = self._lower_names[i]
+            if name_lower == query_lower:
+                score = _NAME_EXACT
+            elif name_lower.startswith(query_lower):
+                score = _NAME_PREFIX
+            elif query_lower in name_lower:
+                score = _NAME_SUBSTRING
+            elif _is_subsequence(query_lower, name_lower):
+                score = _NAME_SUBSEQUENCE
+            else:
+                continue
+            matches.append(i)
+            scores[self.names[i]] = score
+        self._last_query = query_lower
+        self._last_name_matches = matches
+
+    def _score_terms(self, term: str, scores: dict[str, int]) -> None:
+        if not term:
+            return None
+        start = bisect.bisect_left(self._sorted_terms, term)
+        for indexed_term in self._sorted_terms[start:]:
+            if not indexed_term.startswith(term):
+                break
+            score = _TERM_EXACT if indexed_term == term else _TERM_PREFIX
+            for name in self._terms[indexed_term]:
+                if scores.get(name, 0) < score:
+                    scores[name] = score
+
+
+def _terms(entry: LexerEntry) -> Iterable[str]:
+    """Yields the normalized search terms of a lexer apart from its name."""
+    yield from (_normalize_term(alias.lower()) for alias in entry.aliases)
+    for glob in entry.filenames:
+        if glob.startswith("*.") and not _GLOB_CHARACTERS & set(glob[2:]):
+            # An extension, e.g., "*.rs".
+            yield _normalize_term(glob[2:].lower())
+        elif not _GLOB_CHARACTERS & set(glob):
+            # A file name, e.g., "Dockerfile".
+            yield _normalize_term(glob.lower())
+
+
+def _normalize_term(term: str) -> str:
+    # Let ".rs" and "*.rs" find the "rs" extension.
+    return term.lstrip("*.")
+
+
+def _is_subsequence(query: str, target: str) -> bool:
+    t_idx = 0
+    for char in query:
+        t_idx = target.find(char, t_idx)
+        if t_idx == -1:
+            return False
+        t_idx += 1
+    return True
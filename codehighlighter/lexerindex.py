@@ -0,0 +1,5393 @@
+"""The static index of available lexers.
+
+Generated by tools/generatelexerindex.py. Do not edit.
+"""
+
+from typing import NamedTuple
+
+__all__ = ["ALIASES", "LEXERS", "PYGMENTS_VERSION", "LexerEntry"]
+
+
+class LexerEntry(NamedTuple):
+    """The metadata of a lexer.
+
+    Attributes:
+        module: The module that defines the lexer. Relative to this package
+            if it starts with a dot.
+        class_name: The name of the lexer class.
+        aliases: The lexer's aliases. The first one is the preferred one.
+        filenames: Globs of file names the lexer handles.
+        mimetypes: Mimetypes the lexer handles.
+    """
+
+    module: str
+    class_name: str
+    aliases: tuple[str, ...]
+    filenames: tuple[str, ...]
+    mimetypes: tuple[str, ...]
+
+
+PYGMENTS_VERSION = "2.21.0"
+
+# Maps a lexer name to its metadata.
+LEXERS: dict[str, LexerEntry] = {
+    "ABAP": LexerEntry(
+        "pygments.lexers.business",
+        "ABAPLexer",
+        ("abap",),
+        ("*.abap", "*.ABAP"),
+        ("text/x-abap",),
+    ),
+    "AMDGPU": LexerEntry(
+        "pygments.lexers.amdgpu",
+        "AMDGPULexer",
+        ("amdgpu",),
+        ("*.isa",),
+        (),
+    ),
+    "APL": LexerEntry(
+        "pygments.lexers.apl",
+        "APLLexer",
+        ("apl",),
+        ("*.apl", "*.aplf", "*.aplo", "*.apln", "*.aplc", "*.apli", "*.dyalog"),
+        (),
+    ),
+    "ABNF": LexerEntry(
+        "pygments.lexers.grammar_notation",
+        "AbnfLexer",
+        ("abnf",),
+        ("*.abnf",),
+        ("text/x-abnf",),
+    ),
+    "ActionScript 3": LexerEntry(
+        "pygments.lexers.actionscript",
+        "ActionScript3Lexer",
+        ("actionscript3", "as3"),
+        ("*.as",),
+        ("application/x-actionscript3", "text/x-actionscript3", "text/actionscript3"),
+    ),
+    "ActionScript": LexerEntry(
+        "pygments.lexers.actionscript",
+        "ActionScriptLexer",
+        ("actionscript", "as"),
+        ("*.as",),
+        ("application/x-actionscript", "text/x-actionscript", "text/actionscript"),
+    ),
+    "Ada": LexerEntry(
+        "pygments.lexers.ada",
+        "AdaLexer",
+        ("ada", "ada95", "ada2005"),
+        ("*.adb", "*.ads", "*.ada"),
+        ("text/x-ada",),
+    ),
+    "ADL": LexerEntry(
+        "pygments.lexers.archetype",
+        "AdlLexer",
+        ("adl",),
+        ("*.adl", "*.adls", "*.adlf", "*.adlx"),
+        (),
+    ),
+    "Agda": LexerEntry(
+        "pygments.lexers.haskell",
+        "AgdaLexer",
+        ("agda",),
+        ("*.agda",),
+        ("text/x-agda",),
+    ),
+    "Aheui": LexerEntry(
+        "pygments.lexers.esoteric",
+        "AheuiLexer",
+        ("aheui",),
+        ("*.aheui",),
+        (),
+    ),
+    "Alloy": LexerEntry(
+        "pygments.lexers.dsls",
+        "AlloyLexer",
+        ("alloy",),
+        ("*.als",),
+        ("text/x-alloy",),
+    ),
+    "AmbientTalk": LexerEntry(
+        "pygments.lexers.ambient",
+        "AmbientTalkLexer",
+        ("ambienttalk", "ambienttalk/2", "at"),
+        ("*.at",),
+        ("text/x-ambienttalk",),
+    ),
+    "Ampl": LexerEntry(
+        "pygments.lexers.ampl",
+        "AmplLexer",
+        ("ampl",),
+        ("*.run",),
+        (),
+    ),
+    "HTML + Angular2": LexerEntry(
+        "pygments.lexers.templates",
+        "Angular2HtmlLexer",
+        ("html+ng2",),
+        ("*.ng2",),
+        (),
+    ),
+    "Angular2": LexerEntry(
+        "pygments.lexers.templates",
+        "Angular2Lexer",
+        ("ng2",),
+        (),
+        (),
+    ),
+    "ANTLR With ActionScript Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrActionScriptLexer",
+        ("antlr-actionscript", "antlr-as"),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ANTLR With C# Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrCSharpLexer",
+        ("antlr-csharp", "antlr-c#"),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ANTLR With CPP Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrCppLexer",
+        ("antlr-cpp",),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ANTLR With Java Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrJavaLexer",
+        ("antlr-java",),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ANTLR": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrLexer",
+        ("antlr",),
+        (),
+        (),
+    ),
+    "ANTLR With ObjectiveC Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrObjectiveCLexer",
+        ("antlr-objc",),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ANTLR With Perl Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrPerlLexer",
+        ("antlr-perl",),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ANTLR With Python Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrPythonLexer",
+        ("antlr-python",),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ANTLR With Ruby Target": LexerEntry(
+        "pygments.lexers.parsers",
+        "AntlrRubyLexer",
+        ("antlr-ruby", "antlr-rb"),
+        ("*.G", "*.g"),
+        (),
+    ),
+    "ApacheConf": LexerEntry(
+        "pygments.lexers.configs",
+        "ApacheConfLexer",
+        ("apacheconf", "aconf", "apache"),
+        (".htaccess", "apache.conf", "apache2.conf"),
+        ("text/x-apacheconf",),
+    ),
+    "AppleScript": LexerEntry(
+        "pygments.lexers.scripting",
+        "AppleScriptLexer",
+        ("applescript",),
+        ("*.applescript",),
+        (),
+    ),
+    "Arduino": LexerEntry(
+        "pygments.lexers.c_like",
+        "ArduinoLexer",
+        ("arduino",),
+        ("*.ino",),
+        ("text/x-arduino",),
+    ),
+    "Arrow": LexerEntry(
+        "pygments.lexers.arrow",
+        "ArrowLexer",
+        ("arrow",),
+        ("*.arw",),
+        (),
+    ),
+    "Arturo": LexerEntry(
+        "pygments.lexers.arturo",
+        "ArturoLexer",
+        ("arturo", "art"),
+        ("*.art",),
+        (),
+    ),
+    "ASCII armored": LexerEntry(
+        "pygments.lexers.asc",
+        "AscLexer",
+        ("asc", "pem"),
+        (
+            "*.asc",
+            "*.pem",
+            "id_dsa",
+            "id_ecdsa",
+            "id_ecdsa_sk",
+            "id_ed25519",
+            "id_ed25519_sk",
+            "id_rsa",
+        ),
+        (
+            "application/pgp-keys",
+            "application/pgp-encrypted",
+            "application/pgp-signature",
+            "application/pem-certificate-chain",
+        ),
+    ),
+    "ASN.1": LexerEntry(
+        "pygments.lexers.asn1",
+        "Asn1Lexer",
+        ("asn1",),
+        ("*.asn1",),
+        (),
+    ),
+    "AspectJ": LexerEntry(
+        "pygments.lexers.jvm",
+        "AspectJLexer",
+        ("aspectj",),
+        ("*.aj",),
+        ("text/x-aspectj",),
+    ),
+    "Asymptote": LexerEntry(
+        "pygments.lexers.graphics",
+        "AsymptoteLexer",
+        ("asymptote", "asy"),
+        ("*.asy",),
+        ("text/x-asymptote",),
+    ),
+    "Augeas": LexerEntry(
+        "pygments.lexers.configs",
+        "AugeasLexer",
+        ("augeas",),
+        ("*.aug",),
+        (),
+    ),
+    "AutoIt": LexerEntry(
+        "pygments.lexers.automation",
+        "AutoItLexer",
+        ("autoit",),
+        ("*.au3",),
+        ("text/x-autoit",),
+    ),
+    "autohotkey": LexerEntry(
+        "pygments.lexers.automation",
+        "AutohotkeyLexer",
+        ("autohotkey", "ahk"),
+        ("*.ahk", "*.ahkl"),
+        ("text/x-autohotkey",),
+    ),
+    "Awk": LexerEntry(
+        "pygments.lexers.textedit",
+        "AwkLexer",
+        ("awk", "gawk", "mawk", "nawk"),
+        ("*.awk",),
+        ("application/x-awk",),
+    ),
+    "BBC Basic": LexerEntry(
+        "pygments.lexers.basic",
+        "BBCBasicLexer",
+        ("bbcbasic",),
+        ("*.bbc",),
+        (),
+    ),
+    "BBCode": LexerEntry(
+        "pygments.lexers.markup",
+        "BBCodeLexer",
+        ("bbcode",),
+        (),
+        ("text/x-bbcode",),
+    ),
+    "BC": LexerEntry(
+        "pygments.lexers.algebra",
+        "BCLexer",
+        ("bc",),
+        ("*.bc",),
+        (),
+    ),
+    "BQN": LexerEntry(
+        "pygments.lexers.bqn",
+        "BQNLexer",
+        ("bqn",),
+        ("*.bqn",),
+        (),
+    ),
+    "BST": LexerEntry(
+        "pygments.lexers.bibtex",
+        "BSTLexer",
+        ("bst", "bst-pybtex"),
+        ("*.bst",),
+        (),
+    ),
+    "BARE": LexerEntry(
+        "pygments.lexers.bare",
+        "BareLexer",
+        ("bare",),
+        ("*.bare",),
+        (),
+    ),
+    "Base Makefile": LexerEntry(
+        "pygments.lexers.make",
+        "BaseMakefileLexer",
+        ("basemake",),
+        (),
+        (),
+    ),
+    "Bash": LexerEntry(
+        "pygments.lexers.shell",
+        "BashLexer",
+        ("bash", "sh", "ksh", "zsh", "shell", "openrc"),
+        (
+            "*.sh",
+            "*.ksh",
+            "*.bash",
+            "*.ebuild",
+            "*.eclass",
+            "*.exheres-0",
+            "*.exlib",
+            "*.zsh",
+            ".bashrc",
+            "bashrc",
+            ".bash_*",
+            "bash_*",
+            "zshrc",
+            ".zshrc",
+            ".kshrc",
+            "kshrc",
+            "PKGBUILD",
+        ),
+        ("application/x-sh", "application/x-shellscript", "text/x-shellscript"),
+    ),
+    "Bash Session": LexerEntry(
+        "pygments.lexers.shell",
+        "BashSessionLexer",
+        ("console", "shell-session"),
+        ("*.sh-session", "*.shell-session"),
+        ("application/x-shell-session", "application/x-sh-session"),
+    ),
+    "Batchfile": LexerEntry(
+        "pygments.lexers.shell",
+        "BatchLexer",
+        ("batch", "bat", "dosbatch", "winbatch"),
+        ("*.bat", "*.cmd"),
+        ("application/x-dos-batch",),
+    ),
+    "Bdd": LexerEntry(
+        "pygments.lexers.bdd",
+        "BddLexer",
+        ("bdd",),
+        ("*.feature",),
+        ("text/x-bdd",),
+    ),
+    "Befunge": LexerEntry(
+        "pygments.lexers.esoteric",
+        "BefungeLexer",
+        ("befunge",),
+        ("*.befunge",),
+        ("application/x-befunge",),
+    ),
+    "Berry": LexerEntry(
+        "pygments.lexers.berry",
+        "BerryLexer",
+        ("berry", "be"),
+        ("*.be",),
+        ("text/x-berry", "application/x-berry"),
+    ),
+    "BibTeX": LexerEntry(
+        "pygments.lexers.bibtex",
+        "BibTeXLexer",
+        ("bibtex", "bib"),
+        ("*.bib",),
+        ("text/x-bibtex",),
+    ),
+    "BitBake": LexerEntry(
+        "pygments.lexers.bitbake",
+        "BitBakeLexer",
+        ("bitbake",),
+        ("*.bbclass", "*.bbappend"),
+        ("text/x-bitbake",),
+    ),
+    "BlitzBasic": LexerEntry(
+        "pygments.lexers.basic",
+        "BlitzBasicLexer",
+        ("blitzbasic", "b3d", "bplus"),
+        ("*.bb", "*.decls"),
+        ("text/x-bb",),
+    ),
+    "BlitzMax": LexerEntry(
+        "pygments.lexers.basic",
+        "BlitzMaxLexer",
+        ("blitzmax", "bmax"),
+        ("*.bmx",),
+        ("text/x-bmx",),
+    ),
+    "Blueprint": LexerEntry(
+        "pygments.lexers.blueprint",
+        "BlueprintLexer",
+        ("blueprint",),
+        ("*.blp",),
+        ("text/x-blueprint",),
+    ),
+    "BNF": LexerEntry(
+        "pygments.lexers.grammar_notation",
+        "BnfLexer",
+        ("bnf",),
+        ("*.bnf",),
+        ("text/x-bnf",),
+    ),
+    "Boa": LexerEntry(
+        "pygments.lexers.boa",
+        "BoaLexer",
+        ("boa",),
+        ("*.boa",),
+        (),
+    ),
+    "Boo": LexerEntry(
+        "pygments.lexers.dotnet",
+        "BooLexer",
+        ("boo",),
+        ("*.boo",),
+        ("text/x-boo",),
+    ),
+    "Boogie": LexerEntry(
+        "pygments.lexers.verification",
+        "BoogieLexer",
+        ("boogie",),
+        ("*.bpl",),
+        (),
+    ),
+    "Brainfuck": LexerEntry(
+        "pygments.lexers.esoteric",
+        "BrainfuckLexer",
+        ("brainfuck", "bf"),
+        ("*.bf", "*.b"),
+        ("application/x-brainfuck",),
+    ),
+    "BUGS": LexerEntry(
+        "pygments.lexers.modeling",
+        "BugsLexer",
+        ("bugs", "winbugs", "openbugs"),
+        ("*.bug",),
+        (),
+    ),
+    "CAmkES": LexerEntry(
+        "pygments.lexers.esoteric",
+        "CAmkESLexer",
+        ("camkes", "idl4"),
+        ("*.camkes", "*.idl4"),
+        (),
+    ),
+    "CEL": LexerEntry(
+        "pygments.lexers.cel",
+        "CELLexer",
+        ("cel",),
+        ("*.cel",),
+        (),
+    ),
+    "C": LexerEntry(
+        "pygments.lexers.c_cpp",
+        "CLexer",
+        ("c",),
+        ("*.c", "*.h", "*.idc", "*.x[bp]m"),
+        ("text/x-chdr", "text/x-csrc", "image/x-xbitmap", "image/x-xpixmap"),
+    ),
+    "CMake": LexerEntry(
+        "pygments.lexers.make",
+        "CMakeLexer",
+        ("cmake",),
+        ("*.cmake", "CMakeLists.txt"),
+        ("text/x-cmake",),
+    ),
+    "c-objdump": LexerEntry(
+        "pygments.lexers.asm",
+        "CObjdumpLexer",
+        ("c-objdump",),
+        ("*.c-objdump",),
+        ("text/x-c-objdump",),
+    ),
+    "CPSA": LexerEntry(
+        "pygments.lexers.lisp",
+        "CPSALexer",
+        ("cpsa",),
+        ("*.cpsa",),
+        (),
+    ),
+    "CSS+UL4": LexerEntry(
+        "pygments.lexers.ul4",
+        "CSSUL4Lexer",
+        ("css+ul4",),
+        ("*.cssul4",),
+        (),
+    ),
+    "aspx-cs": LexerEntry(
+        "pygments.lexers.dotnet",
+        "CSharpAspxLexer",
+        ("aspx-cs",),
+        ("*.aspx", "*.asax", "*.ascx", "*.ashx", "*.asmx", "*.axd"),
+        (),
+    ),
+    "C#": LexerEntry(
+        "pygments.lexers.dotnet",
+        "CSharpLexer",
+        ("csharp", "c#", "cs"),
+        ("*.cs",),
+        ("text/x-csharp",),
+    ),
+    "ca65 assembler": LexerEntry(
+        "pygments.lexers.asm",
+        "Ca65Lexer",
+        ("ca65",),
+        ("*.s",),
+        (),
+    ),
+    "Caddyfile": LexerEntry(
+        "pygments.lexers.configs",
+        "CaddyfileLexer",
+        ("caddyfile", "caddy"),
+        ("Caddyfile",),
+        (),
+    ),
+    "cADL": LexerEntry(
+        "pygments.lexers.archetype",
+        "CadlLexer",
+        ("cadl",),
+        ("*.cadl",),
+        (),
+    ),
+    "CapDL": LexerEntry(
+        "pygments.lexers.esoteric",
+        "CapDLLexer",
+        ("capdl",),
+        ("*.cdl",),
+        (),
+    ),
+    "Cap'n Proto": LexerEntry(
+        "pygments.lexers.capnproto",
+        "CapnProtoLexer",
+        ("capnp",),
+        ("*.capnp",),
+        (),
+    ),
+    "Carbon": LexerEntry(
+        "pygments.lexers.carbon",
+        "CarbonLexer",
+        ("carbon",),
+        ("*.carbon",),
+        ("text/x-carbon",),
+    ),
+    "CBM BASIC V2": LexerEntry(
+        "pygments.lexers.basic",
+        "CbmBasicV2Lexer",
+        ("cbmbas",),
+        ("*.bas",),
+        (),
+    ),
+    "CDDL": LexerEntry(
+        "pygments.lexers.cddl",
+        "CddlLexer",
+        ("cddl",),
+        ("*.cddl",),
+        ("text/x-cddl",),
+    ),
+    "Ceylon": LexerEntry(
+        "pygments.lexers.jvm",
+        "CeylonLexer",
+        ("ceylon",),
+        ("*.ceylon",),
+        ("text/x-ceylon",),
+    ),
+    "CFEngine3": LexerEntry(
+        "pygments.lexers.configs",
+        "Cfengine3Lexer",
+        ("cfengine3", "cf3"),
+        ("*.cf",),
+        (),
+    ),
+    "ChaiScript": LexerEntry(
+        "pygments.lexers.scripting",
+        "ChaiscriptLexer",
+        ("chaiscript", "chai"),
+        ("*.chai",),
+        ("text/x-chaiscript", "application/x-chaiscript"),
+    ),
+    "Chapel": LexerEntry(
+        "pygments.lexers.chapel",
+        "ChapelLexer",
+        ("chapel", "chpl"),
+        ("*.chpl",),
+        (),
+    ),
+    "Charmci": LexerEntry(
+        "pygments.lexers.c_like",
+        "CharmciLexer",
+        ("charmci",),
+        ("*.ci",),
+        (),
+    ),
+    "HTML+Cheetah": LexerEntry(
+        "pygments.lexers.templates",
+        "CheetahHtmlLexer",
+        ("html+cheetah", "html+spitfire", "htmlcheetah"),
+        (),
+        ("text/html+cheetah", "text/html+spitfire"),
+    ),
+    "JavaScript+Cheetah": LexerEntry(
+        "pygments.lexers.templates",
+        "CheetahJavascriptLexer",
+        ("javascript+cheetah", "js+cheetah", "javascript+spitfire", "js+spitfire"),
+        (),
+        (
+            "application/x-javascript+cheetah",
+            "text/x-javascript+cheetah",
+            "text/javascript+cheetah",
+            "application/x-javascript+spitfire",
+            "text/x-javascript+spitfire",
+            "text/javascript+spitfire",
+        ),
+    ),
+    "Cheetah": LexerEntry(
+        "pygments.lexers.templates",
+        "CheetahLexer",
+        ("cheetah", "spitfire"),
+        ("*.tmpl", "*.spt"),
+        ("application/x-cheetah", "application/x-spitfire"),
+    ),
+    "XML+Cheetah": LexerEntry(
+        "pygments.lexers.templates",
+        "CheetahXmlLexer",
+        ("xml+cheetah", "xml+spitfire"),
+        (),
+        ("application/xml+cheetah", "application/xml+spitfire"),
+    ),
+    "Cirru": LexerEntry(
+        "pygments.lexers.webmisc",
+        "CirruLexer",
+        ("cirru",),
+        ("*.cirru",),
+        ("text/x-cirru",),
+    ),
+    "Clay": LexerEntry(
+        "pygments.lexers.c_like",
+        "ClayLexer",
+        ("clay",),
+        ("*.clay",),
+        ("text/x-clay",),
+    ),
+    "Clean": LexerEntry(
+        "pygments.lexers.clean",
+        "CleanLexer",
+        ("clean",),
+        ("*.icl", "*.dcl"),
+        (),
+    ),
+    "Clojure": LexerEntry(
+        "pygments.lexers.jvm",
+        "ClojureLexer",
+        ("clojure", "clj"),
+        ("*.clj", "*.cljc"),
+        ("text/x-clojure", "application/x-clojure"),
+    ),
+    "ClojureScript": LexerEntry(
+        "pygments.lexers.jvm",
+        "ClojureScriptLexer",
+        ("clojurescript", "cljs"),
+        ("*.cljs",),
+        ("text/x-clojurescript", "application/x-clojurescript"),
+    ),
+    "COBOLFree": LexerEntry(
+        "pygments.lexers.business",
+        "CobolFreeformatLexer",
+        ("cobolfree",),
+        ("*.cbl", "*.CBL"),
+        (),
+    ),
+    "COBOL": LexerEntry(
+        "pygments.lexers.business",
+        "CobolLexer",
+        ("cobol",),
+        ("*.cob", "*.COB", "*.cpy", "*.CPY"),
+        ("text/x-cobol",),
+    ),
+    "CodeQL": LexerEntry(
+        "pygments.lexers.codeql",
+        "CodeQLLexer",
+        ("codeql", "ql"),
+        ("*.ql", "*.qll"),
+        (),
+    ),
+    "CoffeeScript": LexerEntry(
+        "pygments.lexers.javascript",
+        "CoffeeScriptLexer",
+        ("coffeescript", "coffee-script", "coffee"),
+        ("*.coffee",),
+        ("text/coffeescript",),
+    ),
+    "Coldfusion CFC": LexerEntry(
+        "pygments.lexers.templates",
+        "ColdfusionCFCLexer",
+        ("cfc",),
+        ("*.cfc",),
+        (),
+    ),
+    "Coldfusion HTML": LexerEntry(
+        "pygments.lexers.templates",
+        "ColdfusionHtmlLexer",
+        ("cfm",),
+        ("*.cfm", "*.cfml"),
+        ("application/x-coldfusion",),
+    ),
+    "cfstatement": LexerEntry(
+        "pygments.lexers.templates",
+        "ColdfusionLexer",
+        ("cfs",),
+        (),
+        (),
+    ),
+    "COMAL-80": LexerEntry(
+        "pygments.lexers.comal",
+        "Comal80Lexer",
+        ("comal", "comal80"),
+        ("*.cml", "*.comal"),
+        (),
+    ),
+    "Common Lisp": LexerEntry(
+        "pygments.lexers.lisp",
+        "CommonLispLexer",
+        ("common-lisp", "cl", "lisp"),
+        ("*.cl", "*.lisp"),
+        ("text/x-common-lisp",),
+    ),
+    "Component Pascal": LexerEntry(
+        "pygments.lexers.oberon",
+        "ComponentPascalLexer",
+        ("componentpascal", "cp"),
+        ("*.cp", "*.cps"),
+        ("text/x-component-pascal",),
+    ),
+    "cplint": LexerEntry(
+        "pygments.lexers.cplint",
+        "CplintLexer",
+        ("cplint",),
+        ("*.ecl", "*.prolog", "*.pro", "*.pl", "*.P", "*.lpad", "*.cpl"),
+        ("text/x-cplint",),
+    ),
+    "C++": LexerEntry(
+        "pygments.lexers.c_cpp",
+        "CppLexer",
+        ("cpp", "c++"),
+        (
+            "*.cpp",
+            "*.hpp",
+            "*.c++",
+            "*.h++",
+            "*.cc",
+            "*.hh",
+            "*.cxx",
+            "*.hxx",
+            "*.C",
+            "*.H",
+            "*.cp",
+            "*.CPP",
+            "*.tpp",
+            "*.cppm",
+            "*.ixx",
+            "*.mxx",
+            "*.ipp",
+        ),
+        ("text/x-c++hdr", "text/x-c++src"),
+    ),
+    "cpp-objdump": LexerEntry(
+        "pygments.lexers.asm",
+        "CppObjdumpLexer",
+        ("cpp-objdump", "c++-objdumb", "cxx-objdump"),
+        ("*.cpp-objdump", "*.c++-objdump", "*.cxx-objdump"),
+        ("text/x-cpp-objdump",),
+    ),
+    "Crmsh": LexerEntry(
+        "pygments.lexers.dsls",
+        "CrmshLexer",
+        ("crmsh", "pcmk"),
+        ("*.crmsh", "*.pcmk"),
+        (),
+    ),
+    "Croc": LexerEntry(
+        "pygments.lexers.d",
+        "CrocLexer",
+        ("croc",),
+        ("*.croc",),
+        ("text/x-crocsrc",),
+    ),
+    "Cryptol": LexerEntry(
+        "pygments.lexers.haskell",
+        "CryptolLexer",
+        ("cryptol", "cry"),
+        ("*.cry",),
+        ("text/x-cryptol",),
+    ),
+    "Crystal": LexerEntry(
+        "pygments.lexers.crystal",
+        "CrystalLexer",
+        ("cr", "crystal"),
+        ("*.cr",),
+        ("text/x-crystal",),
+    ),
+    "Csound Document": LexerEntry(
+        "pygments.lexers.csound",
+        "CsoundDocumentLexer",
+        ("csound-document", "csound-csd"),
+        ("*.csd",),
+        (),
+    ),
+    "Csound Orchestra": LexerEntry(
+        "pygments.lexers.csound",
+        "CsoundOrchestraLexer",
+        ("csound", "csound-orc"),
+        ("*.orc", "*.udo"),
+        (),
+    ),
+    "Csound Score": LexerEntry(
+        "pygments.lexers.csound",
+        "CsoundScoreLexer",
+        ("csound-score", "csound-sco"),
+        ("*.sco",),
+        (),
+    ),
+    "CSS+Django/Jinja": LexerEntry(
+        "pygments.lexers.templates",
+        "CssDjangoLexer",
+        ("css+django", "css+jinja"),
+        ("*.css.j2", "*.css.jinja2"),
+        ("text/css+django", "text/css+jinja"),
+    ),
+    "CSS+Ruby": LexerEntry(
+        "pygments.lexers.templates",
+        "CssErbLexer",
+        ("css+ruby", "css+erb"),
+        (),
+        ("text/css+ruby",),
+    ),
+    "CSS+Genshi Text": LexerEntry(
+        "pygments.lexers.templates",
+        "CssGenshiLexer",
+        ("css+genshitext", "css+genshi"),
+        (),
+        ("text/css+genshi",),
+    ),
+    "CSS": LexerEntry(
+        "pygments.lexers.css",
+        "CssLexer",
+        ("css",),
+        ("*.css",),
+        ("text/css",),
+    ),
+    "CSS+PHP": LexerEntry(
+        "pygments.lexers.templates",
+        "CssPhpLexer",
+        ("css+php",),
+        (),
+        ("text/css+php",),
+    ),
+    "CSS+Smarty": LexerEntry(
+        "pygments.lexers.templates",
+        "CssSmartyLexer",
+        ("css+smarty",),
+        (),
+        ("text/css+smarty",),
+    ),
+    "CUDA": LexerEntry(
+        "pygments.lexers.c_like",
+        "CudaLexer",
+        ("cuda", "cu"),
+        ("*.cu", "*.cuh"),
+        ("text/x-cuda",),
+    ),
+    "Cypher": LexerEntry(
+        "pygments.lexers.graph",
+        "CypherLexer",
+        ("cypher",),
+        ("*.cyp", "*.cypher"),
+        (),
+    ),
+    "Cython": LexerEntry(
+        "pygments.lexers.python",
+        "CythonLexer",
+        ("cython", "pyx", "pyrex"),
+        ("*.pyx", "*.pxd", "*.pxi"),
+        ("text/x-cython", "application/x-cython"),
+    ),
+    "D": LexerEntry(
+        "pygments.lexers.d",
+        "DLexer",
+        ("d",),
+        ("*.d", "*.di"),
+        ("text/x-dsrc",),
+    ),
+    "d-objdump": LexerEntry(
+        "pygments.lexers.asm",
+        "DObjdumpLexer",
+        ("d-objdump",),
+        ("*.d-objdump",),
+        ("text/x-d-objdump",),
+    ),
+    "Darcs Patch": LexerEntry(
+        "pygments.lexers.diff",
+        "DarcsPatchLexer",
+        ("dpatch",),
+        ("*.dpatch", "*.darcspatch"),
+        (),
+    ),
+    "Dart": LexerEntry(
+        "pygments.lexers.javascript",
+        "DartLexer",
+        ("dart",),
+        ("*.dart",),
+        ("text/x-dart",),
+    ),
+    "DASM16": LexerEntry(
+        "pygments.lexers.asm",
+        "Dasm16Lexer",
+        ("dasm16",),
+        ("*.dasm16", "*.dasm"),
+        ("text/x-dasm16",),
+    ),
+    "Dax": LexerEntry(
+        "pygments.lexers.dax",
+        "DaxLexer",
+        ("dax",),
+        ("*.dax",),
+        (),
+    ),
+    "Debian Control file": LexerEntry(
+        "pygments.lexers.installers",
+        "DebianControlLexer",
+        ("debcontrol", "control"),
+        ("control",),
+        (),
+    ),
+    "Debian Sources file": LexerEntry(
+        "pygments.lexers.installers",
+        "DebianSourcesLexer",
+        ("debian.sources",),
+        ("*.sources",),
+        (),
+    ),
+    "Delphi": LexerEntry(
+        "pygments.lexers.pascal",
+        "DelphiLexer",
+        ("delphi", "pas", "pascal", "objectpascal"),
+        ("*.pas", "*.dpr"),
+        ("text/x-pascal",),
+    ),
+    "Desktop file": LexerEntry(
+        "pygments.lexers.configs",
+        "DesktopLexer",
+        ("desktop",),
+        ("*.desktop",),
+        ("application/x-desktop",),
+    ),
+    "Devicetree": LexerEntry(
+        "pygments.lexers.devicetree",
+        "DevicetreeLexer",
+        ("devicetree", "dts"),
+        ("*.dts", "*.dtsi"),
+        ("text/x-c",),
+    ),
+    "dg": LexerEntry(
+        "pygments.lexers.python",
+        "DgLexer",
+        ("dg",),
+        ("*.dg",),
+        ("text/x-dg",),
+    ),
+    "Diff": LexerEntry(
+        "pygments.lexers.diff",
+        "DiffLexer",
+        ("diff", "udiff"),
+        ("*.diff", "*.patch"),
+        ("text/x-diff", "text/x-patch"),
+    ),
+    "Django/Jinja": LexerEntry(
+        "pygments.lexers.templates",
+        "DjangoLexer",
+        ("django", "jinja"),
+        (),
+        ("application/x-django-templating", "application/x-jinja"),
+    ),
+    "Zone": LexerEntry(
+        "pygments.lexers.dns",
+        "DnsZoneLexer",
+        ("zone",),
+        ("*.zone",),
+        ("text/dns",),
+    ),
+    "Docker": LexerEntry(
+        "pygments.lexers.configs",
+        "DockerLexer",
+        ("docker", "dockerfile"),
+        ("Dockerfile", "*.docker"),
+        ("text/x-dockerfile-config",),
+    ),
+    "DTD": LexerEntry(
+        "pygments.lexers.html",
+        "DtdLexer",
+        ("dtd",),
+        ("*.dtd",),
+        ("application/xml-dtd",),
+    ),
+    "Duel": LexerEntry(
+        "pygments.lexers.webmisc",
+        "DuelLexer",
+        ("duel", "jbst", "jsonml+bst"),
+        ("*.duel", "*.jbst"),
+        ("text/x-duel", "text/x-jbst"),
+    ),
+    "Dylan session": LexerEntry(
+        "pygments.lexers.dylan",
+        "DylanConsoleLexer",
+        ("dylan-console", "dylan-repl"),
+        ("*.dylan-console",),
+        ("text/x-dylan-console",),
+    ),
+    "Dylan": LexerEntry(
+        "pygments.lexers.dylan",
+        "DylanLexer",
+        ("dylan",),
+        ("*.dylan", "*.dyl", "*.intr"),
+        ("text/x-dylan",),
+    ),
+    "DylanLID": LexerEntry(
+        "pygments.lexers.dylan",
+        "DylanLidLexer",
+        ("dylan-lid", "lid"),
+        ("*.lid", "*.hdp"),
+        ("text/x-dylan-lid",),
+    ),
+    "ECL": LexerEntry(
+        "pygments.lexers.ecl",
+        "ECLLexer",
+        ("ecl",),
+        ("*.ecl",),
+        ("application/x-ecl",),
+    ),
+    "eC": LexerEntry(
+        "pygments.lexers.c_like",
+        "ECLexer",
+        ("ec",),
+        ("*.ec", "*.eh"),
+        ("text/x-echdr", "text/x-ecsrc"),
+    ),
+    "Earl Grey": LexerEntry(
+        "pygments.lexers.javascript",
+        "EarlGreyLexer",
+        ("earl-grey", "earlgrey", "eg"),
+        ("*.eg",),
+        ("text/x-earl-grey",),
+    ),
+    "Easytrieve": LexerEntry(
+        "pygments.lexers.scripting",
+        "EasytrieveLexer",
+        ("easytrieve",),
+        ("*.ezt", "*.mac"),
+        ("text/x-easytrieve",),
+    ),
+    "EBNF": LexerEntry(
+        "pygments.lexers.parsers",
+        "EbnfLexer",
+        ("ebnf",),
+        ("*.ebnf",),
+        ("text/x-ebnf",),
+    ),
+    "Eiffel": LexerEntry(
+        "pygments.lexers.eiffel",
+        "EiffelLexer",
+        ("eiffel",),
+        ("*.e",),
+        ("text/x-eiffel",),
+    ),
+    "Elixir iex session": LexerEntry(
+        "pygments.lexers.erlang",
+        "ElixirConsoleLexer",
+        ("iex",),
+        (),
+        ("text/x-elixir-shellsession",),
+    ),
+    "Elixir": LexerEntry(
+        "pygments.lexers.erlang",
+        "ElixirLexer",
+        ("elixir", "ex", "exs"),
+        ("*.ex", "*.eex", "*.exs", "*.leex"),
+        ("text/x-elixir",),
+    ),
+    "Elm": LexerEntry(
+        "pygments.lexers.elm",
+        "ElmLexer",
+        ("elm",),
+        ("*.elm",),
+        ("text/x-elm",),
+    ),
+    "Elpi": LexerEntry(
+        "pygments.lexers.elpi",
+        "ElpiLexer",
+        ("elpi",),
+        ("*.elpi",),
+        ("text/x-elpi",),
+    ),
+    "EmacsLisp": LexerEntry(
+        "pygments.lexers.lisp",
+        "EmacsLispLexer",
+        ("emacs-lisp", "elisp", "emacs"),
+        ("*.el",),
+        ("text/x-elisp", "application/x-elisp"),
+    ),
+    "E-mail": LexerEntry(
+        "pygments.lexers.email",
+        "EmailLexer",
+        ("email", "eml"),
+        ("*.eml",),
+        ("message/rfc822",),
+    ),
+    "ERB": LexerEntry(
+        "pygments.lexers.templates",
+        "ErbLexer",
+        ("erb",),
+        (),
+        ("application/x-ruby-templating",),
+    ),
+    "Erlang": LexerEntry(
+        "pygments.lexers.erlang",
+        "ErlangLexer",
+        ("erlang",),
+        ("*.erl", "*.hrl", "*.es", "*.escript"),
+        ("text/x-erlang",),
+    ),
+    "Erlang erl session": LexerEntry(
+        "pygments.lexers.erlang",
+        "ErlangShellLexer",
+        ("erl",),
+        ("*.erl-sh",),
+        ("text/x-erl-shellsession",),
+    ),
+    "HTML+Evoque": LexerEntry(
+        "pygments.lexers.templates",
+        "EvoqueHtmlLexer",
+        ("html+evoque",),
+        (),
+        ("text/html+evoque",),
+    ),
+    "Evoque": LexerEntry(
+        "pygments.lexers.templates",
+        "EvoqueLexer",
+        ("evoque",),
+        ("*.evoque",),
+        ("application/x-evoque",),
+    ),
+    "XML+Evoque": LexerEntry(
+        "pygments.lexers.templates",
+        "EvoqueXmlLexer",
+        ("xml+evoque",),
+        (),
+        ("application/xml+evoque",),
+    ),
+    "execline": LexerEntry(
+        "pygments.lexers.shell",
+        "ExeclineLexer",
+        ("execline",),
+        ("*.exec",),
+        (),
+    ),
+    "Ezhil": LexerEntry(
+        "pygments.lexers.ezhil",
+        "EzhilLexer",
+        ("ezhil",),
+        ("*.n",),
+        ("text/x-ezhil",),
+    ),
+    "F#": LexerEntry(
+        "pygments.lexers.dotnet",
+        "FSharpLexer",
+        ("fsharp", "f#"),
+        ("*.fs", "*.fsi", "*.fsx"),
+        ("text/x-fsharp",),
+    ),
+    "FStar": LexerEntry(
+        "pygments.lexers.ml",
+        "FStarLexer",
+        ("fstar",),
+        ("*.fst", "*.fsti"),
+        ("text/x-fstar",),
+    ),
+    "Factor": LexerEntry(
+        "pygments.lexers.factor",
+        "FactorLexer",
+        ("factor",),
+        ("*.factor",),
+        ("text/x-factor",),
+    ),
+    "Fancy": LexerEntry(
+        "pygments.lexers.ruby",
+        "FancyLexer",
+        ("fancy", "fy"),
+        ("*.fy", "*.fancypack"),
+        ("text/x-fancysrc",),
+    ),
+    "Fantom": LexerEntry(
+        "pygments.lexers.fantom",
+        "FantomLexer",
+        ("fan",),
+        ("*.fan",),
+        ("application/x-fantom",),
+    ),
+    "Felix": LexerEntry(
+        "pygments.lexers.felix",
+        "FelixLexer",
+        ("felix", "flx"),
+        ("*.flx", "*.flxh"),
+        ("text/x-felix",),
+    ),
+    "Fennel": LexerEntry(
+        "pygments.lexers.lisp",
+        "FennelLexer",
+        ("fennel", "fnl"),
+        ("*.fnl", "*.fnlm"),
+        ("text/x-fennel",),
+    ),
+    "Fift": LexerEntry(
+        "pygments.lexers.fift",
+        "FiftLexer",
+        ("fift", "fif"),
+        ("*.fif",),
+        (),
+    ),
+    "Fish": LexerEntry(
+        "pygments.lexers.shell",
+        "FishShellLexer",
+        ("fish", "fishshell"),
+        ("*.fish", "*.load"),
+        ("application/x-fish",),
+    ),
+    "Flatline": LexerEntry(
+        "pygments.lexers.dsls",
+        "FlatlineLexer",
+        ("flatline",),
+        (),
+        ("text/x-flatline",),
+    ),
+    "FloScript": LexerEntry(
+        "pygments.lexers.floscript",
+        "FloScriptLexer",
+        ("floscript", "flo"),
+        ("*.flo",),
+        (),
+    ),
+    "Forth": LexerEntry(
+        "pygments.lexers.forth",
+        "ForthLexer",
+        ("forth",),
+        ("*.frt", "*.fs"),
+        ("application/x-forth",),
+    ),
+    "FortranFixed": LexerEntry(
+        "pygments.lexers.fortran",
+        "FortranFixedLexer",
+        ("fortranfixed",),
+        ("*.f", "*.F"),
+        (),
+    ),
+    "Fortran": LexerEntry(
+        "pygments.lexers.fortran",
+        "FortranLexer",
+        ("fortran", "f90"),
+        ("*.f03", "*.f90", "*.F03", "*.F90"),
+        ("text/x-fortran",),
+    ),
+    "FoxPro": LexerEntry(
+        "pygments.lexers.foxpro",
+        "FoxProLexer",
+        ("foxpro", "vfp", "clipper", "xbase"),
+        ("*.PRG", "*.prg"),
+        (),
+    ),
+    "Freefem": LexerEntry(
+        "pygments.lexers.freefem",
+        "FreeFemLexer",
+        ("freefem",),
+        ("*.edp",),
+        ("text/x-freefem",),
+    ),
+    "FunC": LexerEntry(
+        "pygments.lexers.func",
+        "FuncLexer",
+        ("func", "fc"),
+        ("*.fc", "*.func"),
+        (),
+    ),
+    "Futhark": LexerEntry(
+        "pygments.lexers.futhark",
+        "FutharkLexer",
+        ("futhark",),
+        ("*.fut",),
+        ("text/x-futhark",),
+    ),
+    "GAP session": LexerEntry(
+        "pygments.lexers.algebra",
+        "GAPConsoleLexer",
+        ("gap-console", "gap-repl"),
+        ("*.tst",),
+        (),
+    ),
+    "GAP": LexerEntry(
+        "pygments.lexers.algebra",
+        "GAPLexer",
+        ("gap",),
+        ("*.g", "*.gd", "*.gi", "*.gap"),
+        (),
+    ),
+    "GDScript": LexerEntry(
+        "pygments.lexers.gdscript",
+        "GDScriptLexer",
+        ("gdscript", "gd"),
+        ("*.gd",),
+        ("text/x-gdscript", "application/x-gdscript"),
+    ),
+    "GLSL": LexerEntry(
+        "pygments.lexers.graphics",
+        "GLShaderLexer",
+        ("glsl",),
+        ("*.vert", "*.frag", "*.geo"),
+        ("text/x-glslsrc",),
+    ),
+    "GSQL": LexerEntry(
+        "pygments.lexers.gsql",
+        "GSQLLexer",
+        ("gsql",),
+        ("*.gsql",),
+        (),
+    ),
+    "GAS": LexerEntry(
+        "pygments.lexers.asm",
+        "GasLexer",
+        ("gas", "asm"),
+        ("*.s", "*.S"),
+        ("text/x-gas",),
+    ),
+    "g-code": LexerEntry(
+        "pygments.lexers.gcodelexer",
+        "GcodeLexer",
+        ("gcode",),
+        ("*.gcode",),
+        (),
+    ),
+    "Genshi": LexerEntry(
+        "pygments.lexers.templates",
+        "GenshiLexer",
+        ("genshi", "kid", "xml+genshi", "xml+kid"),
+        ("*.kid",),
+        ("application/x-genshi", "application/x-kid"),
+    ),
+    "Genshi Text": LexerEntry(
+        "pygments.lexers.templates",
+        "GenshiTextLexer",
+        ("genshitext",),
+        (),
+        ("application/x-genshi-text", "text/x-genshi"),
+    ),
+    "Gettext Catalog": LexerEntry(
+        "pygments.lexers.textfmts",
+        "GettextLexer",
+        ("pot", "po"),
+        ("*.pot", "*.po"),
+        ("application/x-gettext", "text/x-gettext", "text/gettext"),
+    ),
+    "Gherkin": LexerEntry(
+        "pygments.lexers.testing",
+        "GherkinLexer",
+        ("gherkin", "cucumber"),
+        ("*.feature",),
+        ("text/x-gherkin",),
+    ),
+    "Gleam": LexerEntry(
+        "pygments.lexers.gleam",
+        "GleamLexer",
+        ("gleam",),
+        ("*.gleam",),
+        ("text/x-gleam",),
+    ),
+    "Gnuplot": LexerEntry(
+        "pygments.lexers.graphics",
+        "GnuplotLexer",
+        ("gnuplot",),
+        ("*.plot", "*.plt"),
+        ("text/x-gnuplot",),
+    ),
+    "Go": LexerEntry(
+        "pygments.lexers.go",
+        "GoLexer",
+        ("go", "golang"),
+        ("*.go",),
+        ("text/x-gosrc",),
+    ),
+    "Golo": LexerEntry(
+        "pygments.lexers.jvm",
+        "GoloLexer",
+        ("golo",),
+        ("*.golo",),
+        (),
+    ),
+    "GoodData-CL": LexerEntry(
+        "pygments.lexers.business",
+        "GoodDataCLLexer",
+        ("gooddata-cl",),
+        ("*.gdc",),
+        ("text/x-gooddata-cl",),
+    ),
+    "GoogleSQL": LexerEntry(
+        "pygments.lexers.sql",
+        "GoogleSqlLexer",
+        ("googlesql", "zetasql"),
+        ("*.googlesql", "*.googlesql.sql"),
+        ("text/x-google-sql", "text/x-google-sql-aux"),
+    ),
+    "Gosu": LexerEntry(
+        "pygments.lexers.jvm",
+        "GosuLexer",
+        ("gosu",),
+        ("*.gs", "*.gsx", "*.gsp", "*.vark"),
+        ("text/x-gosu",),
+    ),
+    "Gosu Template": LexerEntry(
+        "pygments.lexers.jvm",
+        "GosuTemplateLexer",
+        ("gst",),
+        ("*.gst",),
+        ("text/x-gosu-template",),
+    ),
+    "GraphQL": LexerEntry(
+        "pygments.lexers.graphql",
+        "GraphQLLexer",
+        ("graphql",),
+        ("*.graphql",),
+        (),
+    ),
+    "Graphviz": LexerEntry(
+        "pygments.lexers.graphviz",
+        "GraphvizLexer",
+        ("graphviz", "dot"),
+        ("*.gv", "*.dot"),
+        ("text/x-graphviz", "text/vnd.graphviz"),
+    ),
+    "Groff": LexerEntry(
+        "pygments.lexers.markup",
+        "GroffLexer",
+        ("groff", "nroff", "man"),
+        ("*.[1-9]", "*.man", "*.1p", "*.3pm"),
+        ("application/x-troff", "text/troff"),
+    ),
+    "Groovy": LexerEntry(
+        "pygments.lexers.jvm",
+        "GroovyLexer",
+        ("groovy",),
+        ("*.groovy", "*.gradle"),
+        ("text/x-groovy",),
+    ),
+    "HLSL": LexerEntry(
+        "pygments.lexers.graphics",
+        "HLSLShaderLexer",
+        ("hlsl",),
+        ("*.hlsl", "*.hlsli"),
+        ("text/x-hlsl",),
+    ),
+    "HTML+UL4": LexerEntry(
+        "pygments.lexers.ul4",
+        "HTMLUL4Lexer",
+        ("html+ul4",),
+        ("*.htmlul4",),
+        (),
+    ),
+    "Haml": LexerEntry(
+        "pygments.lexers.html",
+        "HamlLexer",
+        ("haml",),
+        ("*.haml",),
+        ("text/x-haml",),
+    ),
+    "HTML+Handlebars": LexerEntry(
+        "pygments.lexers.templates",
+        "HandlebarsHtmlLexer",
+        ("html+handlebars",),
+        ("*.handlebars", "*.hbs"),
+        ("text/html+handlebars", "text/x-handlebars-template"),
+    ),
+    "Handlebars": LexerEntry(
+        "pygments.lexers.templates",
+        "HandlebarsLexer",
+        ("handlebars",),
+        (),
+        (),
+    ),
+    "Hare": LexerEntry(
+        "pygments.lexers.hare",
+        "HareLexer",
+        ("hare",),
+        ("*.ha",),
+        ("text/x-hare",),
+    ),
+    "Haskell": LexerEntry(
+        "pygments.lexers.haskell",
+        "HaskellLexer",
+        ("haskell", "hs"),
+        ("*.hs",),
+        ("text/x-haskell",),
+    ),
+    "Haxe": LexerEntry(
+        "pygments.lexers.haxe",
+        "HaxeLexer",
+        ("haxe", "hxsl", "hx"),
+        ("*.hx", "*.hxsl"),
+        ("text/haxe", "text/x-haxe", "text/x-hx"),
+    ),
+    "Hexdump": LexerEntry(
+        "pygments.lexers.hexdump",
+        "HexdumpLexer",
+        ("hexdump",),
+        (),
+        (),
+    ),
+    "HSAIL": LexerEntry(
+        "pygments.lexers.asm",
+        "HsailLexer",
+        ("hsail", "hsa"),
+        ("*.hsail",),
+        ("text/x-hsail",),
+    ),
+    "Hspec": LexerEntry(
+        "pygments.lexers.haskell",
+        "HspecLexer",
+        ("hspec",),
+        ("*Spec.hs",),
+        (),
+    ),
+    "HTML+Django/Jinja": LexerEntry(
+        "pygments.lexers.templates",
+        "HtmlDjangoLexer",
+        ("html+django", "html+jinja", "htmldjango"),
+        (
+            "*.html.j2",
+            "*.htm.j2",
+            "*.xhtml.j2",
+            "*.html.jinja2",
+            "*.htm.jinja2",
+            "*.xhtml.jinja2",
+        ),
+        ("text/html+django", "text/html+jinja"),
+    ),
+    "HTML+Genshi": LexerEntry(
+        "pygments.lexers.templates",
+        "HtmlGenshiLexer",
+        ("html+genshi", "html+kid"),
+        (),
+        ("text/html+genshi",),
+    ),
+    "HTML": LexerEntry(
+        "pygments.lexers.html",
+        "HtmlLexer",
+        ("html",),
+        ("*.html", "*.htm", "*.xhtml", "*.xslt"),
+        ("text/html", "application/xhtml+xml"),
+    ),
+    "HTML+PHP": LexerEntry(
+        "pygments.lexers.templates",
+        "HtmlPhpLexer",
+        ("html+php",),
+        ("*.phtml",),
+        (
+            "application/x-php",
+            "application/x-httpd-php",
+            "application/x-httpd-php3",
+            "application/x-httpd-php4",
+            "application/x-httpd-php5",
+        ),
+    ),
+    "HTML+Smarty": LexerEntry(
+        "pygments.lexers.templates",
+        "HtmlSmartyLexer",
+        ("html+smarty",),
+        (),
+        ("text/html+smarty",),
+    ),
+    "HTTP": LexerEntry(
+        "pygments.lexers.textfmts",
+        "HttpLexer",
+        ("http",),
+        (),
+        (),
+    ),
+    "Hxml": LexerEntry(
+        "pygments.lexers.haxe",
+        "HxmlLexer",
+        ("haxeml", "hxml"),
+        ("*.hxml",),
+        (),
+    ),
+    "Hy": LexerEntry(
+        "pygments.lexers.lisp",
+        "HyLexer",
+        ("hylang", "hy"),
+        ("*.hy",),
+        ("text/x-hy", "application/x-hy"),
+    ),
+    "Hybris": LexerEntry(
+        "pygments.lexers.scripting",
+        "HybrisLexer",
+        ("hybris",),
+        ("*.hyb",),
+        ("text/x-hybris", "application/x-hybris"),
+    ),
+    "IDL": LexerEntry(
+        "pygments.lexers.idl",
+        "IDLLexer",
+        ("idl",),
+        ("*.pro",),
+        ("text/idl",),
+    ),
+    "Icon": LexerEntry(
+        "pygments.lexers.unicon",
+        "IconLexer",
+        ("icon",),
+        ("*.icon", "*.ICON"),
+        (),
+    ),
+    "Idris": LexerEntry(
+        "pygments.lexers.haskell",
+        "IdrisLexer",
+        ("idris", "idr"),
+        ("*.idr",),
+        ("text/x-idris",),
+    ),
+    "Igor": LexerEntry(
+        "pygments.lexers.igor",
+        "IgorLexer",
+        ("igor", "igorpro"),
+        ("*.ipf",),
+        ("text/ipf",),
+    ),
+    "Inform 6": LexerEntry(
+        "pygments.lexers.int_fiction",
+        "Inform6Lexer",
+        ("inform6", "i6"),
+        ("*.inf",),
+        (),
+    ),
+    "Inform 6 template": LexerEntry(
+        "pygments.lexers.int_fiction",
+        "Inform6TemplateLexer",
+        ("i6t",),
+        ("*.i6t",),
+        (),
+    ),
+    "Inform 7": LexerEntry(
+        "pygments.lexers.int_fiction",
+        "Inform7Lexer",
+        ("inform7", "i7"),
+        ("*.ni", "*.i7x"),
+        (),
+    ),
+    "INI": LexerEntry(
+        "pygments.lexers.configs",
+        "IniLexer",
+        ("ini", "cfg", "dosini"),
+        ("*.ini", "*.cfg", "*.inf", ".editorconfig"),
+        ("text/x-ini", "text/inf"),
+    ),
+    "Io": LexerEntry(
+        "pygments.lexers.iolang",
+        "IoLexer",
+        ("io",),
+        ("*.io",),
+        ("text/x-iosrc",),
+    ),
+    "Ioke": LexerEntry(
+        "pygments.lexers.jvm",
+        "IokeLexer",
+        ("ioke", "ik"),
+        ("*.ik",),
+        ("text/x-iokesrc",),
+    ),
+    "IRC logs": LexerEntry(
+        "pygments.lexers.textfmts",
+        "IrcLogsLexer",
+        ("irc",),
+        ("*.weechatlog",),
+        ("text/x-irclog",),
+    ),
+    "Isabelle": LexerEntry(
+        "pygments.lexers.theorem",
+        "IsabelleLexer",
+        ("isabelle",),
+        ("*.thy",),
+        ("text/x-isabelle",),
+    ),
+    "J": LexerEntry(
+        "pygments.lexers.j",
+        "JLexer",
+        ("j",),
+        ("*.ijs",),
+        ("text/x-j",),
+    ),
+    "JMESPath": LexerEntry(
+        "pygments.lexers.jmespath",
+        "JMESPathLexer",
+        ("jmespath", "jp"),
+        ("*.jp",),
+        (),
+    ),
+    "JSLT": LexerEntry(
+        "pygments.lexers.jslt",
+        "JSLTLexer",
+        ("jslt",),
+        ("*.jslt",),
+        ("text/x-jslt",),
+    ),
+    "JAGS": LexerEntry(
+        "pygments.lexers.modeling",
+        "JagsLexer",
+        ("jags",),
+        ("*.jag", "*.bug"),
+        (),
+    ),
+    "Janet": LexerEntry(
+        "pygments.lexers.lisp",
+        "JanetLexer",
+        ("janet",),
+        ("*.janet", "*.jdn"),
+        ("text/x-janet", "application/x-janet"),
+    ),
+    "Jasmin": LexerEntry(
+        "pygments.lexers.jvm",
+        "JasminLexer",
+        ("jasmin", "jasminxt"),
+        ("*.j",),
+        (),
+    ),
+    "Java": LexerEntry(
+        "pygments.lexers.jvm",
+        "JavaLexer",
+        ("java",),
+        ("*.java",),
+        ("text/x-java",),
+    ),
+    "JavaScript+Django/Jinja": LexerEntry(
+        "pygments.lexers.templates",
+        "JavascriptDjangoLexer",
+        ("javascript+django", "js+django", "javascript+jinja", "js+jinja"),
+        ("*.js.j2", "*.js.jinja2"),
+        (
+            "application/x-javascript+django",
+            "application/x-javascript+jinja",
+            "text/x-javascript+django",
+            "text/x-javascript+jinja",
+            "text/javascript+django",
+            "text/javascript+jinja",
+        ),
+    ),
+    "JavaScript+Ruby": LexerEntry(
+        "pygments.lexers.templates",
+        "JavascriptErbLexer",
+        ("javascript+ruby", "js+ruby", "javascript+erb", "js+erb"),
+        (),
+        (
+            "application/x-javascript+ruby",
+            "text/x-javascript+ruby",
+            "text/javascript+ruby",
+        ),
+    ),
+    "JavaScript+Genshi Text": LexerEntry(
+        "pygments.lexers.templates",
+        "JavascriptGenshiLexer",
+        ("js+genshitext", "js+genshi", "javascript+genshitext", "javascript+genshi"),
+        (),
+        (
+            "application/x-javascript+genshi",
+            "text/x-javascript+genshi",
+            "text/javascript+genshi",
+        ),
+    ),
+    "JavaScript": LexerEntry(
+        "pygments.lexers.javascript",
+        "JavascriptLexer",
+        ("javascript", "js"),
+        ("*.js", "*.jsm", "*.mjs", "*.cjs"),
+        (
+            "application/javascript",
+            "application/x-javascript",
+            "text/x-javascript",
+            "text/javascript",
+        ),
+    ),
+    "JavaScript+PHP": LexerEntry(
+        "pygments.lexers.templates",
+        "JavascriptPhpLexer",
+        ("javascript+php", "js+php"),
+        (),
+        (
+            "application/x-javascript+php",
+            "text/x-javascript+php",
+            "text/javascript+php",
+        ),
+    ),
+    "JavaScript+Smarty": LexerEntry(
+        "pygments.lexers.templates",
+        "JavascriptSmartyLexer",
+        ("javascript+smarty", "js+smarty"),
+        (),
+        (
+            "application/x-javascript+smarty",
+            "text/x-javascript+smarty",
+            "text/javascript+smarty",
+        ),
+    ),
+    "Javascript+UL4": LexerEntry(
+        "pygments.lexers.ul4",
+        "JavascriptUL4Lexer",
+        ("js+ul4",),
+        ("*.jsul4",),
+        (),
+    ),
+    "JCL": LexerEntry(
+        "pygments.lexers.scripting",
+        "JclLexer",
+        ("jcl",),
+        ("*.jcl",),
+        ("text/x-jcl",),
+    ),
+    "JSGF": LexerEntry(
+        "pygments.lexers.grammar_notation",
+        "JsgfLexer",
+        ("jsgf",),
+        ("*.jsgf",),
+        ("application/jsgf", "application/x-jsgf", "text/jsgf"),
+    ),
+    "JSON5": LexerEntry(
+        "pygments.lexers.json5",
+        "Json5Lexer",
+        ("json5",),
+        ("*.json5",),
+        (),
+    ),
+    "JSON-LD": LexerEntry(
+        "pygments.lexers.data",
+        "JsonLdLexer",
+        ("jsonld", "json-ld"),
+        ("*.jsonld",),
+        ("application/ld+json",),
+    ),
+    "JSON": LexerEntry(
+        "pygments.lexers.data",
+        "JsonLexer",
+        ("json", "json-object"),
+        ("*.json", "*.jsonl", "*.ndjson", "Pipfile.lock", "*.module", "*.xc"),
+        (
+            "application/json",
+            "application/json-object",
+            "application/x-ndjson",
+            "application/jsonl",
+            "application/json-seq",
+        ),
+    ),
+    "Jsonnet": LexerEntry(
+        "pygments.lexers.jsonnet",
+        "JsonnetLexer",
+        ("jsonnet",),
+        ("*.jsonnet", "*.libsonnet"),
+        (),
+    ),
+    "Java Server Page": LexerEntry(
+        "pygments.lexers.templates",
+        "JspLexer",
+        ("jsp",),
+        ("*.jsp",),
+        ("application/x-jsp",),
+    ),
+    "JSX": LexerEntry(
+        "pygments.lexers.jsx",
+        "JsxLexer",
+        ("jsx", "react"),
+        ("*.jsx", "*.react"),
+        ("text/jsx", "text/typescript-jsx"),
+    ),
+    "Julia console": LexerEntry(
+        "pygments.lexers.julia",
+        "JuliaConsoleLexer",
+        ("jlcon", "julia-repl"),
+        (),
+        (),
+    ),
+    "Julia": LexerEntry(
+        "pygments.lexers.julia",
+        "JuliaLexer",
+        ("julia", "jl"),
+        ("*.jl",),
+        ("text/x-julia", "application/x-julia"),
+    ),
+    "Juttle": LexerEntry(
+        "pygments.lexers.javascript",
+        "JuttleLexer",
+        ("juttle",),
+        ("*.juttle",),
+        ("application/juttle", "application/x-juttle", "text/x-juttle", "text/juttle"),
+    ),
+    "K": LexerEntry(
+        "pygments.lexers.q",
+        "KLexer",
+        ("k",),
+        ("*.k",),
+        (),
+    ),
+    "Kal": LexerEntry(
+        "pygments.lexers.javascript",
+        "KalLexer",
+        ("kal",),
+        ("*.kal",),
+        ("text/kal", "application/kal"),
+    ),
+    "Kconfig": LexerEntry(
+        "pygments.lexers.configs",
+        "KconfigLexer",
+        ("kconfig", "menuconfig", "linux-config", "kernel-config"),
+        ("Kconfig*", "*Config.in*", "external.in*", "standard-modules.in"),
+        ("text/x-kconfig",),
+    ),
+    "Kernel log": LexerEntry(
+        "pygments.lexers.textfmts",
+        "KernelLogLexer",
+        ("kmsg", "dmesg"),
+        ("*.kmsg", "*.dmesg"),
+        (),
+    ),
+    "Koka": LexerEntry(
+        "pygments.lexers.haskell",
+        "KokaLexer",
+        ("koka",),
+        ("*.kk", "*.kki"),
+        ("text/x-koka",),
+    ),
+    "Kotlin": LexerEntry(
+        "pygments.lexers.jvm",
+        "KotlinLexer",
+        ("kotlin",),
+        ("*.kt", "*.kts"),
+        ("text/x-kotlin",),
+    ),
+    "Kuin": LexerEntry(
+        "pygments.lexers.kuin",
+        "KuinLexer",
+        ("kuin",),
+        ("*.kn",),
+        (),
+    ),
+    "Kusto": LexerEntry(
+        "pygments.lexers.kusto",
+        "KustoLexer",
+        ("kql", "kusto"),
+        ("*.kql", "*.kusto", ".csl"),
+        (),
+    ),
+    "LSL": LexerEntry(
+        "pygments.lexers.scripting",
+        "LSLLexer",
+        ("lsl",),
+        ("*.lsl",),
+        ("text/x-lsl",),
+    ),
+    "CSS+Lasso": LexerEntry(
+        "pygments.lexers.templates",
+        "LassoCssLexer",
+        ("css+lasso",),
+        (),
+        ("text/css+lasso",),
+    ),
+    "HTML+Lasso": LexerEntry(
+        "pygments.lexers.templates",
+        "LassoHtmlLexer",
+        ("html+lasso",),
+        (),
+        (
+            "text/html+lasso",
+            "application/x-httpd-lasso",
+            "application/x-httpd-lasso[89]",
+        ),
+    ),
+    "JavaScript+Lasso": LexerEntry(
+        "pygments.lexers.templates",
+        "LassoJavascriptLexer",
+        ("javascript+lasso", "js+lasso"),
+        (),
+        (
+            "application/x-javascript+lasso",
+            "text/x-javascript+lasso",
+            "text/javascript+lasso",
+        ),
+    ),
+    "Lasso": LexerEntry(
+        "pygments.lexers.javascript",
+        "LassoLexer",
+        ("lasso", "lassoscript"),
+        ("*.lasso", "*.lasso[89]"),
+        ("text/x-lasso",),
+    ),
+    "XML+Lasso": LexerEntry(
+        "pygments.lexers.templates",
+        "LassoXmlLexer",
+        ("xml+lasso",),
+        (),
+        ("application/xml+lasso",),
+    ),
+    "LDAP configuration file": LexerEntry(
+        "pygments.lexers.ldap",
+        "LdaprcLexer",
+        ("ldapconf", "ldaprc"),
+        (".ldaprc", "ldaprc", "ldap.conf"),
+        ("text/x-ldapconf",),
+    ),
+    "LDIF": LexerEntry(
+        "pygments.lexers.ldap",
+        "LdifLexer",
+        ("ldif",),
+        ("*.ldif",),
+        ("text/x-ldif",),
+    ),
+    "Lean": LexerEntry(
+        "pygments.lexers.lean",
+        "Lean3Lexer",
+        ("lean", "lean3"),
+        ("*.lean",),
+        ("text/x-lean", "text/x-lean3"),
+    ),
+    "Lean4": LexerEntry(
+        "pygments.lexers.lean",
+        "Lean4Lexer",
+        ("lean4",),
+        ("*.lean",),
+        ("text/x-lean4",),
+    ),
+    "LessCss": LexerEntry(
+        "pygments.lexers.css",
+        "LessCssLexer",
+        ("less",),
+        ("*.less",),
+        ("text/x-less-css",),
+    ),
+    "Lighttpd configuration file": LexerEntry(
+        "pygments.lexers.configs",
+        "LighttpdConfLexer",
+        ("lighttpd", "lighty"),
+        ("lighttpd.conf",),
+        ("text/x-lighttpd-conf",),
+    ),
+    "LilyPond": LexerEntry(
+        "pygments.lexers.lilypond",
+        "LilyPondLexer",
+        ("lilypond",),
+        ("*.ly",),
+        (),
+    ),
+    "Limbo": LexerEntry(
+        "pygments.lexers.inferno",
+        "LimboLexer",
+        ("limbo",),
+        ("*.b",),
+        ("text/limbo",),
+    ),
+    "liquid": LexerEntry(
+        "pygments.lexers.templates",
+        "LiquidLexer",
+        ("liquid",),
+        ("*.liquid",),
+        (),
+    ),
+    "Literate Agda": LexerEntry(
+        "pygments.lexers.haskell",
+        "LiterateAgdaLexer",
+        ("literate-agda", "lagda"),
+        ("*.lagda",),
+        ("text/x-literate-agda",),
+    ),
+    "Literate Cryptol": LexerEntry(
+        "pygments.lexers.haskell",
+        "LiterateCryptolLexer",
+        ("literate-cryptol", "lcryptol", "lcry"),
+        ("*.lcry",),
+        ("text/x-literate-cryptol",),
+    ),
+    "Literate Haskell": LexerEntry(
+        "pygments.lexers.haskell",
+        "LiterateHaskellLexer",
+        ("literate-haskell", "lhaskell", "lhs"),
+        ("*.lhs",),
+        ("text/x-literate-haskell",),
+    ),
+    "Literate Idris": LexerEntry(
+        "pygments.lexers.haskell",
+        "LiterateIdrisLexer",
+        ("literate-idris", "lidris", "lidr"),
+        ("*.lidr",),
+        ("text/x-literate-idris",),
+    ),
+    "LiveScript": LexerEntry(
+        "pygments.lexers.javascript",
+        "LiveScriptLexer",
+        ("livescript", "live-script"),
+        ("*.ls",),
+        ("text/livescript",),
+    ),
+    "LLVM": LexerEntry(
+        "pygments.lexers.asm",
+        "LlvmLexer",
+        ("llvm",),
+        ("*.ll",),
+        ("text/x-llvm",),
+    ),
+    "LLVM-MIR Body": LexerEntry(
+        "pygments.lexers.asm",
+        "LlvmMirBodyLexer",
+        ("llvm-mir-body",),
+        (),
+        (),
+    ),
+    "LLVM-MIR": LexerEntry(
+        "pygments.lexers.asm",
+        "LlvmMirLexer",
+        ("llvm-mir",),
+        ("*.mir",),
+        (),
+    ),
+    "Logos": LexerEntry(
+        "pygments.lexers.objective",
+        "LogosLexer",
+        ("logos",),
+        ("*.x", "*.xi", "*.xm", "*.xmi"),
+        ("text/x-logos",),
+    ),
+    "Logtalk": LexerEntry(
+        "pygments.lexers.prolog",
+        "LogtalkLexer",
+        ("logtalk",),
+        ("*.lgt", "*.logtalk"),
+        ("text/x-logtalk",),
+    ),
+    "Lua": LexerEntry(
+        "pygments.lexers.scripting",
+        "LuaLexer",
+        ("lua",),
+        ("*.lua", "*.wlua"),
+        ("text/x-lua", "application/x-lua"),
+    ),
+    "Luau": LexerEntry(
+        "pygments.lexers.scripting",
+        "LuauLexer",
+        ("luau",),
+        ("*.luau",),
+        (),
+    ),
+    "MCFunction": LexerEntry(
+        "pygments.lexers.minecraft",
+        "MCFunctionLexer",
+        ("mcfunction", "mcf"),
+        ("*.mcfunction",),
+        ("text/mcfunction",),
+    ),
+    "MCSchema": LexerEntry(
+        "pygments.lexers.minecraft",
+        "MCSchemaLexer",
+        ("mcschema",),
+        ("*.mcschema",),
+        ("text/mcschema",),
+    ),
+    "MIME": LexerEntry(
+        "pygments.lexers.mime",
+        "MIMELexer",
+        ("mime",),
+        (),
+        ("multipart/mixed", "multipart/related", "multipart/alternative"),
+    ),
+    "MIPS": LexerEntry(
+        "pygments.lexers.mips",
+        "MIPSLexer",
+        ("mips",),
+        ("*.mips", "*.MIPS"),
+        (),
+    ),
+    "MOOCode": LexerEntry(
+        "pygments.lexers.scripting",
+        "MOOCodeLexer",
+        ("moocode", "moo"),
+        ("*.moo",),
+        ("text/x-moocode",),
+    ),
+    "MSDOS Session": LexerEntry(
+        "pygments.lexers.shell",
+        "MSDOSSessionLexer",
+        ("doscon",),
+        (),
+        (),
+    ),
+    "Macaulay2": LexerEntry(
+        "pygments.lexers.macaulay2",
+        "Macaulay2Lexer",
+        ("macaulay2",),
+        ("*.m2",),
+        (),
+    ),
+    "Makefile": LexerEntry(
+        "pygments.lexers.make",
+        "MakefileLexer",
+        ("make", "makefile", "mf", "bsdmake"),
+        ("*.mak", "*.mk", "Makefile", "makefile", "Makefile.*", "GNUmakefile"),
+        ("text/x-makefile",),
+    ),
+    "CSS+Mako": LexerEntry(
+        "pygments.lexers.templates",
+        "MakoCssLexer",
+        ("css+mako",),
+        (),
+        ("text/css+mako",),
+    ),
+    "HTML+Mako": LexerEntry(
+        "pygments.lexers.templates",
+        "MakoHtmlLexer",
+        ("html+mako",),
+        (),
+        ("text/html+mako",),
+    ),
+    "JavaScript+Mako": LexerEntry(
+        "pygments.lexers.templates",
+        "MakoJavascriptLexer",
+        ("javascript+mako", "js+mako"),
+        (),
+        (
+            "application/x-javascript+mako",
+            "text/x-javascript+mako",
+            "text/javascript+mako",
+        ),
+    ),
+    "Mako": LexerEntry(
+        "pygments.lexers.templates",
+        "MakoLexer",
+        ("mako",),
+        ("*.mao",),
+        ("application/x-mako",),
+    ),
+    "XML+Mako": LexerEntry(
+        "pygments.lexers.templates",
+        "MakoXmlLexer",
+        ("xml+mako",),
+        (),
+        ("application/xml+mako",),
+    ),
+    "Maple": LexerEntry(
+        "pygments.lexers.maple",
+        "MapleLexer",
+        ("maple",),
+        ("*.mpl", "*.mi", "*.mm"),
+        ("text/x-maple",),
+    ),
+    "MAQL": LexerEntry(
+        "pygments.lexers.business",
+        "MaqlLexer",
+        ("maql",),
+        ("*.maql",),
+        ("text/x-gooddata-maql", "application/x-gooddata-maql"),
+    ),
+    "Markdown": LexerEntry(
+        "pygments.lexers.markup",
+        "MarkdownLexer",
+        ("markdown", "md"),
+        ("*.md", "*.markdown"),
+        ("text/x-markdown",),
+    ),
+    "Mask": LexerEntry(
+        "pygments.lexers.javascript",
+        "MaskLexer",
+        ("mask",),
+        ("*.mask",),
+        ("text/x-mask",),
+    ),
+    "Mason": LexerEntry(
+        "pygments.lexers.templates",
+        "MasonLexer",
+        ("mason",),
+        ("*.m", "*.mhtml", "*.mc", "*.mi", "autohandler", "dhandler"),
+        ("application/x-mason",),
+    ),
+    "Mathematica": LexerEntry(
+        "pygments.lexers.algebra",
+        "MathematicaLexer",
+        ("mathematica", "mma", "nb", "wl", "wolfram"),
+        ("*.nb", "*.cdf", "*.nbp", "*.ma", "*.wl", "*.wls"),
+        (
+            "application/mathematica",
+            "application/vnd.wolfram.mathematica",
+            "application/vnd.wolfram.mathematica.package",
+            "application/vnd.wolfram.cdf",
+            "application/vnd.wolfram.wl",
+        ),
+    ),
+    "Matlab": LexerEntry(
+        "pygments.lexers.matlab",
+        "MatlabLexer",
+        ("matlab",),
+        ("*.m",),
+        ("text/matlab",),
+    ),
+    "Matlab session": LexerEntry(
+        "pygments.lexers.matlab",
+        "MatlabSessionLexer",
+        ("matlabsession",),
+        (),
+        (),
+    ),
+    "Maxima": LexerEntry(
+        "pygments.lexers.maxima",
+        "MaximaLexer",
+        ("maxima", "macsyma"),
+        ("*.mac", "*.max"),
+        (),
+    ),
+    "Meson": LexerEntry(
+        "pygments.lexers.meson",
+        "MesonLexer",
+        ("meson", "meson.build"),
+        ("meson.build", "meson.options", "meson_options.txt"),
+        ("text/x-meson",),
+    ),
+    "MiniD": LexerEntry(
+        "pygments.lexers.d",
+        "MiniDLexer",
+        ("minid",),
+        (),
+        ("text/x-minidsrc",),
+    ),
+    "MiniScript": LexerEntry(
+        "pygments.lexers.scripting",
+        "MiniScriptLexer",
+        ("miniscript", "ms"),
+        ("*.ms",),
+        ("text/x-minicript", "application/x-miniscript"),
+    ),
+    "Modelica": LexerEntry(
+        "pygments.lexers.modeling",
+        "ModelicaLexer",
+        ("modelica",),
+        ("*.mo",),
+        ("text/x-modelica",),
+    ),
+    "Modula-2": LexerEntry(
+        "pygments.lexers.modula2",
+        "Modula2Lexer",
+        ("modula2", "m2"),
+        ("*.def", "*.mod"),
+        ("text/x-modula2",),
+    ),
+    "MoinMoin/Trac Wiki markup": LexerEntry(
+        "pygments.lexers.markup",
+        "MoinWikiLexer",
+        ("trac-wiki", "moin"),
+        (),
+        ("text/x-trac-wiki",),
+    ),
+    "Mojo": LexerEntry(
+        "pygments.lexers.mojo",
+        "MojoLexer",
+        ("mojo", "🔥"),
+        ("*.mojo", "*.🔥"),
+        ("text/x-mojo", "application/x-mojo"),
+    ),
+    "Monkey": LexerEntry(
+        "pygments.lexers.basic",
+        "MonkeyLexer",
+        ("monkey",),
+        ("*.monkey",),
+        ("text/x-monkey",),
+    ),
+    "Monte": LexerEntry(
+        "pygments.lexers.monte",
+        "MonteLexer",
+        ("monte",),
+        ("*.mt",),
+        (),
+    ),
+    "MoonScript": LexerEntry(
+        "pygments.lexers.scripting",
+        "MoonScriptLexer",
+        ("moonscript", "moon"),
+        ("*.moon",),
+        ("text/x-moonscript", "application/x-moonscript"),
+    ),
+    "Mosel": LexerEntry(
+        "pygments.lexers.mosel",
+        "MoselLexer",
+        ("mosel",),
+        ("*.mos",),
+        (),
+    ),
+    "CSS+mozpreproc": LexerEntry(
+        "pygments.lexers.markup",
+        "MozPreprocCssLexer",
+        ("css+mozpreproc",),
+        ("*.css.in",),
+        (),
+    ),
+    "mozhashpreproc": LexerEntry(
+        "pygments.lexers.markup",
+        "MozPreprocHashLexer",
+        ("mozhashpreproc",),
+        (),
+        (),
+    ),
+    "Javascript+mozpreproc": LexerEntry(
+        "pygments.lexers.markup",
+        "MozPreprocJavascriptLexer",
+        ("javascript+mozpreproc",),
+        ("*.js.in",),
+        (),
+    ),
+    "mozpercentpreproc": LexerEntry(
+        "pygments.lexers.markup",
+        "MozPreprocPercentLexer",
+        ("mozpercentpreproc",),
+        (),
+        (),
+    ),
+    "XUL+mozpreproc": LexerEntry(
+        "pygments.lexers.markup",
+        "MozPreprocXulLexer",
+        ("xul+mozpreproc",),
+        ("*.xul.in",),
+        (),
+    ),
+    "MQL": LexerEntry(
+        "pygments.lexers.c_like",
+        "MqlLexer",
+        ("mql", "mq4", "mq5", "mql4", "mql5"),
+        ("*.mq4", "*.mq5", "*.mqh"),
+        ("text/x-mql",),
+    ),
+    "Mscgen": LexerEntry(
+        "pygments.lexers.dsls",
+        "MscgenLexer",
+        ("mscgen", "msc"),
+        ("*.msc",),
+        (),
+    ),
+    "MuPAD": LexerEntry(
+        "pygments.lexers.algebra",
+        "MuPADLexer",
+        ("mupad",),
+        ("*.mu",),
+        (),
+    ),
+    "MXML": LexerEntry(
+        "pygments.lexers.actionscript",
+        "MxmlLexer",
+        ("mxml",),
+        ("*.mxml",),
+        (),
+    ),
+    "MySQL": LexerEntry(
+        "pygments.lexers.sql",
+        "MySqlLexer",
+        ("mysql",),
+        (),
+        ("text/x-mysql",),
+    ),
+    "CSS+Myghty": LexerEntry(
+        "pygments.lexers.templates",
+        "MyghtyCssLexer",
+        ("css+myghty",),
+        (),
+        ("text/css+myghty",),
+    ),
+    "HTML+Myghty": LexerEntry(
+        "pygments.lexers.templates",
+        "MyghtyHtmlLexer",
+        ("html+myghty",),
+        (),
+        ("text/html+myghty",),
+    ),
+    "JavaScript+Myghty": LexerEntry(
+        "pygments.lexers.templates",
+        "MyghtyJavascriptLexer",
+        ("javascript+myghty", "js+myghty"),
+        (),
+        (
+            "application/x-javascript+myghty",
+            "text/x-javascript+myghty",
+            "text/javascript+mygthy",
+        ),
+    ),
+    "Myghty": LexerEntry(
+        "pygments.lexers.templates",
+        "MyghtyLexer",
+        ("myghty",),
+        ("*.myt", "autodelegate"),
+        ("application/x-myghty",),
+    ),
+    "XML+Myghty": LexerEntry(
+        "pygments.lexers.templates",
+        "MyghtyXmlLexer",
+        ("xml+myghty",),
+        (),
+        ("application/xml+myghty",),
+    ),
+    "NCL": LexerEntry(
+        "pygments.lexers.ncl",
+        "NCLLexer",
+        ("ncl",),
+        ("*.ncl",),
+        ("text/ncl",),
+    ),
+    "NSIS": LexerEntry(
+        "pygments.lexers.installers",
+        "NSISLexer",
+        ("nsis", "nsi", "nsh"),
+        ("*.nsi", "*.nsh"),
+        ("text/x-nsis",),
+    ),
+    "NASM": LexerEntry(
+        "pygments.lexers.asm",
+        "NasmLexer",
+        ("nasm",),
+        ("*.asm", "*.ASM", "*.nasm"),
+        ("text/x-nasm",),
+    ),
+    "objdump-nasm": LexerEntry(
+        "pygments.lexers.asm",
+        "NasmObjdumpLexer",
+        ("objdump-nasm",),
+        ("*.objdump-intel",),
+        ("text/x-nasm-objdump",),
+    ),
+    "Nemerle": LexerEntry(
+        "pygments.lexers.dotnet",
+        "NemerleLexer",
+        ("nemerle",),
+        ("*.n",),
+        ("text/x-nemerle",),
+    ),
+    "nesC": LexerEntry(
+        "pygments.lexers.c_like",
+        "NesCLexer",
+        ("nesc",),
+        ("*.nc",),
+        ("text/x-nescsrc",),
+    ),
+    "NestedText": LexerEntry(
+        "pygments.lexers.configs",
+        "NestedTextLexer",
+        ("nestedtext", "nt"),
+        ("*.nt",),
+        (),
+    ),
+    "NewLisp": LexerEntry(
+        "pygments.lexers.lisp",
+        "NewLispLexer",
+        ("newlisp",),
+        ("*.lsp", "*.nl", "*.kif"),
+        ("text/x-newlisp", "application/x-newlisp"),
+    ),
+    "Newspeak": LexerEntry(
+        "pygments.lexers.smalltalk",
+        "NewspeakLexer",
+        ("newspeak",),
+        ("*.ns2",),
+        ("text/x-newspeak",),
+    ),
+    "Nginx configuration file": LexerEntry(
+        "pygments.lexers.configs",
+        "NginxConfLexer",
+        ("nginx",),
+        ("nginx.conf",),
+        ("text/x-nginx-conf",),
+    ),
+    "Nimrod": LexerEntry(
+        "pygments.lexers.nimrod",
+        "NimrodLexer",
+        ("nimrod", "nim"),
+        ("*.nim", "*.nimrod"),
+        ("text/x-nim",),
+    ),
+    "Nit": LexerEntry(
+        "pygments.lexers.nit",
+        "NitLexer",
+        ("nit",),
+        ("*.nit",),
+        (),
+    ),
+    "Nix": LexerEntry(
+        "pygments.lexers.nix",
+        "NixLexer",
+        ("nixos", "nix"),
+        ("*.nix",),
+        ("text/x-nix",),
+    ),
+    "Node.js REPL console session": LexerEntry(
+        "pygments.lexers.javascript",
+        "NodeConsoleLexer",
+        ("nodejsrepl",),
+        (),
+        ("text/x-nodejsrepl",),
+    ),
+    "Notmuch": LexerEntry(
+        "pygments.lexers.textfmts",
+        "NotmuchLexer",
+        ("notmuch",),
+        (),
+        (),
+    ),
+    "NuSMV": LexerEntry(
+        "pygments.lexers.smv",
+        "NuSMVLexer",
+        ("nusmv",),
+        ("*.smv",),
+        (),
+    ),
+    "NumPy": LexerEntry(
+        "pygments.lexers.python",
+        "NumPyLexer",
+        ("numpy",),
+        (),
+        (),
+    ),
+    "Numba_IR": LexerEntry(
+        "pygments.lexers.numbair",
+        "NumbaIRLexer",
+        ("numba_ir", "numbair"),
+        ("*.numba_ir",),
+        ("text/x-numba_ir", "text/x-numbair"),
+    ),
+    "objdump": LexerEntry(
+        "pygments.lexers.asm",
+        "ObjdumpLexer",
+        ("objdump",),
+        ("*.objdump",),
+        ("text/x-objdump",),
+    ),
+    "Objective-C": LexerEntry(
+        "pygments.lexers.objective",
+        "ObjectiveCLexer",
+        ("objective-c", "objectivec", "obj-c", "objc"),
+        ("*.m", "*.h"),
+        ("text/x-objective-c",),
+    ),
+    "Objective-C++": LexerEntry(
+        "pygments.lexers.objective",
+        "ObjectiveCppLexer",
+        ("objective-c++", "objectivec++", "obj-c++", "objc++"),
+        ("*.mm", "*.hh"),
+        ("text/x-objective-c++",),
+    ),
+    "Objective-J": LexerEntry(
+        "pygments.lexers.javascript",
+        "ObjectiveJLexer",
+        ("objective-j", "objectivej", "obj-j", "objj"),
+        ("*.j",),
+        ("text/x-objective-j",),
+    ),
+    "OCaml": LexerEntry(
+        "pygments.lexers.ml",
+        "OcamlLexer",
+        ("ocaml",),
+        ("*.ml", "*.mli", "*.mll", "*.mly"),
+        ("text/x-ocaml",),
+    ),
+    "Octave": LexerEntry(
+        "pygments.lexers.matlab",
+        "OctaveLexer",
+        ("octave",),
+        ("*.m",),
+        ("text/octave",),
+    ),
+    "ODIN": LexerEntry(
+        "pygments.lexers.archetype",
+        "OdinLexer",
+        ("odin",),
+        ("*.odin",),
+        ("text/odin",),
+    ),
+    "OMG Interface Definition Language": LexerEntry(
+        "pygments.lexers.c_like",
+        "OmgIdlLexer",
+        ("omg-idl",),
+        ("*.idl", "*.pidl"),
+        (),
+    ),
+    "Ooc": LexerEntry(
+        "pygments.lexers.ooc",
+        "OocLexer",
+        ("ooc",),
+        ("*.ooc",),
+        ("text/x-ooc",),
+    ),
+    "Opa": LexerEntry(
+        "pygments.lexers.ml",
+        "OpaLexer",
+        ("opa",),
+        ("*.opa",),
+        ("text/x-opa",),
+    ),
+    "OpenEdge ABL": LexerEntry(
+        "pygments.lexers.business",
+        "OpenEdgeLexer",
+        ("openedge", "abl", "progress"),
+        ("*.p", "*.cls"),
+        ("text/x-openedge", "application/x-openedge"),
+    ),
+    "OpenSCAD": LexerEntry(
+        "pygments.lexers.openscad",
+        "OpenScadLexer",
+        ("openscad",),
+        ("*.scad",),
+        ("application/x-openscad",),
+    ),
+    "Org Mode": LexerEntry(
+        "pygments.lexers.markup",
+        "OrgLexer",
+        ("org", "orgmode", "org-mode"),
+        ("*.org",),
+        ("text/org",),
+    ),
+    "Text output": LexerEntry(
+        "pygments.lexers.special",
+        "OutputLexer",
+        ("output",),
+        (),
+        (),
+    ),
+    "PacmanConf": LexerEntry(
+        "pygments.lexers.configs",
+        "PacmanConfLexer",
+        ("pacmanconf",),
+        ("pacman.conf",),
+        (),
+    ),
+    "Pan": LexerEntry(
+        "pygments.lexers.dsls",
+        "PanLexer",
+        ("pan",),
+        ("*.pan",),
+        (),
+    ),
+    "ParaSail": LexerEntry(
+        "pygments.lexers.parasail",
+        "ParaSailLexer",
+        ("parasail",),
+        ("*.psi", "*.psl"),
+        ("text/x-parasail",),
+    ),
+    "Pawn": LexerEntry(
+        "pygments.lexers.pawn",
+        "PawnLexer",
+        ("pawn",),
+        ("*.p", "*.pwn", "*.inc"),
+        ("text/x-pawn",),
+    ),
+    "PDDL": LexerEntry(
+        "pygments.lexers.pddl",
+        "PddlLexer",
+        ("pddl",),
+        ("*.pddl",),
+        (),
+    ),
+    "PEG": LexerEntry(
+        "pygments.lexers.grammar_notation",
+        "PegLexer",
+        ("peg",),
+        ("*.peg",),
+        ("text/x-peg",),
+    ),
+    "Perl6": LexerEntry(
+        "pygments.lexers.perl",
+        "Perl6Lexer",
+        ("perl6", "pl6", "raku"),
+        (
+            "*.pl",
+            "*.pm",
+            "*.nqp",
+            "*.p6",
+            "*.6pl",
+            "*.p6l",
+            "*.pl6",
+            "*.6pm",
+            "*.p6m",
+            "*.pm6",
+            "*.t",
+            "*.raku",
+            "*.rakumod",
+            "*.rakutest",
+            "*.rakudoc",
+        ),
+        ("text/x-perl6", "application/x-perl6"),
+    ),
+    "Perl": LexerEntry(
+        "pygments.lexers.perl",
+        "PerlLexer",
+        ("perl", "pl"),
+        ("*.pl", "*.pm", "*.t", "*.perl"),
+        ("text/x-perl", "application/x-perl"),
+    ),
+    "Phix": LexerEntry(
+        "pygments.lexers.phix",
+        "PhixLexer",
+        ("phix",),
+        ("*.exw",),
+        ("text/x-phix",),
+    ),
+    "PHP": LexerEntry(
+        "pygments.lexers.php",
+        "PhpLexer",
+        ("php", "php3", "php4", "php5"),
+        ("*.php", "*.php[345]", "*.inc"),
+        ("text/x-php",),
+    ),
+    "Pig": LexerEntry(
+        "pygments.lexers.jvm",
+        "PigLexer",
+        ("pig",),
+        ("*.pig",),
+        ("text/x-pig",),
+    ),
+    "Pike": LexerEntry(
+        "pygments.lexers.c_like",
+        "PikeLexer",
+        ("pike",),
+        ("*.pike", "*.pmod"),
+        ("text/x-pike",),
+    ),
+    "PkgConfig": LexerEntry(
+        "pygments.lexers.configs",
+        "PkgConfigLexer",
+        ("pkgconfig",),
+        ("*.pc",),
+        (),
+    ),
+    "PL/pgSQL": LexerEntry(
+        "pygments.lexers.sql",
+        "PlPgsqlLexer",
+        ("plpgsql",),
+        (),
+        ("text/x-plpgsql",),
+    ),
+    "Pointless": LexerEntry(
+        "pygments.lexers.pointless",
+        "PointlessLexer",
+        ("pointless",),
+        ("*.ptls",),
+        (),
+    ),
+    "Pony": LexerEntry(
+        "pygments.lexers.pony",
+        "PonyLexer",
+        ("pony",),
+        ("*.pony",),
+        (),
+    ),
+    "Portugol": LexerEntry(
+        "pygments.lexers.pascal",
+        "PortugolLexer",
+        ("portugol",),
+        ("*.alg", "*.portugol"),
+        (),
+    ),
+    "PostScript": LexerEntry(
+        "pygments.lexers.graphics",
+        "PostScriptLexer",
+        ("postscript", "postscr"),
+        ("*.ps", "*.eps"),
+        ("application/postscript",),
+    ),
+    "PostgreSQL console (psql)": LexerEntry(
+        "pygments.lexers.sql",
+        "PostgresConsoleLexer",
+        ("psql", "postgresql-console", "postgres-console"),
+        (),
+        ("text/x-postgresql-psql",),
+    ),
+    "PostgreSQL EXPLAIN dialect": LexerEntry(
+        "pygments.lexers.sql",
+        "PostgresExplainLexer",
+        ("postgres-explain",),
+        ("*.explain",),
+        ("text/x-postgresql-explain",),
+    ),
+    "PostgreSQL SQL dialect": LexerEntry(
+        "pygments.lexers.sql",
+        "PostgresLexer",
+        ("postgresql", "postgres"),
+        (),
+        ("text/x-postgresql",),
+    ),
+    "POVRay": LexerEntry(
+        "pygments.lexers.graphics",
+        "PovrayLexer",
+        ("pov",),
+        ("*.pov", "*.inc"),
+        ("text/x-povray",),
+    ),
+    "PowerShell": LexerEntry(
+        "pygments.lexers.shell",
+        "PowerShellLexer",
+        ("powershell", "pwsh", "posh", "ps1", "psm1"),
+        ("*.ps1", "*.psm1"),
+        ("text/x-powershell",),
+    ),
+    "PowerShell Session": LexerEntry(
+        "pygments.lexers.shell",
+        "PowerShellSessionLexer",
+        ("pwsh-session", "ps1con"),
+        (),
+        (),
+    ),
+    "Praat": LexerEntry(
+        "pygments.lexers.praat",
+        "PraatLexer",
+        ("praat",),
+        ("*.praat", "*.proc", "*.psc"),
+        (),
+    ),
+    "Procfile": LexerEntry(
+        "pygments.lexers.procfile",
+        "ProcfileLexer",
+        ("procfile",),
+        ("Procfile",),
+        (),
+    ),
+    "Prolog": LexerEntry(
+        "pygments.lexers.prolog",
+        "PrologLexer",
+        ("prolog",),
+        ("*.ecl", "*.prolog", "*.pro", "*.pl"),
+        ("text/x-prolog",),
+    ),
+    "PromQL": LexerEntry(
+        "pygments.lexers.promql",
+        "PromQLLexer",
+        ("promql",),
+        ("*.promql",),
+        (),
+    ),
+    "Promela": LexerEntry(
+        "pygments.lexers.c_like",
+        "PromelaLexer",
+        ("promela",),
+        ("*.pml", "*.prom", "*.prm", "*.promela", "*.pr", "*.pm"),
+        ("text/x-promela",),
+    ),
+    "Properties": LexerEntry(
+        "pygments.lexers.configs",
+        "PropertiesLexer",
+        ("properties", "jproperties"),
+        ("*.properties",),
+        ("text/x-java-properties",),
+    ),
+    "Protocol Buffer": LexerEntry(
+        "pygments.lexers.dsls",
+        "ProtoBufLexer",
+        ("protobuf", "proto"),
+        ("*.proto",),
+        (),
+    ),
+    "PRQL": LexerEntry(
+        "pygments.lexers.prql",
+        "PrqlLexer",
+        ("prql",),
+        ("*.prql",),
+        ("application/prql", "application/x-prql"),
+    ),
+    "PsySH console session for PHP": LexerEntry(
+        "pygments.lexers.php",
+        "PsyshConsoleLexer",
+        ("psysh",),
+        (),
+        (),
+    ),
+    "PTX": LexerEntry(
+        "pygments.lexers.ptx",
+        "PtxLexer",
+        ("ptx",),
+        ("*.ptx",),
+        ("text/x-ptx",),
+    ),
+    "Pug": LexerEntry(
+        "pygments.lexers.html",
+        "PugLexer",
+        ("pug", "jade"),
+        ("*.pug", "*.jade"),
+        ("text/x-pug", "text/x-jade"),
+    ),
+    "Puppet": LexerEntry(
+        "pygments.lexers.dsls",
+        "PuppetLexer",
+        ("puppet",),
+        ("*.pp",),
+        (),
+    ),
+    "PureScript": LexerEntry(
+        "pygments.lexers.purescript",
+        "PureScriptLexer",
+        ("purescript", "purs"),
+        ("*.purs",),
+        ("text/x-purescript",),
+    ),
+    "PyPy Log": LexerEntry(
+        "pygments.lexers.console",
+        "PyPyLogLexer",
+        ("pypylog", "pypy"),
+        ("*.pypylog",),
+        ("application/x-pypylog",),
+    ),
+    "Python 2.x": LexerEntry(
+        "pygments.lexers.python",
+        "Python2Lexer",
+        ("python2", "py2"),
+        (),
+        ("text/x-python2", "application/x-python2"),
+    ),
+    "Python 2.x Traceback": LexerEntry(
+        "pygments.lexers.python",
+        "Python2TracebackLexer",
+        ("py2tb",),
+        ("*.py2tb",),
+        ("text/x-python2-traceback",),
+    ),
+    "Python console session": LexerEntry(
+        "pygments.lexers.python",
+        "PythonConsoleLexer",
+        ("pycon", "python-console"),
+        (),
+        ("text/x-python-doctest",),
+    ),
+    "Python": LexerEntry(
+        "pygments.lexers.python",
+        "PythonLexer",
+        ("python", "py", "sage", "python3", "py3", "bazel", "starlark", "pyi"),
+        (
+            "*.py",
+            "*.pyw",
+            "*.pyi",
+            "*.jy",
+            "*.sage",
+            "*.sc",
+            "SConstruct",
+            "SConscript",
+            "*.bzl",
+            "BUCK",
+            "BUILD",
+            "BUILD.bazel",
+            "WORKSPACE",
+            "*.tac",
+            "*.pye",
+        ),
+        (
+            "text/x-python",
+            "application/x-python",
+            "text/x-python3",
+            "application/x-python3",
+        ),
+    ),
+    "Python Traceback": LexerEntry(
+        "pygments.lexers.python",
+        "PythonTracebackLexer",
+        ("pytb", "py3tb"),
+        ("*.pytb", "*.py3tb"),
+        ("text/x-python-traceback", "text/x-python3-traceback"),
+    ),
+    "Python+UL4": LexerEntry(
+        "pygments.lexers.ul4",
+        "PythonUL4Lexer",
+        ("py+ul4",),
+        ("*.pyul4",),
+        (),
+    ),
+    "QBasic": LexerEntry(
+        "pygments.lexers.basic",
+        "QBasicLexer",
+        ("qbasic", "basic"),
+        ("*.BAS", "*.bas"),
+        ("text/basic",),
+    ),
+    "Q": LexerEntry(
+        "pygments.lexers.q",
+        "QLexer",
+        ("q",),
+        ("*.q",),
+        (),
+    ),
+    "QVTO": LexerEntry(
+        "pygments.lexers.qvt",
+        "QVToLexer",
+        ("qvto", "qvt"),
+        ("*.qvto",),
+        (),
+    ),
+    "Qlik": LexerEntry(
+        "pygments.lexers.qlik",
+        "QlikLexer",
+        ("qlik", "qlikview", "qliksense", "qlikscript"),
+        ("*.qvs", "*.qvw"),
+        (),
+    ),
+    "QML": LexerEntry(
+        "pygments.lexers.webmisc",
+        "QmlLexer",
+        ("qml", "qbs"),
+        ("*.qml", "*.qbs"),
+        ("application/x-qml", "application/x-qt.qbs+qml"),
+    ),
+    "RConsole": LexerEntry(
+        "pygments.lexers.r",
+        "RConsoleLexer",
+        ("rconsole", "rout"),
+        ("*.Rout",),
+        (),
+    ),
+    "Relax-NG Compact": LexerEntry(
+        "pygments.lexers.rnc",
+        "RNCCompactLexer",
+        ("rng-compact", "rnc"),
+        ("*.rnc",),
+        (),
+    ),
+    "RPMSpec": LexerEntry(
+        "pygments.lexers.installers",
+        "RPMSpecLexer",
+        ("spec",),
+        ("*.spec",),
+        ("text/x-rpm-spec",),
+    ),
+    "Racket": LexerEntry(
+        "pygments.lexers.lisp",
+        "RacketLexer",
+        ("racket", "rkt"),
+        ("*.rkt", "*.rktd", "*.rktl"),
+        ("text/x-racket", "application/x-racket"),
+    ),
+    "Ragel in C Host": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelCLexer",
+        ("ragel-c",),
+        ("*.rl",),
+        (),
+    ),
+    "Ragel in CPP Host": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelCppLexer",
+        ("ragel-cpp",),
+        ("*.rl",),
+        (),
+    ),
+    "Ragel in D Host": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelDLexer",
+        ("ragel-d",),
+        ("*.rl",),
+        (),
+    ),
+    "Embedded Ragel": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelEmbeddedLexer",
+        ("ragel-em",),
+        ("*.rl",),
+        (),
+    ),
+    "Ragel in Java Host": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelJavaLexer",
+        ("ragel-java",),
+        ("*.rl",),
+        (),
+    ),
+    "Ragel": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelLexer",
+        ("ragel",),
+        (),
+        (),
+    ),
+    "Ragel in Objective C Host": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelObjectiveCLexer",
+        ("ragel-objc",),
+        ("*.rl",),
+        (),
+    ),
+    "Ragel in Ruby Host": LexerEntry(
+        "pygments.lexers.parsers",
+        "RagelRubyLexer",
+        ("ragel-ruby", "ragel-rb"),
+        ("*.rl",),
+        (),
+    ),
+    "Rd": LexerEntry(
+        "pygments.lexers.r",
+        "RdLexer",
+        ("rd",),
+        ("*.Rd",),
+        ("text/x-r-doc",),
+    ),
+    "ReasonML": LexerEntry(
+        "pygments.lexers.ml",
+        "ReasonLexer",
+        ("reasonml", "reason"),
+        ("*.re", "*.rei"),
+        ("text/x-reasonml",),
+    ),
+    "REBOL": LexerEntry(
+        "pygments.lexers.rebol",
+        "RebolLexer",
+        ("rebol",),
+        ("*.r", "*.r3", "*.reb"),
+        ("text/x-rebol",),
+    ),
+    "Red": LexerEntry(
+        "pygments.lexers.rebol",
+        "RedLexer",
+        ("red", "red/system"),
+        ("*.red", "*.reds"),
+        ("text/x-red", "text/x-red-system"),
+    ),
+    "Redcode": LexerEntry(
+        "pygments.lexers.esoteric",
+        "RedcodeLexer",
+        ("redcode",),
+        ("*.cw",),
+        (),
+    ),
+    "reg": LexerEntry(
+        "pygments.lexers.configs",
+        "RegeditLexer",
+        ("registry",),
+        ("*.reg",),
+        ("text/x-windows-registry",),
+    ),
+    "Rego": LexerEntry(
+        "pygments.lexers.rego",
+        "RegoLexer",
+        ("rego",),
+        ("*.rego",),
+        ("text/x-rego",),
+    ),
+    "Rell": LexerEntry(
+        "pygments.lexers.rell",
+        "RellLexer",
+        ("rell",),
+        ("*.rell",),
+        ("text/x-rell",),
+    ),
+    "ResourceBundle": LexerEntry(
+        "pygments.lexers.resource",
+        "ResourceLexer",
+        ("resourcebundle", "resource"),
+        (),
+        (),
+    ),
+    "Rexx": LexerEntry(
+        "pygments.lexers.scripting",
+        "RexxLexer",
+        ("rexx", "arexx"),
+        ("*.rexx", "*.rex", "*.rx", "*.arexx"),
+        ("text/x-rexx",),
+    ),
+    "RHTML": LexerEntry(
+        "pygments.lexers.templates",
+        "RhtmlLexer",
+        ("rhtml", "html+erb", "html+ruby"),
+        ("*.rhtml",),
+        ("text/html+ruby",),
+    ),
+    "Ride": LexerEntry(
+        "pygments.lexers.ride",
+        "RideLexer",
+        ("ride",),
+        ("*.ride",),
+        ("text/x-ride",),
+    ),
+    "Rita": LexerEntry(
+        "pygments.lexers.rita",
+        "RitaLexer",
+        ("rita",),
+        ("*.rita",),
+        ("text/rita",),
+    ),
+    "Roboconf Graph": LexerEntry(
+        "pygments.lexers.roboconf",
+        "RoboconfGraphLexer",
+        ("roboconf-graph",),
+        ("*.graph",),
+        (),
+    ),
+    "Roboconf Instances": LexerEntry(
+        "pygments.lexers.roboconf",
+        "RoboconfInstancesLexer",
+        ("roboconf-instances",),
+        ("*.instances",),
+        (),
+    ),
+    "RobotFramework": LexerEntry(
+        "pygments.lexers.robotframework",
+        "RobotFrameworkLexer",
+        ("robotframework",),
+        ("*.robot", "*.resource"),
+        ("text/x-robotframework",),
+    ),
+    "Rocq Prover": LexerEntry(
+        "pygments.lexers.theorem",
+        "RocqLexer",
+        ("coq", "rocq", "rocq-prover"),
+        ("*.v",),
+        ("text/x-coq", "text/x-rocq"),
+    ),
+    "RQL": LexerEntry(
+        "pygments.lexers.sql",
+        "RqlLexer",
+        ("rql",),
+        ("*.rql",),
+        ("text/x-rql",),
+    ),
+    "RSL": LexerEntry(
+        "pygments.lexers.dsls",
+        "RslLexer",
+        ("rsl",),
+        ("*.rsl",),
+        ("text/rsl",),
+    ),
+    "reStructuredText": LexerEntry(
+        "pygments.lexers.markup",
+        "RstLexer",
+        ("restructuredtext", "rst", "rest"),
+        ("*.rst", "*.rest"),
+        ("text/x-rst", "text/prs.fallenstein.rst"),
+    ),
+    "TrafficScript": LexerEntry(
+        "pygments.lexers.trafficscript",
+        "RtsLexer",
+        ("trafficscript", "rts"),
+        ("*.rts",),
+        (),
+    ),
+    "Ruby irb session": LexerEntry(
+        "pygments.lexers.ruby",
+        "RubyConsoleLexer",
+        ("rbcon", "irb"),
+        (),
+        ("text/x-ruby-shellsession",),
+    ),
+    "Ruby": LexerEntry(
+        "pygments.lexers.ruby",
+        "RubyLexer",
+        ("ruby", "rb", "duby"),
+        (
+            "*.rb",
+            "*.rbw",
+            "Rakefile",
+            "*.rake",
+            "*.gemspec",
+            "*.rbx",
+            "*.duby",
+            "Gemfile",
+            "Vagrantfile",
+        ),
+        ("text/x-ruby", "application/x-ruby"),
+    ),
+    "Rust": LexerEntry(
+        "pygments.lexers.rust",
+        "RustLexer",
+        ("rust", "rs"),
+        ("*.rs", "*.rs.in"),
+        ("text/rust", "text/x-rust"),
+    ),
+    "SAS": LexerEntry(
+        "pygments.lexers.sas",
+        "SASLexer",
+        ("sas",),
+        ("*.SAS", "*.sas"),
+        ("text/x-sas", "text/sas", "application/x-sas"),
+    ),
+    "S": LexerEntry(
+        "pygments.lexers.r",
+        "SLexer",
+        ("splus", "s", "r"),
+        ("*.S", "*.R", ".Rhistory", ".Rprofile", ".Renviron"),
+        (
+            "text/S-plus",
+            "text/S",
+            "text/x-r-source",
+            "text/x-r",
+            "text/x-R",
+            "text/x-r-history",
+            "text/x-r-profile",
+        ),
+    ),
+    "Standard ML": LexerEntry(
+        "pygments.lexers.ml",
+        "SMLLexer",
+        ("sml",),
+        ("*.sml", "*.sig", "*.fun"),
+        ("text/x-standardml", "application/x-standardml"),
+    ),
+    "SNBT": LexerEntry(
+        "pygments.lexers.minecraft",
+        "SNBTLexer",
+        ("snbt",),
+        ("*.snbt",),
+        ("text/snbt",),
+    ),
+    "SARL": LexerEntry(
+        "pygments.lexers.jvm",
+        "SarlLexer",
+        ("sarl",),
+        ("*.sarl",),
+        ("text/x-sarl",),
+    ),
+    "Sass": LexerEntry(
+        "pygments.lexers.css",
+        "SassLexer",
+        ("sass",),
+        ("*.sass",),
+        ("text/x-sass",),
+    ),
+    "Savi": LexerEntry(
+        "pygments.lexers.savi",
+        "SaviLexer",
+        ("savi",),
+        ("*.savi",),
+        (),
+    ),
+    "Scala": LexerEntry(
+        "pygments.lexers.jvm",
+        "ScalaLexer",
+        ("scala",),
+        ("*.scala",),
+        ("text/x-scala",),
+    ),
+    "Scaml": LexerEntry(
+        "pygments.lexers.html",
+        "ScamlLexer",
+        ("scaml",),
+        ("*.scaml",),
+        ("text/x-scaml",),
+    ),
+    "scdoc": LexerEntry(
+        "pygments.lexers.scdoc",
+        "ScdocLexer",
+        ("scdoc", "scd"),
+        ("*.scd", "*.scdoc"),
+        (),
+    ),
+    "Scheme": LexerEntry(
+        "pygments.lexers.lisp",
+        "SchemeLexer",
+        ("scheme", "scm"),
+        ("*.scm", "*.ss"),
+        ("text/x-scheme", "application/x-scheme"),
+    ),
+    "Scilab": LexerEntry(
+        "pygments.lexers.matlab",
+        "ScilabLexer",
+        ("scilab",),
+        ("*.sci", "*.sce", "*.tst"),
+        ("text/scilab",),
+    ),
+    "SCSS": LexerEntry(
+        "pygments.lexers.css",
+        "ScssLexer",
+        ("scss",),
+        ("*.scss",),
+        ("text/x-scss",),
+    ),
+    "Sed": LexerEntry(
+        "pygments.lexers.textedit",
+        "SedLexer",
+        ("sed", "gsed", "ssed"),
+        ("*.sed", "*.[gs]sed"),
+        ("text/x-sed",),
+    ),
+    "ShExC": LexerEntry(
+        "pygments.lexers.rdf",
+        "ShExCLexer",
+        ("shexc", "shex"),
+        ("*.shex",),
+        ("text/shex",),
+    ),
+    "Shen": LexerEntry(
+        "pygments.lexers.lisp",
+        "ShenLexer",
+        ("shen",),
+        ("*.shen",),
+        ("text/x-shen", "application/x-shen"),
+    ),
+    "Sieve": LexerEntry(
+        "pygments.lexers.sieve",
+        "SieveLexer",
+        ("sieve",),
+        ("*.siv", "*.sieve"),
+        (),
+    ),
+    "Silver": LexerEntry(
+        "pygments.lexers.verification",
+        "SilverLexer",
+        ("silver",),
+        ("*.sil", "*.vpr"),
+        (),
+    ),
+    "Singularity": LexerEntry(
+        "pygments.lexers.configs",
+        "SingularityLexer",
+        ("singularity",),
+        ("*.def", "Singularity"),
+        (),
+    ),
+    "Slash": LexerEntry(
+        "pygments.lexers.slash",
+        "SlashLexer",
+        ("slash",),
+        ("*.sla",),
+        (),
+    ),
+    "Slim": LexerEntry(
+        "pygments.lexers.webmisc",
+        "SlimLexer",
+        ("slim",),
+        ("*.slim",),
+        ("text/x-slim",),
+    ),
+    "Slurm": LexerEntry(
+        "pygments.lexers.shell",
+        "SlurmBashLexer",
+        ("slurm", "sbatch"),
+        ("*.sl",),
+        (),
+    ),
+    "Smali": LexerEntry(
+        "pygments.lexers.dalvik",
+        "SmaliLexer",
+        ("smali",),
+        ("*.smali",),
+        ("text/smali",),
+    ),
+    "Smalltalk": LexerEntry(
+        "pygments.lexers.smalltalk",
+        "SmalltalkLexer",
+        ("smalltalk", "squeak", "st"),
+        ("*.st",),
+        ("text/x-smalltalk",),
+    ),
+    "SmartGameFormat": LexerEntry(
+        "pygments.lexers.sgf",
+        "SmartGameFormatLexer",
+        ("sgf",),
+        ("*.sgf",),
+        (),
+    ),
+    "Smarty": LexerEntry(
+        "pygments.lexers.templates",
+        "SmartyLexer",
+        ("smarty",),
+        ("*.tpl",),
+        ("application/x-smarty",),
+    ),
+    "Smithy": LexerEntry(
+        "pygments.lexers.smithy",
+        "SmithyLexer",
+        ("smithy",),
+        ("*.smithy",),
+        (),
+    ),
+    "Snobol": LexerEntry(
+        "pygments.lexers.snobol",
+        "SnobolLexer",
+        ("snobol",),
+        ("*.snobol",),
+        ("text/x-snobol",),
+    ),
+    "Snowball": LexerEntry(
+        "pygments.lexers.dsls",
+        "SnowballLexer",
+        ("snowball",),
+        ("*.sbl",),
+        (),
+    ),
+    "Solidity": LexerEntry(
+        "pygments.lexers.solidity",
+        "SolidityLexer",
+        ("solidity",),
+        ("*.sol",),
+        (),
+    ),
+    "Soong": LexerEntry(
+        "pygments.lexers.soong",
+        "SoongLexer",
+        ("androidbp", "bp", "soong"),
+        ("Android.bp",),
+        (),
+    ),
+    "Sophia": LexerEntry(
+        "pygments.lexers.sophia",
+        "SophiaLexer",
+        ("sophia",),
+        ("*.aes",),
+        (),
+    ),
+    "SourcePawn": LexerEntry(
+        "pygments.lexers.pawn",
+        "SourcePawnLexer",
+        ("sp",),
+        ("*.sp",),
+        ("text/x-sourcepawn",),
+    ),
+    "Debian Sourcelist": LexerEntry(
+        "pygments.lexers.installers",
+        "SourcesListLexer",
+        ("debsources", "sourceslist", "sources.list"),
+        ("sources.list",),
+        (),
+    ),
+    "SPARQL": LexerEntry(
+        "pygments.lexers.rdf",
+        "SparqlLexer",
+        ("sparql",),
+        ("*.rq", "*.sparql"),
+        ("application/sparql-query",),
+    ),
+    "Spice": LexerEntry(
+        "pygments.lexers.spice",
+        "SpiceLexer",
+        ("spice", "spicelang"),
+        ("*.spice",),
+        ("text/x-spice",),
+    ),
+    "SQL+Jinja": LexerEntry(
+        "pygments.lexers.templates",
+        "SqlJinjaLexer",
+        ("sql+jinja",),
+        ("*.sql", "*.sql.j2", "*.sql.jinja2"),
+        (),
+    ),
+    "SQL": LexerEntry(
+        "pygments.lexers.sql",
+        "SqlLexer",
+        ("sql",),
+        ("*.sql",),
+        ("text/x-sql",),
+    ),
+    "sqlite3con": LexerEntry(
+        "pygments.lexers.sql",
+        "SqliteConsoleLexer",
+        ("sqlite3",),
+        ("*.sqlite3-console",),
+        ("text/x-sqlite3-console",),
+    ),
+    "SquidConf": LexerEntry(
+        "pygments.lexers.configs",
+        "SquidConfLexer",
+        ("squidconf", "squid.conf", "squid"),
+        ("squid.conf",),
+        ("text/x-squidconf",),
+    ),
+    "Srcinfo": LexerEntry(
+        "pygments.lexers.srcinfo",
+        "SrcinfoLexer",
+        ("srcinfo",),
+        (".SRCINFO",),
+        (),
+    ),
+    "Scalate Server Page": LexerEntry(
+        "pygments.lexers.templates",
+        "SspLexer",
+        ("ssp",),
+        ("*.ssp",),
+        ("application/x-ssp",),
+    ),
+    "Stan": LexerEntry(
+        "pygments.lexers.modeling",
+        "StanLexer",
+        ("stan",),
+        ("*.stan",),
+        (),
+    ),
+    "Stata": LexerEntry(
+        "pygments.lexers.stata",
+        "StataLexer",
+        ("stata", "do"),
+        ("*.do", "*.ado"),
+        ("text/x-stata", "text/stata", "application/x-stata"),
+    ),
+    "SuperCollider": LexerEntry(
+        "pygments.lexers.supercollider",
+        "SuperColliderLexer",
+        ("supercollider", "sc"),
+        ("*.sc", "*.scd"),
+        ("application/supercollider", "text/supercollider"),
+    ),
+    "Swift": LexerEntry(
+        "pygments.lexers.objective",
+        "SwiftLexer",
+        ("swift",),
+        ("*.swift",),
+        ("text/x-swift",),
+    ),
+    "SWIG": LexerEntry(
+        "pygments.lexers.c_like",
+        "SwigLexer",
+        ("swig",),
+        ("*.swg", "*.i"),
+        ("text/swig",),
+    ),
+    "systemverilog": LexerEntry(
+        "pygments.lexers.hdl",
+        "SystemVerilogLexer",
+        ("systemverilog", "sv"),
+        ("*.sv", "*.svh"),
+        ("text/x-systemverilog",),
+    ),
+    "Systemd": LexerEntry(
+        "pygments.lexers.configs",
+        "SystemdLexer",
+        ("systemd",),
+        (
+            "*.service",
+            "*.socket",
+            "*.device",
+            "*.mount",
+            "*.automount",
+            "*.swap",
+            "*.target",
+            "*.path",
+            "*.timer",
+            "*.slice",
+            "*.scope",
+        ),
+        (),
+    ),
+    "TAP": LexerEntry(
+        "pygments.lexers.testing",
+        "TAPLexer",
+        ("tap",),
+        ("*.tap",),
+        (),
+    ),
+    "Typographic Number Theory": LexerEntry(
+        "pygments.lexers.tnt",
+        "TNTLexer",
+        ("tnt",),
+        ("*.tnt",),
+        (),
+    ),
+    "TOML": LexerEntry(
+        "pygments.lexers.configs",
+        "TOMLLexer",
+        ("toml",),
+        ("*.toml", "Pipfile", "poetry.lock"),
+        ("application/toml",),
+    ),
+    "TableGen": LexerEntry(
+        "pygments.lexers.tablegen",
+        "TableGenLexer",
+        ("tablegen", "td"),
+        ("*.td",),
+        (),
+    ),
+    "Tact": LexerEntry(
+        "pygments.lexers.tact",
+        "TactLexer",
+        ("tact",),
+        ("*.tact",),
+        (),
+    ),
+    "TADS 3": LexerEntry(
+        "pygments.lexers.int_fiction",
+        "Tads3Lexer",
+        ("tads3",),
+        ("*.t",),
+        (),
+    ),
+    "Tal": LexerEntry(
+        "pygments.lexers.tal",
+        "TalLexer",
+        ("tal", "uxntal"),
+        ("*.tal",),
+        ("text/x-uxntal",),
+    ),
+    "TASM": LexerEntry(
+        "pygments.lexers.asm",
+        "TasmLexer",
+        ("tasm",),
+        ("*.asm", "*.ASM", "*.tasm"),
+        ("text/x-tasm",),
+    ),
+    "Tcl": LexerEntry(
+        "pygments.lexers.tcl",
+        "TclLexer",
+        ("tcl",),
+        ("*.tcl", "*.rvt"),
+        ("text/x-tcl", "text/x-script.tcl", "application/x-tcl"),
+    ),
+    "Tcsh": LexerEntry(
+        "pygments.lexers.shell",
+        "TcshLexer",
+        ("tcsh", "csh"),
+        ("*.tcsh", "*.csh"),
+        ("application/x-csh",),
+    ),
+    "Tcsh Session": LexerEntry(
+        "pygments.lexers.shell",
+        "TcshSessionLexer",
+        ("tcshcon",),
+        (),
+        (),
+    ),
+    "Tea": LexerEntry(
+        "pygments.lexers.templates",
+        "TeaTemplateLexer",
+        ("tea",),
+        ("*.tea",),
+        ("text/x-tea",),
+    ),
+    "teal": LexerEntry(
+        "pygments.lexers.teal",
+        "TealLexer",
+        ("teal",),
+        ("*.teal",),
+        (),
+    ),
+    "Tera Term macro": LexerEntry(
+        "pygments.lexers.teraterm",
+        "TeraTermLexer",
+        ("teratermmacro", "teraterm", "ttl"),
+        ("*.ttl",),
+        ("text/x-teratermmacro",),
+    ),
+    "Termcap": LexerEntry(
+        "pygments.lexers.configs",
+        "TermcapLexer",
+        ("termcap",),
+        ("termcap", "termcap.src"),
+        (),
+    ),
+    "Terminfo": LexerEntry(
+        "pygments.lexers.configs",
+        "TerminfoLexer",
+        ("terminfo",),
+        ("terminfo", "terminfo.src"),
+        (),
+    ),
+    "Terraform": LexerEntry(
+        "pygments.lexers.configs",
+        "TerraformLexer",
+        ("terraform", "tf", "hcl"),
+        ("*.tf", "*.hcl"),
+        ("application/x-tf", "application/x-terraform"),
+    ),
+    "TeX": LexerEntry(
+        "pygments.lexers.markup",
+        "TexLexer",
+        ("tex", "latex"),
+        ("*.tex", "*.aux", "*.toc"),
+        ("text/x-tex", "text/x-latex"),
+    ),
+    "Text only": LexerEntry(
+        "pygments.lexers.special",
+        "TextLexer",
+        ("text",),
+        ("*.txt",),
+        ("text/plain",),
+    ),
+    "ThingsDB": LexerEntry(
+        "pygments.lexers.thingsdb",
+        "ThingsDBLexer",
+        ("ti", "thingsdb"),
+        ("*.ti",),
+        (),
+    ),
+    "Thrift": LexerEntry(
+        "pygments.lexers.dsls",
+        "ThriftLexer",
+        ("thrift",),
+        ("*.thrift",),
+        ("application/x-thrift",),
+    ),
+    "tiddler": LexerEntry(
+        "pygments.lexers.markup",
+        "TiddlyWiki5Lexer",
+        ("tid",),
+        ("*.tid",),
+        ("text/vnd.tiddlywiki",),
+    ),
+    "Tl-b": LexerEntry(
+        "pygments.lexers.tlb",
+        "TlbLexer",
+        ("tlb",),
+        ("*.tlb",),
+        (),
+    ),
+    "TLS Presentation Language": LexerEntry(
+        "pygments.lexers.tls",
+        "TlsLexer",
+        ("tls",),
+        (),
+        (),
+    ),
+    "Todotxt": LexerEntry(
+        "pygments.lexers.textfmts",
+        "TodotxtLexer",
+        ("todotxt",),
+        ("todo.txt", "*.todotxt"),
+        ("text/x-todo",),
+    ),
+    "Transact-SQL": LexerEntry(
+        "pygments.lexers.sql",
+        "TransactSqlLexer",
+        ("tsql", "t-sql"),
+        ("*.sql",),
+        ("text/x-tsql",),
+    ),
+    "Treetop": LexerEntry(
+        "pygments.lexers.parsers",
+        "TreetopLexer",
+        ("treetop",),
+        ("*.treetop", "*.tt"),
+        (),
+    ),
+    "TSX": LexerEntry(
+        "pygments.lexers.jsx",
+        "TsxLexer",
+        ("tsx",),
+        ("*.tsx",),
+        ("text/typescript-tsx",),
+    ),
+    "Turtle": LexerEntry(
+        "pygments.lexers.rdf",
+        "TurtleLexer",
+        ("turtle",),
+        ("*.ttl",),
+        ("text/turtle", "application/x-turtle"),
+    ),
+    "HTML+Twig": LexerEntry(
+        "pygments.lexers.templates",
+        "TwigHtmlLexer",
+        ("html+twig",),
+        ("*.twig",),
+        ("text/html+twig",),
+    ),
+    "Twig": LexerEntry(
+        "pygments.lexers.templates",
+        "TwigLexer",
+        ("twig",),
+        (),
+        ("application/x-twig",),
+    ),
+    "TypeScript": LexerEntry(
+        "pygments.lexers.javascript",
+        "TypeScriptLexer",
+        ("typescript", "ts"),
+        ("*.ts",),
+        ("application/x-typescript", "text/x-typescript"),
+    ),
+    "TypoScriptCssData": LexerEntry(
+        "pygments.lexers.typoscript",
+        "TypoScriptCssDataLexer",
+        ("typoscriptcssdata",),
+        (),
+        (),
+    ),
+    "TypoScriptHtmlData": LexerEntry(
+        "pygments.lexers.typoscript",
+        "TypoScriptHtmlDataLexer",
+        ("typoscripthtmldata",),
+        (),
+        (),
+    ),
+    "TypoScript": LexerEntry(
+        "pygments.lexers.typoscript",
+        "TypoScriptLexer",
+        ("typoscript",),
+        ("*.typoscript",),
+        ("text/x-typoscript",),
+    ),
+    "Typst": LexerEntry(
+        "pygments.lexers.typst",
+        "TypstLexer",
+        ("typst",),
+        ("*.typ",),
+        ("text/x-typst",),
+    ),
+    "UL4": LexerEntry(
+        "pygments.lexers.ul4",
+        "UL4Lexer",
+        ("ul4",),
+        ("*.ul4",),
+        (),
+    ),
+    "ucode": LexerEntry(
+        "pygments.lexers.unicon",
+        "UcodeLexer",
+        ("ucode",),
+        ("*.u", "*.u1", "*.u2"),
+        (),
+    ),
+    "Unicon": LexerEntry(
+        "pygments.lexers.unicon",
+        "UniconLexer",
+        ("unicon",),
+        ("*.icn",),
+        ("text/unicon",),
+    ),
+    "Unix/Linux config files": LexerEntry(
+        "pygments.lexers.configs",
+        "UnixConfigLexer",
+        ("unixconfig", "linuxconfig"),
+        (),
+        (),
+    ),
+    "UrbiScript": LexerEntry(
+        "pygments.lexers.urbi",
+        "UrbiscriptLexer",
+        ("urbiscript",),
+        ("*.u",),
+        ("application/x-urbiscript",),
+    ),
+    "urlencoded": LexerEntry(
+        "pygments.lexers.html",
+        "UrlEncodedLexer",
+        ("urlencoded",),
+        (),
+        ("application/x-www-form-urlencoded",),
+    ),
+    "USD": LexerEntry(
+        "pygments.lexers.usd",
+        "UsdLexer",
+        ("usd", "usda"),
+        ("*.usd", "*.usda"),
+        (),
+    ),
+    "VBScript": LexerEntry(
+        "pygments.lexers.basic",
+        "VBScriptLexer",
+        ("vbscript",),
+        ("*.vbs", "*.VBS"),
+        (),
+    ),
+    "VCL": LexerEntry(
+        "pygments.lexers.varnish",
+        "VCLLexer",
+        ("vcl",),
+        ("*.vcl",),
+        ("text/x-vclsrc",),
+    ),
+    "VCLSnippets": LexerEntry(
+        "pygments.lexers.varnish",
+        "VCLSnippetLexer",
+        ("vclsnippets", "vclsnippet"),
+        (),
+        ("text/x-vclsnippet",),
+    ),
+    "VCTreeStatus": LexerEntry(
+        "pygments.lexers.console",
+        "VCTreeStatusLexer",
+        ("vctreestatus",),
+        (),
+        (),
+    ),
+    "VGL": LexerEntry(
+        "pygments.lexers.dsls",
+        "VGLLexer",
+        ("vgl",),
+        ("*.rpf",),
+        (),
+    ),
+    "Vala": LexerEntry(
+        "pygments.lexers.c_like",
+        "ValaLexer",
+        ("vala", "vapi"),
+        ("*.vala", "*.vapi"),
+        ("text/x-vala",),
+    ),
+    "aspx-vb": LexerEntry(
+        "pygments.lexers.dotnet",
+        "VbNetAspxLexer",
+        ("aspx-vb",),
+        ("*.aspx", "*.asax", "*.ascx", "*.ashx", "*.asmx", "*.axd"),
+        (),
+    ),
+    "VB.net": LexerEntry(
+        "pygments.lexers.dotnet",
+        "VbNetLexer",
+        ("vb.net", "vbnet", "lobas", "oobas", "sobas", "visual-basic", "visualbasic"),
+        ("*.vb", "*.bas"),
+        ("text/x-vbnet", "text/x-vba"),
+    ),
+    "HTML+Velocity": LexerEntry(
+        "pygments.lexers.templates",
+        "VelocityHtmlLexer",
+        ("html+velocity",),
+        (),
+        ("text/html+velocity",),
+    ),
+    "Velocity": LexerEntry(
+        "pygments.lexers.templates",
+        "VelocityLexer",
+        ("velocity",),
+        ("*.vm", "*.fhtml"),
+        (),
+    ),
+    "XML+Velocity": LexerEntry(
+        "pygments.lexers.templates",
+        "VelocityXmlLexer",
+        ("xml+velocity",),
+        (),
+        ("application/xml+velocity",),
+    ),
+    "Verifpal": LexerEntry(
+        "pygments.lexers.verifpal",
+        "VerifpalLexer",
+        ("verifpal",),
+        ("*.vp",),
+        ("text/x-verifpal",),
+    ),
+    "verilog": LexerEntry(
+        "pygments.lexers.hdl",
+        "VerilogLexer",
+        ("verilog", "v"),
+        ("*.v",),
+        ("text/x-verilog",),
+    ),
+    "vhdl": LexerEntry(
+        "pygments.lexers.hdl",
+        "VhdlLexer",
+        ("vhdl",),
+        ("*.vhdl", "*.vhd"),
+        ("text/x-vhdl",),
+    ),
+    "VimL": LexerEntry(
+        "pygments.lexers.textedit",
+        "VimLexer",
+        ("vim",),
+        (
+            "*.vim",
+            ".vimrc",
+            ".exrc",
+            ".gvimrc",
+            "_vimrc",
+            "_exrc",
+            "_gvimrc",
+            "vimrc",
+            "gvimrc",
+        ),
+        ("text/x-vim",),
+    ),
+    "Visual Prolog Grammar": LexerEntry(
+        "pygments.lexers.vip",
+        "VisualPrologGrammarLexer",
+        ("visualprologgrammar",),
+        ("*.vipgrm",),
+        (),
+    ),
+    "Visual Prolog": LexerEntry(
+        "pygments.lexers.vip",
+        "VisualPrologLexer",
+        ("visualprolog",),
+        ("*.pro", "*.cl", "*.i", "*.pack", "*.ph"),
+        (),
+    ),
+    "Vue": LexerEntry(
+        "pygments.lexers.html",
+        "VueLexer",
+        ("vue",),
+        ("*.vue",),
+        (),
+    ),
+    "Vyper": LexerEntry(
+        "pygments.lexers.vyper",
+        "VyperLexer",
+        ("vyper",),
+        ("*.vy",),
+        (),
+    ),
+    "WDiff": LexerEntry(
+        "pygments.lexers.diff",
+        "WDiffLexer",
+        ("wdiff",),
+        ("*.wdiff",),
+        (),
+    ),
+    "WebAssembly": LexerEntry(
+        "pygments.lexers.webassembly",
+        "WatLexer",
+        ("wast", "wat"),
+        ("*.wat", "*.wast"),
+        (),
+    ),
+    "Web IDL": LexerEntry(
+        "pygments.lexers.webidl",
+        "WebIDLLexer",
+        ("webidl",),
+        ("*.webidl",),
+        (),
+    ),
+    "WebGPU Shading Language": LexerEntry(
+        "pygments.lexers.wgsl",
+        "WgslLexer",
+        ("wgsl",),
+        ("*.wgsl",),
+        ("text/wgsl",),
+    ),
+    "Whiley": LexerEntry(
+        "pygments.lexers.whiley",
+        "WhileyLexer",
+        ("whiley",),
+        ("*.whiley",),
+        ("text/x-whiley",),
+    ),
+    "Wikitext": LexerEntry(
+        "pygments.lexers.markup",
+        "WikitextLexer",
+        ("wikitext", "mediawiki"),
+        (),
+        ("text/x-wiki",),
+    ),
+    "World of Warcraft TOC": LexerEntry(
+        "pygments.lexers.wowtoc",
+        "WoWTocLexer",
+        ("wowtoc",),
+        ("*.toc",),
+        (),
+    ),
+    "Wren": LexerEntry(
+        "pygments.lexers.wren",
+        "WrenLexer",
+        ("wren",),
+        ("*.wren",),
+        (),
+    ),
+    "X10": LexerEntry(
+        "pygments.lexers.x10",
+        "X10Lexer",
+        ("x10", "xten"),
+        ("*.x10",),
+        ("text/x-x10",),
+    ),
+    "XML+UL4": LexerEntry(
+        "pygments.lexers.ul4",
+        "XMLUL4Lexer",
+        ("xml+ul4",),
+        ("*.xmlul4",),
+        (),
+    ),
+    "XQuery": LexerEntry(
+        "pygments.lexers.webmisc",
+        "XQueryLexer",
+        ("xquery", "xqy", "xq", "xql", "xqm"),
+        ("*.xqy", "*.xquery", "*.xq", "*.xql", "*.xqm"),
+        ("text/xquery", "application/xquery"),
+    ),
+    "XML+Django/Jinja": LexerEntry(
+        "pygments.lexers.templates",
+        "XmlDjangoLexer",
+        ("xml+django", "xml+jinja"),
+        ("*.xml.j2", "*.xml.jinja2"),
+        ("application/xml+django", "application/xml+jinja"),
+    ),
+    "XML+Ruby": LexerEntry(
+        "pygments.lexers.templates",
+        "XmlErbLexer",
+        ("xml+ruby", "xml+erb"),
+        (),
+        ("application/xml+ruby",),
+    ),
+    "XML": LexerEntry(
+        "pygments.lexers.html",
+        "XmlLexer",
+        ("xml",),
+        (
+            "*.xml",
+            "*.xsl",
+            "*.rss",
+            "*.xslt",
+            "*.xsd",
+            "*.wsdl",
+            "*.wsf",
+            "*.xbrl",
+            "*.pom",
+            "*.svg",
+        ),
+        (
+            "text/xml",
+            "application/xml",
+            "image/svg+xml",
+            "application/rss+xml",
+            "application/atom+xml",
+        ),
+    ),
+    "XML+PHP": LexerEntry(
+        "pygments.lexers.templates",
+        "XmlPhpLexer",
+        ("xml+php",),
+        (),
+        ("application/xml+php",),
+    ),
+    "XML+Smarty": LexerEntry(
+        "pygments.lexers.templates",
+        "XmlSmartyLexer",
+        ("xml+smarty",),
+        (),
+        ("application/xml+smarty",),
+    ),
+    "Xorg": LexerEntry(
+        "pygments.lexers.xorg",
+        "XorgLexer",
+        ("xorg.conf",),
+        ("xorg.conf",),
+        (),
+    ),
+    "X++": LexerEntry(
+        "pygments.lexers.dotnet",
+        "XppLexer",
+        ("xpp", "x++"),
+        ("*.xpp",),
+        (),
+    ),
+    "XSLT": LexerEntry(
+        "pygments.lexers.html",
+        "XsltLexer",
+        ("xslt",),
+        ("*.xsl", "*.xslt", "*.xpl"),
+        ("application/xsl+xml", "application/xslt+xml"),
+    ),
+    "Xtend": LexerEntry(
+        "pygments.lexers.jvm",
+        "XtendLexer",
+        ("xtend",),
+        ("*.xtend",),
+        ("text/x-xtend",),
+    ),
+    "xtlang": LexerEntry(
+        "pygments.lexers.lisp",
+        "XtlangLexer",
+        ("extempore",),
+        ("*.xtm",),
+        (),
+    ),
+    "YAML+Jinja": LexerEntry(
+        "pygments.lexers.templates",
+        "YamlJinjaLexer",
+        ("yaml+jinja", "salt", "sls"),
+        ("*.sls", "*.yaml.j2", "*.yml.j2", "*.yaml.jinja2", "*.yml.jinja2"),
+        ("text/x-yaml+jinja", "text/x-sls"),
+    ),
+    "YAML": LexerEntry(
+        "pygments.lexers.data",
+        "YamlLexer",
+        ("yaml", "yml"),
+        ("*.yaml", "*.yml"),
+        ("text/x-yaml",),
+    ),
+    "YANG": LexerEntry(
+        "pygments.lexers.yang",
+        "YangLexer",
+        ("yang",),
+        ("*.yang",),
+        ("application/yang",),
+    ),
+    "YARA": LexerEntry(
+        "pygments.lexers.yara",
+        "YaraLexer",
+        ("yara", "yar"),
+        ("*.yar",),
+        ("text/x-yara",),
+    ),
+    "Zeek": LexerEntry(
+        "pygments.lexers.dsls",
+        "ZeekLexer",
+        ("zeek", "bro"),
+        ("*.zeek", "*.bro"),
+        (),
+    ),
+    "Zephir": LexerEntry(
+        "pygments.lexers.php",
+        "ZephirLexer",
+        ("zephir",),
+        ("*.zep",),
+        (),
+    ),
+    "Zig": LexerEntry(
+        "pygments.lexers.zig",
+        "ZigLexer",
+        ("zig",),
+        ("*.zig",),
+        ("text/zig",),
+    ),
+    "ANSYS parametric design language": LexerEntry(
+        "pygments.lexers.apdlexer",
+        "apdlexer",
+        ("ansys", "apdl"),
+        ("*.ans",),
+        (),
+    ),
+    "ARM": LexerEntry(
+        ".pygmentsarm",
+        "ArmLexer",
+        ("arm",),
+        ("*.S",),
+        (),
+    ),
+}
+
+# Maps a lowercase alias to a lexer name.
+ALIASES: dict[str, str] = {
+    "arm": "ARM",
+    "abap": "ABAP",
+    "amdgpu": "AMDGPU",
+    "apl": "APL",
+    "abnf": "ABNF",
+    "actionscript3": "ActionScript 3",
+    "as3": "ActionScript 3",
+    "actionscript": "ActionScript",
+    "as": "ActionScript",
+    "ada": "Ada",
+    "ada95": "Ada",
+    "ada2005": "Ada",
+    "adl": "ADL",
+    "agda": "Agda",
+    "aheui": "Aheui",
+    "alloy": "Alloy",
+    "ambienttalk": "AmbientTalk",
+    "ambienttalk/2": "AmbientTalk",
+    "at": "AmbientTalk",
+    "ampl": "Ampl",
+    "html+ng2": "HTML + Angular2",
+    "ng2": "Angular2",
+    "antlr-actionscript": "ANTLR With ActionScript Target",
+    "antlr-as": "ANTLR With ActionScript Target",
+    "antlr-csharp": "ANTLR With C# Target",
+    "antlr-c#": "ANTLR With C# Target",
+    "antlr-cpp": "ANTLR With CPP Target",
+    "antlr-java": "ANTLR With Java Target",
+    "antlr": "ANTLR",
+    "antlr-objc": "ANTLR With ObjectiveC Target",
+    "antlr-perl": "ANTLR With Perl Target",
+    "antlr-python": "ANTLR With Python Target",
+    "antlr-ruby": "ANTLR With Ruby Target",
+    "antlr-rb": "ANTLR With Ruby Target",
+    "apacheconf": "ApacheConf",
+    "aconf": "ApacheConf",
+    "apache": "ApacheConf",
+    "applescript": "AppleScript",
+    "arduino": "Arduino",
+    "arrow": "Arrow",
+    "arturo": "Arturo",
+    "art": "Arturo",
+    "asc": "ASCII armored",
+    "pem": "ASCII armored",
+    "asn1": "ASN.1",
+    "aspectj": "AspectJ",
+    "asymptote": "Asymptote",
+    "asy": "Asymptote",
+    "augeas": "Augeas",
+    "autoit": "AutoIt",
+    "autohotkey": "autohotkey",
+    "ahk": "autohotkey",
+    "awk": "Awk",
+    "gawk": "Awk",
+    "mawk": "Awk",
+    "nawk": "Awk",
+    "bbcbasic": "BBC Basic",
+    "bbcode": "BBCode",
+    "bc": "BC",
+    "bqn": "BQN",
+    "bst": "BST",
+    "bst-pybtex": "BST",
+    "bare": "BARE",
+    "basemake": "Base Makefile",
+    "bash": "Bash",
+    "sh": "Bash",
+    "ksh": "Bash",
+    "zsh": "Bash",
+    "shell": "Bash",
+    "openrc": "Bash",
+    "console": "Bash Session",
+    "shell-session": "Bash Session",
+    "batch": "Batchfile",
+    "bat": "Batchfile",
+    "dosbatch": "Batchfile",
+    "winbatch": "Batchfile",
+    "bdd": "Bdd",
+    "befunge": "Befunge",
+    "berry": "Berry",
+    "be": "Berry",
+    "bibtex": "BibTeX",
+    "bib": "BibTeX",
+    "bitbake": "BitBake",
+    "blitzbasic": "BlitzBasic",
+    "b3d": "BlitzBasic",
+    "bplus": "BlitzBasic",
+    "blitzmax": "BlitzMax",
+    "bmax": "BlitzMax",
+    "blueprint": "Blueprint",
+    "bnf": "BNF",
+    "boa": "Boa",
+    "boo": "Boo",
+    "boogie": "Boogie",
+    "brainfuck": "Brainfuck",
+    "bf": "Brainfuck",
+    "bugs": "BUGS",
+    "winbugs": "BUGS",
+    "openbugs": "BUGS",
+    "camkes": "CAmkES",
+    "idl4": "CAmkES",
+    "cel": "CEL",
+    "c": "C",
+    "cmake": "CMake",
+    "c-objdump": "c-objdump",
+    "cpsa": "CPSA",
+    "css+ul4": "CSS+UL4",
+    "aspx-cs": "aspx-cs",
+    "csharp": "C#",
+    "c#": "C#",
+    "cs": "C#",
+    "ca65": "ca65 assembler",
+    "caddyfile": "Caddyfile",
+    "caddy": "Caddyfile",
+    "cadl": "cADL",
+    "capdl": "CapDL",
+    "capnp": "Cap'n Proto",
+    "carbon": "Carbon",
+    "cbmbas": "CBM BASIC V2",
+    "cddl": "CDDL",
+    "ceylon": "Ceylon",
+    "cfengine3": "CFEngine3",
+    "cf3": "CFEngine3",
+    "chaiscript": "ChaiScript",
+    "chai": "ChaiScript",
+    "chapel": "Chapel",
+    "chpl": "Chapel",
+    "charmci": "Charmci",
+    "html+cheetah": "HTML+Cheetah",
+    "html+spitfire": "HTML+Cheetah",
+    "htmlcheetah": "HTML+Cheetah",
+    "javascript+cheetah": "JavaScript+Cheetah",
+    "js+cheetah": "JavaScript+Cheetah",
+    "javascript+spitfire": "JavaScript+Cheetah",
+    "js+spitfire": "JavaScript+Cheetah",
+    "cheetah": "Cheetah",
+    "spitfire": "Cheetah",
+    "xml+cheetah": "XML+Cheetah",
+    "xml+spitfire": "XML+Cheetah",
+    "cirru": "Cirru",
+    "clay": "Clay",
+    "clean": "Clean",
+    "clojure": "Clojure",
+    "clj": "Clojure",
+    "clojurescript": "ClojureScript",
+    "cljs": "ClojureScript",
+    "cobolfree": "COBOLFree",
+    "cobol": "COBOL",
+    "codeql": "CodeQL",
+    "ql": "CodeQL",
+    "coffeescript": "CoffeeScript",
+    "coffee-script": "CoffeeScript",
+    "coffee": "CoffeeScript",
+    "cfc": "Coldfusion CFC",
+    "cfm": "Coldfusion HTML",
+    "cfs": "cfstatement",
+    "comal": "COMAL-80",
+    "comal80": "COMAL-80",
+    "common-lisp": "Common Lisp",
+    "cl": "Common Lisp",
+    "lisp": "Common Lisp",
+    "componentpascal": "Component Pascal",
+    "cp": "Component Pascal",
+    "cplint": "cplint",
+    "cpp": "C++",
+    "c++": "C++",
+    "cpp-objdump": "cpp-objdump",
+    "c++-objdumb": "cpp-objdump",
+    "cxx-objdump": "cpp-objdump",
+    "crmsh": "Crmsh",
+    "pcmk": "Crmsh",
+    "croc": "Croc",
+    "cryptol": "Cryptol",
+    "cry": "Cryptol",
+    "cr": "Crystal",
+    "crystal": "Crystal",
+    "csound-document": "Csound Document",
+    "csound-csd": "Csound Document",
+    "csound": "Csound Orchestra",
+    "csound-orc": "Csound Orchestra",
+    "csound-score": "Csound Score",
+    "csound-sco": "Csound Score",
+    "css+django": "CSS+Django/Jinja",
+    "css+jinja": "CSS+Django/Jinja",
+    "css+ruby": "CSS+Ruby",
+    "css+erb": "CSS+Ruby",
+    "css+genshitext": "CSS+Genshi Text",
+    "css+genshi": "CSS+Genshi Text",
+    "css": "CSS",
+    "css+php": "CSS+PHP",
+    "css+smarty": "CSS+Smarty",
+    "cuda": "CUDA",
+    "cu": "CUDA",
+    "cypher": "Cypher",
+    "cython": "Cython",
+    "pyx": "Cython",
+    "pyrex": "Cython",
+    "d": "D",
+    "d-objdump": "d-objdump",
+    "dpatch": "Darcs Patch",
+    "dart": "Dart",
+    "dasm16": "DASM16",
+    "dax": "Dax",
+    "debcontrol": "Debian Control file",
+    "control": "Debian Control file",
+    "debian.sources": "Debian Sources file",
+    "delphi": "Delphi",
+    "pas": "Delphi",
+    "pascal": "Delphi",
+    "objectpascal": "Delphi",
+    "desktop": "Desktop file",
+    "devicetree": "Devicetree",
+    "dts": "Devicetree",
+    "dg": "dg",
+    "diff": "Diff",
+    "udiff": "Diff",
+    "django": "Django/Jinja",
+    "jinja": "Django/Jinja",
+    "zone": "Zone",
+    "docker": "Docker",
+    "dockerfile": "Docker",
+    "dtd": "DTD",
+    "duel": "Duel",
+    "jbst": "Duel",
+    "jsonml+bst": "Duel",
+    "dylan-console": "Dylan session",
+    "dylan-repl": "Dylan session",
+    "dylan": "Dylan",
+    "dylan-lid": "DylanLID",
+    "lid": "DylanLID",
+    "ecl": "ECL",
+    "ec": "eC",
+    "earl-grey": "Earl Grey",
+    "earlgrey": "Earl Grey",
+    "eg": "Earl Grey",
+    "easytrieve": "Easytrieve",
+    "ebnf": "EBNF",
+    "eiffel": "Eiffel",
+    "iex": "Elixir iex session",
+    "elixir": "Elixir",
+    "ex": "Elixir",
+    "exs": "Elixir",
+    "elm": "Elm",
+    "elpi": "Elpi",
+    "emacs-lisp": "EmacsLisp",
+    "elisp": "EmacsLisp",
+    "emacs": "EmacsLisp",
+    "email": "E-mail",
+    "eml": "E-mail",
+    "erb": "ERB",
+    "erlang": "Erlang",
+    "erl": "Erlang erl session",
+    "html+evoque": "HTML+Evoque",
+    "evoque": "Evoque",
+    "xml+evoque": "XML+Evoque",
+    "execline": "execline",
+    "ezhil": "Ezhil",
+    "fsharp": "F#",
+    "f#": "F#",
+    "fstar": "FStar",
+    "factor": "Factor",
+    "fancy": "Fancy",
+    "fy": "Fancy",
+    "fan": "Fantom",
+    "felix": "Felix",
+    "flx": "Felix",
+    "fennel": "Fennel",
+    "fnl": "Fennel",
+    "fift": "Fift",
+    "fif": "Fift",
+    "fish": "Fish",
+    "fishshell": "Fish",
+    "flatline": "Flatline",
+    "floscript": "FloScript",
+    "flo": "FloScript",
+    "forth": "Forth",
+    "fortranfixed": "FortranFixed",
+    "fortran": "Fortran",
+    "f90": "Fortran",
+    "foxpro": "FoxPro",
+    "vfp": "FoxPro",
+    "clipper": "FoxPro",
+    "xbase": "FoxPro",
+    "freefem": "Freefem",
+    "func": "FunC",
+    "fc": "FunC",
+    "futhark": "Futhark",
+    "gap-console": "GAP session",
+    "gap-repl": "GAP session",
+    "gap": "GAP",
+    "gdscript": "GDScript",
+    "gd": "GDScript",
+    "glsl": "GLSL",
+    "gsql": "GSQL",
+    "gas": "GAS",
+    "asm": "GAS",
+    "gcode": "g-code",
+    "genshi": "Genshi",
+    "kid": "Genshi",
+    "xml+genshi": "Genshi",
+    "xml+kid": "Genshi",
+    "genshitext": "Genshi Text",
+    "pot": "Gettext Catalog",
+    "po": "Gettext Catalog",
+    "gherkin": "Gherkin",
+    "cucumber": "Gherkin",
+    "gleam": "Gleam",
+    "gnuplot": "Gnuplot",
+    "go": "Go",
+    "golang": "Go",
+    "golo": "Golo",
+    "gooddata-cl": "GoodData-CL",
+    "googlesql": "GoogleSQL",
+    "zetasql": "GoogleSQL",
+    "gosu": "Gosu",
+    "gst": "Gosu Template",
+    "graphql": "GraphQL",
+    "graphviz": "Graphviz",
+    "dot": "Graphviz",
+    "groff": "Groff",
+    "nroff": "Groff",
+    "man": "Groff",
+    "groovy": "Groovy",
+    "hlsl": "HLSL",
+    "html+ul4": "HTML+UL4",
+    "haml": "Haml",
+    "html+handlebars": "HTML+Handlebars",
+    "handlebars": "Handlebars",
+    "hare": "Hare",
+    "haskell": "Haskell",
+    "hs": "Haskell",
+    "haxe": "Haxe",
+    "hxsl": "Haxe",
+    "hx": "Haxe",
+    "hexdump": "Hexdump",
+    "hsail": "HSAIL",
+    "hsa": "HSAIL",
+    "hspec": "Hspec",
+    "html+django": "HTML+Django/Jinja",
+    "html+jinja": "HTML+Django/Jinja",
+    "htmldjango": "HTML+Django/Jinja",
+    "html+genshi": "HTML+Genshi",
+    "html+kid": "HTML+Genshi",
+    "html": "HTML",
+    "html+php": "HTML+PHP",
+    "html+smarty": "HTML+Smarty",
+    "http": "HTTP",
+    "haxeml": "Hxml",
+    "hxml": "Hxml",
+    "hylang": "Hy",
+    "hy": "Hy",
+    "hybris": "Hybris",
+    "idl": "IDL",
+    "icon": "Icon",
+    "idris": "Idris",
+    "idr": "Idris",
+    "igor": "Igor",
+    "igorpro": "Igor",
+    "inform6": "Inform 6",
+    "i6": "Inform 6",
+    "i6t": "Inform 6 template",
+    "inform7": "Inform 7",
+    "i7": "Inform 7",
+    "ini": "INI",
+    "cfg": "INI",
+    "dosini": "INI",
+    "io": "Io",
+    "ioke": "Ioke",
+    "ik": "Ioke",
+    "irc": "IRC logs",
+    "isabelle": "Isabelle",
+    "j": "J",
+    "jmespath": "JMESPath",
+    "jp": "JMESPath",
+    "jslt": "JSLT",
+    "jags": "JAGS",
+    "janet": "Janet",
+    "jasmin": "Jasmin",
+    "jasminxt": "Jasmin",
+    "java": "Java",
+    "javascript+django": "JavaScript+Django/Jinja",
+    "js+django": "JavaScript+Django/Jinja",
+    "javascript+jinja": "JavaScript+Django/Jinja",
+    "js+jinja": "JavaScript+Django/Jinja",
+    "javascript+ruby": "JavaScript+Ruby",
+    "js+ruby": "JavaScript+Ruby",
+    "javascript+erb": "JavaScript+Ruby",
+    "js+erb": "JavaScript+Ruby",
+    "js+genshitext": "JavaScript+Genshi Text",
+    "js+genshi": "JavaScript+Genshi Text",
+    "javascript+genshitext": "JavaScript+Genshi Text",
+    "javascript+genshi": "JavaScript+Genshi Text",
+    "javascript": "JavaScript",
+    "js": "JavaScript",
+    "javascript+php": "JavaScript+PHP",
+    "js+php": "JavaScript+PHP",
+    "javascript+smarty": "JavaScript+Smarty",
+    "js+smarty": "JavaScript+Smarty",
+    "js+ul4": "Javascript+UL4",
+    "jcl": "JCL",
+    "jsgf": "JSGF",
+    "json5": "JSON5",
+    "jsonld": "JSON-LD",
+    "json-ld": "JSON-LD",
+    "json": "JSON",
+    "json-object": "JSON",
+    "jsonnet": "Jsonnet",
+    "jsp": "Java Server Page",
+    "jsx": "JSX",
+    "react": "JSX",
+    "jlcon": "Julia console",
+    "julia-repl": "Julia console",
+    "julia": "Julia",
+    "jl": "Julia",
+    "juttle": "Juttle",
+    "k": "K",
+    "kal": "Kal",
+    "kconfig": "Kconfig",
+    "menuconfig": "Kconfig",
+    "linux-config": "Kconfig",
+    "kernel-config": "Kconfig",
+    "kmsg": "Kernel log",
+    "dmesg": "Kernel log",
+    "koka": "Koka",
+    "kotlin": "Kotlin",
+    "kuin": "Kuin",
+    "kql": "Kusto",
+    "kusto": "Kusto",
+    "lsl": "LSL",
+    "css+lasso": "CSS+Lasso",
+    "html+lasso": "HTML+Lasso",
+    "javascript+lasso": "JavaScript+Lasso",
+    "js+lasso": "JavaScript+Lasso",
+    "lasso": "Lasso",
+    "lassoscript": "Lasso",
+    "xml+lasso": "XML+Lasso",
+    "ldapconf": "LDAP configuration file",
+    "ldaprc": "LDAP configuration file",
+    "ldif": "LDIF",
+    "lean": "Lean",
+    "lean3": "Lean",
+    "lean4": "Lean4",
+    "less": "LessCss",
+    "lighttpd": "Lighttpd configuration file",
+    "lighty": "Lighttpd configuration file",
+    "lilypond": "LilyPond",
+    "limbo": "Limbo",
+    "liquid": "liquid",
+    "literate-agda": "Literate Agda",
+    "lagda": "Literate Agda",
+    "literate-cryptol": "Literate Cryptol",
+    "lcryptol": "Literate Cryptol",
+    "lcry": "Literate Cryptol",
+    "literate-haskell": "Literate Haskell",
+    "lhaskell": "Literate Haskell",
+    "lhs": "Literate Haskell",
+    "literate-idris": "Literate Idris",
+    "lidris": "Literate Idris",
+    "lidr": "Literate Idris",
+    "livescript": "LiveScript",
+    "live-script": "LiveScript",
+    "llvm": "LLVM",
+    "llvm-mir-body": "LLVM-MIR Body",
+    "llvm-mir": "LLVM-MIR",
+    "logos": "Logos",
+    "logtalk": "Logtalk",
+    "lua": "Lua",
+    "luau": "Luau",
+    "mcfunction": "MCFunction",
+    "mcf": "MCFunction",
+    "mcschema": "MCSchema",
+    "mime": "MIME",
+    "mips": "MIPS",
+    "moocode": "MOOCode",
+    "moo": "MOOCode",
+    "doscon": "MSDOS Session",
+    "macaulay2": "Macaulay2",
+    "make": "Makefile",
+    "makefile": "Makefile",
+    "mf": "Makefile",
+    "bsdmake": "Makefile",
+    "css+mako": "CSS+Mako",
+    "html+mako": "HTML+Mako",
+    "javascript+mako": "JavaScript+Mako",
+    "js+mako": "JavaScript+Mako",
+    "mako": "Mako",
+    "xml+mako": "XML+Mako",
+    "maple": "Maple",
+    "maql": "MAQL",
+    "markdown": "Markdown",
+    "md": "Markdown",
+    "mask": "Mask",
+    "mason": "Mason",
+    "mathematica": "Mathematica",
+    "mma": "Mathematica",
+    "nb": "Mathematica",
+    "wl": "Mathematica",
+    "wolfram": "Mathematica",
+    "matlab": "Matlab",
+    "matlabsession": "Matlab session",
+    "maxima": "Maxima",
+    "macsyma": "Maxima",
+    "meson": "Meson",
+    "meson.build": "Meson",
+    "minid": "MiniD",
+    "miniscript": "MiniScript",
+    "ms": "MiniScript",
+    "modelica": "Modelica",
+    "modula2": "Modula-2",
+    "m2": "Modula-2",
+    "trac-wiki": "MoinMoin/Trac Wiki markup",
+    "moin": "MoinMoin/Trac Wiki markup",
+    "mojo": "Mojo",
+    "🔥": "Mojo",
+    "monkey": "Monkey",
+    "monte": "Monte",
+    "moonscript": "MoonScript",
+    "moon": "MoonScript",
+    "mosel": "Mosel",
+    "css+mozpreproc": "CSS+mozpreproc",
+    "mozhashpreproc": "mozhashpreproc",
+    "javascript+mozpreproc": "Javascript+mozpreproc",
+    "mozpercentpreproc": "mozpercentpreproc",
+    "xul+mozpreproc": "XUL+mozpreproc",
+    "mql": "MQL",
+    "mq4": "MQL",
+    "mq5": "MQL",
+    "mql4": "MQL",
+    "mql5": "MQL",
+    "mscgen": "Mscgen",
+    "msc": "Mscgen",
+    "mupad": "MuPAD",
+    "mxml": "MXML",
+    "mysql": "MySQL",
+    "css+myghty": "CSS+Myghty",
+    "html+myghty": "HTML+Myghty",
+    "javascript+myghty": "JavaScript+Myghty",
+    "js+myghty": "JavaScript+Myghty",
+    "myghty": "Myghty",
+    "xml+myghty": "XML+Myghty",
+    "ncl": "NCL",
+    "nsis": "NSIS",
+    "nsi": "NSIS",
+    "nsh": "NSIS",
+    "nasm": "NASM",
+    "objdump-nasm": "objdump-nasm",
+    "nemerle": "Nemerle",
+    "nesc": "nesC",
+    "nestedtext": "NestedText",
+    "nt": "NestedText",
+    "newlisp": "NewLisp",
+    "newspeak": "Newspeak",
+    "nginx": "Nginx configuration file",
+    "nimrod": "Nimrod",
+    "nim": "Nimrod",
+    "nit": "Nit",
+    "nixos": "Nix",
+    "nix": "Nix",
+    "nodejsrepl": "Node.js REPL console session",
+    "notmuch": "Notmuch",
+    "nusmv": "NuSMV",
+    "numpy": "NumPy",
+    "numba_ir": "Numba_IR",
+    "numbair": "Numba_IR",
+    "objdump": "objdump",
+    "objective-c": "Objective-C",
+    "objectivec": "Objective-C",
+    "obj-c": "Objective-C",
+    "objc": "Objective-C",
+    "objective-c++": "Objective-C++",
+    "objectivec++": "Objective-C++",
+    "obj-c++": "Objective-C++",
+    "objc++": "Objective-C++",
+    "objective-j": "Objective-J",
+    "objectivej": "Objective-J",
+    "obj-j": "Objective-J",
+    "objj": "Objective-J",
+    "ocaml": "OCaml",
+    "octave": "Octave",
+    "odin": "ODIN",
+    "omg-idl": "OMG Interface Definition Language",
+    "ooc": "Ooc",
+    "opa": "Opa",
+    "openedge": "OpenEdge ABL",
+    "abl": "OpenEdge ABL",
+    "progress": "OpenEdge ABL",
+    "openscad": "OpenSCAD",
+    "org": "Org Mode",
+    "orgmode": "Org Mode",
+    "org-mode": "Org Mode",
+    "output": "Text output",
+    "pacmanconf": "PacmanConf",
+    "pan": "Pan",
+    "parasail": "ParaSail",
+    "pawn": "Pawn",
+    "pddl": "PDDL",
+    "peg": "PEG",
+    "perl6": "Perl6",
+    "pl6": "Perl6",
+    "raku": "Perl6",
+    "perl": "Perl",
+    "pl": "Perl",
+    "phix": "Phix",
+    "php": "PHP",
+    "php3": "PHP",
+    "php4": "PHP",
+    "php5": "PHP",
+    "pig": "Pig",
+    "pike": "Pike",
+    "pkgconfig": "PkgConfig",
+    "plpgsql": "PL/pgSQL",
+    "pointless": "Pointless",
+    "pony": "Pony",
+    "portugol": "Portugol",
+    "postscript": "PostScript",
+    "postscr": "PostScript",
+    "psql": "PostgreSQL console (psql)",
+    "postgresql-console": "PostgreSQL console (psql)",
+    "postgres-console": "PostgreSQL console (psql)",
+    "postgres-explain": "PostgreSQL EXPLAIN dialect",
+    "postgresql": "PostgreSQL SQL dialect",
+    "postgres": "PostgreSQL SQL dialect",
+    "pov": "POVRay",
+    "powershell": "PowerShell",
+    "pwsh": "PowerShell",
+    "posh": "PowerShell",
+    "ps1": "PowerShell",
+    "psm1": "PowerShell",
+    "pwsh-session": "PowerShell Session",
+    "ps1con": "PowerShell Session",
+    "praat": "Praat",
+    "procfile": "Procfile",
+    "prolog": "Prolog",
+    "promql": "PromQL",
+    "promela": "Promela",
+    "properties": "Properties",
+    "jproperties": "Properties",
+    "protobuf": "Protocol Buffer",
+    "proto": "Protocol Buffer",
+    "prql": "PRQL",
+    "psysh": "PsySH console session for PHP",
+    "ptx": "PTX",
+    "pug": "Pug",
+    "jade": "Pug",
+    "puppet": "Puppet",
+    "purescript": "PureScript",
+    "purs": "PureScript",
+    "pypylog": "PyPy Log",
+    "pypy": "PyPy Log",
+    "python2": "Python 2.x",
+    "py2": "Python 2.x",
+    "py2tb": "Python 2.x Traceback",
+    "pycon": "Python console session",
+    "python-console": "Python console session",
+    "python": "Python",
+    "py": "Python",
+    "sage": "Python",
+    "python3": "Python",
+    "py3": "Python",
+    "bazel": "Python",
+    "starlark": "Python",
+    "pyi": "Python",
+    "pytb": "Python Traceback",
+    "py3tb": "Python Traceback",
+    "py+ul4": "Python+UL4",
+    "qbasic": "QBasic",
+    "basic": "QBasic",
+    "q": "Q",
+    "qvto": "QVTO",
+    "qvt": "QVTO",
+    "qlik": "Qlik",
+    "qlikview": "Qlik",
+    "qliksense": "Qlik",
+    "qlikscript": "Qlik",
+    "qml": "QML",
+    "qbs": "QML",
+    "rconsole": "RConsole",
+    "rout": "RConsole",
+    "rng-compact": "Relax-NG Compact",
+    "rnc": "Relax-NG Compact",
+    "spec": "RPMSpec",
+    "racket": "Racket",
+    "rkt": "Racket",
+    "ragel-c": "Ragel in C Host",
+    "ragel-cpp": "Ragel in CPP Host",
+    "ragel-d": "Ragel in D Host",
+    "ragel-em": "Embedded Ragel",
+    "ragel-java": "Ragel in Java Host",
+    "ragel": "Ragel",
+    "ragel-objc": "Ragel in Objective C Host",
+    "ragel-ruby": "Ragel in Ruby Host",
+    "ragel-rb": "Ragel in Ruby Host",
+    "rd": "Rd",
+    "reasonml": "ReasonML",
+    "reason": "ReasonML",
+    "rebol": "REBOL",
+    "red": "Red",
+    "red/system": "Red",
+    "redcode": "Redcode",
+    "registry": "reg",
+    "rego": "Rego",
+    "rell": "Rell",
+    "resourcebundle": "ResourceBundle",
+    "resource": "ResourceBundle",
+    "rexx": "Rexx",
+    "arexx": "Rexx",
+    "rhtml": "RHTML",
+    "html+erb": "RHTML",
+    "html+ruby": "RHTML",
+    "ride": "Ride",
+    "rita": "Rita",
+    "roboconf-graph": "Roboconf Graph",
+    "roboconf-instances": "Roboconf Instances",
+    "robotframework": "RobotFramework",
+    "coq": "Rocq Prover",
+    "rocq": "Rocq Prover",
+    "rocq-prover": "Rocq Prover",
+    "rql": "RQL",
+    "rsl": "RSL",
+    "restructuredtext": "reStructuredText",
+    "rst": "reStructuredText",
+    "rest": "reStructuredText",
+    "trafficscript": "TrafficScript",
+    "rts": "TrafficScript",
+    "rbcon": "Ruby irb session",
+    "irb": "Ruby irb session",
+    "ruby": "Ruby",
+    "rb": "Ruby",
+    "duby": "Ruby",
+    "rust": "Rust",
+    "rs": "Rust",
+    "sas": "SAS",
+    "splus": "S",
+    "s": "S",
+    "r": "S",
+    "sml": "Standard ML",
+    "snbt": "SNBT",
+    "sarl": "SARL",
+    "sass": "Sass",
+    "savi": "Savi",
+    "scala": "Scala",
+    "scaml": "Scaml",
+    "scdoc": "scdoc",
+    "scd": "scdoc",
+    "scheme": "Scheme",
+    "scm": "Scheme",
+    "scilab": "Scilab",
+    "scss": "SCSS",
+    "sed": "Sed",
+    "gsed": "Sed",
+    "ssed": "Sed",
+    "shexc": "ShExC",
+    "shex": "ShExC",
+    "shen": "Shen",
+    "sieve": "Sieve",
+    "silver": "Silver",
+    "singularity": "Singularity",
+    "slash": "Slash",
+    "slim": "Slim",
+    "slurm": "Slurm",
+    "sbatch": "Slurm",
+    "smali": "Smali",
+    "smalltalk": "Smalltalk",
+    "squeak": "Smalltalk",
+    "st": "Smalltalk",
+    "sgf": "SmartGameFormat",
+    "smarty": "Smarty",
+    "smithy": "Smithy",
+    "snobol": "Snobol",
+    "snowball": "Snowball",
+    "solidity": "Solidity",
+    "androidbp": "Soong",
+    "bp": "Soong",
+    "soong": "Soong",
+    "sophia": "Sophia",
+    "sp": "SourcePawn",
+    "debsources": "Debian Sourcelist",
+    "sourceslist": "Debian Sourcelist",
+    "sources.list": "Debian Sourcelist",
+    "sparql": "SPARQL",
+    "spice": "Spice",
+    "spicelang": "Spice",
+    "sql+jinja": "SQL+Jinja",
+    "sql": "SQL",
+    "sqlite3": "sqlite3con",
+    "squidconf": "SquidConf",
+    "squid.conf": "SquidConf",
+    "squid": "SquidConf",
+    "srcinfo": "Srcinfo",
+    "ssp": "Scalate Server Page",
+    "stan": "Stan",
+    "stata": "Stata",
+    "do": "Stata",
+    "supercollider": "SuperCollider",
+    "sc": "SuperCollider",
+    "swift": "Swift",
+    "swig": "SWIG",
+    "systemverilog": "systemverilog",
+    "sv": "systemverilog",
+    "systemd": "Systemd",
+    "tap": "TAP",
+    "tnt": "Typographic Number Theory",
+    "toml": "TOML",
+    "tablegen": "TableGen",
+    "td": "TableGen",
+    "tact": "Tact",
+    "tads3": "TADS 3",
+    "tal": "Tal",
+    "uxntal": "Tal",
+    "tasm": "TASM",
+    "tcl": "Tcl",
+    "tcsh": "Tcsh",
+    "csh": "Tcsh",
+    "tcshcon": "Tcsh Session",
+    "tea": "Tea",
+    "teal": "teal",
+    "teratermmacro": "Tera Term macro",
+    "teraterm": "Tera Term macro",
+    "ttl": "Tera Term macro",
+    "termcap": "Termcap",
+    "terminfo": "Terminfo",
+    "terraform": "Terraform",
+    "tf": "Terraform",
+    "hcl": "Terraform",
+    "tex": "TeX",
+    "latex": "TeX",
+    "text": "Text only",
+    "ti": "ThingsDB",
+    "thingsdb": "ThingsDB",
+    "thrift": "Thrift",
+    "tid": "tiddler",
+    "tlb": "Tl-b",
+    "tls": "TLS Presentation Language",
+    "todotxt": "Todotxt",
+    "tsql": "Transact-SQL",
+    "t-sql": "Transact-SQL",
+    "treetop": "Treetop",
+    "tsx": "TSX",
+    "turtle": "Turtle",
+    "html+twig": "HTML+Twig",
+    "twig": "Twig",
+    "typescript": "TypeScript",
+    "ts": "TypeScript",
+    "typoscriptcssdata": "TypoScriptCssData",
+    "typoscripthtmldata": "TypoScriptHtmlData",
+    "typoscript": "TypoScript",
+    "typst": "Typst",
+    "ul4": "UL4",
+    "ucode": "ucode",
+    "unicon": "Unicon",
+    "unixconfig": "Unix/Linux config files",
+    "linuxconfig": "Unix/Linux config files",
+    "urbiscript": "UrbiScript",
+    "urlencoded": "urlencoded",
+    "usd": "USD",
+    "usda": "USD",
+    "vbscript": "VBScript",
+    "vcl": "VCL",
+    "vclsnippets": "VCLSnippets",
+    "vclsnippet": "VCLSnippets",
+    "vctreestatus": "VCTreeStatus",
+    "vgl": "VGL",
+    "vala": "Vala",
+    "vapi": "Vala",
+    "aspx-vb": "aspx-vb",
+    "vb.net": "VB.net",
+    "vbnet": "VB.net",
+    "lobas": "VB.net",
+    "oobas": "VB.net",
+    "sobas": "VB.net",
+    "visual-basic": "VB.net",
+    "visualbasic": "VB.net",
+    "html+velocity": "HTML+Velocity",
+    "velocity": "Velocity",
+    "xml+velocity": "XML+Velocity",
+    "verifpal": "Verifpal",
+    "verilog": "verilog",
+    "v": "verilog",
+    "vhdl": "vhdl",
+    "vim": "VimL",
+    "visualprologgrammar": "Visual Prolog Grammar",
+    "visualprolog": "Visual Prolog",
+    "vue": "Vue",
+    "vyper": "Vyper",
+    "wdiff": "WDiff",
+    "wast": "WebAssembly",
+    "wat": "WebAssembly",
+    "webidl": "Web IDL",
+    "wgsl": "WebGPU Shading Language",
+    "whiley": "Whiley",
+    "wikitext": "Wikitext",
+    "mediawiki": "Wikitext",
+    "wowtoc": "World of Warcraft TOC",
+    "wren": "Wren",
+    "x10": "X10",
+    "xten": "X10",
+    "xml+ul4": "XML+UL4",
+    "xquery": "XQuery",
+    "xqy": "XQuery",
+    "xq": "XQuery",
+    "xql": "XQuery",
+    "xqm": "XQuery",
+    "xml+django": "XML+Django/Jinja",
+    "xml+jinja": "XML+Django/Jinja",
+    "xml+ruby": "XML+Ruby",
+    "xml+erb": "XML+Ruby",
+    "xml": "XML",
+    "xml+php": "XML+PHP",
+    "xml+smarty": "XML+Smarty",
+    "xorg.conf": "Xorg",
+    "xpp": "X++",
+    "x++": "X++",
+    "xslt": "XSLT",
+    "xtend": "Xtend",
+    "extempore": "xtlang",
+    "yaml+jinja": "YAML+Jinja",
+    "salt": "YAML+Jinja",
+    "sls": "YAML+Jinja",
+    "yaml": "YAML",
+    "yml": "YAML",
+    "yang": "YANG",
+    "yara": "YARA",
+    "yar": "YARA",
+    "zeek": "Zeek",
+    "bro": "Zeek",
+    "zephir": "Zephir",
+    "zig": "Zig",
+    "ansys": "ANSYS parametric design language",
+    "apdl": "ANSYS parametric design language",
+}
@@ -1,19 +1,24 @@
 """The implementation of the code highlighter add-on."""
 
+from __future__ import annotations
+
+import atexit
+import functools
 import os.path
 import random
 import sys
+import time
+from concurrent.futures import Future
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
 import aqt
 import aqt.editor
 import aqt.qt
-import bs4
 from aqt import gui_hooks, mw
 from aqt.qt import QApplication
-from aqt.utils import showWarning
+from aqt.utils import showInfo, showWarning
 
 sys.path.append(os.path.dirname(__file__))
 
@@ -22,33 +27,34 @@ import anki.collection
 import anki.media
 import anki.notes
 
-from . import config, pygments_highlighter
-from .ankieditorextra import (
-    AnkiEditorInterface,
-    EditorInterface,
-    SelectionException,
-    transform_selection,
-)
-from .assets import (
-    AnkiAssetManager,
-    AnkiAssetStateManager,
-    get_addon_assets,
-    has_newer_version,
-    sync_assets,
-)
-from .clipboard import Clipboard, EmptyClipboard
-from .dialog import (
-    DISPLAY_STYLE,
-    HighlighterConfig,
-    HighlighterWizardState,
-    HighlighterWizardStateJSONConverter,
-    PartialPygmentsConfig,
-    ask_for_highlighter_config,
-)
-from .field import set_up_style_import
-from .html import PlainString
-from .media import AnkiMediaInstaller
-from .serialization import JSONObjectSerializer
+# Anki loads the add-on during its start-up, so this module imports only what
+# it needs to register its hooks. Functions import the rest, e.g., the
+# highlighting engine (Pygments), BeautifulSoup, and the dialogs, on first
+# use.
+from . import config
+from .background import CancellationToken, Cancelled, NoProgress, run_in_foreground
+from .html import HtmlString, PlainString
+
+if TYPE_CHECKING:
+    from .ankieditorextra import EditorInterface, HighlightCallback
+    from .assets import State
+    from .background import BackgroundRunner, Progress
+    from .clipboard import Clipboard
+    from .dialog import (
+        DISPLAY_STYLE,
+        HighlighterConfig,
+        HighlighterWizardState,
+        LanguagePreviewFactory,
+        PartialPygmentsConfig,
+    )
+    from .editorhelper import BridgeStats
+    from .highlight_cache import HighlightCache
+    from .highlight_worker import HighlightWorker
+    from .preview import LanguagePreviewer
+    from .pygments_highlighter import HighlightRequest, HtmlStyle
+    from .speculation import SpeculationStats
+    from .userfiles import UserFileState
+    from .warmup import LexerWarmUp
 
 addon_path = os.path.dirname(__file__)
 ASSET_PREFIX = "_gch-"
@@ -56,29 +62,110 @@ DEFAULT_CSS_ASSETS = [
     "_gch-pygments-solarized.css",
 ]
 VERSION_ASSET = "_gch-asset-version.txt"
+# The SHA-256 digests of the installed assets.
+ASSET_MANIFEST = Path(ASSET_PREFIX + "asset-manifest.json")
 GUARD = "Greg's Code Highlighter (Add-on 1527277801)"
 CLASS_NAME = "gregs-code-highlighter"
+HIGHLIGHT_CACHE_DB = "highlight-cache.sqlite3"
+# Previews show only the first lines of a snippet, so a few megabytes hold
+# many of them.
+PREVIEW_CACHE_BYTES = 4 * 1024 * 1024
+# Each profile has its own wizard state, like the media folder that kept it
+# before.
+WIZARD_STATE_FILE = "wizard-state-{profile}.json"
+# The warm-up budget usually runs out before this many languages.
+WARM_UP_LANGUAGES = 8
+# The wizard state's location before it moved to user_files.
+LEGACY_WIZARD_STATE_ASSET = Path(ASSET_PREFIX + "wizard-state.json")
 
 
 def create_anki_asset_manager(css_assets: List[str], col: anki.collection.Collection):
+    from .assets import AnkiAssetManager, get_addon_assets
+    from .media import AnkiMediaInstaller
+
     return AnkiAssetManager(
-        AnkiMediaInstaller(ASSET_PREFIX, get_addon_assets(ASSET_PREFIX), col.media),
+        AnkiMediaInstaller(
+            ASSET_PREFIX,
+            get_addon_assets(ASSET_PREFIX),
+            col.media,
+            manifest_asset=ASSET_MANIFEST,
+        ),
         css_assets,
         class_name=CLASS_NAME,
     )
 
 
-def WizardStateManager(media):
-    return AnkiAssetStateManager(
-        media=media,
-        path=Path(ASSET_PREFIX + "wizard-state.json"),
+def get_wizard_state() -> UserFileState[HighlighterWizardState]:
+    """Returns the current profile's wizard state, which lives in user_files."""
+    assert mw is not None and mw.pm.name is not None
+    return get_profile_wizard_state(mw.pm.name)
+
+
+@functools.cache
+def get_profile_wizard_state(profile: str) -> UserFileState[HighlighterWizardState]:
+    """Returns a profile's wizard state, which lives in user_files."""
+    from .dialog import HighlighterWizardState, HighlighterWizardStateJSONConverter
+    from .serialization import JSONObjectSerializer
+    from .userfiles import UserFileState, user_files_directory
+
+    wizard_state = UserFileState(
+        user_files_directory() / WIZARD_STATE_FILE.format(profile=profile),
         serializer=JSONObjectSerializer(HighlighterWizardStateJSONConverter()),
         default=HighlighterWizardState(),
+        schedule=run_later,
+    )
+    return wizard_state
+
+
+def flush_wizard_state() -> None:
+    """Writes pending changes of the wizard state."""
+    get_wizard_state().flush()
+
+
+def run_later(delay: float, fn: Callable[[], None]) -> None:
+    """Calls the function on the main thread after a delay in seconds."""
+    aqt.qt.QTimer.singleShot(int(delay * 1000), fn)
+
+
+def read_wizard_state(media) -> HighlighterWizardState:
+    migrate_wizard_state(media)
+    return get_wizard_state().get()
+
+
+def migrate_wizard_state(media) -> None:
+    """Moves the profile's wizard state from the media folder to user_files.
+
+    Older versions kept the state in the media folder, where each highlight
+    changed a file that Anki then synced. Each profile migrates its own state
+    when it first opens.
+    """
+    from .assets import read_asset_state
+    from .dialog import HighlighterWizardState, HighlighterWizardStateJSONConverter
+    from .media import anki_media_directory
+    from .serialization import JSONObjectSerializer
+
+    wizard_state = get_wizard_state()
+    if wizard_state.exists():
+        return None
+    if not (anki_media_directory(media) / LEGACY_WIZARD_STATE_ASSET).is_file():
+        return None
+    wizard_state.put(
+        read_asset_state(
+            media=media,
+            path=LEGACY_WIZARD_STATE_ASSET,
+            serializer=JSONObjectSerializer(HighlighterWizardStateJSONConverter()),
+            default=HighlighterWizardState(),
+        )
     )
+    wizard_state.flush()
+    media.trash_files([LEGACY_WIZARD_STATE_ASSET.name])
 
 
 def get_highlighter_config(
-    parent, media, preselected: PartialPygmentsConfig
+    parent,
+    media,
+    preselected: PartialPygmentsConfig,
+    language_preview: Optional[LanguagePreviewFactory] = None,
 ) -> Optional[HighlighterConfig]:
     """Gets the highlighter configuration from the user.
 
@@ -90,24 +177,176 @@ def get_highlighter_config(
         parent: The parent widget.
         media: The media manager.
         preselected: The preselected configuration options.
+        language_preview: The factory of the language list's previewer.
 
     Returns:
         The highlighter configuration if the user accepted it, otherwise None.
     """
-    with WizardStateManager(media) as wizard_state:
-        highlighter_config, new_wizard_state = ask_for_highlighter_config(
-            parent, preselected=preselected, state=wizard_state.get()
-        )
-        wizard_state.put(new_wizard_state)
+    from .dialog import ask_for_highlighter_config
+
+    highlighter_config, new_wizard_state = ask_for_highlighter_config(
+        parent,
+        preselected=preselected,
+        state=read_wizard_state(media),
+        language_preview=language_preview,
+    )
+    get_wizard_state().put(new_wizard_state)
     return highlighter_config
 
 
+@functools.cache
+def get_highlight_cache() -> HighlightCache:
+    """Returns the add-on's highlight cache.
+
+    The cache persists highlights in user_files unless configured otherwise.
+    """
+    import sqlite3
+
+    from . import pygments_highlighter
+    from .highlight_cache import HighlightCache, SqliteTier
+    from .userfiles import user_files_directory
+
+    persistent = None
+    if config.snapshot().persistent_highlight_cache:
+        try:
+            persistent = SqliteTier(
+                user_files_directory() / HIGHLIGHT_CACHE_DB,
+                pygments_highlighter.engine_fingerprint(),
+            )
+        except sqlite3.Error:
+            # Fall back to the in-memory tier. The cache is just an
+            # optimization.
+            persistent = None
+    return HighlightCache(persistent=persistent)
+
+
+@functools.cache
+def get_preview_cache() -> HighlightCache:
+    """Returns the in-memory cache of language previews."""
+    from .highlight_cache import HighlightCache
+
+    return HighlightCache(max_bytes=PREVIEW_CACHE_BYTES)
+
+
+@functools.cache
+def get_highlight_worker() -> HighlightWorker:
+    """Returns the add-on's isolated highlighter process."""
+    return create_highlight_worker()
+
+
+@functools.cache
+def get_speculative_highlight_worker() -> HighlightWorker:
+    """Returns the isolated highlighter process of speculative highlights.
+
+    Cancelling a wrong guess kills its process, so guesses run in their own
+    process. That way they neither restart nor hold up the worker of real
+    highlights.
+    """
+    return create_highlight_worker()
+
+
+def create_highlight_worker() -> HighlightWorker:
+    """Creates an isolated highlighter process with the configured budgets."""
+    from .highlight_worker import HighlightWorker
+
+    addon_config = config.snapshot()
+    worker = HighlightWorker(
+        time_budget=addon_config.highlight_time_budget,
+        memory_budget=int(addon_config.highlight_memory_budget * 1024 * 1024),
+    )
+    atexit.register(worker.close)
+    return worker
+
+
+def reset_highlighting() -> None:
+    """Drops the highlight cache, workers, and warm-up after a config update.
+
+    The next use rebuilds them from the updated config.
+    """
+    if get_lexer_warm_up.cache_info().currsize:
+        get_lexer_warm_up().stop()
+    for get_worker in (get_highlight_worker, get_speculative_highlight_worker):
+        if get_worker.cache_info().currsize:
+            close_in_background(get_worker().close)
+        get_worker.cache_clear()
+    get_lexer_warm_up.cache_clear()
+    close_highlight_cache()
+
+
+def close_in_background(close: Callable[[], None]) -> None:
+    """Closes a resource without waiting for it on the main thread.
+
+    A worker may be in the middle of a highlight, for example.
+    """
+    if not mw:
+        close()
+        return None
+
+    def on_closed(future: Future) -> None:
+        # Closing is best-effort, so ignore failures.
+        future.exception()
+
+    mw.taskman.run_in_background(close, on_closed, uses_collection=False)
+
+
+def close_highlight_cache() -> None:
+    """Releases the highlight cache's database. The next use reopens it."""
+    if get_highlight_cache.cache_info().currsize:
+        get_highlight_cache().close()
+    get_highlight_cache.cache_clear()
+
+
+@functools.cache
+def get_bridge_stats() -> BridgeStats:
+    """Returns the counters of the add-on's editor bridge traffic."""
+    from .editorhelper import BridgeStats
+
+    return BridgeStats()
+
+
+@functools.cache
+def get_speculation_stats() -> SpeculationStats:
+    """Returns the counters of highlights started on a predicted config."""
+    from .speculation import SpeculationStats
+
+    return SpeculationStats()
+
+
+@functools.cache
+def get_asset_sync() -> State[Optional[Future[None]]]:
+    """Returns the future of the latest asset sync or None if none has started."""
+    from .assets import State
+
+    return State(None)
+
+
+@functools.cache
+def get_lexer_warm_up() -> LexerWarmUp:
+    """Returns the add-on's lexer warm-up."""
+    from .warmup import LexerWarmUp
+
+    return LexerWarmUp(get_highlight_worker(), budget=config.snapshot().warm_up_budget)
+
+
 def get_qclipboard_or_empty() -> Clipboard:
     """Returns the QApplication clipboard or an empty clipboard."""
+    from .clipboard import EmptyClipboard
+
     return QApplication.clipboard() or EmptyClipboard()
 
 
 def highlight_action(editor: aqt.editor.Editor) -> None:
+    # The user needs the highlighter now, so let them have it.
+    get_lexer_warm_up().stop()
+
+    # The highlight refers to the add-on's stylesheets, so wait until they are
+    # installed. The sync resolves on the main thread, so the highlight
+    # resumes there.
+    asset_sync = get_asset_sync().get()
+    if asset_sync is not None and not asset_sync.done():
+        asset_sync.add_done_callback(lambda _: highlight_action(editor))
+        return None
+
     note: Optional[anki.notes.Note] = editor.note
     if note is None:
         showWarning(
@@ -131,68 +370,244 @@ def highlight_action(editor: aqt.editor.Editor) -> None:
         return None
     media_manager: anki.media.MediaManager = mw.col.media
 
-    block_style = config.get("block-style") or "display:flex; justify-content:center;"
+    from .ankieditorextra import AnkiEditorInterface
+    from .progressdialog import CancellableProgressDialog
+
+    block_style = config.snapshot().block_style
 
-    editor_interface = AnkiEditorInterface(editor.web, str(random.randint(0, 10000)))
+    editor_interface = AnkiEditorInterface(
+        editor.web, str(random.randint(0, 10000)), get_bridge_stats()
+    )
 
     highlight(
-        lambda preselected: get_highlighter_config(parent, media_manager, preselected),
+        lambda preselected, code: get_highlighter_config(
+            parent,
+            media_manager,
+            preselected,
+            language_preview=create_language_preview(code, block_style),
+        ),
         block_style,
         clipboard=get_qclipboard_or_empty(),
         editor=editor_interface,
         on_error=showWarning,
+        cache=get_highlight_cache(),
+        worker=get_highlight_worker(),
+        speculative_worker=get_speculative_highlight_worker(),
+        runner=run_in_anki_background,
+        progress=CancellableProgressDialog(parent, "Highlighting code…"),
+        predict=lambda preselected: read_wizard_state(
+            media_manager
+        ).pygments_config.update(preselected),
+        speculation_stats=get_speculation_stats(),
+    )
+
+
+def create_language_preview(
+    code: PlainString, block_style: str
+) -> LanguagePreviewFactory:
+    """Creates the factory of previewers of the snippet in languages.
+
+    The previews have their own in-memory cache, so that they neither evict
+    nor persist real highlights.
+    """
+    from .preview import preview_snippet
+
+    snippet = preview_snippet(code)
+
+    def create(display_style: DISPLAY_STYLE) -> LanguagePreviewer:
+        from . import pygments_highlighter
+        from .preview import LanguagePreviewer
+
+        style = create_html_style(display_style, block_style)
+
+        def render(language: str, token: CancellationToken) -> HtmlString:
+            # Render in-process. Cancelling a worker job restarts the worker.
+            html = render_highlight_request(
+                pygments_highlighter.HighlightRequest(snippet, language, style),
+                get_preview_cache(),
+                token,
+            )
+            return HtmlString(f"<style>{get_preview_stylesheet()}</style>{html}")
+
+        return LanguagePreviewer(render, run_in_anki_background, run_later)
+
+    return create
+
+
+@functools.cache
+def get_preview_stylesheet() -> str:
+    """Returns the stylesheet of highlighted previews."""
+    from .assets import assets_directory
+
+    return "".join(
+        (assets_directory() / asset).read_text() for asset in DEFAULT_CSS_ASSETS
     )
 
 
+def run_in_anki_background(
+    task: Callable[[], Any], on_done: Callable[[Future], None]
+) -> None:
+    """A BackgroundRunner that uses Anki's task manager."""
+    mw = aqt.mw
+    if mw is None:
+        # Should never happen
+        run_in_foreground(task, on_done)
+        return None
+    mw.taskman.run_in_background(task, on_done, uses_collection=False)
+
+
 # This is the side-effect free part of the highlight action.
 def highlight(
     highlighter_config_factory: Callable[
-        [PartialPygmentsConfig], Optional[HighlighterConfig]
+        [PartialPygmentsConfig, PlainString], Optional[HighlighterConfig]
     ],
     block_style: str,
     clipboard: Clipboard,
     editor: EditorInterface,
     on_error,
+    cache: Optional[HighlightCache] = None,
+    worker: Optional[HighlightWorker] = None,
+    runner: BackgroundRunner = run_in_foreground,
+    progress: Optional[Progress] = None,
+    predict: Optional[Callable[[PartialPygmentsConfig], HighlighterConfig]] = None,
+    speculation_stats: Optional[SpeculationStats] = None,
+    speculative_worker: Optional[HighlightWorker] = None,
 ) -> None:
     """
     Highlights the selected or copied code snippet with a user configured
     highlighter and sets up necessary style imports (todo).
+
+    The highlighting itself goes through the runner, so that it can run in the
+    background. The progress indicator lets the user cancel it. If the worker
+    fails to highlight the snippet, e.g., because it exceeds the time budget,
+    the snippet is formatted as plain text and the user gets a warning.
+
+    If `predict` is given, highlighting starts with the predicted config while
+    the user configures the highlighter. The highlight is cancelled if the
+    user picks another config. It runs in the speculative worker, so that
+    cancelling it neither restarts the worker nor holds up the worker's next
+    highlight.
     """
-    transform_selection(
-        highlight=lambda code: highlight_selection(
+    from .ankieditorextra import transform_selection_async
+    from .field import style_import_block
+    from .highlight_worker import WorkerError
+    from .speculation import Speculation
+
+    if progress is None:
+        progress = NoProgress()
+
+    def render_in(
+        highlighter: Optional[HighlightWorker],
+        request: HighlightRequest,
+        token: CancellationToken,
+    ) -> tuple[HtmlString, Optional[str]]:
+        from . import pygments_highlighter
+
+        try:
+            return render_highlight_request(request, cache, token, highlighter), None
+        except WorkerError as e:
+            return pygments_highlighter.highlight_plaintext(*request), (
+                f"Failed to highlight the code snippet: {e}\n"
+                + "The snippet has been formatted as plain text instead."
+            )
+
+    render = partial(render_in, worker)
+    render_speculatively = partial(render_in, speculative_worker)
+
+    def highlight_code(code: PlainString, on_highlighted: HighlightCallback) -> None:
+        speculation: Optional[Speculation] = None
+
+        def configure(
+            preselected: PartialPygmentsConfig, snippet: PlainString
+        ) -> Optional[HighlighterConfig]:
+            nonlocal speculation
+            if predict is not None:
+                speculation = Speculation(
+                    create_highlight_request(
+                        snippet, predict(preselected), block_style
+                    ),
+                    render_speculatively,
+                    runner,
+                    speculation_stats,
+                )
+            return highlighter_config_factory(preselected, snippet)
+
+        request = ask_for_highlight_request(
             code,
-            highlighter_config_factory,
+            configure,
             block_style,
             clipboard=clipboard,
-            auto_detect_display_style=config.get(
-                "auto-detect-display-style", default=True
-            ),
-        ),
+            auto_detect_display_style=config.snapshot().auto_detect_display_style,
+        )
+        if request is None:
+            if speculation is not None:
+                speculation.cancel()
+            on_highlighted(None)
+            return None
+
+        # The speculative highlight is the highlight if its guess was right.
+        used = speculation if speculation and speculation.take(request) else None
+        token = used.token if used else CancellationToken()
+
+        def on_rendered(future: Future) -> None:
+            progress.finish()
+            html, warning = None, None
+            try:
+                html, warning = future.result()
+            except Cancelled:
+                pass
+            except Exception as e:
+                on_error(f"Failed to highlight the code snippet: {e}")
+            # Drop late results, too. The user has moved on.
+            on_highlighted(None if token.cancelled else html)
+            if warning and not token.cancelled:
+                on_error(warning)
+
+        progress.start(token)
+        if used:
+            used.add_done_callback(on_rendered)
+        else:
+            runner(lambda: render(request, token), on_rendered)
+
+    # Replace the selection and set up the field's styles in one round trip.
+    # The editor replaces a stale style block in the same call. Only fall back
+    # to rewriting the field afterwards if the editor can't, e.g., because the
+    # stale block is malformed.
+    transform_selection_async(
+        highlight=highlight_code,
         editor=editor,
         on_error=on_error,
-        on_done=lambda: set_up_field_styles(editor, on_error),
+        style_block=style_import_block(DEFAULT_CSS_ASSETS, GUARD),
+        on_stale_styles=lambda: set_up_field_styles(editor, on_error),
     )
 
 
 def set_up_field_styles(
     editor: EditorInterface, on_error: Callable[[str], Any]
-) -> None:
-    assets = DEFAULT_CSS_ASSETS
+) -> Future[None]:
+    """Sets up the style import of the active note field.
+
+    Returns:
+        The future of the set-up. It resolves after any error has been reported.
+    """
+    from .ankieditorextra import SelectionException
+    from .editorfutures import EditorFutures, then
+    from .field import set_up_style_import
+
+    editor_futures = EditorFutures(editor)
 
-    def on_get(html_or_exception):
+    def on_get(html_or_exception) -> Optional[Future]:
         if isinstance(html_or_exception, SelectionException):
             on_error(f"Failed to get field content: {str(html_or_exception)}")
             return None
+        new_html = set_up_style_import(html_or_exception, DEFAULT_CSS_ASSETS, GUARD)
+        return editor_futures.set_note_field(new_html)
 
-        new_html = set_up_style_import(html_or_exception, assets, GUARD)
-
-        def on_set(result_or_exception):
-            if isinstance(result_or_exception, SelectionException):
-                on_error(f"Failed to set field styles: {str(result_or_exception)}")
+    def on_set(result_or_exception) -> None:
+        if isinstance(result_or_exception, SelectionException):
+            on_error(f"Failed to set field styles: {str(result_or_exception)}")
 
-        editor.set_note_field(new_html, on_set)
-
-    editor.get_note_field(on_get)
+    return then(then(editor_futures.get_note_field(), on_get), on_set)
 
 
 def _has_multiple_lines(code: str) -> bool:
@@ -205,6 +620,8 @@ def _determine_preselected_highlighter_config(
     auto_detect_display_style: bool = True,
 ) -> PartialPygmentsConfig:
     """Determines the preselected configuration based on the code content."""
+    from .dialog import DISPLAY_STYLE, PartialPygmentsConfig
+
     display_style = None
     if auto_detect_display_style:
         if _has_multiple_lines(code):
@@ -215,16 +632,47 @@ def _determine_preselected_highlighter_config(
 def highlight_selection(
     code: PlainString,
     highlighter_config_factory: Callable[
-        [PartialPygmentsConfig], Optional[HighlighterConfig]
+        [PartialPygmentsConfig, PlainString], Optional[HighlighterConfig]
     ],
     block_style: str,
     clipboard: Clipboard,
     auto_detect_display_style: bool = True,
-) -> Optional[bs4.Tag]:
+    cache: Optional[HighlightCache] = None,
+) -> Optional[HtmlString]:
     """Highlights the selected or copied code snippet with a user configured highlighter.
 
     This is like `highlight` but with the code provided upfront without any
     selection transformation logic.
+
+    If a cache is provided, the highlighter reuses previous results.
+    """
+    request = ask_for_highlight_request(
+        code,
+        highlighter_config_factory,
+        block_style,
+        clipboard=clipboard,
+        auto_detect_display_style=auto_detect_display_style,
+    )
+    if request is None:
+        return None
+    return render_highlight_request(request, cache)
+
+
+def ask_for_highlight_request(
+    code: PlainString,
+    highlighter_config_factory: Callable[
+        [PartialPygmentsConfig, PlainString], Optional[HighlighterConfig]
+    ],
+    block_style: str,
+    clipboard: Clipboard,
+    auto_detect_display_style: bool = True,
+) -> Optional[HighlightRequest]:
+    """Asks the user how to highlight the selected or copied code snippet.
+
+    The factory gets the preselected options and the snippet.
+
+    Returns:
+        The highlight request or None if the user has cancelled.
     """
     if len(code) == 0:
         code = PlainString(clipboard.text())
@@ -234,19 +682,75 @@ def highlight_selection(
         auto_detect_display_style=auto_detect_display_style,
     )
 
-    highlighter_config = highlighter_config_factory(preselected_highlighter_config)
+    highlighter_config = highlighter_config_factory(
+        preselected_highlighter_config, code
+    )
     if not highlighter_config:
         return None
+    return create_highlight_request(code, highlighter_config, block_style)
 
-    display_style = highlighter_config.display_style
-    html_style = (
-        pygments_highlighter.create_inline_style()
-        if display_style == DISPLAY_STYLE.INLINE
-        else pygments_highlighter.create_block_style(block_style)
+
+def create_highlight_request(
+    code: PlainString, highlighter_config: HighlighterConfig, block_style: str
+) -> HighlightRequest:
+    from . import pygments_highlighter
+
+    return pygments_highlighter.HighlightRequest(
+        code,
+        highlighter_config.language,
+        create_html_style(highlighter_config.display_style, block_style),
     )
 
-    return pygments_highlighter.highlight(
-        code, language=highlighter_config.language, style=html_style
+
+def create_html_style(display_style: DISPLAY_STYLE, block_style: str) -> HtmlStyle:
+    from . import pygments_highlighter
+    from .dialog import DISPLAY_STYLE
+
+    if display_style == DISPLAY_STYLE.INLINE:
+        return pygments_highlighter.create_inline_style()
+    return pygments_highlighter.create_block_style(block_style)
+
+
+def render_highlight_request(
+    request: HighlightRequest,
+    cache: Optional[HighlightCache] = None,
+    cancellation: Optional[CancellationToken] = None,
+    worker: Optional[HighlightWorker] = None,
+) -> HtmlString:
+    """Highlights the code snippet of a request.
+
+    This function doesn't touch the GUI, so it can run in the background.
+
+    Args:
+        request: The highlight request.
+        cache: An optional highlight cache.
+        cancellation: An optional token that stops highlighting.
+        worker: An optional isolated highlighter process. Without one, the
+            snippet is highlighted in this process.
+
+    Raises:
+        Cancelled: If the cancellation token has been cancelled.
+        WorkerError: If the worker has failed to highlight the snippet.
+    """
+
+    from . import pygments_highlighter
+
+    def render() -> HtmlString:
+        if worker is not None:
+            return worker.highlight_html(*request, cancellation=cancellation)
+        return pygments_highlighter.highlight_html(*request, cancellation=cancellation)
+
+    if cache is None:
+        return render()
+    # A snippet that fits one worker's budgets may not fit another's, so a
+    # cached highlight is only valid for the budgets it was rendered under.
+    context = (
+        []
+        if worker is None
+        else [f"time: {worker.time_budget:g}", f"memory: {worker.memory_budget}"]
+    )
+    return cache.get_or_compute(
+        pygments_highlighter.cache_key(*request, context=context), render
     )
 
 
@@ -256,7 +760,7 @@ def get_shortcut() -> str:
 
     :rtype str: The keyboard shortcut, e.g., "ctrl+o".
     """
-    return config.get("shortcut") or "ctrl+o"
+    return config.snapshot().shortcut
 
 
 def on_editor_shortcuts_init(
@@ -269,6 +773,14 @@ def on_editor_shortcuts_init(
     )
 
 
+def inject_editor_helper(web_content: aqt.webview.WebContent, context) -> None:
+    """Preloads the add-on's JavaScript helper into editor pages."""
+    from .editorhelper import EDITOR_HELPER_JS
+
+    if isinstance(context, aqt.editor.Editor):
+        web_content.head += f"<script>{EDITOR_HELPER_JS}</script>"
+
+
 def on_editor_buttons_init(buttons: List, editor: aqt.editor.Editor) -> None:
     action_button = editor.addButton(
         icon=os.path.join(addon_path, "icons", "icon.png"),
@@ -283,7 +795,7 @@ def on_editor_buttons_init(buttons: List, editor: aqt.editor.Editor) -> None:
 def setup_menu() -> None:
     # Manipulating assets should not be a part of a normal flow.
     # Let’s leave it out of the supported surface.
-    dev_mode = config.get("dev-mode") or False
+    dev_mode = config.snapshot().dev_mode
     if not dev_mode:
         return
 
@@ -319,12 +831,45 @@ def setup_menu() -> None:
         anki_asset_manager = create_anki_asset_manager(DEFAULT_CSS_ASSETS, col)
         anki_asset_manager.delete_assets()
 
+    def show_statistics() -> None:
+        showInfo(statistics_report(), title="Greg’s Code Highlighter Statistics")
+
     a = aqt.qt.QAction("Refresh Greg’s Code Highlighter Assets", main_window)  # type: ignore
     a.triggered.connect(refresh)
     main_window.form.menuTools.addAction(a)
     a = aqt.qt.QAction("Delete Greg’s Code Highlighter Assets", main_window, triggered=delete)  # type: ignore
     a.triggered.connect(delete)
     main_window.form.menuTools.addAction(a)
+    a = aqt.qt.QAction("Show Greg’s Code Highlighter Statistics", main_window)  # type: ignore
+    a.triggered.connect(show_statistics)
+    main_window.form.menuTools.addAction(a)
+
+
+def statistics_report() -> str:
+    """Returns a human-readable report of the add-on's performance counters."""
+    cache_stats = get_highlight_cache().stats()
+    bridge_stats = get_bridge_stats()
+    speculation_stats = get_speculation_stats()
+    return "\n".join(
+        [
+            "Highlight cache:",
+            f"  hits: {cache_stats.hits}",
+            f"  persistent hits: {cache_stats.persistent_hits}",
+            f"  misses: {cache_stats.misses}",
+            f"  evictions: {cache_stats.evictions}",
+            "Highlighter process:",
+            f"  restarts: {get_highlight_worker().restarts}",
+            "Editor bridge:",
+            f"  calls: {bridge_stats.calls}",
+            f"  sent bytes: {bridge_stats.sent_bytes}",
+            f"  received bytes: {bridge_stats.received_bytes}",
+            f"  helper re-injections: {bridge_stats.injections}",
+            "Speculative highlights:",
+            f"  started: {speculation_stats.started}",
+            f"  used: {speculation_stats.used}",
+            f"  cancelled: {speculation_stats.cancelled}",
+        ]
+    )
 
 
 def sync_assets_hook():
@@ -332,8 +877,10 @@ def sync_assets_hook():
 
     This function must run once the profile is loaded.
     Otherwise, we don't know which assets need updating.
+
+    The sync runs in the background. `get_asset_sync` holds its future.
     """
-    if not config.get("auto-update-media", True):
+    if not config.snapshot().auto_update_media:
         return None
 
     main_window = mw
@@ -348,15 +895,78 @@ def sync_assets_hook():
         )
         return None
 
+    from .assets import has_newer_version, sync_assets_in_background
+
+    # Without a manifest, the sync trashes all stale add-on media, which
+    # includes the legacy wizard state.
+    migrate_wizard_state(main_window.col.media)
+
+    # Checking and copying files takes a while, so do it in the background.
+    # Only the registration of the changes with Anki runs on the main thread.
     anki_asset_manager = create_anki_asset_manager(DEFAULT_CSS_ASSETS, main_window.col)
-    sync_assets(
+    asset_sync = sync_assets_in_background(
         partial(has_newer_version, main_window.col.media, VERSION_ASSET),
         anki_asset_manager,
+        runner=lambda task, on_done: main_window.taskman.run_in_background(
+            task, on_done, uses_collection=False
+        ),
+    )
+    get_asset_sync().put(asset_sync)
+
+    def on_synced(future: Future) -> None:
+        if (e := future.exception()) is not None:
+            showWarning(f"Code Highlighter failed to update its media files: {e}")
+
+    asset_sync.add_done_callback(on_synced)
+
+
+def warm_up_hook() -> None:
+    """Warms up the lexers of the user's languages in the background.
+
+    The warm-up starts with the last language and continues with the most
+    frecent ones until its budget runs out.
+
+    This function must run once the profile is loaded, because the wizard
+    state, which knows the user's languages, may still need migrating from
+    the collection's media.
+    """
+    warm_up = get_lexer_warm_up()
+    main_window = mw
+    if warm_up.budget <= 0 or not main_window or not main_window.col:
+        return None
+    state = read_wizard_state(main_window.col.media)
+    # The last language is the wizard's default, so it comes first.
+    languages = [state.pygments_config.language]
+    for language in state.language_frecency.top(time.time(), WARM_UP_LANGUAGES):
+        if language not in languages:
+            languages.append(language)
+
+    def on_done(future: Future) -> None:
+        # Warming up is best-effort, so ignore failures.
+        future.exception()
+
+    main_window.taskman.run_in_background(
+        partial(warm_up.run, languages[:WARM_UP_LANGUAGES]),
+        on_done,
+        uses_collection=False,
     )
 
 
+def discard_kept_finder_dialogs() -> None:
+    """Discards the language finder dialogs kept for reuse."""
+    from .fuzzy_finder_dialog import FuzzyFinderDialog
+
+    FuzzyFinderDialog.discard_kept()
+
+
 def main():
+    config.watch_updates(reset_highlighting)
     gui_hooks.profile_did_open.append(sync_assets_hook)
+    gui_hooks.profile_did_open.append(warm_up_hook)
     gui_hooks.main_window_did_init.append(setup_menu)
+    gui_hooks.profile_will_close.append(discard_kept_finder_dialogs)
+    gui_hooks.profile_will_close.append(flush_wizard_state)
+    gui_hooks.profile_will_close.append(close_highlight_cache)
     gui_hooks.editor_did_init_shortcuts.append(on_editor_shortcuts_init)
     gui_hooks.editor_did_init_buttons.append(on_editor_buttons_init)
+    gui_hooks.webview_will_set_content.append(inject_editor_helper)
@@ -1,10 +1,15 @@
 """This module handles Anki media files."""
 
 import contextlib
+import hashlib
+import json
 import typing
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Optional
 
 from anki.media import MediaManager
 
@@ -22,20 +27,65 @@ class MediaInstaller(ABC):
         """Deletes all add-on's media."""
         pass
 
+    @abstractmethod
+    def update_media_assets(self) -> None:
+        """Installs add-on's media that is missing or differs from the installed."""
+        pass
+
+    def prepare_media_update(self) -> Callable[[], None]:
+        """Prepares `update_media_assets` and returns the step that applies it.
+
+        The preparation may run in the background. Run the returned step on
+        the main thread.
+        """
+        return self.update_media_assets
+
 
 class AnkiMediaInstaller(MediaInstaller):
     def __init__(
-        self, addon_prefix: str, addon_assets: list[Path], media_manager: MediaManager
+        self,
+        addon_prefix: str,
+        addon_assets: list[Path],
+        media_manager: MediaManager,
+        manifest_asset: Path,
     ):
+        """
+        Args:
+            addon_prefix: The filename prefix of all add-on's media.
+            addon_assets: The paths to the add-on's bundled assets.
+            media_manager: Anki's media manager.
+            manifest_asset: The media path of the manifest of installed
+                assets.
+        """
         self.addon_prefix = addon_prefix
         self.addon_assets = addon_assets
         self.media = media_manager
+        self.manifest_asset = manifest_asset
 
     def install_media_assets(self) -> None:
         install_media_assets(self.addon_assets, self.media)
+        write_manifest(
+            self.media, self.manifest_asset, asset_manifest(self.addon_assets)
+        )
+
+    def update_media_assets(self) -> None:
+        update_media_assets(
+            self.addon_assets, self.media, self.manifest_asset, self.addon_prefix
+        )
+
+    def prepare_media_update(self) -> Callable[[], None]:
+        update = plan_media_update(
+            self.addon_assets,
+            anki_media_directory(self.media),
+            self.manifest_asset,
+            self.addon_prefix,
+        )
+        return partial(apply_media_update, update, self.media, self.manifest_asset)
 
     def delete_media_assets(self):
-        delete_media_assets(self.addon_prefix, self.media)
+        delete_media_assets(
+            self.addon_prefix, self.addon_assets, self.media, self.manifest_asset
+        )
 
 
 def anki_media_directory(media: MediaManager) -> Path:
@@ -47,10 +97,201 @@ def install_media_assets(assets: list[Path], media: MediaManager) -> None:
         media.add_file(str(asset))
 
 
-def delete_media_assets(asset_prefix: str, media: MediaManager) -> None:
-    """Deletes all media assets whose filenames starts with `asset_prefix`"""
-    my_assets = list_files_with_prefix(anki_media_directory(media), asset_prefix)
-    media.trash_files(my_assets)
+def asset_manifest(assets: list[Path]) -> dict[str, str]:
+    """Returns the SHA-256 digests of assets keyed by their filenames."""
+    return {asset.name: file_sha256(asset) for asset in assets}
+
+
+def file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@dataclass
+class MediaUpdate:
+    """The changes that bring the installed assets up to date.
+
+    Attributes:
+        changed: The bundled assets that are missing or differ.
+        trashed: The filenames of the installed files to trash.
+        manifest: The manifest of the bundled assets.
+        manifest_changed: Whether the manifest differs from the installed one.
+    """
+
+    changed: list[Path]
+    trashed: list[str]
+    manifest: dict[str, str]
+    manifest_changed: bool
+
+
+def update_media_assets(
+    assets: list[Path],
+    media: MediaManager,
+    manifest_asset: Path,
+    asset_prefix: Optional[str] = None,
+) -> list[str]:
+    """Installs assets that are missing from the media directory or differ.
+
+    Unlike reinstalling all assets, this leaves identical files untouched, so
+    Anki doesn't sync them again. The function also trashes assets that an
+    earlier update has installed but that are no longer bundled.
+
+    Args:
+        assets: The paths to the bundled assets.
+        media: Anki's media manager.
+        manifest_asset: The media path of the manifest of installed assets.
+        asset_prefix: The filename prefix of all add-on's media. If given and
+            there is no manifest yet, files with the prefix that are no longer
+            bundled count as obsolete.
+
+    Returns:
+        The filenames of the installed assets.
+    """
+    update = plan_media_update(
+        assets, anki_media_directory(media), manifest_asset, asset_prefix
+    )
+    apply_media_update(update, media, manifest_asset)
+    return [asset.name for asset in update.changed]
+
+
+def plan_media_update(
+    assets: list[Path],
+    media_dir: Path,
+    manifest_asset: Path,
+    asset_prefix: Optional[str] = None,
+) -> MediaUpdate:
+    """Finds the changes that `update_media_assets` applies.
+
+    This function only reads files, so it can run in the background.
+
+    Args:
+        assets: The paths to the bundled assets.
+        media_dir: The media directory.
+        manifest_asset: The media path of the manifest of installed assets.
+        asset_prefix: The filename prefix of all add-on's media.
+
+    Returns:
+        The update.
+    """
+    manifest = asset_manifest(assets)
+    installed_manifest = _read_manifest(media_dir / manifest_asset)
+
+    def is_current(asset: Path) -> bool:
+        installed = media_dir / asset.name
+        return installed.is_file() and file_sha256(installed) == manifest[asset.name]
+
+    changed = [asset for asset in assets if not is_current(asset)]
+    obsolete = [
+        name
+        for name in _installed_names(media_dir, manifest_asset, asset_prefix)
+        if name not in manifest
+    ]
+    # Anki doesn't overwrite a media file with different contents, it adds
+    # the new file under another name. Trash the old file first.
+    trashed = [
+        name
+        for name in [asset.name for asset in changed] + obsolete
+        if (media_dir / name).is_file()
+    ]
+    return MediaUpdate(changed, trashed, manifest, manifest != installed_manifest)
+
+
+def apply_media_update(
+    update: MediaUpdate, media: MediaManager, manifest_asset: Path
+) -> None:
+    """Applies an update through Anki's media manager.
+
+    Run this function on the main thread.
+    """
+    if update.trashed:
+        media.trash_files(update.trashed)
+    install_media_assets(update.changed, media)
+    if update.manifest_changed:
+        write_manifest(media, manifest_asset, update.manifest)
+
+
+def write_manifest(
+    media: MediaManager, manifest_asset: Path, manifest: dict[str, str]
+) -> None:
+    """Records the manifest of installed assets in the media directory."""
+    with open_media_asset(media, manifest_asset, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def _read_manifest(path: Path) -> dict[str, str]:
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _installed_names(
+    media_dir: Path, manifest_asset: Path, asset_prefix: Optional[str]
+) -> list[str]:
+    """Returns the filenames of the installed assets according to the manifest.
+
+    Versions before the manifest left no ledger. Without one, this function
+    lists the media directory for files with the asset prefix instead. That
+    happens once, because installing or updating the assets writes the
+    manifest.
+    """
+    manifest_path = media_dir / manifest_asset
+    if asset_prefix is None or manifest_path.is_file():
+        return list(_read_manifest(manifest_path))
+    return list_files_with_prefix(media_dir, asset_prefix)
+
+
+def installed_media_assets(
+    asset_prefix: str,
+    assets: list[Path],
+    media: MediaManager,
+    manifest_asset: Path,
+) -> list[str]:
+    """Returns the filenames of the installed add-on's media.
+
+    The manifest serves as a ledger of the installed assets, so this function
+    checks only the files the add-on knows about instead of listing the whole
+    media directory, which can hold hundreds of thousands of files. Only
+    without a manifest, e.g., after an older version, it lists the directory.
+
+    Args:
+        asset_prefix: The filename prefix of all add-on's media.
+        assets: The paths to the bundled assets. They count as installed
+            even if the ledger is missing, e.g., after a manual copy.
+        media: Anki's media manager.
+        manifest_asset: The media path of the manifest of installed assets.
+
+    Returns:
+        The filenames of the add-on's media that exist in the media
+        directory.
+    """
+    media_dir = anki_media_directory(media)
+    names = dict.fromkeys(
+        [
+            *_installed_names(media_dir, manifest_asset, asset_prefix),
+            *[asset.name for asset in assets],
+            manifest_asset.name,
+        ]
+    )
+    return [
+        name
+        for name in names
+        if name.startswith(asset_prefix) and (media_dir / name).is_file()
+    ]
+
+
+def delete_media_assets(
+    asset_prefix: str,
+    assets: list[Path],
+    media: MediaManager,
+    manifest_asset: Path,
+) -> None:
+    """Deletes the installed add-on's media (see `installed_media_assets`)."""
+    installed = installed_media_assets(asset_prefix, assets, media, manifest_asset)
+    if installed:
+        media.trash_files(installed)
 
 
 @contextlib.contextmanager
@@ -0,0 +1,147 @@
+"""Previews a snippet in the languages that the user moves through.
+
+The language finder shows what the snippet would look like in the selected
+language. Moving through the list must stay instant, so `LanguagePreviewer`
+waits until the selection rests for a moment, renders in the background,
+drops renders that the selection has moved past, and remembers what it has
+rendered. It renders only the beginnings of the snippet's first lines, which
+is all the preview pane shows. Capping the characters as well as the lines
+keeps a snippet with huge lines from stalling the in-process render.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Optional
+
+from .background import BackgroundRunner, CancellationToken, Scheduler
+from .html import HtmlString, PlainString
+
+__all__ = [
+    "PREVIEW_CHARACTERS",
+    "PREVIEW_COLUMNS",
+    "PREVIEW_LINES",
+    "LanguagePreviewer",
+    "preview_snippet",
+]
+
+# How many lines of the snippet to preview.
+PREVIEW_LINES = 30
+# How many characters of each line to preview.
+PREVIEW_COLUMNS = 160
+# How many characters of the snippet to preview.
+PREVIEW_CHARACTERS = 4096
+
+
+def preview_snippet(
+    code: PlainString,
+    lines: int = PREVIEW_LINES,
+    columns: int = PREVIEW_COLUMNS,
+    characters: int = PREVIEW_CHARACTERS,
+) -> PlainString:
+    """Returns the beginning of the snippet that the preview shows.
+
+    Args:
+        code: A code snippet without HTML markup.
+        lines: How many lines to keep.
+        columns: How many characters of each line to keep.
+        characters: How many characters to keep in total.
+
+    Returns:
+        The first lines of the snippet, cut to the given number of columns
+        and characters. Cut lines keep their line break.
+    """
+    parts: list[str] = []
+    size = 0
+    start = 0
+    # Walk the line breaks instead of splitting the whole snippet, which can
+    # be huge.
+    for _ in range(lines):
+        if start >= len(code) or size >= characters:
+            break
+        newline = code.find("\n", start)
+        next_start = len(code) if newline == -1 else newline + 1
+        end = min(next_start, start + columns)
+        parts.append(code[start:end])
+        if end < next_start and newline != -1:
+            parts.append("\n")
+        size += end - start
+        start = next_start
+    return PlainString("".join(parts)[:characters])
+
+
+class LanguagePreviewer:
+    """Renders previews of one snippet in different languages.
+
+    The previewer serves the `OptionPreviewer` interface of the fuzzy finder.
+    All methods run on the main thread.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[str, CancellationToken], HtmlString],
+        runner: BackgroundRunner,
+        schedule: Scheduler,
+        delay: float = 0.15,
+    ):
+        """
+        Args:
+            render: Renders the snippet's preview in a language. It runs in the
+                background and may raise Cancelled once the token is
+                cancelled.
+            runner: The runner of renders.
+            schedule: The scheduler of debounced renders.
+            delay: How many seconds the selection must rest before a render.
+        """
+        self.render = render
+        self.runner = runner
+        self.schedule = schedule
+        self.delay = delay
+        self._rendered: dict[str, HtmlString] = {}
+        self._generation = 0
+        self._token: Optional[CancellationToken] = None
+
+    def preview(self, language: str, show: Callable[[str], None]) -> None:
+        """Previews the snippet in the language.
+
+        Calls `show` with the preview unless another preview or `cancel`
+        supersedes this one.
+        """
+        self.cancel()
+        html = self._rendered.get(language)
+        if html is not None:
+            show(html)
+            return None
+        generation = self._generation
+        self.schedule(
+            self.delay, lambda: self._render_if_latest(generation, language, show)
+        )
+
+    def cancel(self) -> None:
+        """Drops the pending preview and stops its render."""
+        self._generation += 1
+        if self._token is not None:
+            self._token.cancel()
+            self._token = None
+
+    def _render_if_latest(
+        self, generation: int, language: str, show: Callable[[str], None]
+    ) -> None:
+        if generation != self._generation:
+            return None
+        token = CancellationToken()
+        self._token = token
+
+        def on_rendered(future: Future) -> None:
+            if generation != self._generation:
+                return None
+            self._token = None
+            try:
+                html = future.result()
+            except Exception:
+                # A preview is only a convenience, so a failed one shows
+                # nothing. Highlighting itself reports errors.
+                return None
+            self._rendered[language] = html
+            show(html)
+
+        self.runner(lambda: self.render(language, token), on_rendered)
@@ -0,0 +1,48 @@
+"""A Qt progress indicator for cancellable background tasks."""
+
+from typing import Optional
+
+from aqt.qt import QProgressDialog, Qt, QWidget
+
+from .background import CancellationToken
+
+__all__ = ["CancellableProgressDialog"]
+
+
+class CancellableProgressDialog:
+    """Shows a busy progress dialog with a cancel button.
+
+    The dialog only appears if the task takes longer than `min_duration_ms`,
+    so quick tasks don't flash a window.
+    """
+
+    def __init__(
+        self, parent: Optional[QWidget], label: str, min_duration_ms: int = 400
+    ):
+        self.parent = parent
+        self.label = label
+        self.min_duration_ms = min_duration_ms
+        self.dialog: Optional[QProgressDialog] = None
+
+    def start(self, token: CancellationToken) -> None:
+        # A (0, 0) range makes a busy indicator.
+        dialog = QProgressDialog(self.label, "Cancel", 0, 0, self.parent)
+        dialog.setWindowTitle("Greg’s Code Highlighter")
+        # Block the editor, so that the user can't remove the selection while
+        # it's being highlighted.
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(self.min_duration_ms)
+        dialog.canceled.connect(token.cancel)
+        # Escape rejects the dialog without emitting `canceled`.
+        dialog.rejected.connect(token.cancel)
+        dialog.setValue(0)
+        self.dialog = dialog
+
+    def finish(self) -> None:
+        if self.dialog is None:
+            return
+        self.dialog.canceled.disconnect()
+        self.dialog.rejected.disconnect()
+        self.dialog.reset()
+        self.dialog.deleteLater()
+        self.dialog = None
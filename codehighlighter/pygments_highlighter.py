@@ -2,22 +2,25 @@
 
 See DEV.md for more information on the highlighter concept."""
 
+import concurrent.futures
 import functools
-import re
-from collections.abc import Iterable
+import hashlib
+import importlib
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
 from typing import NamedTuple, Optional
 
 import bs4
-
 import pygments  # type: ignore
-import pygments.formatters  # type: ignore
 import pygments.lexer
-import pygments.lexers  # type: ignore
-import pygments.util
 
+from . import lexerindex, pygmentsarm, pygmentsformatter
+from .background import CancellationToken
 from .bs4extra import create_soup
 from .html import HtmlString, PlainString
-from .pygmentsarm import ArmLexer
+from .languageindex import LanguageIndex
+from .pygmentsformatter import GchHtmlFormatter
 
 LexerName = str
 LexerAlias = str
@@ -174,33 +177,276 @@ def create_block_style(
     return HtmlStyle("block", block_style=block_style)
 
 
-def remove_spurious_inline_newline(html: str) -> str:
-    """Removes a spurious newline character at the end of an inline code block.
+def highlight_html(
+    code: PlainString,
+    language: LexerName,
+    style: HtmlStyle,
+    cancellation: Optional[CancellationToken] = None,
+) -> HtmlString:
+    """Highlights the code snippet with Pygments.
+
+    Args:
+        code: A code snippet without HTML markup.
+        language: A language.
+        style: The style options to use.
+        cancellation: An optional token that stops highlighting.
+
+    Returns:
+        HtmlString: The HTML markup of the highlighted code.
+
+    Raises:
+        Cancelled: If the cancellation token has been cancelled.
+    """
+    lexer = get_lexer_by_name(language)
+    if lexer is None:
+        # Use the plaintext lexer as a fallback
+        lexer = get_plaintext_lexer()
+    formatter = GchHtmlFormatter(
+        language=language,
+        display_style=style.display_style,
+        block_style=style.block_style,
+        cancellation=cancellation,
+    )
+    return HtmlString(pygments.highlight(code, lexer, formatter))
+
+
+def highlight_chunks(
+    code: PlainString,
+    language: LexerName,
+    style: HtmlStyle,
+    chunk_size: int = 64 * 1024,
+    cancellation: Optional[CancellationToken] = None,
+) -> Iterator[HtmlString]:
+    """Highlights the code snippet lazily in chunks.
+
+    Use this for huge snippets, e.g., logs or disassembly. The pipeline from
+    the lexer to the formatter is lazy, so the memory needed on top of the
+    code itself is proportional to the chunk size, not to the markup's size.
+
+    Args:
+        code: A code snippet without HTML markup.
+        language: A language.
+        style: The style options to use.
+        chunk_size: The minimum number of characters in a chunk.
+        cancellation: An optional token that stops highlighting.
+
+    Yields:
+        HtmlString: Consecutive chunks of the HTML markup. Their concatenation
+          equals the result of `highlight_html`.
+
+    Raises:
+        Cancelled: If the cancellation token has been cancelled.
+    """
+    lexer = get_lexer_by_name(language) or get_plaintext_lexer()
+    formatter = GchHtmlFormatter(
+        language=language,
+        display_style=style.display_style,
+        block_style=style.block_style,
+        cancellation=cancellation,
+    )
+    for chunk in formatter.format_chunks(lexer.get_tokens(code), chunk_size):
+        yield HtmlString(chunk)
+
+
+def highlight_plaintext(
+    code: PlainString, language: LexerName, style: HtmlStyle
+) -> HtmlString:
+    """Formats the code snippet without highlighting.
+
+    This is the fallback for snippets that the highlighter can't handle. The
+    markup still records the requested language.
+
+    Args:
+        code: A code snippet without HTML markup.
+        language: The requested language.
+        style: The style options to use.
+
+    Returns:
+        HtmlString: The HTML markup of the code.
+    """
+    formatter = GchHtmlFormatter(
+        language=language,
+        display_style=style.display_style,
+        block_style=style.block_style,
+    )
+    return HtmlString(pygments.highlight(code, get_plaintext_lexer(), formatter))
+
+
+class HighlightRequest(NamedTuple):
+    """A single snippet to highlight.
+
+    Attributes:
+        code: A code snippet without HTML markup.
+        language: A language.
+        style: The style options to use.
+    """
+
+    code: PlainString
+    language: LexerName
+    style: HtmlStyle
+
+
+def group_requests(
+    requests: Sequence[HighlightRequest], chunksize: Optional[int] = None
+) -> list[list[int]]:
+    """Groups requests that share a language and a style.
 
     Args:
-        html: The HTML string.
+        requests: The requests to group.
+        chunksize: The optional maximum size of a group.
 
     Returns:
-        str: The cleaned HTML string.
+        list[list[int]]: The indices of the requests in each group.
     """
-    return re.sub("</span>\n</code>$", "</span></code>", html)
+    groups: dict[tuple[LexerName, HtmlStyle], list[int]] = {}
+    for i, request in enumerate(requests):
+        groups.setdefault((request.language, request.style), []).append(i)
+    if chunksize is None:
+        return list(groups.values())
+    return [
+        list(chunk)
+        for indices in groups.values()
+        for chunk in itertools.batched(indices, chunksize)
+    ]
+
+
+def highlight_group(
+    language: LexerName,
+    style: HtmlStyle,
+    codes: Sequence[PlainString],
+    cancellation: Optional[CancellationToken] = None,
+) -> list[HtmlString]:
+    """Highlights snippets that share a language and a style.
+
+    The snippets reuse a single lexer and formatter.
+
+    Args:
+        language: A language.
+        style: The style options to use.
+        codes: Code snippets without HTML markup.
+        cancellation: An optional token that stops highlighting.
 
+    Returns:
+        list[HtmlString]: The HTML markup of the highlighted snippets.
 
-def remove_spurious_inline_spanw(html: str) -> str:
-    """Removes the spurious <span class="w"></span> that Pygments inserts.
+    Raises:
+        Cancelled: If the cancellation token has been cancelled.
+    """
+    lexer = get_lexer_by_name(language) or get_plaintext_lexer()
+    formatter = GchHtmlFormatter(
+        language=language,
+        display_style=style.display_style,
+        block_style=style.block_style,
+        cancellation=cancellation,
+    )
+    return [HtmlString(pygments.highlight(code, lexer, formatter)) for code in codes]
+
+
+def highlight_many(
+    requests: Iterable[HighlightRequest],
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunksize: int = 64,
+) -> list[HtmlString]:
+    """Highlights many code snippets.
+
+    The snippets are grouped by language and style, so that each group reuses
+    a single lexer and formatter.
+
+    To fan the work out to processes, use
+    `highlight_worker.HighlightWorkerPool`. A ProcessPoolExecutor doesn't work
+    inside Anki, because its children import the add-on package's __init__.
 
     Args:
-        html: The HTML string.
+        requests: The snippets to highlight.
+        executor: An optional executor to fan the work out to, e.g., a
+            ThreadPoolExecutor. Without one, the snippets are highlighted on
+            the calling thread.
+        chunksize: The maximum number of snippets sent to the executor in one
+            task.
+
+    Returns:
+        list[HtmlString]: The HTML markup of the highlighted snippets in the
+          order of requests.
+    """
+    requests = list(requests)
+    results: list[HtmlString] = [HtmlString("")] * len(requests)
+    if executor is None:
+        for indices in group_requests(requests):
+            first = requests[indices[0]]
+            codes = [requests[i].code for i in indices]
+            htmls = highlight_group(first.language, first.style, codes)
+            for i, html in zip(indices, htmls):
+                results[i] = html
+        return results
+
+    futures = {}
+    for chunk in group_requests(requests, chunksize):
+        first = requests[chunk[0]]
+        codes = [requests[i].code for i in chunk]
+        future = executor.submit(highlight_group, first.language, first.style, codes)
+        futures[future] = chunk
+    for future in concurrent.futures.as_completed(futures):
+        for i, html in zip(futures[future], future.result()):
+            results[i] = html
+    return results
+
+
+@functools.cache
+def engine_fingerprint() -> str:
+    """Returns a fingerprint of the highlighting engine.
+
+    The fingerprint changes whenever the bundled Pygments, the ARM lexer, or
+    the formatter change, which invalidates cached highlights.
 
     Returns:
-        str: The cleaned HTML string.
+        str: The fingerprint.
     """
-    return re.sub('<span class="w"></span>', "", html)
+    digest = hashlib.sha256(pygments.__version__.encode())
+    for module in (pygmentsarm, pygmentsformatter):
+        assert module.__file__ is not None
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(
+    code: PlainString,
+    language: LexerName,
+    style: HtmlStyle,
+    context: Iterable[str] = (),
+) -> str:
+    """Returns the highlight cache key of a snippet.
+
+    Args:
+        code: A code snippet without HTML markup.
+        language: A language.
+        style: The style options to use.
+        context: Other settings that the highlight depends on, e.g., the
+            budgets that it had to fit in.
+
+    Returns:
+        str: The cache key.
+    """
+    lexer = get_lexer_by_name(language) or get_plaintext_lexer()
+    digest = hashlib.sha256()
+    # The language is part of the key, because the output records it.
+    for part in [
+        engine_fingerprint(),
+        lexer.name,
+        language,
+        style.display_style,
+        style.block_style or "",
+        *context,
+    ]:
+        digest.update(part.encode() + b"\0")
+    digest.update(code.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
 
 
 def highlight(code: PlainString, language: LexerName, style: HtmlStyle) -> bs4.Tag:
     """Highlights the code snippet with Pygments.
 
+    Prefer `highlight_html` unless you need to manipulate the result.
+
     Args:
         code: A code snippet without HTML markup.
         language: A language.
@@ -209,38 +455,7 @@ def highlight(code: PlainString, language: LexerName, style: HtmlStyle) -> bs4.T
     Returns:
         bs4.Tag: A BeautifulSoup tag representing the highlighted code.
     """
-    lexer = get_lexer_by_name(language)
-    if lexer is None:
-        # Use the plaintext lexer as a fallback
-        lexer = get_plaintext_lexer()
-    htmlf = (
-        pygments.formatters.get_formatter_by_name("html", nowrap=True)
-        if style.display_style == "inline"
-        else pygments.formatters.get_formatter_by_name("html")
-    )
-    highlighted = pygments.highlight(code, lexer, htmlf)
-    assert isinstance(highlighted, str)
-    highlighted = remove_spurious_inline_spanw(highlighted)
-
-    # Comment-in the lexer in case we ever want to migrate in the future.
-    comment = f"<!-- gch-lang: {language} -->"
-    if style.display_style == "inline":
-        highlighted = f'<code class="gch-pygments">{comment}' + highlighted + "</code>"
-        highlighted = remove_spurious_inline_newline(highlighted)
-    elif style.display_style == "block":
-        highlighted = highlighted.strip()
-        highlighted = highlighted.removeprefix('<div class="highlight">')
-        highlighted = highlighted.removesuffix("</div>")
-        highlighted = highlighted.removeprefix("<pre>")
-        highlighted = highlighted.removesuffix("</pre>")
-        highlighted = highlighted.removeprefix("<span></span>")
-        style_attr = f' style="{style.block_style}"' if style.block_style else ""
-        highlighted = (
-            f'<div class="gch-pygments"{style_attr}>\n'
-            + f"  <pre><code>{comment}{highlighted}</code></pre>\n"
-            + "</div>\n"
-        )
-    return create_soup(HtmlString(highlighted))
+    return create_soup(highlight_html(code, language, style))
 
 
 @functools.cache
@@ -250,12 +465,7 @@ def get_lexer_name_alias_map() -> dict[LexerName, LexerAlias]:
     Returns:
         dict[LexerName, LexerAlias]: A dictionary mapping lexer names to their aliases.
     """
-    # We need to check if `t[1]` has an element, because not all lexer tuples
-    # have this.
-    # Deprecated lexers have an empty alias list.
-    lexers = {t[0]: t[1][0] for t in pygments.lexers.get_all_lexers() if len(t[1]) >= 1}
-    lexers[ArmLexer.name] = ArmLexer.aliases[0]
-    return lexers
+    return {name: entry.aliases[0] for name, entry in lexerindex.LEXERS.items()}
 
 
 @functools.cache
@@ -265,23 +475,26 @@ def get_lexer_by_name(name: LexerName) -> Optional[pygments.lexer.Lexer]:
     Pygments' get_lexer_by_name actually accepts an alias. This function
     corrects this conceptual mismatch.
 
+    The lookup goes through the static lexer index, so it only imports the
+    module of the returned lexer.
+
     Args:
         name: The name of the lexer.
 
     Returns:
         Optional[pygments.lexer.Lexer]: The matching Pygments Lexer, or None if not found.
     """
-    name_alias_map = get_lexer_name_alias_map()
-    # Treat the name itself as an alias if it is not in the map.
-    # This is done to facilitate user manually entering strings like "python"
-    # or "cpp".
-    alias = name_alias_map.get(name, name)
-    if alias == "arm":
-        return ArmLexer()
-    try:
-        return pygments.lexers.get_lexer_by_name(alias)
-    except pygments.util.ClassNotFound:
-        return None
+    entry = lexerindex.LEXERS.get(name)
+    if entry is None:
+        # Treat the name as an alias if it is not in the index.
+        # This is done to facilitate user manually entering strings like
+        # "python" or "cpp".
+        alias_name = lexerindex.ALIASES.get(name.lower())
+        if alias_name is None:
+            return None
+        entry = lexerindex.LEXERS[alias_name]
+    module = importlib.import_module(entry.module, __package__)
+    return getattr(module, entry.class_name)()
 
 
 @functools.cache
@@ -305,3 +518,12 @@ def get_available_languages() -> Iterable[LexerName]:
         Iterable[LexerName]: An iterable of available language names.
     """
     return SUPPORTED_LEXERS
+
+
+@functools.cache
+def get_language_index() -> LanguageIndex:
+    """Returns the index that finds languages among all bundled lexers.
+
+    The index lists the available languages for an empty query.
+    """
+    return LanguageIndex(lexerindex.LEXERS, get_available_languages())
@@ -0,0 +1,216 @@
+"""The Pygments formatter that produces Code Highlighter's final HTML markup.
+
+See DEV.md for more information on the highlighter concept."""
+
+import html
+import io
+import re
+from collections.abc import Iterator
+
+from bs4.formatter import HTMLFormatter
+from pygments.formatters.html import HtmlFormatter  # type: ignore
+
+from .background import CancellationToken
+
+__all__ = ["GchHtmlFormatter"]
+
+# The BeautifulSoup formatter that used to serialize highlighted snippets.
+# Escaping text with it keeps the markup byte-identical to what the add-on
+# produced when it reparsed Pygments' output with BeautifulSoup.
+_HTML5_FORMATTER = HTMLFormatter.REGISTRY["html5"]
+
+# Older Pygments versions emit empty whitespace spans.
+_EMPTY_WHITESPACE_SPAN = '<span class="w"></span>'
+
+# A text node that consists only of ASCII whitespace.
+_WHITESPACE_NODE = re.compile(">[ \t\n\r\f]+<")
+
+
+def escape_html5(text: str) -> str:
+    """Escapes a text node the way BeautifulSoup's html5 formatter does.
+
+    Args:
+        text: The raw text.
+
+    Returns:
+        The escaped text.
+    """
+    # The html5 formatter only ever rewrites <, >, entity-like ampersands, and
+    # non-ASCII characters, so most code tokens can skip the regexes.
+    if text.isascii() and "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return _HTML5_FORMATTER.substitute(text)
+
+
+def quote_attribute_value(value: str) -> str:
+    """Escapes and quotes an HTML attribute value the way BeautifulSoup does.
+
+    Args:
+        value: The raw attribute value as written in the markup.
+
+    Returns:
+        The quoted attribute value.
+    """
+    escaped = _HTML5_FORMATTER.attribute_value(html.unescape(value))
+    if '"' not in escaped:
+        return f'"{escaped}"'
+    elif "'" not in escaped:
+        return f"'{escaped}'"
+    else:
+        return '"' + escaped.replace('"', "&quot;") + '"'
+
+
+def collapse_whitespace_nodes(markup: str) -> str:
+    """Collapses whitespace-only text nodes the way BeautifulSoup does.
+
+    Outside of <pre>, BeautifulSoup replaces a text node consisting only of
+    whitespace with a single newline or a single space.
+
+    Args:
+        markup: HTML markup with escaped text nodes.
+
+    Returns:
+        The markup with collapsed whitespace nodes.
+    """
+    return _WHITESPACE_NODE.sub(
+        lambda m: ">\n<" if "\n" in m.group() else "> <", markup
+    )
+
+
+class GchHtmlFormatter(HtmlFormatter):
+    """Formats tokens straight into the add-on's `gch-pygments` markup.
+
+    The stock HTML formatter's output needed a series of string replacements
+    and a BeautifulSoup round trip to become the add-on's markup. This
+    formatter writes the final markup in one pass.
+
+    Options:
+        language: The language name recorded in the gch-lang comment.
+        display_style: Either "inline" or "block".
+        block_style: Additional CSS styling applied to the block container.
+        cancellation: An optional CancellationToken. The formatter checks it
+            after every line and raises Cancelled once it's cancelled.
+    """
+
+    name = "Code Highlighter HTML"
+
+    def __init__(self, **options):
+        options["nowrap"] = True
+        super().__init__(**options)
+        self.language = options.get("language", "")
+        self.inline = options.get("display_style", "block") == "inline"
+        self.block_style = options.get("block_style")
+        self.cancellation: CancellationToken | None = options.get("cancellation")
+        self.opening, self.closing = self._wrapping_markup()
+        self._run_classes: dict = {}
+
+    def _wrapping_markup(self) -> tuple[str, str]:
+        # Comment-in the lexer in case we ever want to migrate in the future.
+        comment = f"<!-- gch-lang: {self.language} -->"
+        if self.inline:
+            return (f'<code class="gch-pygments">{comment}', "</code>")
+        style_attr = (
+            f" style={quote_attribute_value(self.block_style)}"
+            if self.block_style
+            else ""
+        )
+        return (
+            f'<div class="gch-pygments"{style_attr}>\n<pre><code>{comment}',
+            "</code></pre>\n</div>\n",
+        )
+
+    def _translate_parts(self, value: str) -> list[str]:
+        return escape_html5(value).split("\n")
+
+    def _merge_runs(self, tokensource) -> Iterator[tuple]:
+        """Merges consecutive tokens that end up in the same span.
+
+        BeautifulSoup escaped whole text nodes, so an entity-like sequence
+        that straddles two tokens must be escaped as one run.
+        """
+        run_classes = self._run_classes
+        run_type = None
+        run_class = None
+        run_values: list[str] = []
+        for ttype, value in tokensource:
+            try:
+                css_class = run_classes[ttype]
+            except KeyError:
+                css_class = run_classes[ttype] = self._get_css_classes(ttype)
+            if css_class == run_class:
+                run_values.append(value)
+                continue
+            if run_values:
+                yield run_type, "".join(run_values)
+            run_type, run_class, run_values = ttype, css_class, [value]
+        if run_values:
+            yield run_type, "".join(run_values)
+
+    def format_unencoded(self, tokensource, outfile) -> None:
+        if self.inline:
+            # Inline code lives outside of <pre>, so its whitespace-only text
+            # nodes need collapsing. Inline snippets are short, so buffering
+            # them is cheap.
+            inline_buffer = io.StringIO()
+            self._format_markup(tokensource, inline_buffer)
+            outfile.write(collapse_whitespace_nodes(inline_buffer.getvalue()))
+        else:
+            self._format_markup(tokensource, outfile)
+
+    def format_chunks(self, tokensource, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """Formats tokens lazily into chunks of markup.
+
+        Unlike `format`, this method never holds the whole markup, so
+        formatting a huge snippet needs memory proportional to the chunk size.
+        Inline markup comes in one chunk, because it needs whitespace
+        collapsing.
+
+        Args:
+            tokensource: An iterable of Pygments tokens.
+            chunk_size: The minimum number of characters in a chunk. The last
+                chunk may be shorter.
+
+        Yields:
+            Consecutive chunks of the markup.
+        """
+        if self.inline:
+            inline_buffer = io.StringIO()
+            self.format_unencoded(tokensource, inline_buffer)
+            yield inline_buffer.getvalue()
+            return None
+        parts: list[str] = []
+        size = 0
+        for part in self._markup_parts(tokensource):
+            parts.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(parts)
+                parts.clear()
+                size = 0
+        if parts:
+            yield "".join(parts)
+
+    def _format_markup(self, tokensource, outfile) -> None:
+        write = outfile.write
+        for part in self._markup_parts(tokensource):
+            write(part)
+
+    def _markup_parts(self, tokensource) -> Iterator[str]:
+        cancellation = self.cancellation
+        yield self.opening
+        # The last line needs special treatment, so it lags one line behind.
+        pending_line = None
+        for _, line in self._format_lines(self._merge_runs(tokensource)):
+            if cancellation is not None:
+                cancellation.raise_if_cancelled()
+            if _EMPTY_WHITESPACE_SPAN in line:
+                line = line.replace(_EMPTY_WHITESPACE_SPAN, "")
+            if pending_line is not None:
+                yield pending_line
+            pending_line = line
+        if pending_line is not None:
+            if self.inline and pending_line.endswith("</span>\n"):
+                # Drop the spurious newline at the end of inline code.
+                pending_line = pending_line[:-1]
+            yield pending_line
+        yield self.closing
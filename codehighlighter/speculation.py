@@ -0,0 +1,99 @@
+"""Starts background work on a guess before its input is known.
+
+The highlighter wizard waits for the user, who usually picks what they
+picked last time. A `Speculation` starts highlighting the predicted request
+right away. If the user confirms the prediction, the highlight is done or
+underway by the time the wizard closes. Otherwise, the speculation is
+cancelled.
+"""
+
+import typing
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
+
+from .background import BackgroundRunner, CancellationToken
+
+__all__ = ["Speculation", "SpeculationStats"]
+
+K = typing.TypeVar("K")
+T = typing.TypeVar("T")
+
+
+@dataclass
+class SpeculationStats:
+    """Counters of speculative tasks.
+
+    Attributes:
+        started: The number of started speculations.
+        used: The number of speculations whose guess was right.
+        cancelled: The number of speculations cancelled before use, e.g.,
+            because the guess was wrong.
+    """
+
+    started: int = 0
+    used: int = 0
+    cancelled: int = 0
+
+
+class Speculation(typing.Generic[K, T]):
+    """A background task started on a guess of its input.
+
+    All methods run on the main thread.
+    """
+
+    def __init__(
+        self,
+        guess: K,
+        task: Callable[[K, CancellationToken], T],
+        runner: BackgroundRunner,
+        stats: Optional[SpeculationStats] = None,
+    ):
+        """Starts the task on the guess.
+
+        Args:
+            guess: The guessed input.
+            task: The task. It may raise Cancelled once the token is cancelled.
+            runner: The runner of the task.
+            stats: The counters to update.
+        """
+        self.guess = guess
+        self.token = CancellationToken()
+        self.stats = stats or SpeculationStats()
+        self._result: Optional[Future[T]] = None
+        self._callbacks: list[Callable[[Future[T]], None]] = []
+        self.stats.started += 1
+        runner(lambda: task(guess, self.token), self._on_done)
+
+    def take(self, actual: K) -> bool:
+        """Claims the task for the actual input.
+
+        Returns:
+            Whether the guess was right. If it wasn't, the speculation is
+            cancelled.
+        """
+        if actual == self.guess:
+            self.stats.used += 1
+            return True
+        self.cancel()
+        return False
+
+    def cancel(self) -> None:
+        """Cancels the task and drops its result."""
+        self.stats.cancelled += 1
+        self.token.cancel()
+        self._callbacks.clear()
+
+    def add_done_callback(self, fn: Callable[[Future[T]], None]) -> None:
+        """Calls `fn` with the task's future once the task is done."""
+        if self._result is not None:
+            fn(self._result)
+        else:
+            self._callbacks.append(fn)
+
+    def _on_done(self, future: Future[T]) -> None:
+        self._result = future
+        callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(future)
@@ -0,0 +1,115 @@
+"""This module handles the add-on's user_files directory.
+
+Anki keeps the user_files directory when it updates an add-on
+(https://addon-docs.ankiweb.net/addon-folders.html#user-files), so it's the
+place for local data that should outlive an update.
+"""
+
+import logging
+import os
+import os.path
+import typing
+from pathlib import Path
+
+from .background import Scheduler
+from .serialization import Serializer
+
+__all__ = ["UserFileState", "user_files_directory"]
+
+addon_path = os.path.dirname(__file__)
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+
+def user_files_directory() -> Path:
+    """Returns the add-on's user_files directory, creating it if necessary.
+
+    Returns:
+        The user_files path.
+    """
+    path = Path(addon_path) / "user_files"
+    path.mkdir(exist_ok=True)
+    return path
+
+
+class UserFileState(typing.Generic[T]):
+    """A state that lives in memory and is backed by a file.
+
+    The state reads the file on first access. Putting a changed state marks it
+    dirty and schedules a write, which later puts postpone, so that a burst of
+    changes costs one write. Putting an unchanged state writes nothing.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        serializer: Serializer[T],
+        default: T,
+        schedule: Scheduler,
+        delay: float = 1.0,
+    ):
+        """
+        Args:
+            path: The backing file.
+            serializer: The serializer of the state.
+            default: The state to use if the file is missing or corrupt.
+            schedule: The scheduler of delayed writes.
+            delay: How many seconds to wait for further changes before
+                writing.
+        """
+        self.path = path
+        self.serializer = serializer
+        self.default = default
+        self.schedule = schedule
+        self.delay = delay
+        self._value: typing.Optional[T] = None
+        self._loaded = False
+        self._dirty = False
+        self._generation = 0
+
+    def exists(self) -> bool:
+        """Checks whether the state has been saved or is about to be."""
+        return self._dirty or self.path.is_file()
+
+    def get(self) -> T:
+        if not self._loaded:
+            self._value = self._read()
+            self._loaded = True
+        return typing.cast(T, self._value)
+
+    def put(self, value: T) -> None:
+        if value == self.get():
+            return None
+        self._value = value
+        self._dirty = True
+        self._generation += 1
+        generation = self._generation
+        self.schedule(self.delay, lambda: self._flush_if_latest(generation))
+
+    def flush(self) -> None:
+        """Writes the state if it's dirty."""
+        if not self._dirty:
+            return None
+        # Write to a temporary file first, so that a crash doesn't leave a
+        # truncated state behind.
+        temporary_path = self.path.with_name(self.path.name + ".tmp")
+        temporary_path.write_text(self.serializer.dumps(typing.cast(T, self._value)))
+        os.replace(temporary_path, self.path)
+        self._dirty = False
+
+    def _flush_if_latest(self, generation: int) -> None:
+        if generation == self._generation:
+            self.flush()
+
+    def _read(self) -> T:
+        try:
+            return self.serializer.loads(self.path.read_text()) or self.default
+        except FileNotFoundError:
+            return self.default
+        except Exception:
+            # An unreadable state, e.g., one saved by an older version, must
+            # not break highlighting.
+            logger.warning("Could not read %s.", self.path, exc_info=True)
+            return self.default
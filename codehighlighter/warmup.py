@@ -0,0 +1,88 @@
+"""Warms up lexers before the user needs them.
+
+The first use of a Pygments `RegexLexer` compiles its whole token table, which
+takes a noticeable moment for heavy grammars like C++ or PHP. `LexerWarmUp`
+does that work in the background after the profile opens, so that the first
+highlight of a session is fast.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Optional
+
+from .background import CancellationToken
+from .highlight_worker import HighlightWorker, WorkerError
+from .html import PlainString
+
+if TYPE_CHECKING:
+    from .pygments_highlighter import LexerName
+
+__all__ = ["LexerWarmUp"]
+
+# A snippet that goes through the whole highlighting pipeline.
+_WARM_UP_SNIPPET = PlainString("x = 1\n")
+
+
+class LexerWarmUp:
+    """Instantiates lexers and primes the formatter in the background.
+
+    The warm-up highlights a tiny snippet in each language, both in this
+    process (for cache keys) and in the worker process. It stops once it has
+    spent its time budget or once the user needs the highlighter.
+    """
+
+    def __init__(
+        self,
+        worker: Optional[HighlightWorker],
+        budget: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            worker: The worker process to warm up. Without one, only this
+                process warms up.
+            budget: How many seconds the warm-up may take.
+            clock: The clock that measures the budget.
+        """
+        self.worker = worker
+        self.budget = budget
+        self.clock = clock
+        self.warmed: list[LexerName] = []
+        self._token = CancellationToken()
+
+    def run(self, languages: Iterable[LexerName]) -> None:
+        """Warms up lexers in order until the budget runs out.
+
+        This method may block, so run it in the background.
+
+        Args:
+            languages: The languages to warm up, the most important first.
+        """
+        from . import pygments_highlighter
+
+        deadline = self.clock() + self.budget
+        style = pygments_highlighter.create_block_style()
+        for language in languages:
+            # A warm-up step is short, so check for the user in between steps
+            # instead of interrupting one.
+            if self._token.cancelled or self.clock() >= deadline:
+                return None
+            try:
+                if self.worker is not None:
+                    pygments_highlighter.get_lexer_by_name(language)
+                    self.worker.highlight_html(_WARM_UP_SNIPPET, language, style)
+                else:
+                    pygments_highlighter.highlight_html(
+                        _WARM_UP_SNIPPET, language, style
+                    )
+            except WorkerError:
+                # The worker restarts on the next highlight. Don't warm up a
+                # process that keeps failing.
+                return None
+            self.warmed.append(language)
+
+    def stop(self) -> None:
+        """Stops the warm-up, e.g., because the user needs the highlighter."""
+        self._token.cancel()
@@ -1,5 +1,7 @@
 from typing import Any, Dict, Optional
 
+from codehighlighter.config import AddonConfig
+
 
 class InMemoryConfig:
     """An in-memory dictionary-backed implementation of the config module for testing."""
@@ -23,3 +25,7 @@ class InMemoryConfig:
     def config(self) -> Dict[str, Any]:
         """Returns the config dictionary."""
         return self.data
+
+    def snapshot(self) -> AddonConfig:
+        """Returns the typed config."""
+        return AddonConfig.from_dict(self.data)
@@ -2,9 +2,11 @@ import unittest
 
 from codehighlighter.ankieditorextra import (
     EditorInterface,
+    ReplaceWrapSelection,
     SelectedText,
     UnwrapSelection,
     transform_selection,
+    transform_selection_async,
 )
 
 
@@ -101,3 +103,77 @@ class TransformSelectionTestCase(unittest.TestCase):
         )
 
         self.assertFalse(on_done_called)
+
+
+class TransformSelectionAsyncTestCase(unittest.TestCase):
+
+    def test_replaces_the_selection_once_highlighted(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        pending = []
+
+        transform_selection_async(
+            lambda code, on_highlighted: pending.append(on_highlighted),
+            editor,
+            on_error=lambda msg: None,
+        )
+        self.assertIsNone(editor.unwrap_action)
+
+        pending[0]("<code>123</code>")
+        self.assertIsInstance(editor.unwrap_action, ReplaceWrapSelection)
+
+    def test_unwraps_on_cancelled_highlight(self):
+        editor = MockEditorInterface(SelectedText("123"))
+
+        transform_selection_async(
+            lambda code, on_highlighted: on_highlighted(None),
+            editor,
+            on_error=lambda msg: None,
+        )
+
+        self.assertEqual(UnwrapSelection(), editor.unwrap_action)
+
+    def test_falls_back_on_styles_the_editor_cannot_set_up(self):
+        editor = MockEditorInterface(SelectedText("123"), note_field_html="<p>123</p>")
+        stale_styles = []
+
+        transform_selection_async(
+            lambda code, on_highlighted: on_highlighted("<code>123</code>"),
+            editor,
+            on_error=lambda msg: None,
+            style_block="<style></style>",
+            on_stale_styles=lambda: stale_styles.append(True),
+        )
+
+        self.assertIsInstance(editor.unwrap_action, ReplaceWrapSelection)
+        self.assertEqual([True], stale_styles)
+
+    def test_skips_current_styles(self):
+        editor = MockEditorInterface(
+            SelectedText("123"), note_field_html="<style></style><p>123</p>"
+        )
+        stale_styles = []
+
+        transform_selection_async(
+            lambda code, on_highlighted: on_highlighted("<code>123</code>"),
+            editor,
+            on_error=lambda msg: None,
+            style_block="<style></style>",
+            on_stale_styles=lambda: stale_styles.append(True),
+        )
+
+        self.assertIsInstance(editor.unwrap_action, ReplaceWrapSelection)
+        self.assertEqual([], stale_styles)
+
+    def test_does_not_fetch_the_field(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        editor.get_note_field = lambda cb: self.fail("Fetched the field.")
+        editor.replace_selection_and_ensure_styles = lambda action, style_block, cb: cb(
+            True
+        )
+
+        transform_selection_async(
+            lambda code, on_highlighted: on_highlighted("<code>123</code>"),
+            editor,
+            on_error=self.fail,
+            style_block="<style></style>",
+        )
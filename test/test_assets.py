@@ -4,6 +4,7 @@ from pathlib import Path
 
 from codehighlighter import assets
 from codehighlighter.assets import AnkiAssetManager
+from codehighlighter.background import run_in_foreground
 
 from .media import FakeMediaInstaller
 
@@ -20,6 +21,12 @@ class FakeAssetManager:
     def delete_assets(self) -> None:
         self.local_version = 0
 
+    def update_assets(self) -> None:
+        self.local_version = self.plugin_version
+
+    def prepare_update(self):
+        return self.update_assets
+
 
 class AssetsTestCase(unittest.TestCase):
 
@@ -33,6 +40,32 @@ class AssetsTestCase(unittest.TestCase):
         assets.sync_assets(lambda: False, manager)
         self.assertEqual(manager.local_version, 2)
 
+    def test_sync_assets_in_background_applies_the_update(self):
+        manager = FakeAssetManager(local_version=1, plugin_version=2)
+        pending = []
+
+        synced = assets.sync_assets_in_background(
+            lambda: True,
+            manager,
+            runner=lambda task, on_done: pending.append((task, on_done)),
+        )
+        self.assertFalse(synced.done())
+        task, on_done = pending[0]
+        run_in_foreground(task, on_done)
+
+        self.assertIsNone(synced.result())
+        self.assertEqual(manager.local_version, 2)
+
+    def test_sync_assets_in_background_passes_if_newer_version_present(self):
+        manager = FakeAssetManager(local_version=2, plugin_version=1)
+
+        synced = assets.sync_assets_in_background(
+            lambda: False, manager, runner=run_in_foreground
+        )
+
+        self.assertIsNone(synced.result())
+        self.assertEqual(manager.local_version, 2)
+
     def test_read_asset_version_returns_none_on_nonexistant_file(self):
         self.assertEqual(assets.read_asset_version(Path("./foo/bar")), None)
 
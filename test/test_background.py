@@ -0,0 +1,31 @@
+import unittest
+
+from codehighlighter.background import (
+    CancellationToken,
+    Cancelled,
+    run_in_foreground,
+)
+
+
+class CancellationTokenTestCase(unittest.TestCase):
+    def test_raises_only_once_cancelled(self):
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        self.assertTrue(token.cancelled)
+        self.assertRaises(Cancelled, token.raise_if_cancelled)
+
+
+class RunInForegroundTestCase(unittest.TestCase):
+    def test_passes_the_result(self):
+        futures = []
+        run_in_foreground(lambda: 42, futures.append)
+        self.assertEqual(futures[0].result(), 42)
+
+    def test_passes_the_exception(self):
+        def fail():
+            raise ValueError("oops")
+
+        futures = []
+        run_in_foreground(fail, futures.append)
+        self.assertIsInstance(futures[0].exception(), ValueError)
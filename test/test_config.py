@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch
+
+from codehighlighter import config
+from codehighlighter.config import AddonConfig
+
+
+class AddonConfigTestCase(unittest.TestCase):
+
+    def test_defaults_missing_keys(self):
+        self.assertEqual(AddonConfig(), AddonConfig.from_dict({}))
+
+    def test_parses_values(self):
+        addon_config = AddonConfig.from_dict(
+            {"shortcut": "ctrl+h", "dev-mode": True, "warm-up-budget": 0.5}
+        )
+
+        self.assertEqual("ctrl+h", addon_config.shortcut)
+        self.assertTrue(addon_config.dev_mode)
+        self.assertEqual(0.5, addon_config.warm_up_budget)
+
+    def test_defaults_invalid_values(self):
+        addon_config = AddonConfig.from_dict(
+            {"shortcut": "", "dev-mode": "yes", "highlight-time-budget": True}
+        )
+
+        self.assertEqual(AddonConfig(), addon_config)
+
+
+class SnapshotTestCase(unittest.TestCase):
+
+    def setUp(self):
+        config.invalidate()
+        self.addCleanup(config.invalidate)
+        patcher = patch("codehighlighter.config.aqt")
+        self.aqt = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.aqt.mw.addonManager.getConfig.return_value = {"shortcut": "ctrl+h"}
+
+    def test_reads_the_config_once(self):
+        config.snapshot()
+        config.snapshot()
+        config.get("shortcut")
+
+        self.aqt.mw.addonManager.getConfig.assert_called_once()
+
+    def test_rebuilds_after_a_config_update(self):
+        config.watch_updates()
+        (_, on_update), _ = self.aqt.mw.addonManager.setConfigUpdatedAction.call_args
+        self.assertEqual("ctrl+h", config.snapshot().shortcut)
+
+        self.aqt.mw.addonManager.getConfig.return_value = {"shortcut": "ctrl+j"}
+        on_update({"shortcut": "ctrl+j"})
+
+        self.assertEqual("ctrl+j", config.snapshot().shortcut)
+
+    def test_notifies_listeners_after_a_config_update(self):
+        shortcuts = []
+        config.watch_updates(lambda: shortcuts.append(config.snapshot().shortcut))
+        (_, on_update), _ = self.aqt.mw.addonManager.setConfigUpdatedAction.call_args
+
+        self.aqt.mw.addonManager.getConfig.return_value = {"shortcut": "ctrl+j"}
+        on_update({"shortcut": "ctrl+j"})
+
+        self.assertEqual(["ctrl+j"], shortcuts)
@@ -1,6 +1,6 @@
 import json
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from codehighlighter.dialog import (
     DISPLAY_STYLE,
@@ -11,7 +11,9 @@ from codehighlighter.dialog import (
     PygmentsConfig,
     PygmentsConfigJSONConverter,
     ask_for_highlighter_config,
+    ask_for_pygments_config,
 )
+from codehighlighter.frecency import Frecency
 
 
 class DisplayStyleJSONConverterTestCase(unittest.TestCase):
@@ -63,6 +65,22 @@ class HighlighterWizardStateJSONConverterTestCase(unittest.TestCase):
         conversion = self.converter.convert(config)
         json.dumps(conversion)
 
+    def test_keeps_language_frecency(self):
+        config = HighlighterWizardState(
+            PygmentsConfig(DISPLAY_STYLE.BLOCK, "C++"),
+            Frecency().record("Python", now=0),
+        )
+        conversion = json.loads(json.dumps(self.converter.convert(config)))
+        self.assertEqual(self.converter.deconvert(conversion), config)
+
+    def test_reads_states_without_frecency(self):
+        state = self.converter.deconvert(
+            {"pygments_config": {"display_style": 1, "language": "C++"}}
+        )
+        self.assertEqual(
+            state, HighlighterWizardState(PygmentsConfig(DISPLAY_STYLE.BLOCK, "C++"))
+        )
+
 
 class AskForHighlighterConfigTestCase(unittest.TestCase):
 
@@ -86,3 +104,66 @@ class AskForHighlighterConfigTestCase(unittest.TestCase):
         self.assertIsNotNone(config)
         self.assertEqual(config.display_style, DISPLAY_STYLE.INLINE)
         self.assertEqual(config.language, "Python")
+
+    @patch("codehighlighter.dialog.time.time", return_value=100.0)
+    @patch("codehighlighter.dialog.ask_for_pygments_config")
+    def test_records_the_chosen_language(self, mock_ask_pygments_config, _):
+        mock_ask_pygments_config.return_value = PartialPygmentsConfig(
+            display_style=None, language="Python"
+        )
+        state = HighlighterWizardState(
+            PygmentsConfig(DISPLAY_STYLE.BLOCK, "C++"),
+            Frecency().record("C++", now=100.0),
+        )
+
+        _, new_state = ask_for_highlighter_config(
+            parent=None,
+            preselected=PartialPygmentsConfig(
+                display_style=DISPLAY_STYLE.BLOCK, language=None
+            ),
+            state=state,
+        )
+
+        self.assertEqual(
+            {"C++": 1.0},
+            mock_ask_pygments_config.call_args.kwargs["language_preferences"],
+        )
+        self.assertEqual(
+            {"C++": 1.0, "Python": 1.0}, new_state.language_frecency.scores(100.0)
+        )
+
+    @patch("codehighlighter.dialog.ask_for_pygments_config", return_value=None)
+    def test_cancelling_records_nothing(self, _):
+        state = HighlighterWizardState()
+
+        _, new_state = ask_for_highlighter_config(
+            parent=None,
+            preselected=PartialPygmentsConfig(display_style=None, language=None),
+            state=state,
+        )
+
+        self.assertEqual(state, new_state)
+
+
+class AskForPygmentsConfigTestCase(unittest.TestCase):
+
+    @patch("codehighlighter.dialog.ask_for_language", return_value="Python")
+    @patch(
+        "codehighlighter.dialog.ask_for_display_style",
+        return_value=DISPLAY_STYLE.INLINE,
+    )
+    def test_previews_languages_in_the_chosen_display_style(self, _, mock_ask_language):
+        language_preview = MagicMock()
+
+        ask_for_pygments_config(
+            parent=None,
+            preselected=PartialPygmentsConfig(display_style=None, language=None),
+            defaults=PygmentsConfig(DISPLAY_STYLE.BLOCK, "C++"),
+            language_preview=language_preview,
+        )
+
+        language_preview.assert_called_once_with(DISPLAY_STYLE.INLINE)
+        self.assertIs(
+            language_preview.return_value,
+            mock_ask_language.call_args.kwargs["previewer"],
+        )
@@ -0,0 +1,101 @@
+import unittest
+from concurrent.futures import Future
+
+from codehighlighter.ankieditorextra import EditorInterface, SelectedText
+from codehighlighter.editorfutures import EditorFutures, then
+
+
+class DeferredEditorInterface(EditorInterface):
+    """An editor that answers calls only when told to."""
+
+    def __init__(self):
+        self.calls = []
+
+    def wrap_and_get_selection(self, cb):
+        self.calls.append(("wrap_and_get_selection", cb))
+
+    def get_note_field(self, cb):
+        self.calls.append(("get_note_field", cb))
+
+    def set_note_field(self, html, cb):
+        self.calls.append(("set_note_field", cb))
+
+
+class EditorFuturesTestCase(unittest.TestCase):
+
+    def test_issues_calls_without_waiting(self):
+        editor = DeferredEditorInterface()
+        editor_futures = EditorFutures(editor)
+
+        selection = editor_futures.wrap_and_get_selection()
+        field = editor_futures.get_note_field()
+
+        self.assertEqual(
+            ["wrap_and_get_selection", "get_note_field"],
+            [name for name, _ in editor.calls],
+        )
+        editor.calls[1][1]("<p>123</p>")
+        self.assertFalse(selection.done())
+        self.assertEqual("<p>123</p>", field.result())
+
+    def test_cancel_drops_late_results(self):
+        editor = DeferredEditorInterface()
+        editor_futures = EditorFutures(editor)
+        field = editor_futures.get_note_field()
+
+        editor_futures.cancel()
+        editor.calls[0][1]("<p>123</p>")
+
+        self.assertTrue(field.cancelled())
+
+    def test_cancel_leaves_finished_calls(self):
+        editor = DeferredEditorInterface()
+        editor_futures = EditorFutures(editor)
+        selection = editor_futures.wrap_and_get_selection()
+        editor.calls[0][1](SelectedText("123"))
+
+        editor_futures.cancel()
+
+        self.assertEqual(SelectedText("123"), selection.result())
+
+
+class ThenTestCase(unittest.TestCase):
+
+    def test_applies_the_function(self):
+        future: Future = Future()
+        doubled = then(future, lambda x: 2 * x)
+
+        future.set_result(21)
+
+        self.assertEqual(42, doubled.result())
+
+    def test_flattens_returned_futures(self):
+        future: Future = Future()
+        inner: Future = Future()
+        chained = then(future, lambda _: inner)
+
+        future.set_result(None)
+        self.assertFalse(chained.done())
+        inner.set_result(42)
+
+        self.assertEqual(42, chained.result())
+
+    def test_propagates_cancellation(self):
+        future: Future = Future()
+        chained = then(future, lambda x: x)
+
+        future.cancel()
+
+        self.assertTrue(chained.cancelled())
+
+    def test_fails_if_the_function_raises(self):
+        future: Future = Future()
+
+        def fail(_):
+            raise ValueError("Oops.")
+
+        chained = then(future, fail)
+        with self.assertLogs("concurrent.futures", level="ERROR"):
+            future.set_result(None)
+
+        self.assertIsInstance(chained.exception(), ValueError)
@@ -0,0 +1,97 @@
+import json
+import unittest
+
+from codehighlighter.editorhelper import (
+    EDITOR_HELPER_JS,
+    TRANSFER_CHUNK_SIZE,
+    BridgeStats,
+    call_editor_helper,
+    encode_text,
+)
+
+
+class FakeWebView:
+    """A webview that replies with queued results."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.scripts = []
+
+    def evalWithCallback(self, js, cb):
+        self.scripts.append(js)
+        cb(self.results.pop(0))
+
+
+class CallEditorHelperTestCase(unittest.TestCase):
+    def test_calls_the_helper_with_json_arguments(self):
+        webview = FakeWebView({"selectionText": "x"})
+        results = []
+
+        call_editor_helper(webview, "wrapAndGetSelection", ['"42"'], results.append)
+
+        self.assertEqual([{"selectionText": "x"}], results)
+        self.assertEqual(1, len(webview.scripts))
+        self.assertIn('gchEditor.call("wrapAndGetSelection", "42")', webview.scripts[0])
+        self.assertNotIn(EDITOR_HELPER_JS, webview.scripts[0])
+
+    def test_reinjects_a_missing_helper(self):
+        webview = FakeWebView({"missingHelper": True}, None)
+        results = []
+
+        call_editor_helper(webview, "getNoteField", [], results.append)
+
+        self.assertEqual([None], results)
+        self.assertIn(EDITOR_HELPER_JS, webview.scripts[1])
+        self.assertIn('gchEditor.call("getNoteField")', webview.scripts[1])
+
+    def test_counts_the_traffic(self):
+        webview = FakeWebView({"missingHelper": True}, "<p>x</p>")
+        stats = BridgeStats()
+
+        call_editor_helper(webview, "getNoteField", [], lambda _: None, stats)
+
+        self.assertEqual(2, stats.calls)
+        self.assertEqual(sum(len(js) for js in webview.scripts), stats.sent_bytes)
+        self.assertEqual(len('"<p>x</p>"'), stats.received_bytes)
+        self.assertEqual(1, stats.injections)
+
+
+class EncodeTextTestCase(unittest.TestCase):
+    def test_encodes_short_text_as_json(self):
+        webview = FakeWebView()
+        encoded = []
+
+        encode_text(webview, 'say "hi"', encoded.append, self.fail)
+
+        self.assertEqual([json.dumps('say "hi"')], encoded)
+        self.assertEqual([], webview.scripts)
+
+    def test_encodes_none_as_null(self):
+        encoded = []
+
+        encode_text(FakeWebView(), None, encoded.append, self.fail)
+
+        self.assertEqual(["null"], encoded)
+
+    def test_transfers_long_text_in_chunks(self):
+        text = "x" * (2 * TRANSFER_CHUNK_SIZE + 1)
+        webview = FakeWebView(None, None, None)
+        encoded = []
+
+        encode_text(webview, text, encoded.append, self.fail)
+
+        self.assertEqual(3, len(webview.scripts))
+        self.assertTrue(all("appendChunk" in js for js in webview.scripts))
+        self.assertTrue(
+            all(len(js) < TRANSFER_CHUNK_SIZE + 200 for js in webview.scripts)
+        )
+        self.assertEqual(3, json.loads(encoded[0])["chunks"])
+
+    def test_reports_a_failed_transfer(self):
+        text = "x" * (TRANSFER_CHUNK_SIZE + 1)
+        error = {"error": {"message": "Oops."}}
+        errors = []
+
+        encode_text(FakeWebView(error), text, self.fail, errors.append)
+
+        self.assertEqual([error], errors)
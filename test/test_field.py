@@ -1,7 +1,7 @@
 import unittest
 from textwrap import dedent
 
-from codehighlighter.field import set_up_style_import
+from codehighlighter.field import set_up_style_import, style_import_block
 
 
 class FieldTestCase(unittest.TestCase):
@@ -48,3 +48,12 @@ class FieldTestCase(unittest.TestCase):
 
             <p>hello world</p>""")
         self.assertEqual(result, expected)
+
+
+class StyleImportBlockTestCase(unittest.TestCase):
+
+    def test_starts_a_set_up_field(self):
+        css_assets = ["_gch-pygments-solarized.css"]
+        html = set_up_style_import("<p>hello world</p>", css_assets, "ACH add-on")
+
+        self.assertTrue(html.startswith(style_import_block(css_assets, "ACH add-on")))
@@ -0,0 +1,78 @@
+import json
+import unittest
+
+from codehighlighter.frecency import (
+    HALF_LIFE,
+    Frecency,
+    FrecencyEntry,
+    FrecencyJSONConverter,
+)
+
+
+class FrecencyTestCase(unittest.TestCase):
+
+    def test_unused_items_score_zero(self):
+        self.assertEqual(0, Frecency().score("Python", now=0))
+
+    def test_uses_add_up(self):
+        frecency = Frecency().record("Python", now=0).record("Python", now=0)
+        self.assertEqual(2, frecency.score("Python", now=0))
+
+    def test_scores_halve_every_half_life(self):
+        frecency = Frecency().record("Python", now=0)
+        self.assertAlmostEqual(0.5, frecency.score("Python", now=HALF_LIFE))
+
+    def test_recent_uses_outrank_old_frequent_uses(self):
+        frecency = Frecency()
+        for _ in range(3):
+            frecency = frecency.record("Java", now=0)
+        frecency = frecency.record("Python", now=4 * HALF_LIFE)
+
+        scores = frecency.scores(now=4 * HALF_LIFE)
+
+        self.assertGreater(scores["Python"], scores["Java"])
+
+    def test_forgets_lowest_scored_items_beyond_capacity(self):
+        frecency = Frecency(capacity=2)
+        frecency = frecency.record("C", now=0).record("C", now=0)
+        frecency = frecency.record("Go", now=0).record("Rust", now=1)
+
+        self.assertEqual({"C", "Rust"}, set(frecency.entries))
+
+    def test_top_lists_the_highest_scored_items_first(self):
+        frecency = Frecency().record("C", now=0).record("Go", now=0)
+        frecency = frecency.record("Go", now=0).record("Rust", now=0)
+        frecency = frecency.record("Rust", now=0).record("Rust", now=0)
+
+        self.assertEqual(["Rust", "Go"], frecency.top(now=0, count=2))
+
+    def test_record_keeps_the_original(self):
+        frecency = Frecency()
+        frecency.record("Python", now=0)
+        self.assertEqual({}, frecency.entries)
+
+
+class FrecencyJSONConverterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.converter = FrecencyJSONConverter()
+
+    def test_keeps_frecency(self):
+        frecency = Frecency().record("Python", now=10).record("C++", now=20)
+        conversion = json.loads(json.dumps(self.converter.convert(frecency)))
+        self.assertEqual(frecency, self.converter.deconvert(conversion))
+
+    def test_skips_malformed_entries(self):
+        self.assertEqual(
+            Frecency({"Python": FrecencyEntry(1.0, 2.0)}),
+            self.converter.deconvert(
+                {"Python": [1, 2], "Java": "oops", "C": [True, 1], "Go": [1]}
+            ),
+        )
+
+    def test_rejects_non_objects(self):
+        self.assertIsNone(self.converter.deconvert(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
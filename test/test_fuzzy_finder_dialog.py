@@ -1,6 +1,7 @@
 import unittest
 
 from codehighlighter.fuzzy_finder_dialog import (
+    OptionIndex,
     filter_and_sort_options,
     is_subsequence,
     score_match,
@@ -64,3 +65,29 @@ class FuzzyFinderDialogTestCase(unittest.TestCase):
         # Expected sorted order:
         # "Java"
         self.assertEqual(filter_and_sort_options("a", options), ["Java"])
+
+
+class OptionIndexTestCase(unittest.TestCase):
+
+    def test_filters_like_filter_and_sort_options(self):
+        options = ["Python", "pydeps", "copy", "C++", "Java"]
+        index = OptionIndex(options)
+
+        for query in ["", "p", "py", "pyt", "a", "Py", "x", ""]:
+            self.assertEqual(
+                filter_and_sort_options(query, options), index.filter(query)
+            )
+
+    def test_narrows_extended_queries(self):
+        index = OptionIndex(["Python", "Perl", "Java"])
+
+        self.assertEqual(["Perl", "Python"], index.filter("p"))
+        self.assertEqual(["Python"], index.filter("py"))
+        self.assertEqual(["Java"], index.filter("ja"))
+
+    def test_preferences_break_ties(self):
+        index = OptionIndex(["C", "Rust", "Trust"], preferences={"Trust": 2, "C": 1})
+
+        self.assertEqual(["Trust", "C", "Rust"], index.filter(""))
+        # A better match still ranks first.
+        self.assertEqual(["Rust", "Trust"], index.filter("rust"))
@@ -0,0 +1,138 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from codehighlighter.highlight_cache import (
+    CacheStats,
+    HighlightCache,
+    SqliteTier,
+    _entry_size,
+)
+from codehighlighter.html import HtmlString, PlainString
+from codehighlighter.pygments_highlighter import (
+    cache_key,
+    create_block_style,
+    create_inline_style,
+)
+
+
+class InMemoryTier:
+    def __init__(self):
+        self.entries: dict[str, HtmlString] = {}
+
+    def get(self, key: str) -> HtmlString | None:
+        return self.entries.get(key)
+
+    def put(self, key: str, html: HtmlString) -> None:
+        self.entries[key] = html
+
+    def close(self) -> None:
+        pass
+
+
+class HighlightCacheTestCase(unittest.TestCase):
+    def test_counts_hits_and_misses(self):
+        cache = HighlightCache()
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", HtmlString("<b>a</b>"))
+        self.assertEqual(cache.get("a"), "<b>a</b>")
+        self.assertEqual(cache.stats(), CacheStats(hits=1, misses=1))
+
+    def test_evicts_least_recently_used_entries(self):
+        cache = HighlightCache(max_bytes=2 * _entry_size("a", "x" * 100))
+        cache.put("a", HtmlString("x" * 100))
+        cache.put("b", HtmlString("y" * 100))
+        cache.get("a")
+        cache.put("c", HtmlString("z" * 100))
+
+        self.assertEqual(cache.get("a"), "x" * 100)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "z" * 100)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_skips_entries_larger_than_the_budget(self):
+        cache = HighlightCache(max_bytes=100)
+        cache.put("a", HtmlString("x" * 1000))
+        self.assertIsNone(cache.get("a"))
+
+    def test_falls_back_to_the_persistent_tier(self):
+        tier = InMemoryTier()
+        HighlightCache(persistent=tier).put("a", HtmlString("<b>a</b>"))
+
+        cache = HighlightCache(persistent=tier)
+        self.assertEqual(cache.get("a"), "<b>a</b>")
+        self.assertEqual(cache.get("a"), "<b>a</b>")
+        self.assertEqual(cache.stats(), CacheStats(hits=1, persistent_hits=1))
+
+    def test_get_or_compute_computes_once(self):
+        cache = HighlightCache()
+        calls = []
+
+        def compute() -> HtmlString:
+            calls.append(None)
+            return HtmlString("<b>a</b>")
+
+        cache.get_or_compute("a", compute)
+        self.assertEqual(cache.get_or_compute("a", compute), "<b>a</b>")
+        self.assertEqual(len(calls), 1)
+
+
+class SqliteTierTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "cache.sqlite3"
+
+        self.tiers: list[SqliteTier] = []
+
+    def tearDown(self):
+        for tier in self.tiers:
+            tier.close()
+        self.directory.cleanup()
+
+    def tier(self, fingerprint: str, **kwargs) -> SqliteTier:
+        tier = SqliteTier(self.path, fingerprint, **kwargs)
+        self.tiers.append(tier)
+        return tier
+
+    def test_persists_entries(self):
+        self.tier("v1").put("a", HtmlString("<b>a</b>"))
+        self.assertEqual(self.tier("v1").get("a"), "<b>a</b>")
+
+    def test_drops_entries_on_fingerprint_change(self):
+        self.tier("v1").put("a", HtmlString("<b>a</b>"))
+        self.assertIsNone(self.tier("v2").get("a"))
+
+    def test_misses_once_closed(self):
+        tier = self.tier("v1")
+        tier.put("a", HtmlString("<b>a</b>"))
+        cache = HighlightCache(persistent=tier)
+
+        cache.close()
+
+        self.assertIsNone(tier.get("a"))
+        cache.put("b", HtmlString("<b>b</b>"))
+        self.assertEqual(cache.get("b"), "<b>b</b>")
+
+    def test_prunes_least_recently_used_entries(self):
+        tier = self.tier("v1", max_entries=2)
+        tier.put("a", HtmlString("a"))
+        tier.put("b", HtmlString("b"))
+        tier.get("a")
+        tier.put("c", HtmlString("c"))
+
+        self.assertEqual(tier.get("a"), "a")
+        self.assertIsNone(tier.get("b"))
+        self.assertEqual(tier.get("c"), "c")
+
+
+class CacheKeyTestCase(unittest.TestCase):
+    def test_key_depends_on_all_inputs(self):
+        code = PlainString("return 1")
+        keys = {
+            cache_key(code, "Python", create_inline_style()),
+            cache_key(PlainString("return 2"), "Python", create_inline_style()),
+            cache_key(code, "Ruby", create_inline_style()),
+            cache_key(code, "Python", create_block_style()),
+            cache_key(code, "Python", create_block_style("color: red")),
+        }
+        self.assertEqual(len(keys), 5)
@@ -0,0 +1,145 @@
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from codehighlighter.background import CancellationToken, Cancelled
+from codehighlighter.highlight_worker import (
+    BudgetExceededError,
+    HighlightWorker,
+    HighlightWorkerPool,
+)
+from codehighlighter.html import PlainString
+from codehighlighter.pygments_highlighter import (
+    HighlightRequest,
+    create_block_style,
+    create_inline_style,
+    highlight_html,
+)
+
+# The Systemd grammar backtracks catastrophically on a run of tabs: its
+# highlighting time grows with the cube of the run's length, and this snippet
+# takes minutes.
+PATHOLOGICAL_SNIPPET = PlainString("\t" * 3000 + "x")
+PATHOLOGICAL_LANGUAGE = "Systemd"
+
+
+class HighlightWorkerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.worker = HighlightWorker(time_budget=1.0)
+
+    def tearDown(self):
+        self.worker.close()
+
+    def test_highlights_like_the_in_process_highlighter(self):
+        code = PlainString("def f(x):\n    return x < 'ä'\n")
+        style = create_block_style()
+        self.assertEqual(
+            self.worker.highlight_html(code, "Python", style),
+            highlight_html(code, "Python", style),
+        )
+
+    def test_returns_within_the_time_budget(self):
+        # Start the worker, so that its start-up doesn't count.
+        self.worker.highlight_html(PlainString("x"), "Python", create_block_style())
+
+        start = time.monotonic()
+        with self.assertRaises(BudgetExceededError):
+            self.worker.highlight_html(
+                PATHOLOGICAL_SNIPPET, PATHOLOGICAL_LANGUAGE, create_block_style()
+            )
+        self.assertLess(time.monotonic() - start, 2.0)
+
+    def test_restarts_after_an_overrun(self):
+        with self.assertRaises(BudgetExceededError):
+            self.worker.highlight_html(
+                PATHOLOGICAL_SNIPPET, PATHOLOGICAL_LANGUAGE, create_block_style()
+            )
+
+        code = PlainString("return 1")
+        self.assertEqual(
+            self.worker.highlight_html(code, "Python", create_block_style()),
+            highlight_html(code, "Python", create_block_style()),
+        )
+        self.assertEqual(self.worker.restarts, 1)
+
+    @patch("subprocess.Popen")
+    def test_highlights_in_process_in_a_frozen_build(self, popen):
+        code = PlainString("return 1")
+        style = create_block_style()
+        with patch.object(sys, "frozen", True, create=True):
+            html = self.worker.highlight_html(code, "Python", style)
+
+        self.assertEqual(html, highlight_html(code, "Python", style))
+        popen.assert_not_called()
+
+    @unittest.skipUnless(sys.platform == "linux", "The memory budget needs Linux.")
+    def test_enforces_the_memory_budget(self):
+        worker = HighlightWorker(time_budget=30.0, memory_budget=4 * 1024 * 1024)
+        try:
+            with self.assertRaises(BudgetExceededError):
+                worker.highlight_html(
+                    PlainString("x = 1\n" * 50000), "Python", create_block_style()
+                )
+        finally:
+            worker.close()
+
+    @patch("subprocess.Popen")
+    def test_skips_cancelled_snippets(self, popen):
+        token = CancellationToken()
+        token.cancel()
+
+        with self.assertRaises(Cancelled):
+            self.worker.highlight_html(
+                PlainString("x"), "Python", create_block_style(), token
+            )
+        popen.assert_not_called()
+
+    def test_stops_once_cancelled(self):
+        token = CancellationToken()
+        threading.Timer(0.2, token.cancel).start()
+
+        start = time.monotonic()
+        with self.assertRaises(Cancelled):
+            HighlightWorker(time_budget=30.0).highlight_html(
+                PATHOLOGICAL_SNIPPET, PATHOLOGICAL_LANGUAGE, create_block_style(), token
+            )
+        self.assertLess(time.monotonic() - start, 2.0)
+
+
+class HighlightWorkerPoolTestCase(unittest.TestCase):
+    REQUESTS = [
+        HighlightRequest(PlainString("return 1"), "Python", create_inline_style()),
+        HighlightRequest(PlainString("int x;"), "C++", create_block_style()),
+        HighlightRequest(PlainString("return 2"), "Python", create_inline_style()),
+        HighlightRequest(PlainString("return 3"), "Python", create_block_style()),
+    ]
+
+    def setUp(self):
+        self.pool = HighlightWorkerPool(size=2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_returns_results_in_request_order(self):
+        self.assertEqual(
+            self.pool.highlight_many(self.REQUESTS, chunksize=1),
+            [highlight_html(r.code, r.language, r.style) for r in self.REQUESTS],
+        )
+
+    def test_enforces_the_time_budget(self):
+        pool = HighlightWorkerPool(size=1, time_budget=0.5)
+        try:
+            with self.assertRaises(BudgetExceededError):
+                pool.highlight_many(
+                    [
+                        HighlightRequest(
+                            PATHOLOGICAL_SNIPPET,
+                            PATHOLOGICAL_LANGUAGE,
+                            create_block_style(),
+                        )
+                    ]
+                )
+        finally:
+            pool.close()
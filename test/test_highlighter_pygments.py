@@ -4,6 +4,7 @@ from os import path
 
 import pygments.lexer
 import pygments.lexers
+
 from codehighlighter import ankieditorextra, pygments_highlighter
 from codehighlighter.pygments_highlighter import create_block_style, create_inline_style
 
@@ -28,6 +29,12 @@ class HighlighterPygmentsTestCase(unittest.TestCase):
             lexer = pygments_highlighter.get_lexer_by_name(language)
             self.assertIsInstance(lexer, pygments.lexer.Lexer)
 
+    def test_language_index_lists_available_languages(self):
+        self.assertCountEqual(
+            pygments_highlighter.get_available_languages(),
+            pygments_highlighter.get_language_index().filter(""),
+        )
+
     def test_get_lexer_by_name_also_works_with_aliases(self):
         lexer = pygments_highlighter.get_lexer_by_name("cpp")
         self.assertEqual(lexer.name, "C++")
@@ -0,0 +1,75 @@
+import unittest
+
+from codehighlighter.languageindex import LanguageIndex
+from codehighlighter.lexerindex import LEXERS, LexerEntry
+
+
+def entry(aliases=(), filenames=()) -> LexerEntry:
+    return LexerEntry("module", "Lexer", tuple(aliases), tuple(filenames), ())
+
+
+class LanguageIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.index = LanguageIndex(LEXERS, ["C++", "Python", "Rust"])
+
+    def test_empty_query_lists_featured_languages(self):
+        self.assertEqual(["C++", "Python", "Rust"], self.index.filter(""))
+
+    def test_finds_languages_by_alias(self):
+        self.assertEqual("Python", self.index.filter("py")[0])
+        self.assertEqual("C++", self.index.filter("cpp")[0])
+
+    def test_finds_languages_by_extension(self):
+        self.assertEqual("Rust", self.index.filter(".rs")[0])
+        self.assertEqual("Rust", self.index.filter("*.rs")[0])
+        self.assertEqual("Terraform", self.index.filter("tf")[0])
+
+    def test_finds_languages_by_file_name(self):
+        self.assertEqual("Docker", self.index.filter("Dockerfile")[0])
+
+    def test_finds_the_arm_lexer(self):
+        self.assertEqual("ARM", self.index.filter("arm")[0])
+
+    def test_ranks_names_above_aliases(self):
+        index = LanguageIndex(
+            {"Go": entry(), "Golo": entry(aliases=["go"])}, featured=[]
+        )
+        self.assertEqual(["Go", "Golo"], index.filter("go"))
+
+    def test_breaks_ties_with_featured_languages(self):
+        index = LanguageIndex(
+            {"A": entry(filenames=["*.x"]), "B": entry(filenames=["*.x"])},
+            featured=["B"],
+        )
+        self.assertEqual(["B", "A"], index.filter(".x"))
+
+    def test_ignores_wildcard_globs(self):
+        index = LanguageIndex(
+            {"C": entry(filenames=["*.[ch]", "Makefile.*"])}, featured=[]
+        )
+        self.assertEqual([], index.filter("makefile"))
+
+    def test_preferred_languages_lead_the_empty_query(self):
+        self.index.set_preferences({"Go": 3.0, "Rust": 1.0, "Unknown": 2.0})
+
+        self.assertEqual(["Go", "Rust", "C++", "Python"], self.index.filter(""))
+
+    def test_preferences_break_ties(self):
+        self.index.set_preferences({"RSL": 1.0})
+
+        self.assertEqual(["Rust", "RSL"], self.index.filter("rs")[:2])
+        matches = self.index.filter("r")
+        self.assertLess(matches.index("RSL"), matches.index("Rust"))
+
+    def test_narrowing_and_widening_queries(self):
+        self.assertEqual("Python", self.index.filter("pyth")[0])
+        self.assertEqual("Rust", self.index.filter("rust")[0])
+        self.assertEqual(
+            LanguageIndex(LEXERS, ["C++", "Python", "Rust"]).filter("ru"),
+            self.index.filter("ru"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+import pygments
+
+from codehighlighter import lexerindex
+from codehighlighter.pygments_highlighter import get_lexer_by_name
+from tools.generatelexerindex import build_alias_index, build_index
+
+
+class LexerIndexTestCase(unittest.TestCase):
+    """Checks that the generated index matches the live Pygments.
+
+    Regenerate the index with `just generate-lexer-index` if this fails.
+    """
+
+    def test_matches_the_pygments_version(self):
+        self.assertEqual(pygments.__version__, lexerindex.PYGMENTS_VERSION)
+
+    def test_matches_the_live_lexers(self):
+        self.assertEqual(
+            build_index(),
+            {name: tuple(entry) for name, entry in lexerindex.LEXERS.items()},
+        )
+
+    def test_matches_the_live_aliases(self):
+        self.assertEqual(build_alias_index(build_index()), lexerindex.ALIASES)
+
+    def test_entries_point_to_their_lexers(self):
+        for name, entry in lexerindex.LEXERS.items():
+            with self.subTest(name=name):
+                lexer = get_lexer_by_name(name)
+                assert lexer is not None
+                self.assertEqual(name, lexer.name)
+                self.assertEqual(list(entry.aliases), lexer.aliases)
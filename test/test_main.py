@@ -1,22 +1,86 @@
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
+from concurrent.futures import Future
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from codehighlighter.ankieditorextra import (
+    ReplaceWrapSelection,
     SelectedText,
+    UnwrapSelection,
 )
+from codehighlighter.background import CancellationToken, run_in_foreground
 from codehighlighter.clipboard import EmptyClipboard, StubClipboard
-from codehighlighter.dialog import DISPLAY_STYLE, PygmentsConfig
+from codehighlighter.dialog import (
+    DISPLAY_STYLE,
+    HighlighterWizardState,
+    HighlighterWizardStateJSONConverter,
+    PygmentsConfig,
+)
+from codehighlighter.editorhelper import EDITOR_HELPER_JS
+from codehighlighter.field import style_import_block
+from codehighlighter.frecency import Frecency
+from codehighlighter.highlight_cache import HighlightCache
+from codehighlighter.highlight_worker import BudgetExceededError
+from codehighlighter.html import PlainString
 from codehighlighter.main import (
     DEFAULT_CSS_ASSETS,
+    GUARD,
+    create_language_preview,
+    flush_wizard_state,
+    get_asset_sync,
+    get_highlight_cache,
+    get_highlight_worker,
+    get_lexer_warm_up,
+    get_preview_cache,
+    get_profile_wizard_state,
+    get_speculative_highlight_worker,
+    get_wizard_state,
     highlight,
+    highlight_action,
     highlight_selection,
+    inject_editor_helper,
+    read_wizard_state,
+    render_highlight_request,
+    reset_highlighting,
+    set_up_field_styles,
     sync_assets_hook,
+    warm_up_hook,
 )
+from codehighlighter.pygments_highlighter import HighlightRequest, create_block_style
+from codehighlighter.serialization import JSONObjectSerializer
+from codehighlighter.speculation import SpeculationStats
+from codehighlighter.userfiles import UserFileState
 
 from .in_memory_config import InMemoryConfig
 from .test_ankieditorextra import MockEditorInterface
 
 
+class LoadTestCase(unittest.TestCase):
+
+    def test_loading_the_addon_does_not_import_the_highlighting_engine(self):
+        # Load the add-on in a fresh interpreter, because other tests have
+        # already loaded the engine into this one.
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, codehighlighter.main; print(*sys.modules)",
+            ],
+            cwd=Path(__file__).parents[1],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        modules = completed.stdout.split()
+
+        self.assertNotIn("pygments", modules)
+        self.assertNotIn("bs4", modules)
+
+
 class HighlightTestCase(unittest.TestCase):
 
     @patch(
@@ -32,7 +96,7 @@ class HighlightTestCase(unittest.TestCase):
             err_msg = msg
 
         highlight(
-            highlighter_config_factory=lambda preselected: PygmentsConfig(
+            highlighter_config_factory=lambda preselected, code: PygmentsConfig(
                 display_style=DISPLAY_STYLE.INLINE, language="python"
             ),
             block_style="",
@@ -43,19 +107,252 @@ class HighlightTestCase(unittest.TestCase):
 
         self.assertIsNone(err_msg)
         self.assertEqual(
-            '\'<code class="gch-pygments"><!-- gch-lang: python -->'
+            '<code class="gch-pygments"><!-- gch-lang: python -->'
             + '<span class="mi">123</span>'
-            + "</code>'",
+            + "</code>",
             editor.unwrap_action.contents,
         )
 
 
+class SetUpFieldStylesTestCase(unittest.TestCase):
+
+    def test_replaces_a_stale_style_block(self):
+        editor = MockEditorInterface(
+            SelectedText("123"),
+            note_field_html=f"<!-- {GUARD} BEGIN -->\n<style></style>\n"
+            + f"<!-- {GUARD} END -->\n<p>123</p>",
+        )
+
+        done = set_up_field_styles(editor, on_error=self.fail)
+
+        self.assertIsNone(done.result())
+        self.assertTrue(
+            editor.note_field_html.startswith(
+                style_import_block(DEFAULT_CSS_ASSETS, GUARD)
+            )
+        )
+        self.assertTrue(editor.note_field_html.endswith("<p>123</p>"))
+
+
+class DeferredRunner:
+    """A BackgroundRunner that runs tasks on demand."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def __call__(self, task, on_done):
+        self.tasks.append((task, on_done))
+
+    def run_all(self):
+        for task, on_done in self.tasks:
+            run_in_foreground(task, on_done)
+
+
+class RecordingProgress:
+    def __init__(self):
+        self.token = None
+        self.finished = False
+
+    def start(self, token):
+        self.token = token
+
+    def finish(self):
+        self.finished = True
+
+
+@patch(
+    "codehighlighter.main.config",
+    new=InMemoryConfig({"auto-detect-display-style": True}),
+)
+class BackgroundHighlightTestCase(unittest.TestCase):
+
+    def highlight(
+        self, editor, runner, progress, on_error=lambda msg: None, worker=None
+    ):
+        highlight(
+            highlighter_config_factory=lambda preselected, code: PygmentsConfig(
+                display_style=DISPLAY_STYLE.INLINE, language="python"
+            ),
+            block_style="",
+            clipboard=EmptyClipboard(),
+            editor=editor,
+            on_error=on_error,
+            runner=runner,
+            progress=progress,
+            worker=worker,
+        )
+
+    def highlight_with_prediction(
+        self,
+        editor,
+        runner,
+        progress,
+        language,
+        stats,
+        worker=None,
+        speculative_worker=None,
+        on_error=lambda msg: None,
+    ):
+        highlight(
+            highlighter_config_factory=lambda preselected, code: PygmentsConfig(
+                display_style=DISPLAY_STYLE.INLINE, language="python"
+            ),
+            block_style="",
+            clipboard=EmptyClipboard(),
+            editor=editor,
+            on_error=on_error,
+            runner=runner,
+            progress=progress,
+            predict=lambda preselected: PygmentsConfig(
+                display_style=DISPLAY_STYLE.INLINE, language=language
+            ),
+            speculation_stats=stats,
+            worker=worker,
+            speculative_worker=speculative_worker,
+        )
+
+    def test_uses_the_speculative_highlight_of_a_right_prediction(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        runner = DeferredRunner()
+        progress = RecordingProgress()
+        stats = SpeculationStats()
+
+        self.highlight_with_prediction(editor, runner, progress, "python", stats)
+        runner.run_all()
+
+        self.assertEqual(1, len(runner.tasks))
+        self.assertTrue(progress.finished)
+        self.assertIsInstance(editor.unwrap_action, ReplaceWrapSelection)
+        self.assertEqual(SpeculationStats(started=1, used=1), stats)
+
+    def test_cancels_the_speculative_highlight_of_a_wrong_prediction(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        runner = DeferredRunner()
+        progress = RecordingProgress()
+        stats = SpeculationStats()
+
+        self.highlight_with_prediction(editor, runner, progress, "rust", stats)
+        runner.run_all()
+
+        self.assertEqual(2, len(runner.tasks))
+        self.assertFalse(progress.token.cancelled)
+        self.assertIn("gch-lang: python", editor.unwrap_action.contents)
+        self.assertEqual(SpeculationStats(started=1, cancelled=1), stats)
+
+    def test_keeps_wrong_predictions_away_from_the_worker(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        runner = DeferredRunner()
+        worker = MagicMock()
+        worker.highlight_html.return_value = "<code>123</code>"
+        speculative_worker = MagicMock()
+
+        self.highlight_with_prediction(
+            editor,
+            runner,
+            RecordingProgress(),
+            "rust",
+            SpeculationStats(),
+            worker,
+            speculative_worker,
+        )
+        runner.run_all()
+
+        worker.highlight_html.assert_called_once()
+        (_, language, _), _ = worker.highlight_html.call_args
+        self.assertEqual("python", language)
+        speculative_worker.highlight_html.assert_called_once()
+        (_, language, _), kwargs = speculative_worker.highlight_html.call_args
+        self.assertEqual("rust", language)
+        self.assertTrue(kwargs["cancellation"].cancelled)
+
+    def test_keeps_the_budgets_of_speculative_highlights(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        runner = DeferredRunner()
+        errors = []
+        speculative_worker = MagicMock()
+        speculative_worker.highlight_html.side_effect = BudgetExceededError(
+            "The snippet exceeded the time budget of 1 s."
+        )
+
+        self.highlight_with_prediction(
+            editor,
+            runner,
+            RecordingProgress(),
+            "python",
+            SpeculationStats(),
+            speculative_worker=speculative_worker,
+            on_error=errors.append,
+        )
+        runner.run_all()
+
+        self.assertEqual(1, len(runner.tasks))
+        self.assertIn("gch-lang: python", editor.unwrap_action.contents)
+        self.assertEqual(1, len(errors))
+        self.assertIn("time budget", errors[0])
+
+    def test_replaces_the_selection_after_the_task_finishes(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        runner = DeferredRunner()
+        progress = RecordingProgress()
+
+        self.highlight(editor, runner, progress)
+        self.assertIsNone(editor.unwrap_action)
+        runner.run_all()
+
+        self.assertTrue(progress.finished)
+        self.assertIsInstance(editor.unwrap_action, ReplaceWrapSelection)
+
+    def test_cleans_up_the_selection_on_cancel(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        runner = DeferredRunner()
+        progress = RecordingProgress()
+
+        self.highlight(editor, runner, progress)
+        progress.token.cancel()
+        runner.run_all()
+
+        self.assertTrue(progress.finished)
+        self.assertEqual(UnwrapSelection(), editor.unwrap_action)
+
+    def test_reports_errors_and_cleans_up_the_selection(self):
+        editor = MockEditorInterface(SelectedText("123"))
+        errors = []
+
+        def failing_runner(task, on_done):
+            run_in_foreground(lambda: 1 / 0, on_done)
+
+        self.highlight(editor, failing_runner, RecordingProgress(), errors.append)
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(UnwrapSelection(), editor.unwrap_action)
+
+    def test_falls_back_to_plain_text_on_worker_failure(self):
+        editor = MockEditorInterface(SelectedText("return 1"))
+        errors = []
+        worker = MagicMock()
+        worker.highlight_html.side_effect = BudgetExceededError("Too slow.")
+
+        self.highlight(
+            editor, run_in_foreground, RecordingProgress(), errors.append, worker
+        )
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Too slow.", errors[0])
+        self.assertEqual(
+            ReplaceWrapSelection(
+                contents='<code class="gch-pygments"><!-- gch-lang: python -->'
+                + '<span class="go">return 1</span></code>'
+            ),
+            editor.unwrap_action,
+        )
+
+
 class HighlightSelectionTestCase(unittest.TestCase):
 
     def test_highlights_pygments_python_code(self):
         result = highlight_selection(
             code="return 123",
-            highlighter_config_factory=lambda preselected: PygmentsConfig(
+            highlighter_config_factory=lambda preselected, code: PygmentsConfig(
                 display_style=DISPLAY_STYLE.INLINE, language="python"
             ),
             block_style="display:flex; justify-content:center;",
@@ -72,7 +369,7 @@ class HighlightSelectionTestCase(unittest.TestCase):
     def test_quits_on_no_config(self):
         result = highlight_selection(
             code="return 123",
-            highlighter_config_factory=lambda preselected: None,
+            highlighter_config_factory=lambda preselected, code: None,
             block_style="display:flex; justify-content:center;",
             clipboard=EmptyClipboard(),
         )
@@ -82,7 +379,7 @@ class HighlightSelectionTestCase(unittest.TestCase):
     def test_uses_clipboard_on_empty_selection(self):
         result = highlight_selection(
             code="",
-            highlighter_config_factory=lambda preselected: PygmentsConfig(
+            highlighter_config_factory=lambda preselected, code: PygmentsConfig(
                 display_style=DISPLAY_STYLE.INLINE, language="python"
             ),
             block_style="",
@@ -96,6 +393,18 @@ class HighlightSelectionTestCase(unittest.TestCase):
             str(result),
         )
 
+    def test_passes_the_snippet_to_the_config_factory(self):
+        factory = MagicMock(return_value=None)
+
+        highlight_selection(
+            code="",
+            highlighter_config_factory=factory,
+            block_style="",
+            clipboard=StubClipboard("123"),
+        )
+
+        self.assertEqual("123", factory.call_args.args[1])
+
     @patch(
         "codehighlighter.main.config",
         new=InMemoryConfig({"auto-detect-display-style": False}),
@@ -103,7 +412,7 @@ class HighlightSelectionTestCase(unittest.TestCase):
     def test_auto_detect_display_style_disabled(self):
         recorded_preselected = None
 
-        def factory(preselected):
+        def factory(preselected, code):
             nonlocal recorded_preselected
             recorded_preselected = preselected
             return PygmentsConfig(display_style=DISPLAY_STYLE.INLINE, language="python")
@@ -124,7 +433,7 @@ class HighlightSelectionTestCase(unittest.TestCase):
     def test_auto_detect_display_style_enabled_single_line(self):
         recorded_preselected = None
 
-        def factory(preselected):
+        def factory(preselected, code):
             nonlocal recorded_preselected
             recorded_preselected = preselected
             return PygmentsConfig(display_style=DISPLAY_STYLE.INLINE, language="python")
@@ -145,7 +454,7 @@ class HighlightSelectionTestCase(unittest.TestCase):
     def test_auto_detect_display_style_enabled_multi_line(self):
         recorded_preselected = None
 
-        def factory(preselected):
+        def factory(preselected, code):
             nonlocal recorded_preselected
             recorded_preselected = preselected
             return PygmentsConfig(display_style=DISPLAY_STYLE.INLINE, language="python")
@@ -198,12 +507,15 @@ class SyncAssetsHookTestCase(unittest.TestCase):
     @patch("codehighlighter.main.mw")
     @patch("codehighlighter.main.showWarning")
     @patch("codehighlighter.main.create_anki_asset_manager")
-    @patch("codehighlighter.main.has_newer_version")
+    @patch("codehighlighter.assets.has_newer_version")
     @patch("codehighlighter.main.config", new=InMemoryConfig())
     def test_deps_are_present_has_newer_version_runs_sync(
         self, mock_has_newer_version, mock_create_manager, mock_show_warning, mock_mw
     ):
         mock_mw.col = MagicMock()
+        mock_mw.taskman.run_in_background.side_effect = (
+            lambda task, on_done, uses_collection: run_in_foreground(task, on_done)
+        )
         mock_has_newer_version.return_value = True
         fake_manager = MagicMock()
         mock_create_manager.return_value = fake_manager
@@ -212,13 +524,68 @@ class SyncAssetsHookTestCase(unittest.TestCase):
 
         mock_show_warning.assert_not_called()
         mock_create_manager.assert_called_once_with(DEFAULT_CSS_ASSETS, mock_mw.col)
-        fake_manager.delete_assets.assert_called_once()
-        fake_manager.install_assets.assert_called_once()
+        fake_manager.prepare_update.assert_called_once()
+        fake_manager.prepare_update.return_value.assert_called_once()
+        fake_manager.delete_assets.assert_not_called()
+        self.assertTrue(get_asset_sync().get().done())
+
+    @patch("codehighlighter.main.mw")
+    @patch("codehighlighter.main.migrate_wizard_state")
+    @patch("codehighlighter.main.create_anki_asset_manager")
+    @patch("codehighlighter.main.config", new=InMemoryConfig())
+    def test_migrates_the_wizard_state_before_the_sync(
+        self, mock_create_manager, mock_migrate_wizard_state, mock_mw
+    ):
+        mock_mw.col = MagicMock()
+        mock_create_manager.side_effect = lambda *args: (
+            mock_migrate_wizard_state.assert_called_once_with(mock_mw.col.media)
+        )
+
+        sync_assets_hook()
+
+        mock_create_manager.assert_called_once()
 
     @patch("codehighlighter.main.mw")
     @patch("codehighlighter.main.showWarning")
     @patch("codehighlighter.main.create_anki_asset_manager")
-    @patch("codehighlighter.main.has_newer_version")
+    @patch("codehighlighter.assets.has_newer_version")
+    @patch("codehighlighter.main.config", new=InMemoryConfig())
+    def test_runs_the_sync_in_the_background(
+        self, mock_has_newer_version, mock_create_manager, mock_show_warning, mock_mw
+    ):
+        mock_mw.col = MagicMock()
+        mock_has_newer_version.return_value = True
+        fake_manager = MagicMock()
+        mock_create_manager.return_value = fake_manager
+
+        sync_assets_hook()
+
+        mock_mw.taskman.run_in_background.assert_called_once()
+        mock_has_newer_version.assert_not_called()
+        self.assertFalse(get_asset_sync().get().done())
+
+    @patch("codehighlighter.main.mw")
+    @patch("codehighlighter.main.showWarning")
+    @patch("codehighlighter.main.create_anki_asset_manager")
+    @patch("codehighlighter.assets.has_newer_version")
+    @patch("codehighlighter.main.config", new=InMemoryConfig())
+    def test_warns_about_a_failed_sync(
+        self, mock_has_newer_version, mock_create_manager, mock_show_warning, mock_mw
+    ):
+        mock_mw.col = MagicMock()
+        mock_mw.taskman.run_in_background.side_effect = (
+            lambda task, on_done, uses_collection: run_in_foreground(task, on_done)
+        )
+        mock_has_newer_version.side_effect = OSError("Disk full.")
+
+        sync_assets_hook()
+
+        mock_show_warning.assert_called_once()
+
+    @patch("codehighlighter.main.mw")
+    @patch("codehighlighter.main.showWarning")
+    @patch("codehighlighter.main.create_anki_asset_manager")
+    @patch("codehighlighter.assets.has_newer_version")
     @patch(
         "codehighlighter.main.config",
         new=InMemoryConfig({"auto-update-media": False}),
@@ -236,3 +603,252 @@ class SyncAssetsHookTestCase(unittest.TestCase):
         mock_show_warning.assert_not_called()
         mock_create_manager.assert_not_called()
         fake_manager.install_assets.assert_not_called()
+
+
+class MigrateWizardStateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_dir = Path(temp_dir.name) / "collection.media"
+        self.media_dir.mkdir()
+        self.media = MagicMock()
+        self.media.dir.return_value = str(self.media_dir)
+        self.wizard_state = UserFileState(
+            Path(temp_dir.name) / "wizard-state.json",
+            serializer=JSONObjectSerializer(HighlighterWizardStateJSONConverter()),
+            default=HighlighterWizardState(),
+            schedule=lambda delay, fn: None,
+        )
+        patcher = patch(
+            "codehighlighter.main.get_wizard_state", return_value=self.wizard_state
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_moves_the_state_from_the_media_folder(self):
+        (self.media_dir / "_gch-wizard-state.json").write_text(
+            '{"pygments_config": {"display_style": 2, "language": "PHP"}}'
+        )
+
+        state = read_wizard_state(self.media)
+
+        self.assertEqual("PHP", state.pygments_config.language)
+        self.assertTrue(self.wizard_state.path.is_file())
+        self.media.trash_files.assert_called_once_with(["_gch-wizard-state.json"])
+
+    def test_leaves_the_media_folder_alone_without_a_legacy_state(self):
+        state = read_wizard_state(self.media)
+
+        self.assertEqual(HighlighterWizardState(), state)
+        self.media.trash_files.assert_not_called()
+
+    def test_flush_writes_pending_changes(self):
+        self.wizard_state.put(
+            HighlighterWizardState(PygmentsConfig(DISPLAY_STYLE.BLOCK, "PHP"))
+        )
+
+        flush_wizard_state()
+
+        self.assertTrue(self.wizard_state.path.is_file())
+
+
+class GetWizardStateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        patcher = patch(
+            "codehighlighter.userfiles.user_files_directory",
+            return_value=Path(temp_dir.name),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(get_profile_wizard_state.cache_clear)
+
+    @patch("codehighlighter.main.mw")
+    def test_keeps_a_state_per_profile(self, mock_mw):
+        mock_mw.pm.name = "Alice"
+        alice_state = get_wizard_state()
+        mock_mw.pm.name = "Bob"
+        bob_state = get_wizard_state()
+        mock_mw.pm.name = "Alice"
+
+        self.assertIs(alice_state, get_wizard_state())
+        self.assertNotEqual(alice_state.path, bob_state.path)
+
+
+class HighlightActionTestCase(unittest.TestCase):
+
+    @patch("codehighlighter.main.showWarning")
+    @patch("codehighlighter.main.get_lexer_warm_up")
+    def test_waits_for_the_asset_sync(self, mock_get_warm_up, mock_show_warning):
+        asset_sync: Future = Future()
+        get_asset_sync().put(asset_sync)
+        self.addCleanup(get_asset_sync().put, None)
+        editor = MagicMock(note=None)
+
+        highlight_action(editor)
+        mock_show_warning.assert_not_called()
+        asset_sync.set_result(None)
+
+        # The action resumes and complains about the missing note.
+        mock_show_warning.assert_called_once()
+
+
+class WarmUpHookTestCase(unittest.TestCase):
+
+    @patch("codehighlighter.main.mw")
+    @patch("codehighlighter.main.read_wizard_state")
+    @patch("codehighlighter.main.get_lexer_warm_up")
+    def test_warms_up_the_last_language(
+        self, mock_get_warm_up, mock_read_wizard_state, mock_mw
+    ):
+        mock_get_warm_up.return_value = warm_up = MagicMock(budget=2)
+        mock_read_wizard_state.return_value = HighlighterWizardState(
+            PygmentsConfig(display_style=DISPLAY_STYLE.BLOCK, language="PHP")
+        )
+        mock_mw.taskman.run_in_background.side_effect = (
+            lambda task, on_done, uses_collection: run_in_foreground(task, on_done)
+        )
+
+        warm_up_hook()
+
+        warm_up.run.assert_called_once_with(["PHP"])
+
+    @patch("codehighlighter.main.mw")
+    @patch("codehighlighter.main.read_wizard_state")
+    @patch("codehighlighter.main.get_lexer_warm_up")
+    def test_continues_with_the_most_frecent_languages(
+        self, mock_get_warm_up, mock_read_wizard_state, mock_mw
+    ):
+        mock_get_warm_up.return_value = warm_up = MagicMock(budget=2)
+        now = time.time()
+        frecency = Frecency().record("Go", now).record("PHP", now)
+        frecency = frecency.record("Rust", now).record("Rust", now)
+        mock_read_wizard_state.return_value = HighlighterWizardState(
+            PygmentsConfig(display_style=DISPLAY_STYLE.BLOCK, language="PHP"),
+            language_frecency=frecency,
+        )
+        mock_mw.taskman.run_in_background.side_effect = (
+            lambda task, on_done, uses_collection: run_in_foreground(task, on_done)
+        )
+
+        warm_up_hook()
+
+        warm_up.run.assert_called_once_with(["PHP", "Rust", "Go"])
+
+    @patch("codehighlighter.main.mw")
+    @patch("codehighlighter.main.get_lexer_warm_up")
+    def test_does_nothing_without_a_budget(self, mock_get_warm_up, mock_mw):
+        mock_get_warm_up.return_value = MagicMock(budget=0)
+
+        warm_up_hook()
+
+        mock_mw.taskman.run_in_background.assert_not_called()
+
+
+class ResetHighlightingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        for patcher in [
+            patch("codehighlighter.main.mw", new=None),
+            patch(
+                "codehighlighter.main.config",
+                new=InMemoryConfig({"persistent-highlight-cache": False}),
+            ),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(reset_highlighting)
+
+    def test_rebuilds_the_worker_from_the_updated_config(self):
+        worker = get_highlight_worker()
+
+        with patch(
+            "codehighlighter.main.config",
+            new=InMemoryConfig({"highlight-time-budget": 1}),
+        ):
+            reset_highlighting()
+            updated_worker = get_highlight_worker()
+
+        self.assertIsNot(worker, updated_worker)
+        self.assertEqual(1, updated_worker.time_budget)
+        self.assertIsNot(worker, get_lexer_warm_up().worker)
+
+    def test_rebuilds_the_speculative_worker_from_the_updated_config(self):
+        worker = get_speculative_highlight_worker()
+
+        with patch(
+            "codehighlighter.main.config",
+            new=InMemoryConfig({"highlight-time-budget": 1}),
+        ):
+            reset_highlighting()
+            updated_worker = get_speculative_highlight_worker()
+
+        self.assertIsNot(worker, updated_worker)
+        self.assertEqual(1, updated_worker.time_budget)
+
+    def test_clears_the_highlight_cache(self):
+        cache = get_highlight_cache()
+
+        reset_highlighting()
+
+        self.assertIsNot(cache, get_highlight_cache())
+
+
+class CreateLanguagePreviewTestCase(unittest.TestCase):
+
+    @patch("codehighlighter.main.get_preview_stylesheet", return_value="")
+    @patch("codehighlighter.main.get_highlight_cache")
+    @patch("codehighlighter.preview.LanguagePreviewer")
+    def test_previews_bypass_the_highlight_cache(
+        self, mock_previewer, mock_get_highlight_cache, _
+    ):
+        get_preview_cache.cache_clear()
+        self.addCleanup(get_preview_cache.cache_clear)
+        create_language_preview(PlainString("x = 1"), "")(DISPLAY_STYLE.BLOCK)
+        (render, *_), _ = mock_previewer.call_args
+
+        html = render("Python", CancellationToken())
+
+        self.assertIn("gch-pygments", html)
+        mock_get_highlight_cache.assert_not_called()
+        self.assertEqual(1, get_preview_cache().stats().misses)
+
+
+class RenderHighlightRequestTestCase(unittest.TestCase):
+
+    def test_caches_highlights_per_worker_budget(self):
+        cache = HighlightCache()
+        request = HighlightRequest(PlainString("x = 1"), "Python", create_block_style())
+        worker = MagicMock(time_budget=5, memory_budget=1024)
+        worker.highlight_html.return_value = "<code>x = 1</code>"
+        tighter_worker = MagicMock(time_budget=1, memory_budget=1024)
+        tighter_worker.highlight_html.return_value = "<code>x = 1</code>"
+
+        render_highlight_request(request, cache, worker=worker)
+        render_highlight_request(request, cache, worker=worker)
+        render_highlight_request(request, cache, worker=tighter_worker)
+
+        worker.highlight_html.assert_called_once()
+        tighter_worker.highlight_html.assert_called_once()
+
+
+class InjectEditorHelperTestCase(unittest.TestCase):
+
+    def test_injects_the_helper_into_editors(self):
+        import aqt.editor
+
+        web_content = MagicMock(head="")
+
+        inject_editor_helper(web_content, MagicMock(spec=aqt.editor.Editor))
+
+        self.assertIn(EDITOR_HELPER_JS, web_content.head)
+
+    def test_leaves_other_pages_alone(self):
+        web_content = MagicMock(head="")
+
+        inject_editor_helper(web_content, object())
+
+        self.assertEqual("", web_content.head)
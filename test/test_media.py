@@ -0,0 +1,171 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from codehighlighter.media import (
+    asset_manifest,
+    delete_media_assets,
+    installed_media_assets,
+    update_media_assets,
+)
+
+MANIFEST = Path("_gch-asset-manifest.json")
+
+
+class FakeMediaManager:
+    """A media manager that works on a directory."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.added: list[str] = []
+        self.trashed: list[str] = []
+
+    def dir(self) -> str:
+        return str(self.directory)
+
+    def add_file(self, path: str) -> str:
+        shutil.copy(path, self.directory)
+        self.added.append(Path(path).name)
+        return Path(path).name
+
+    def trash_files(self, names: list[str]) -> None:
+        for name in names:
+            (self.directory / name).unlink()
+        self.trashed.extend(names)
+
+
+class MediaDirectoryTestCase(unittest.TestCase):
+    """A test case with a bundled assets directory and a media directory."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.assets_dir = Path(temp_dir.name) / "assets"
+        self.media_dir = Path(temp_dir.name) / "collection.media"
+        self.assets_dir.mkdir()
+        self.media_dir.mkdir()
+        self.media = FakeMediaManager(self.media_dir)
+
+    def asset(self, name: str, content: str) -> Path:
+        path = self.assets_dir / name
+        path.write_text(content)
+        return path
+
+
+class UpdateMediaAssetsTestCase(MediaDirectoryTestCase):
+
+    def test_installs_missing_assets(self):
+        assets = [self.asset("_gch-a.css", "a"), self.asset("_gch-b.css", "b")]
+
+        installed = update_media_assets(assets, self.media, MANIFEST)
+
+        self.assertEqual(["_gch-a.css", "_gch-b.css"], installed)
+        self.assertEqual("a", (self.media_dir / "_gch-a.css").read_text())
+        self.assertEqual([], self.media.trashed)
+
+    def test_leaves_identical_assets_untouched(self):
+        assets = [self.asset("_gch-a.css", "a"), self.asset("_gch-b.css", "b")]
+        update_media_assets(assets, self.media, MANIFEST)
+        self.media.added.clear()
+        self.asset("_gch-b.css", "new b")
+
+        installed = update_media_assets(assets, self.media, MANIFEST)
+
+        self.assertEqual(["_gch-b.css"], installed)
+        self.assertEqual(["_gch-b.css"], self.media.added)
+        self.assertEqual(["_gch-b.css"], self.media.trashed)
+        self.assertEqual("new b", (self.media_dir / "_gch-b.css").read_text())
+
+    def test_replaces_modified_media_files(self):
+        assets = [self.asset("_gch-a.css", "a")]
+        update_media_assets(assets, self.media, MANIFEST)
+        (self.media_dir / "_gch-a.css").write_text("edited")
+
+        installed = update_media_assets(assets, self.media, MANIFEST)
+
+        self.assertEqual(["_gch-a.css"], installed)
+        self.assertEqual("a", (self.media_dir / "_gch-a.css").read_text())
+
+    def test_trashes_assets_that_are_no_longer_bundled(self):
+        old_asset = self.asset("_gch-old.css", "old")
+        update_media_assets([old_asset], self.media, MANIFEST)
+        new_asset = self.asset("_gch-new.css", "new")
+
+        update_media_assets([new_asset], self.media, MANIFEST)
+
+        self.assertEqual(["_gch-old.css"], self.media.trashed)
+        self.assertFalse((self.media_dir / "_gch-old.css").exists())
+
+    def test_trashes_stale_assets_of_versions_without_a_manifest(self):
+        (self.media_dir / "_gch-old.css").write_text("old")
+        (self.media_dir / "image.png").write_text("")
+        new_asset = self.asset("_gch-new.css", "new")
+
+        update_media_assets([new_asset], self.media, MANIFEST, "_gch-")
+        self.media.trashed.clear()
+        (self.media_dir / "_gch-user.css").write_text("")
+        update_media_assets([new_asset], self.media, MANIFEST, "_gch-")
+
+        self.assertFalse((self.media_dir / "_gch-old.css").exists())
+        self.assertTrue((self.media_dir / "image.png").exists())
+        # The manifest exists now, so the second update didn't list the media.
+        self.assertEqual([], self.media.trashed)
+
+    def test_records_the_manifest(self):
+        assets = [self.asset("_gch-a.css", "a")]
+
+        update_media_assets(assets, self.media, MANIFEST)
+
+        self.assertIn(
+            asset_manifest(assets)["_gch-a.css"],
+            (self.media_dir / MANIFEST).read_text(),
+        )
+
+
+class InstalledMediaAssetsTestCase(MediaDirectoryTestCase):
+
+    def test_finds_assets_in_the_ledger(self):
+        old_asset = self.asset("_gch-old.css", "old")
+        update_media_assets([old_asset], self.media, MANIFEST)
+        (self.media_dir / "_gch-wizard-state.json").write_text("{}")
+        (self.media_dir / "image.png").write_text("")
+
+        installed = installed_media_assets(
+            "_gch-", [self.asset("_gch-new.css", "new")], self.media, MANIFEST
+        )
+
+        self.assertEqual(["_gch-old.css", str(MANIFEST)], installed)
+
+    def test_finds_bundled_assets_without_a_ledger(self):
+        asset = self.asset("_gch-a.css", "a")
+        (self.media_dir / "_gch-a.css").write_text("a")
+
+        installed = installed_media_assets("_gch-", [asset], self.media, MANIFEST)
+
+        self.assertEqual(["_gch-a.css"], installed)
+
+    def test_finds_assets_of_versions_without_a_ledger(self):
+        (self.media_dir / "_gch-old.css").write_text("old")
+        (self.media_dir / "image.png").write_text("")
+
+        installed = installed_media_assets("_gch-", [], self.media, MANIFEST)
+
+        self.assertEqual(["_gch-old.css"], installed)
+
+    def test_ignores_ledger_entries_without_the_prefix(self):
+        (self.media_dir / MANIFEST).write_text('{"image.png": ""}')
+        (self.media_dir / "image.png").write_text("")
+
+        installed = installed_media_assets("_gch-", [], self.media, MANIFEST)
+
+        self.assertEqual([str(MANIFEST)], installed)
+
+    def test_delete_trashes_installed_assets(self):
+        assets = [self.asset("_gch-a.css", "a")]
+        update_media_assets(assets, self.media, MANIFEST)
+        (self.media_dir / "image.png").write_text("")
+
+        delete_media_assets("_gch-", assets, self.media, MANIFEST)
+
+        self.assertEqual(["image.png"], [p.name for p in self.media_dir.iterdir()])
@@ -0,0 +1,124 @@
+import unittest
+
+from codehighlighter.background import Cancelled, run_in_foreground
+from codehighlighter.html import HtmlString, PlainString
+from codehighlighter.preview import LanguagePreviewer, preview_snippet
+
+
+class ManualScheduler:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, delay, fn):
+        self.calls.append(fn)
+
+    def run_all(self):
+        calls, self.calls = self.calls, []
+        for fn in calls:
+            fn()
+
+
+class DeferredRunner:
+    """A runner that finishes tasks only when told to."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def __call__(self, task, on_done):
+        self.jobs.append((task, on_done))
+
+    def finish(self, i):
+        task, on_done = self.jobs[i]
+        run_in_foreground(task, on_done)
+
+
+class PreviewSnippetTestCase(unittest.TestCase):
+
+    def test_keeps_the_first_lines(self):
+        self.assertEqual("a\nb\n", preview_snippet(PlainString("a\nb\nc\n"), lines=2))
+
+    def test_keeps_short_snippets(self):
+        self.assertEqual("a\nb", preview_snippet(PlainString("a\nb"), lines=2))
+
+    def test_cuts_long_lines(self):
+        self.assertEqual(
+            "abc\nd\nxyz",
+            preview_snippet(PlainString("abcdef\nd\nxyzw"), columns=3),
+        )
+
+    def test_caps_the_characters(self):
+        self.assertEqual(
+            "ab\ncd\ne",
+            preview_snippet(PlainString("ab\ncd\nef\ngh\n"), characters=7),
+        )
+
+
+class LanguagePreviewerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.rendered = []
+        self.shown = []
+        self.scheduler = ManualScheduler()
+
+    def render(self, language, token):
+        self.rendered.append(language)
+        token.raise_if_cancelled()
+        return HtmlString(f"<b>{language}</b>")
+
+    def test_renders_only_the_latest_language(self):
+        previewer = LanguagePreviewer(self.render, run_in_foreground, self.scheduler)
+
+        previewer.preview("C", self.shown.append)
+        previewer.preview("Go", self.shown.append)
+        self.scheduler.run_all()
+
+        self.assertEqual(["Go"], self.rendered)
+        self.assertEqual(["<b>Go</b>"], self.shown)
+
+    def test_reuses_rendered_previews(self):
+        previewer = LanguagePreviewer(self.render, run_in_foreground, self.scheduler)
+        previewer.preview("Go", self.shown.append)
+        self.scheduler.run_all()
+
+        previewer.preview("Go", self.shown.append)
+
+        self.assertEqual(["Go"], self.rendered)
+        self.assertEqual(["<b>Go</b>", "<b>Go</b>"], self.shown)
+        self.assertEqual([], self.scheduler.calls)
+
+    def test_cancels_stale_renders(self):
+        runner = DeferredRunner()
+        previewer = LanguagePreviewer(self.render, runner, self.scheduler)
+        previewer.preview("C", self.shown.append)
+        self.scheduler.run_all()
+
+        previewer.preview("Go", self.shown.append)
+        self.scheduler.run_all()
+        runner.finish(1)
+        runner.finish(0)
+
+        self.assertEqual(["<b>Go</b>"], self.shown)
+
+    def test_cancel_drops_the_pending_preview(self):
+        previewer = LanguagePreviewer(self.render, run_in_foreground, self.scheduler)
+        previewer.preview("Go", self.shown.append)
+
+        previewer.cancel()
+        self.scheduler.run_all()
+
+        self.assertEqual([], self.rendered)
+        self.assertEqual([], self.shown)
+
+    def test_failed_renders_show_nothing(self):
+        def fail(language, token):
+            raise Cancelled()
+
+        previewer = LanguagePreviewer(fail, run_in_foreground, self.scheduler)
+        previewer.preview("Go", self.shown.append)
+        self.scheduler.run_all()
+
+        self.assertEqual([], self.shown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,16 @@
+import concurrent.futures
 import unittest
 
 from codehighlighter.html import PlainString
 from codehighlighter.pygments_highlighter import (
     SUPPORTED_LEXERS,
+    HighlightRequest,
+    create_block_style,
     create_inline_style,
     get_lexer_name_alias_map,
     highlight,
+    highlight_html,
+    highlight_many,
 )
 
 
@@ -34,3 +39,29 @@ class PygmentsHighlighterTestCase(unittest.TestCase):
             + '<span class="w"> </span><span class="no">r1</span><span class="p">,</span><span class="w"> </span><span class="no">r0</span>'
             + "</code>",
         )
+
+
+REQUESTS = [
+    HighlightRequest(PlainString("return 1"), "Python", create_inline_style()),
+    HighlightRequest(PlainString("int x;"), "C++", create_block_style()),
+    HighlightRequest(PlainString("return 2"), "Python", create_inline_style()),
+    HighlightRequest(PlainString("free text"), "doesnotexist", create_block_style()),
+    HighlightRequest(PlainString("return 3"), "Python", create_block_style()),
+]
+
+
+class HighlightManyTestCase(unittest.TestCase):
+    def expected(self) -> list[str]:
+        return [highlight_html(r.code, r.language, r.style) for r in REQUESTS]
+
+    def test_returns_results_in_request_order(self):
+        self.assertEqual(highlight_many(REQUESTS), self.expected())
+
+    def test_returns_results_in_request_order_with_an_executor(self):
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            self.assertEqual(
+                highlight_many(REQUESTS, executor, chunksize=1), self.expected()
+            )
+
+    def test_handles_no_requests(self):
+        self.assertEqual(highlight_many([]), [])
@@ -0,0 +1,158 @@
+import re
+import tracemalloc
+import unittest
+
+import bs4
+import pygments
+import pygments.formatters
+
+from codehighlighter import pygments_highlighter
+from codehighlighter.background import CancellationToken, Cancelled
+from codehighlighter.bs4extra import create_soup, encode_soup
+from codehighlighter.html import HtmlString, PlainString
+from codehighlighter.pygments_highlighter import (
+    HtmlStyle,
+    create_block_style,
+    create_inline_style,
+    highlight_chunks,
+    highlight_html,
+)
+from codehighlighter.pygmentsformatter import escape_html5, quote_attribute_value
+
+
+def reference_highlight(code: str, language: str, style: HtmlStyle) -> HtmlString:
+    """Highlights code the way the add-on did before GchHtmlFormatter.
+
+    It runs the stock HTML formatter, cleans up its output, and serializes it
+    through BeautifulSoup.
+    """
+    lexer = (
+        pygments_highlighter.get_lexer_by_name(language)
+        or pygments_highlighter.get_plaintext_lexer()
+    )
+    htmlf = (
+        pygments.formatters.get_formatter_by_name("html", nowrap=True)
+        if style.display_style == "inline"
+        else pygments.formatters.get_formatter_by_name("html")
+    )
+    highlighted = pygments.highlight(code, lexer, htmlf)
+    highlighted = re.sub('<span class="w"></span>', "", highlighted)
+    comment = f"<!-- gch-lang: {language} -->"
+    if style.display_style == "inline":
+        highlighted = f'<code class="gch-pygments">{comment}' + highlighted + "</code>"
+        highlighted = re.sub("</span>\n</code>$", "</span></code>", highlighted)
+    else:
+        highlighted = highlighted.strip()
+        highlighted = highlighted.removeprefix('<div class="highlight">')
+        highlighted = highlighted.removesuffix("</div>")
+        highlighted = highlighted.removeprefix("<pre>")
+        highlighted = highlighted.removesuffix("</pre>")
+        highlighted = highlighted.removeprefix("<span></span>")
+        style_attr = f' style="{style.block_style}"' if style.block_style else ""
+        highlighted = (
+            f'<div class="gch-pygments"{style_attr}>\n'
+            + f"  <pre><code>{comment}{highlighted}</code></pre>\n"
+            + "</div>\n"
+        )
+    return encode_soup(create_soup(HtmlString(highlighted)))
+
+
+SNIPPETS: list[tuple[str, str]] = [
+    ("C++", "int main() {\n  return a && b; // done\n}\n"),
+    ("C++", '/* multi\n   line */\nconst char* s = "<b>&amp;</b>";'),
+    ("Python", "def f(x):\n    '''Doc & more'''\n    return x > 1\n"),
+    ("Python", "print('naïve café → λ ≧̸ ≧')\n\n\n"),
+    ("Python", "x    =  1\n  y\t= 2"),
+    ("HTML", '<a href="x?a=1&b=2">say "hi" \'x\'</a>\n'),
+    ("Bash", "echo $HOME && ls -la | grep '&lt;' > out\n"),
+    ("Text only", "true &amp &amp; &lt;x&gt; &#39; &#x27;"),
+    ("Text only", ""),
+    ("Text only", "   \n\t tabbed\n\n"),
+    ("ARM", "mov  r1, r0 @ comment\n.text\n"),
+    ("Diff", "--- a\n+++ b\n@@ -1 +1 @@\n-old\n+new\n"),
+    ("JSON", '{"a": [1, 2.5, "x&y"], "b": null}'),
+    ("Haskell", 'main = putStrLn "¬ ∀ x → y" >>= \\_ -> pure ()'),
+    ("Rust", 'fn main() { let x: &str = "\\u{2267}"; }\r\n'),
+    ("doesnotexist", "free-form <text>"),
+]
+
+STYLES: list[HtmlStyle] = [
+    create_inline_style(),
+    create_block_style(),
+    create_block_style(""),
+    create_block_style("font-family: Fira &amp; Code; color: <red>"),
+]
+
+
+class GchHtmlFormatterTestCase(unittest.TestCase):
+
+    def test_output_matches_the_beautifulsoup_pipeline(self):
+        for language, code in SNIPPETS:
+            for style in STYLES:
+                with self.subTest(language=language, code=code, style=style):
+                    self.assertEqual(
+                        highlight_html(PlainString(code), language, style),
+                        reference_highlight(code, language, style),
+                    )
+
+    def test_output_is_stable_under_beautifulsoup_round_trip(self):
+        html = highlight_html(PlainString("a < b && c\n"), "C++", create_block_style())
+        self.assertEqual(encode_soup(create_soup(html)), html)
+
+    def test_highlight_returns_parsed_output(self):
+        result = pygments_highlighter.highlight(
+            PlainString("true"), "C++", create_inline_style()
+        )
+        self.assertIsInstance(result, bs4.BeautifulSoup)
+
+    def test_escape_html5_skips_plain_ascii(self):
+        self.assertEqual(escape_html5("return x;"), "return x;")
+        self.assertEqual(escape_html5("a < b & c"), "a &lt; b & c")
+
+    def test_quote_attribute_value_prefers_double_quotes(self):
+        self.assertEqual(quote_attribute_value("display:flex;"), '"display:flex;"')
+        self.assertEqual(quote_attribute_value('font: "A"'), "'font: \"A\"'")
+
+    def test_stops_once_cancelled(self):
+        token = CancellationToken()
+        token.cancel()
+        with self.assertRaises(Cancelled):
+            highlight_html(PlainString("a\nb\n"), "Python", create_block_style(), token)
+
+
+class HighlightChunksTestCase(unittest.TestCase):
+
+    def test_chunks_concatenate_to_the_full_markup(self):
+        for language, code in SNIPPETS:
+            for style in STYLES:
+                with self.subTest(language=language, code=code, style=style):
+                    self.assertEqual(
+                        "".join(
+                            highlight_chunks(
+                                PlainString(code), language, style, chunk_size=8
+                            )
+                        ),
+                        highlight_html(PlainString(code), language, style),
+                    )
+
+    def test_peak_memory_is_bounded_by_the_chunk_size(self):
+        code = PlainString("x = f(1, 'a') + y  # comment\n" * 3000)
+        chunk_size = 4 * 1024
+        # Warm up the lexer and the formatter's caches.
+        for _ in highlight_chunks(code, "Python", create_block_style(), chunk_size):
+            pass
+
+        tracemalloc.start()
+        try:
+            for chunk in highlight_chunks(
+                code, "Python", create_block_style(), chunk_size
+            ):
+                self.assertLess(len(chunk), 2 * chunk_size)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Pygments copies the code while preprocessing it. The markup is many
+        # times larger than the code, so the peak shows that it was never held
+        # as a whole.
+        self.assertLess(peak, 2 * len(code) + 16 * chunk_size)
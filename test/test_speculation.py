@@ -0,0 +1,78 @@
+import unittest
+
+from codehighlighter.background import Cancelled, run_in_foreground
+from codehighlighter.speculation import Speculation, SpeculationStats
+
+
+class DeferredRunner:
+    """A runner that runs tasks only when told to."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def __call__(self, task, on_done):
+        self.tasks.append((task, on_done))
+
+    def run_all(self):
+        for task, on_done in self.tasks:
+            run_in_foreground(task, on_done)
+
+
+def double(x, token):
+    token.raise_if_cancelled()
+    return 2 * x
+
+
+class SpeculationTestCase(unittest.TestCase):
+
+    def test_a_right_guess_hands_over_the_result(self):
+        stats = SpeculationStats()
+        speculation = Speculation(21, double, run_in_foreground, stats)
+        results = []
+
+        self.assertTrue(speculation.take(21))
+        speculation.add_done_callback(lambda f: results.append(f.result()))
+
+        self.assertEqual([42], results)
+        self.assertEqual(SpeculationStats(started=1, used=1), stats)
+
+    def test_a_right_guess_waits_for_the_task(self):
+        runner = DeferredRunner()
+        speculation = Speculation(21, double, runner)
+        results = []
+        speculation.take(21)
+        speculation.add_done_callback(lambda f: results.append(f.result()))
+
+        self.assertEqual([], results)
+        runner.run_all()
+
+        self.assertEqual([42], results)
+
+    def test_a_wrong_guess_cancels_the_task(self):
+        runner = DeferredRunner()
+        stats = SpeculationStats()
+        speculation = Speculation(21, double, runner, stats)
+        results = []
+        speculation.add_done_callback(results.append)
+
+        self.assertFalse(speculation.take(1))
+        runner.run_all()
+
+        self.assertTrue(speculation.token.cancelled)
+        self.assertEqual([], results)
+        self.assertEqual(SpeculationStats(started=1, cancelled=1), stats)
+
+    def test_cancelled_tasks_fail(self):
+        runner = DeferredRunner()
+        speculation = Speculation(21, double, runner)
+        speculation.cancel()
+        runner.run_all()
+
+        futures = []
+        speculation.add_done_callback(futures.append)
+
+        self.assertIsInstance(futures[0].exception(), Cancelled)
+
+
+if __name__ == "__main__":
+    unittest.main()
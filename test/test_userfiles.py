@@ -0,0 +1,110 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from codehighlighter.userfiles import UserFileState
+
+
+class JSONSerializer:
+    def loads(self, content):
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            return None
+
+    def dumps(self, t):
+        return json.dumps(t)
+
+
+class ManualScheduler:
+    """A scheduler that runs delayed calls when told to."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, delay, fn):
+        self.calls.append(fn)
+
+    def run_all(self):
+        calls, self.calls = self.calls, []
+        for fn in calls:
+            fn()
+
+
+class UserFileStateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "state.json"
+        self.scheduler = ManualScheduler()
+
+    def state(self):
+        return UserFileState(
+            self.path, JSONSerializer(), default="default", schedule=self.scheduler
+        )
+
+    def test_returns_the_default_without_a_file(self):
+        self.assertEqual("default", self.state().get())
+
+    def test_reads_the_file(self):
+        self.path.write_text('"saved"')
+
+        self.assertEqual("saved", self.state().get())
+
+    def test_falls_back_to_the_default_on_a_corrupt_file(self):
+        self.path.write_text("{")
+
+        self.assertEqual("default", self.state().get())
+
+    def test_falls_back_to_the_default_if_the_serializer_raises(self):
+        class StrictSerializer(JSONSerializer):
+            def loads(self, content):
+                return json.loads(content)["state"]
+
+        self.path.write_text('{"old": "format"}')
+        state = UserFileState(
+            self.path, StrictSerializer(), default="default", schedule=self.scheduler
+        )
+
+        with self.assertLogs("codehighlighter.userfiles", level="WARNING"):
+            self.assertEqual("default", state.get())
+
+    def test_writes_changes_once_debounced(self):
+        state = self.state()
+
+        state.put("a")
+        state.put("b")
+        self.assertFalse(self.path.exists())
+        self.assertEqual("b", state.get())
+        self.scheduler.run_all()
+
+        self.assertEqual('"b"', self.path.read_text())
+
+    def test_postpones_writes_for_later_changes(self):
+        state = self.state()
+        state.put("a")
+        first_write = self.scheduler.calls[0]
+
+        state.put("b")
+        first_write()
+
+        self.assertFalse(self.path.exists())
+
+    def test_skips_unchanged_state(self):
+        self.path.write_text('"saved"')
+        state = self.state()
+
+        state.put("saved")
+
+        self.assertEqual([], self.scheduler.calls)
+
+    def test_flush_writes_dirty_state(self):
+        state = self.state()
+        state.put("a")
+
+        state.flush()
+
+        self.assertEqual('"a"', self.path.read_text())
+        self.assertTrue(state.exists())
@@ -0,0 +1,75 @@
+import unittest
+
+from codehighlighter.highlight_worker import WorkerError
+from codehighlighter.warmup import LexerWarmUp
+
+
+class RecordingWorker:
+    def __init__(self, on_highlight=lambda language: None):
+        self.languages = []
+        self.on_highlight = on_highlight
+
+    def highlight_html(self, code, language, style):
+        self.languages.append(language)
+        self.on_highlight(language)
+        return ""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class LexerWarmUpTestCase(unittest.TestCase):
+    def test_warms_up_the_worker_in_order(self):
+        worker = RecordingWorker()
+        warm_up = LexerWarmUp(worker, budget=10)  # type: ignore
+
+        warm_up.run(["C++", "Python"])
+
+        self.assertEqual(["C++", "Python"], worker.languages)
+        self.assertEqual(["C++", "Python"], warm_up.warmed)
+
+    def test_warms_up_in_process_without_a_worker(self):
+        warm_up = LexerWarmUp(None, budget=10)
+
+        warm_up.run(["Python"])
+
+        self.assertEqual(["Python"], warm_up.warmed)
+
+    def test_stops_once_the_budget_runs_out(self):
+        clock = FakeClock()
+
+        def advance(language):
+            clock.now += 1
+
+        warm_up = LexerWarmUp(
+            RecordingWorker(advance), budget=1.5, clock=clock  # type: ignore
+        )
+
+        warm_up.run(["C++", "Python", "PHP"])
+
+        self.assertEqual(["C++", "Python"], warm_up.warmed)
+
+    def test_stops_when_asked_to(self):
+        def stop(language):
+            warm_up.stop()
+
+        warm_up = LexerWarmUp(RecordingWorker(stop), budget=10)  # type: ignore
+
+        warm_up.run(["C++", "Python"])
+
+        self.assertEqual(["C++"], warm_up.warmed)
+
+    def test_stops_on_worker_failure(self):
+        def fail(language):
+            raise WorkerError("The worker process has died.")
+
+        warm_up = LexerWarmUp(RecordingWorker(fail), budget=10)  # type: ignore
+
+        warm_up.run(["C++", "Python"])
+
+        self.assertEqual([], warm_up.warmed)
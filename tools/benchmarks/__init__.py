@@ -0,0 +1,42 @@
+"""Benchmarks for Code Highlighter's hot paths.
+
+Run a benchmark with `just benchmark <name>`, e.g., `just benchmark formatter`.
+"""
+
+import time
+from collections.abc import Callable
+
+__all__ = ["measure", "report", "synthetic_python"]
+
+# A small, token-dense Python snippet used to build larger inputs.
+_PYTHON_SNIPPET = '''\
+def fibonacci(n: int) -> list[int]:
+    """Returns the first n Fibonacci numbers & more."""
+    numbers = [0, 1]
+    while len(numbers) < n:  # Keep going.
+        numbers.append(numbers[-1] + numbers[-2])
+    return numbers[:n] if n > 0 else []
+'''
+
+
+def synthetic_python(lines: int) -> str:
+    """Returns a Python snippet with the given number of lines."""
+    snippet_lines = _PYTHON_SNIPPET.splitlines(keepends=True)
+    repeated = snippet_lines * (lines // len(snippet_lines) + 1)
+    return "".join(repeated[:lines])
+
+
+def measure(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Returns the best wall-clock time of `fn` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(label: str, seconds: float, baseline: float | None = None) -> None:
+    """Prints a benchmark result, optionally with a speedup over a baseline."""
+    speedup = f"  ({baseline / seconds:.2f}x)" if baseline else ""
+    print(f"{label:<40} {seconds * 1000:10.2f} ms{speedup}")
@@ -0,0 +1,66 @@
+"""Compares highlight_many backends on a mixed-language corpus."""
+
+import concurrent.futures
+import os
+
+from codehighlighter.highlight_worker import HighlightWorkerPool
+from codehighlighter.html import PlainString
+from codehighlighter.pygments_highlighter import (
+    HighlightRequest,
+    create_block_style,
+    create_inline_style,
+    highlight_html,
+    highlight_many,
+)
+
+from . import measure, report, synthetic_python
+
+_SNIPPETS = {
+    "C++": "int main() {\n  std::vector<int> v{1, 2, 3};\n  return v.size();\n}\n",
+    "Haskell": "main :: IO ()\nmain = mapM_ print [x * x | x <- [1 .. 10]]\n",
+    "JavaScript": "const f = (xs) => xs.filter((x) => x > 1).map(String);\n",
+    "Python": synthetic_python(12),
+    "Rust": 'fn main() {\n    println!("{}", (1..10).sum::<i32>());\n}\n',
+    "SQL": "SELECT id, name FROM notes WHERE mid = 42 ORDER BY id;\n",
+}
+
+
+def corpus(size: int) -> list[HighlightRequest]:
+    """Returns a corpus that resembles a deck of mixed code notes."""
+    languages = sorted(_SNIPPETS)
+    styles = [create_block_style(), create_inline_style()]
+    return [
+        HighlightRequest(
+            PlainString(_SNIPPETS[languages[i % len(languages)]]),
+            languages[i % len(languages)],
+            styles[i % len(styles)],
+        )
+        for i in range(size)
+    ]
+
+
+def main():
+    requests = corpus(3000)
+    workers = os.cpu_count() or 1
+    baseline = measure(
+        lambda: [highlight_html(r.code, r.language, r.style) for r in requests],
+        repeat=3,
+    )
+    report(f"{len(requests)} snippets, highlight_html loop", baseline)
+    serial = measure(lambda: highlight_many(requests), repeat=3)
+    report("highlight_many, serial", serial, baseline)
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        threaded = measure(lambda: highlight_many(requests, executor), repeat=3)
+    report(f"highlight_many, {workers}-thread pool", threaded, baseline)
+    pool = HighlightWorkerPool(workers)
+    try:
+        # Warm up the workers, so that the measurement excludes their start-up.
+        pool.highlight_many(requests[:workers], chunksize=1)
+        processes = measure(lambda: pool.highlight_many(requests), repeat=3)
+    finally:
+        pool.close()
+    report(f"highlight_many, {workers}-process pool", processes, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measures the editor round trips of one highlight with a simulated bridge.
+
+Each call to the webview costs a round trip through Qt's JavaScript bridge.
+The simulated editor sleeps for a fixed delay per round trip.
+"""
+
+import time
+
+from . import measure, report, stubaqt
+
+# The highlight flow lives in main.py, which imports Anki.
+stubaqt.install()
+
+from codehighlighter.ankieditorextra import (  # noqa: E402
+    EditorInterface,
+    SelectedText,
+    transform_selection_async,
+)
+from codehighlighter.field import (  # noqa: E402
+    set_up_style_import,
+    style_import_block,
+)
+from codehighlighter.main import (  # noqa: E402
+    DEFAULT_CSS_ASSETS,
+    GUARD,
+    set_up_field_styles,
+)
+
+# A typical round trip through the bridge of a busy editor.
+BRIDGE_DELAY = 0.005
+
+_HIGHLIGHTED = '<code class="gch-pygments"><span class="mi">123</span></code>'
+
+
+class SimulatedBridgeEditor(EditorInterface):
+    """An editor that pays a delay per round trip."""
+
+    def __init__(self, note_field_html: str, delay: float = BRIDGE_DELAY):
+        self.note_field_html = note_field_html
+        self.delay = delay
+        self.round_trips = 0
+
+    def round_trip(self) -> None:
+        self.round_trips += 1
+        time.sleep(self.delay)
+
+    def wrap_and_get_selection(self, cb):
+        self.round_trip()
+        cb(SelectedText("123"))
+
+    def unwrap_selection(self, action, cb):
+        self.round_trip()
+        cb(None)
+
+    def replace_selection_and_ensure_styles(self, action, style_block, cb):
+        self.round_trip()
+        if not self.note_field_html.startswith(style_block):
+            # The editor inserts a missing block or replaces a stale one.
+            self.note_field_html = set_up_style_import(
+                self.note_field_html, DEFAULT_CSS_ASSETS, GUARD
+            )
+        cb(True)
+
+    def get_note_field(self, cb):
+        self.round_trip()
+        cb(self.note_field_html)
+
+    def set_note_field(self, html, cb):
+        self.round_trip()
+        self.note_field_html = html
+        cb(None)
+
+
+def highlight(editor: EditorInterface, combined: bool) -> None:
+    """Runs the highlight flow of main.highlight with a ready highlight."""
+
+    def set_up_styles() -> None:
+        set_up_field_styles(editor, print)
+
+    if combined:
+        transform_selection_async(
+            lambda code, on_highlighted: on_highlighted(_HIGHLIGHTED),
+            editor,
+            on_error=print,
+            style_block=style_import_block(DEFAULT_CSS_ASSETS, GUARD),
+            on_stale_styles=set_up_styles,
+        )
+    else:
+        transform_selection_async(
+            lambda code, on_highlighted: on_highlighted(_HIGHLIGHTED),
+            editor,
+            on_error=print,
+            on_done=set_up_styles,
+        )
+
+
+def main():
+    print(f"Simulated bridge delay: {BRIDGE_DELAY * 1000:.0f} ms per round trip.")
+    plain_field = "<p>Some code:</p>"
+    set_up_field = set_up_style_import(plain_field, DEFAULT_CSS_ASSETS, GUARD)
+    for field_label, field in [
+        ("set-up field", set_up_field),
+        ("new field", plain_field),
+    ]:
+        baseline = None
+        for label, combined in [("Separate calls", False), ("Combined call", True)]:
+            editors: list[SimulatedBridgeEditor] = []
+
+            def run(
+                editors: list[SimulatedBridgeEditor] = editors,
+                field: str = field,
+                combined: bool = combined,
+            ) -> None:
+                editors.append(SimulatedBridgeEditor(field))
+                highlight(editors[-1], combined)
+
+            seconds = measure(run, repeat=10)
+            label = f"{label}, {field_label} ({editors[-1].round_trips} trips)"
+            report(label, seconds, baseline)
+            baseline = baseline or seconds
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measures the latency of the first highlight after Anki starts.
+
+Each measurement runs in a fresh interpreter with the add-on already loaded,
+so it includes finding and loading the lexer. For reference, the benchmark
+also measures a lookup that walks all Pygments lexers, as the add-on used to.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from . import report
+
+_REPOSITORY = Path(__file__).parents[2]
+
+_FIRST_HIGHLIGHT = """
+import time
+from tools.benchmarks import stubaqt
+stubaqt.install()
+from codehighlighter.pygments_highlighter import create_inline_style, highlight_html
+start = time.perf_counter()
+highlight_html("return 1", "Python", create_inline_style())
+print(time.perf_counter() - start)
+"""
+
+_LEXER_WALK = """
+import time
+import pygments.lexers
+start = time.perf_counter()
+names = {t[0]: t[1][0] for t in pygments.lexers.get_all_lexers() if t[1]}
+pygments.lexers.get_lexer_by_name(names["Python"])
+print(time.perf_counter() - start)
+"""
+
+
+def run(script: str) -> float:
+    """Runs a script in a fresh interpreter and returns the time it prints."""
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=_REPOSITORY,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return float(completed.stdout)
+
+
+def main():
+    report("First highlight", min(run(_FIRST_HIGHLIGHT) for _ in range(5)))
+    report("Lexer lookup via get_all_lexers", min(run(_LEXER_WALK) for _ in range(5)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Compares GchHtmlFormatter with the former BeautifulSoup-based pipeline."""
+
+from codehighlighter.ankieditorextra import highlight_selection
+from codehighlighter.html import PlainString
+from codehighlighter.pygments_highlighter import (
+    create_block_style,
+    create_inline_style,
+    highlight_html,
+)
+from test.test_pygmentsformatter import reference_highlight
+
+from . import measure, report, synthetic_python
+
+
+def main():
+    for lines in [50, 5000]:
+        code = PlainString(synthetic_python(lines))
+        for style in [create_block_style(), create_inline_style()]:
+            # Include highlight_selection, because it used to reencode the
+            # soup.
+            baseline = measure(
+                lambda code=code, style=style: reference_highlight(
+                    code, "Python", style
+                ),
+                repeat=3,
+            )
+            optimized = measure(
+                lambda code=code, style=style: highlight_selection(
+                    code, lambda c: highlight_html(c, "Python", style)
+                ),
+                repeat=3,
+            )
+            name = f"{lines} lines, {style.display_style}"
+            report(f"{name}, BeautifulSoup pipeline", baseline)
+            report(f"{name}, GchHtmlFormatter", optimized, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measures filtering the language list as the user types.
+
+The options are all names and aliases of the bundled lexers, which is what the
+list grows to once the finder searches aliases. It also measures the slowest
+keystroke of the language index, which searches names, aliases, file names,
+and extensions.
+"""
+
+import functools
+
+from . import measure, report, stubaqt
+
+# The finder is a Qt dialog.
+stubaqt.install()
+
+from codehighlighter.fuzzy_finder_dialog import (  # noqa: E402
+    OptionIndex,
+    filter_and_sort_options,
+)
+from codehighlighter.languageindex import LanguageIndex  # noqa: E402
+from codehighlighter.lexerindex import ALIASES, LEXERS  # noqa: E402
+
+QUERY = "javascript"
+LANGUAGE_QUERIES = ["javascript", "py", ".rs", "tf", "Dockerfile"]
+
+
+def main():
+    options = sorted(set(LEXERS) | set(ALIASES))
+    keystrokes = [QUERY[:i] for i in range(len(QUERY) + 1)]
+    print(f"Options: {len(options)}, keystrokes: {len(keystrokes)}")
+
+    def refilter() -> None:
+        for query in keystrokes:
+            filter_and_sort_options(query, options)
+
+    def incremental() -> None:
+        index = OptionIndex(options)
+        for query in keystrokes:
+            index.filter(query)
+
+    baseline = measure(refilter)
+    report("Filter from scratch", baseline)
+    report("Incremental index", measure(incremental), baseline)
+
+    language_index = LanguageIndex(LEXERS, [])
+    print(f"Lexers: {len(LEXERS)}")
+    report("Language index build", measure(lambda: LanguageIndex(LEXERS, [])))
+    for query in LANGUAGE_QUERIES:
+        slowest = max(
+            measure(functools.partial(language_index.filter, query[:i]))
+            for i in range(1, len(query) + 1)
+        )
+        report(f"Slowest keystroke of {query!r}", slowest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measures how long Anki takes to load the add-on.
+
+Each measurement runs in a fresh interpreter with stub aqt and anki packages,
+so that it only counts the add-on's own modules. The benchmark fails if
+loading the add-on imports the highlighting engine or takes longer than
+THRESHOLD_MS.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from . import report
+
+__all__ = ["HEAVY_MODULES", "THRESHOLD_MS", "measure_import"]
+
+# Modules that must only load on first use.
+HEAVY_MODULES = ["bs4", "pygments"]
+
+THRESHOLD_MS = 50
+
+_REPOSITORY = Path(__file__).parents[2]
+
+_MEASURE = """
+import json, sys, time
+from tools.benchmarks import stubaqt
+stubaqt.install()
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(module: str = "codehighlighter") -> tuple[float, list[str]]:
+    """Imports a module in a fresh interpreter.
+
+    Returns:
+        The import time in seconds and the heavy modules loaded by the import.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", _MEASURE.format(module=module)],
+        cwd=_REPOSITORY,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    result = json.loads(completed.stdout)
+    heavy = [m for m in HEAVY_MODULES if m in result["modules"]]
+    return result["seconds"], heavy
+
+
+def main():
+    load, heavy = min(measure_import() for _ in range(5))
+    report("Load the add-on", load)
+    first_use, _ = min(
+        measure_import("codehighlighter.pygments_highlighter") for _ in range(5)
+    )
+    report("Load the highlighting engine", first_use)
+    if heavy:
+        sys.exit(f"Loading the add-on imports {', '.join(heavy)}.")
+    if load * 1000 > THRESHOLD_MS:
+        sys.exit(f"Loading the add-on exceeds the {THRESHOLD_MS} ms threshold.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Measures finding the add-on's media in a large media directory.
+
+Heavy Anki users have hundreds of thousands of media files. The benchmark
+compares listing the whole directory with checking the installed-asset ledger.
+"""
+
+import tempfile
+from pathlib import Path
+
+from . import measure, report, stubaqt
+
+# media.py imports Anki's media manager.
+stubaqt.install()
+
+from codehighlighter.media import (  # noqa: E402
+    installed_media_assets,
+    update_media_assets,
+)
+from codehighlighter.osextra import list_files_with_prefix  # noqa: E402
+
+MEDIA_FILES = 200_000
+
+_PREFIX = "_gch-"
+_MANIFEST = Path(_PREFIX + "asset-manifest.json")
+
+
+class DirectoryMediaManager:
+    """A media manager that works on a directory."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def dir(self) -> str:
+        return str(self.directory)
+
+    def add_file(self, path: str) -> str:
+        name = Path(path).name
+        (self.directory / name).write_bytes(Path(path).read_bytes())
+        return name
+
+    def trash_files(self, names: list[str]) -> None:
+        for name in names:
+            (self.directory / name).unlink()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assets_dir = Path(temp_dir) / "assets"
+        media_dir = Path(temp_dir) / "collection.media"
+        assets_dir.mkdir()
+        media_dir.mkdir()
+        for i in range(MEDIA_FILES):
+            (media_dir / f"image-{i}.png").touch()
+        assets = []
+        for name in ["_gch-pygments-solarized.css", "_gch-asset-version.txt"]:
+            (assets_dir / name).write_text(name)
+            assets.append(assets_dir / name)
+        media = DirectoryMediaManager(media_dir)
+        update_media_assets(assets, media, _MANIFEST)
+
+        print(f"Media files: {MEDIA_FILES}")
+        baseline = measure(lambda: list_files_with_prefix(media_dir, _PREFIX))
+        report("Directory listing", baseline)
+        report(
+            "Ledger",
+            measure(lambda: installed_media_assets(_PREFIX, assets, media, _MANIFEST)),
+            baseline,
+        )
+
+
+if __name__ == "__main__":
+    main()
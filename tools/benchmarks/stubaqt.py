@@ -0,0 +1,52 @@
+"""Stub aqt and anki packages for loading the add-on outside of Anki.
+
+Every module under the stubbed packages exists, and every attribute of such a
+module is a stub class. A stub class accepts any arguments, can be subclassed,
+and returns itself for any attribute.
+"""
+
+import importlib.abc
+import importlib.machinery
+import sys
+import types
+
+__all__ = ["install"]
+
+STUBBED_PACKAGES = ("aqt", "anki")
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return cls
+
+
+class _Stub(metaclass=_StubMeta):
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, fullname, path, target=None):
+        if fullname.partition(".")[0] not in STUBBED_PACKAGES:
+            return None
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        return _StubModule(spec.name)
+
+    def exec_module(self, module):
+        pass
+
+
+def install() -> None:
+    """Makes imports of aqt and anki return stubs."""
+    sys.meta_path.insert(0, _StubFinder())
@@ -0,0 +1,100 @@
+"""Measures the insertion of large highlighted blocks into the editor.
+
+The benchmark runs the editor helper in Node.js with a minimal DOM that
+stands in for Anki's editor webview. It compares sending the whole block in
+one script with the chunked transfer of `encode_text`.
+
+Requires `node` in PATH.
+"""
+
+import json
+import subprocess
+import typing
+
+from . import measure, report, stubaqt
+
+stubaqt.install()
+
+from codehighlighter.ankieditorextra import (  # noqa: E402
+    ReplaceWrapSelection,
+    unwrap_selection,
+)
+from codehighlighter.editorhelper import (  # noqa: E402
+    EDITOR_HELPER_JS,
+    call_editor_helper,
+)
+
+SIZES_MB = [1, 5, 20]
+
+_WRAP_ID = "gch-wrap"
+
+# Evaluates one script per input line and answers with its JSON result.
+_NODE_WEBVIEW = r"""
+const readline = require("readline");
+const span = { nextElementSibling: null, outerHTML: "" };
+globalThis.document = {
+  activeElement: { shadowRoot: { getElementById: () => span } },
+};
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+  const result = (0, eval)(JSON.parse(line));
+  process.stdout.write(JSON.stringify(result ?? null) + "\n");
+});
+"""
+
+
+class NodeWebView:
+    """A webview that evaluates scripts in a Node.js process."""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ["node", "-e", _NODE_WEBVIEW],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self.evalWithCallback(EDITOR_HELPER_JS, lambda _: None)
+
+    def evalWithCallback(self, js: str, cb: typing.Callable[[typing.Any], None]):
+        assert self.process.stdin and self.process.stdout
+        self.process.stdin.write(json.dumps(js) + "\n")
+        self.process.stdin.flush()
+        cb(json.loads(self.process.stdout.readline()))
+
+    def close(self) -> None:
+        self.process.communicate()
+
+
+def block(megabytes: int) -> str:
+    """Returns a highlighted-looking HTML block of the given size."""
+    line = '<span class="n">value</span> <span class="o">=</span> "x"<br>\n'
+    return line * (megabytes * 1024 * 1024 // len(line))
+
+
+def main():
+    webview = NodeWebView()
+    try:
+        for megabytes in SIZES_MB:
+            html = block(megabytes)
+
+            def single_script(html: str = html) -> None:
+                call_editor_helper(
+                    webview,
+                    "unwrapSelection",
+                    [json.dumps(_WRAP_ID), json.dumps(html)],
+                    lambda _: None,
+                )
+
+            def chunked(html: str = html) -> None:
+                unwrap_selection(
+                    webview, _WRAP_ID, ReplaceWrapSelection(html), lambda _: None
+                )
+
+            baseline = measure(single_script, repeat=3)
+            report(f"{megabytes} MB, single script", baseline)
+            report(f"{megabytes} MB, chunked", measure(chunked, repeat=3), baseline)
+    finally:
+        webview.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Generates codehighlighter/lexerindex.py, the static index of lexers.
+
+The index covers the built-in Pygments lexers and the bundled ARM lexer. Run
+it against the bundled Pygments, e.g., with `just generate-lexer-index`.
+"""
+
+import json
+from collections.abc import Iterable
+
+import pygments
+from pygments.lexers._mapping import LEXERS  # type: ignore
+
+from codehighlighter.pygmentsarm import ArmLexer
+
+# The index's entries: (module, class name, aliases, filename globs, mimetypes).
+Entry = tuple[str, str, tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+
+_HEADER = '''"""The static index of available lexers.
+
+Generated by tools/generatelexerindex.py. Do not edit.
+"""
+
+from typing import NamedTuple
+
+__all__ = ["ALIASES", "LEXERS", "PYGMENTS_VERSION", "LexerEntry"]
+
+
+class LexerEntry(NamedTuple):
+    """The metadata of a lexer.
+
+    Attributes:
+        module: The module that defines the lexer. Relative to this package
+            if it starts with a dot.
+        class_name: The name of the lexer class.
+        aliases: The lexer's aliases. The first one is the preferred one.
+        filenames: Globs of file names the lexer handles.
+        mimetypes: Mimetypes the lexer handles.
+    """
+
+    module: str
+    class_name: str
+    aliases: tuple[str, ...]
+    filenames: tuple[str, ...]
+    mimetypes: tuple[str, ...]
+
+
+'''
+
+_INDENT = "    "
+_LINE_LENGTH = 88
+
+
+def build_index() -> dict[str, Entry]:
+    """Returns the lexer index keyed by lexer name.
+
+    Lexers without aliases are deprecated and left out.
+    """
+    index: dict[str, Entry] = {}
+    for class_name, (module, name, aliases, filenames, mimetypes) in LEXERS.items():
+        if aliases:
+            index[name] = (module, class_name, aliases, filenames, mimetypes)
+    index[ArmLexer.name] = (
+        ".pygmentsarm",
+        ArmLexer.__name__,
+        tuple(ArmLexer.aliases),
+        tuple(ArmLexer.filenames),
+        tuple(ArmLexer.mimetypes),
+    )
+    return index
+
+
+def build_alias_index(index: dict[str, Entry]) -> dict[str, str]:
+    """Returns a map from an alias to a lexer name.
+
+    Like Pygments, prefers the first lexer with the alias. The ARM lexer
+    takes precedence over built-in lexers.
+    """
+    aliases: dict[str, str] = {}
+    for name in [ArmLexer.name, *index]:
+        for alias in index[name][2]:
+            aliases.setdefault(alias, name)
+    return aliases
+
+
+def _quote(string: str) -> str:
+    """Returns a string literal in Black's style."""
+    return json.dumps(string, ensure_ascii=False)
+
+
+def _format_tuple(items: Iterable[str], depth: int) -> str:
+    """Formats a tuple of strings like Black does."""
+    items = list(items)
+    if len(items) == 1:
+        return f"({_quote(items[0])},)"
+    one_line = "(" + ", ".join(_quote(item) for item in items) + ")"
+    if len(_INDENT * depth) + len(one_line) + 1 <= _LINE_LENGTH:
+        return one_line
+    inner = _INDENT * (depth + 1)
+    return (
+        "(\n"
+        + "".join(f"{inner}{_quote(item)},\n" for item in items)
+        + _INDENT * depth
+        + ")"
+    )
+
+
+def generate() -> str:
+    """Returns the source code of the index module."""
+    index = build_index()
+    lines = [_HEADER, f"PYGMENTS_VERSION = {_quote(pygments.__version__)}\n\n"]
+    lines.append("# Maps a lexer name to its metadata.\n")
+    lines.append("LEXERS: dict[str, LexerEntry] = {\n")
+    for name, (module, class_name, aliases, filenames, mimetypes) in index.items():
+        lines.append(f"{_INDENT}{_quote(name)}: LexerEntry(\n")
+        lines.append(f"{_INDENT * 2}{_quote(module)},\n")
+        lines.append(f"{_INDENT * 2}{_quote(class_name)},\n")
+        for items in (aliases, filenames, mimetypes):
+            lines.append(f"{_INDENT * 2}{_format_tuple(items, 2)},\n")
+        lines.append(f"{_INDENT}),\n")
+    lines.append("}\n\n")
+    lines.append("# Maps a lowercase alias to a lexer name.\n")
+    lines.append("ALIASES: dict[str, str] = {\n")
+    for alias, name in build_alias_index(index).items():
+        lines.append(f"{_INDENT}{_quote(alias)}: {_quote(name)},\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main():
+    print(generate(), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,3 +2,12 @@
 # mypy: ignore-errors
 filenames  # unused variable (codehighlighter/pygmentsarm.py:16)
 tokens  # unused variable (codehighlighter/pygmentsarm.py:23)
+_translate_parts  # unused method (codehighlighter/pygmentsformatter.py)
+format_unencoded  # unused method (codehighlighter/pygmentsformatter.py)
+highlight_selection  # unused function (codehighlighter/ankieditorextra.py, codehighlighter/main.py)
+serve  # unused function (codehighlighter/highlight_worker.py), runs in the worker process
+highlight_chunks  # unused function (codehighlighter/pygments_highlighter.py)
+mimetypes  # unused variable (codehighlighter/lexerindex.py)
+highlight_many  # unused function (codehighlighter/pygments_highlighter.py, codehighlighter/highlight_worker.py), a batch API for bulk jobs
+get_lexer_name_alias_map  # unused function (codehighlighter/pygments_highlighter.py)
+head  # unused attribute (codehighlighter/main.py), read by Anki